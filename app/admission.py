@@ -0,0 +1,174 @@
+"""
+Admission control for the endpoints enqueuing jobs.
+
+The number of concurrently running jobs is bounded by the workers (see :mod:`app.worker`),
+the number of waiting requests by :attr:`~app.config.Settings.max_queued_jobs`,
+where a batch counts with each of its members.
+Requests beyond that are rejected before any work is stored:
+
+- **429** if the queue is full, i.e. clients send more than the workers can handle.
+- **503** if the oldest job waits longer than :attr:`~app.config.Settings.max_queue_wait_seconds`,
+  i.e. the workers are stalled or missing.
+
+Both carry a ``Retry-After`` header estimated from the queue depth and recent job durations.
+Queue depth and rejections are exported by :func:`format_metrics` for autoscaling.
+"""
+
+from collections import Counter
+from math import ceil
+from typing import Annotated
+
+from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import Settings
+from app.job_queue import QueueDepth, get_queue_depth
+from app.services import get_db_engine, get_settings
+
+DEFAULT_JOB_DURATION = 5.0
+"""Assumed duration of a job in seconds until the first job finished in this process."""
+
+DURATION_SMOOTHING = 0.2
+"""Weight of the latest job in the moving average of job durations."""
+
+MAX_RETRY_AFTER = 3600
+"""Upper bound of the ``Retry-After`` header in seconds."""
+
+
+class JobDurations:
+    """
+    Exponential moving average of the durations of jobs run in this process.
+    """
+
+    mean: float
+    count: int
+
+    def __init__(self) -> None:
+        self.mean = DEFAULT_JOB_DURATION
+        self.count = 0
+
+    def record(self, seconds: float) -> None:
+        """
+        Add the duration of a finished job.
+        """
+
+        if self.count == 0:
+            self.mean = seconds
+        else:
+            self.mean += DURATION_SMOOTHING * (seconds - self.mean)
+        self.count += 1
+
+
+job_durations = JobDurations()
+"""Durations of jobs run by the workers of this process."""
+
+rejections: Counter[int] = Counter()
+"""Requests rejected by this process, by status code."""
+
+
+def retry_after(jobs_ahead: int, depth: QueueDepth, mean_duration: float) -> int:
+    """
+    Estimate the seconds until `jobs_ahead` jobs are done.
+
+    The number of running jobs approximates the number of active workers.
+
+    :param jobs_ahead: Jobs that have to finish before a retry can succeed.
+    :param depth: Current load of the queue.
+    :param mean_duration: Mean duration of a job in seconds.
+    """
+
+    seconds = ceil(jobs_ahead * mean_duration / max(depth.running, 1))
+    return min(max(seconds, 1), MAX_RETRY_AFTER)
+
+
+def _reject(status_code: int, detail: str, seconds: int) -> HTTPException:
+    rejections[status_code] += 1
+    return HTTPException(
+        status_code=status_code,
+        detail=detail,
+        headers={"Retry-After": str(seconds)},
+    )
+
+
+async def check_admission(
+    engine: AsyncEngine, settings: Settings, weight: int = 1
+) -> None:
+    """
+    Check whether the queue accepts a job processing `weight` requests.
+
+    A job larger than :attr:`~app.config.Settings.max_queued_jobs` is only accepted
+    by an empty queue.
+
+    :param engine: Database engine to use.
+    :param settings: Settings from .env file.
+    :param weight: Number of requests of the job, e.g. the members of a batch.
+    :raises HTTPException: (Status 429) If the queue is full.
+    :raises HTTPException: (Status 503) If the queue is not drained fast enough.
+    """
+
+    depth = await get_queue_depth(engine)
+
+    limit = settings.max_queued_jobs
+    if limit is not None and depth.queued + min(weight, limit) > limit:
+        raise _reject(
+            429,
+            f"Too many queued requests ({depth.queued}), please retry later.",
+            retry_after(
+                depth.queued + min(weight, limit) - limit, depth, job_durations.mean
+            ),
+        )
+
+    max_wait = settings.max_queue_wait_seconds
+    if max_wait is not None and depth.oldest_wait > max_wait:
+        raise _reject(
+            503,
+            f"Queued requests wait longer than {max_wait:g} seconds, please retry later.",
+            retry_after(depth.queued, depth, job_durations.mean),
+        )
+
+
+async def admit_job(
+    engine: Annotated[AsyncEngine, Depends(get_db_engine)],
+    settings: Annotated[Settings, Depends(get_settings)],
+) -> None:
+    """
+    Check whether the queue accepts another job processing a single request.
+
+    Used as dependency of the endpoints.
+    FastAPI validates the request body first, but nothing is stored for rejected requests.
+
+    :param engine: Database engine to use.
+    :param settings: Settings from .env file.
+    :raises HTTPException: (Status 429) If the queue is full.
+    :raises HTTPException: (Status 503) If the queue is not drained fast enough.
+    """
+
+    await check_admission(engine, settings)
+
+
+def format_metrics(depth: QueueDepth) -> str:
+    """
+    Render the queue metrics in the Prometheus text format.
+    """
+
+    lines = [
+        "# HELP leqo_jobs_queued Jobs waiting to be claimed by a worker.",
+        "# TYPE leqo_jobs_queued gauge",
+        f"leqo_jobs_queued {depth.queued}",
+        "# HELP leqo_jobs_running Jobs currently running on a worker.",
+        "# TYPE leqo_jobs_running gauge",
+        f"leqo_jobs_running {depth.running}",
+        "# HELP leqo_job_queue_oldest_wait_seconds Wait time of the oldest queued job.",
+        "# TYPE leqo_job_queue_oldest_wait_seconds gauge",
+        f"leqo_job_queue_oldest_wait_seconds {depth.oldest_wait}",
+        "# HELP leqo_job_duration_seconds Moving average of job durations in this process.",
+        "# TYPE leqo_job_duration_seconds gauge",
+        f"leqo_job_duration_seconds {job_durations.mean}",
+        "# HELP leqo_admission_rejections_total Requests rejected by admission control.",
+        "# TYPE leqo_admission_rejections_total counter",
+    ]
+    lines.extend(
+        f'leqo_admission_rejections_total{{code="{code}"}} {rejections[code]}'
+        for code in (429, 503)
+    )
+    return "\n".join(lines) + "\n"
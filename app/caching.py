@@ -0,0 +1,67 @@
+"""
+HTTP caching helpers for stored results.
+
+Entity tags are content hashes computed once when a payload is written.
+They are stored next to the payload, so conditional requests can be answered
+without loading the payload itself.
+"""
+
+from hashlib import sha256
+
+from app.compression import ContentEncoding
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+"""Cache policy for resources that never change once written."""
+
+REVALIDATE_CACHE_CONTROL = "no-cache"
+"""Cache policy for resources that may be replaced and must be revalidated."""
+
+
+def compute_digest(content: bytes) -> str:
+    """
+    Compute the content hash used as entity tag of a payload.
+
+    :param content: The uncompressed payload.
+    :return: Hex encoded SHA-256 digest.
+    """
+
+    return sha256(content).hexdigest()
+
+
+def format_etag(digest: str, encoding: ContentEncoding = "identity") -> str:
+    """
+    Format a strong ``ETag`` header value for a representation of a payload.
+
+    Each content encoding is a different representation and gets a distinct tag.
+
+    :param digest: Digest as returned by :func:`compute_digest`.
+    :param encoding: Content encoding of the sent representation.
+    """
+
+    if encoding == "identity":
+        return f'"{digest}"'
+    return f'"{digest}-{encoding}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Evaluate an ``If-None-Match`` header against the current entity tag.
+
+    Uses the weak comparison function as required for ``If-None-Match``.
+
+    :param if_none_match: Value of the ``If-None-Match`` request header.
+    :param etag: Current (formatted) entity tag.
+    :return: Whether the client already has the current representation.
+    """
+
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
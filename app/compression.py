@@ -0,0 +1,129 @@
+"""
+Transparent compression of large text payloads stored in the database.
+
+Payloads are stored as raw bytes alongside a content-encoding tag.
+The tag uses the HTTP ``Content-Encoding`` vocabulary, so stored bytes can be sent
+to clients that accept the encoding without decompressing them first.
+Rows written before compression was introduced are tagged ``identity``.
+"""
+
+import gzip
+from dataclasses import dataclass
+from typing import Literal
+
+ContentEncoding = Literal["identity", "gzip"]
+
+COMPRESSION_MIN_SIZE = 1024
+"""Payloads smaller than this (in bytes) are stored uncompressed."""
+
+COMPRESSION_LEVEL = 6
+"""Gzip level used for stored payloads. Trades a little ratio for a lot of speed."""
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """
+    Text payload as stored in the database.
+
+    :param content: The (possibly compressed) UTF-8 bytes.
+    :param encoding: How `content` is encoded.
+    """
+
+    content: bytes
+    encoding: ContentEncoding = "identity"
+
+    @staticmethod
+    def encode(text: str, min_size: int = COMPRESSION_MIN_SIZE) -> "EncodedPayload":
+        """
+        Encode text for storage, compressing it if it is large enough.
+
+        :param text: The text to store.
+        :param min_size: Minimal size in bytes to compress the payload.
+        :return: The encoded payload.
+        """
+
+        raw = text.encode("utf-8")
+        if len(raw) < min_size:
+            return EncodedPayload(raw)
+
+        compressed = gzip.compress(raw, compresslevel=COMPRESSION_LEVEL, mtime=0)
+        if len(compressed) >= len(raw):
+            return EncodedPayload(raw)
+
+        return EncodedPayload(compressed, "gzip")
+
+    @staticmethod
+    def from_db(content: bytes, encoding: str | None) -> "EncodedPayload":
+        """
+        Create a payload from a database row.
+
+        :param content: Value of the payload column.
+        :param encoding: Value of the `content_encoding` column.
+        :raises ValueError: If the encoding is not supported.
+        """
+
+        return EncodedPayload(content, parse_content_encoding(encoding))
+
+    def decode(self) -> str:
+        """
+        Decompress (if needed) and decode the payload.
+        """
+
+        match self.encoding:
+            case "identity":
+                return self.content.decode("utf-8")
+            case "gzip":
+                return gzip.decompress(self.content).decode("utf-8")
+
+
+def parse_content_encoding(encoding: str | None) -> ContentEncoding:
+    """
+    Validate the value of a `content_encoding` column.
+
+    :param encoding: The stored value (`None` for legacy rows).
+    :raises ValueError: If the encoding is not supported.
+    """
+
+    match encoding:
+        case None | "identity":
+            return "identity"
+        case "gzip":
+            return "gzip"
+        case _:
+            msg = f"Unsupported content encoding '{encoding}'"
+            raise ValueError(msg)
+
+
+def accepts_encoding(accept_encoding: str | None, encoding: ContentEncoding) -> bool:
+    """
+    Check whether an ``Accept-Encoding`` header allows the given encoding.
+
+    :param accept_encoding: Value of the ``Accept-Encoding`` request header.
+    :param encoding: Encoding to check for.
+    :return: Whether the client accepts a response with this encoding.
+    """
+
+    if encoding == "identity":
+        return True
+
+    if not accept_encoding:
+        return False
+
+    wildcard = False
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.strip().partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding == encoding:
+            return quality > 0
+        if coding == "*":
+            wildcard = quality > 0
+
+    return wildcard
@@ -2,7 +2,9 @@
 Load environment variables from the .env file.
 """
 
-from pydantic import AnyHttpUrl
+from typing import Self
+
+from pydantic import AnyHttpUrl, Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -27,4 +29,54 @@ class Settings(BaseSettings):
     qiskit_compat_mode: bool = False
     """Enable Qiskit compatibility adjustments (e.g. stripping literal nodes)."""
 
+    embedded_workers: int = Field(default=1, ge=0)
+    """Number of job workers running inside the API process. Use 0 for API replicas that only enqueue."""
+
+    worker_concurrency: int = Field(default=1, ge=1)
+    """Number of jobs a standalone worker (``python -m app.worker``) runs concurrently."""
+
+    job_lease_seconds: float = Field(default=360.0, gt=0)
+    """Seconds a claimed job stays leased without heartbeat before another worker may take it over.
+    Must exceed the processing deadline, so a job is never taken over while it may still be running."""
+
+    job_poll_interval: float = Field(default=1.0, gt=0)
+    """Seconds an idle worker waits before looking for new jobs again."""
+
+    job_max_attempts: int = Field(default=3, ge=1)
+    """Attempts before a job is given up and its request marked as failed."""
+
+    job_heartbeat_interval: float = Field(default=5.0, gt=0)
+    """Seconds between heartbeats of a running job, which also pick up cancellation requests."""
+
+    max_processed_nodes: int | None = Field(default=10_000, gt=0)
+    """Maximal number of nodes processed per request, including unrolled repeat nodes."""
+
+    max_qubit_width: int | None = Field(default=1024, gt=0)
+    """Maximal number of qubits of a compiled program."""
+
+    max_statements: int | None = Field(default=1_000_000, gt=0)
+    """Maximal number of OpenQASM statements of all nodes of a request."""
+
+    processing_deadline_seconds: float | None = Field(default=300.0, gt=0)
+    """Maximal processing time of a request in seconds."""
+
+    max_queued_jobs: int | None = Field(default=1000, gt=0)
+    """Requests waiting in the queue (a batch counts each member) before new requests are rejected with status 429."""
+
+    max_queue_wait_seconds: float | None = Field(default=600.0, gt=0)
+    """Seconds the oldest queued job may wait before new requests are rejected with status 503."""
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    @model_validator(mode="after")
+    def _check_job_lease(self) -> Self:
+        if self.job_heartbeat_interval >= self.job_lease_seconds:
+            msg = "job_heartbeat_interval must be shorter than job_lease_seconds"
+            raise ValueError(msg)
+        if (
+            self.processing_deadline_seconds is not None
+            and self.job_lease_seconds <= self.processing_deadline_seconds
+        ):
+            msg = "job_lease_seconds must be longer than processing_deadline_seconds"
+            raise ValueError(msg)
+        return self
@@ -98,6 +98,88 @@ MIGRATIONS: tuple[Migration, ...] = (
             'UPDATE "service_deployment_models" SET "content_type" = COALESCE("content_type", \'application/json\')',
         ),
     ),
+    Migration(
+        name="0007_compress_results_and_payloads",
+        statements=(
+            'ALTER TABLE "compile_results" ADD COLUMN IF NOT EXISTS "content_encoding" VARCHAR NOT NULL DEFAULT \'identity\'',
+            'ALTER TABLE "compile_results" ALTER COLUMN "implementation" TYPE BYTEA USING convert_to("implementation"::text, \'UTF8\')',
+            'ALTER TABLE "compile_request_payloads" ADD COLUMN IF NOT EXISTS "content_encoding" VARCHAR NOT NULL DEFAULT \'identity\'',
+            'ALTER TABLE "compile_request_payloads" ALTER COLUMN "payload" TYPE BYTEA USING convert_to("payload"::text, \'UTF8\')',
+            'ALTER TABLE "process_states" ADD COLUMN IF NOT EXISTS "content_encoding" VARCHAR NOT NULL DEFAULT \'identity\'',
+            'ALTER TABLE "process_states" ALTER COLUMN "result" TYPE BYTEA USING convert_to("result"::text, \'UTF8\')',
+        ),
+    ),
+    Migration(
+        name="0008_add_etags",
+        statements=(
+            'ALTER TABLE "compile_results" ADD COLUMN IF NOT EXISTS "etag" VARCHAR',
+            'UPDATE "compile_results" SET "etag" = encode(sha256("implementation"), \'hex\') WHERE "etag" IS NULL AND "content_encoding" = \'identity\'',
+            'ALTER TABLE "compile_request_payloads" ADD COLUMN IF NOT EXISTS "etag" VARCHAR',
+            'UPDATE "compile_request_payloads" SET "etag" = encode(sha256("payload"), \'hex\') WHERE "etag" IS NULL AND "content_encoding" = \'identity\'',
+            'ALTER TABLE "enrich_result" ADD COLUMN IF NOT EXISTS "etag" VARCHAR',
+            'ALTER TABLE "qrms" ADD COLUMN IF NOT EXISTS "etag" VARCHAR',
+            'UPDATE "qrms" SET "etag" = encode(sha256("payload"), \'hex\') WHERE "etag" IS NULL',
+            'ALTER TABLE "service_deployment_models" ADD COLUMN IF NOT EXISTS "etag" VARCHAR',
+            'UPDATE "service_deployment_models" SET "etag" = encode(sha256("payload"), \'hex\') WHERE "etag" IS NULL',
+        ),
+    ),
+    Migration(
+        name="0009_add_batch_id_to_process_states",
+        statements=(
+            'ALTER TABLE "process_states" ADD COLUMN IF NOT EXISTS "batch_id" UUID',
+            'CREATE INDEX IF NOT EXISTS "ix_process_states_batch_id" ON "process_states" ("batch_id")',
+        ),
+    ),
+    Migration(
+        name="0010_create_jobs",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS "jobs" (
+                "id" UUID PRIMARY KEY,
+                "kind" VARCHAR NOT NULL,
+                "payload" BYTEA NOT NULL,
+                "content_encoding" VARCHAR NOT NULL DEFAULT 'identity',
+                "state" VARCHAR NOT NULL,
+                "attempts" INTEGER NOT NULL DEFAULT 0,
+                "max_attempts" INTEGER NOT NULL,
+                "createdAt" TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+                "run_after" TIMESTAMP WITH TIME ZONE NOT NULL,
+                "lease_owner" VARCHAR,
+                "lease_expires_at" TIMESTAMP WITH TIME ZONE,
+                "last_error" TEXT
+            )
+            """,
+            'CREATE INDEX IF NOT EXISTS "ix_jobs_state_run_after" ON "jobs" ("state", "run_after")',
+        ),
+    ),
+    Migration(
+        name="0011_add_cancellation",
+        statements=(
+            "ALTER TYPE \"statustype\" ADD VALUE IF NOT EXISTS 'CANCELLED'",
+            "ALTER TYPE \"statustype\" ADD VALUE IF NOT EXISTS 'TIMEOUT'",
+            'ALTER TABLE "jobs" ADD COLUMN IF NOT EXISTS "cancel_requested" BOOLEAN NOT NULL DEFAULT FALSE',
+        ),
+    ),
+    Migration(
+        name="0012_create_quantum_group_results",
+        statements=(
+            """
+            CREATE TABLE IF NOT EXISTS "quantum_group_results" (
+                "request_digest" VARCHAR NOT NULL,
+                "group_index" INTEGER NOT NULL,
+                "implementation" BYTEA NOT NULL,
+                "content_encoding" VARCHAR NOT NULL DEFAULT 'identity',
+                PRIMARY KEY ("request_digest", "group_index")
+            )
+            """,
+        ),
+    ),
+    Migration(
+        name="0013_add_job_weight",
+        statements=(
+            'ALTER TABLE "jobs" ADD COLUMN IF NOT EXISTS "weight" INTEGER NOT NULL DEFAULT 1',
+        ),
+    ),
 )
 
 
@@ -11,9 +11,10 @@ Some services could read implementations from a database or generate them on the
 import asyncio
 import math
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Coroutine, Iterable
+from collections.abc import Callable, Coroutine, Hashable, Iterable
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from importlib import import_module
+from typing import Any, Literal, override
 
 from openqasm3.ast import Program
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -28,6 +29,7 @@ from app.model.CompileRequest import (
     Node as FrontendNode,
 )
 from app.model.data_types import LeqoSupportedType
+from app.openqasm3.clone import clone
 from app.utils import not_none_or
 
 
@@ -152,15 +154,197 @@ class EnricherStrategy(ABC):
         return False
 
 
+class LazyEnricherStrategy(EnricherStrategy):
+    """
+    Descriptor of a strategy whose module is imported on first use.
+
+    Strategies built on heavy dependencies (e.g. qiskit and numpy) are registered this way,
+    so importing the application stays fast.
+    Nodes of other types are skipped without importing the module.
+
+    :param module: Name of the module defining the strategy.
+    :param name: Name of the strategy class in `module`.
+    :param node_types: Types of the nodes the strategy can enrich.
+    :param available: Name of a flag in `module` telling whether its dependencies are usable.
+    :param args: Arguments passed to the strategy class.
+    """
+
+    module: str
+    name: str
+    node_types: tuple[type[BaseNode], ...]
+    available: str | None
+    args: tuple[Any, ...]
+    _strategy: EnricherStrategy | None
+    _loaded: bool
+
+    def __init__(
+        self,
+        module: str,
+        name: str,
+        node_types: tuple[type[BaseNode], ...],
+        *args: Any,
+        available: str | None = None,
+    ) -> None:
+        self.module = module
+        self.name = name
+        self.node_types = node_types
+        self.available = available
+        self.args = args
+        self._strategy = None
+        self._loaded = False
+
+    def load(self) -> EnricherStrategy | None:
+        """
+        Import and create the strategy.
+
+        :return: The strategy or `None` if its dependencies are not available.
+        """
+
+        if not self._loaded:
+            module = import_module(self.module)
+            if self.available is None or getattr(module, self.available):
+                self._strategy = getattr(module, self.name)(*self.args)
+            self._loaded = True
+        return self._strategy
+
+    @override
+    def _enrich_impl(
+        self, node: FrontendNode, constraints: Constraints | None
+    ) -> (
+        EnrichmentResult
+        | Iterable[EnrichmentResult]
+        | Coroutine[None, None, EnrichmentResult]
+        | Coroutine[None, None, Iterable[EnrichmentResult]]
+    ):
+        if not isinstance(node, self.node_types):
+            return []
+        strategy = self.load()
+        if strategy is None:
+            return []
+        return strategy._enrich_impl(node, constraints)  # noqa: SLF001
+
+    @override
+    async def insert_enrichment(
+        self,
+        node: FrontendNode,
+        implementation: str,
+        requested_inputs: dict[int, LeqoSupportedType],
+        meta_data: SingleInsertMetaData,
+        session: AsyncSession | None = None,
+    ) -> bool:
+        if not isinstance(node, self.node_types):
+            return False
+        strategy = self.load()
+        if strategy is None:
+            return False
+        return await strategy.insert_enrichment(
+            node, implementation, requested_inputs, meta_data, session
+        )
+
+
+class EnrichmentCache:
+    """
+    Shares enrichments between requests containing identical nodes with identical constraints.
+
+    Concurrent lookups of the same node wait for a single enrichment.
+    Failures are shared as well.
+    """
+
+    _results: dict[
+        Hashable, asyncio.Future[ImplementationNode | ParsedImplementationNode]
+    ]
+
+    def __init__(self) -> None:
+        self._results = {}
+
+    @staticmethod
+    def key(node: FrontendNode, constraints: Constraints | None) -> Hashable:
+        """
+        Identify an enrichment by its node and constraints.
+        """
+
+        if constraints is None:
+            return node.model_dump_json(), None
+
+        return (
+            node.model_dump_json(),
+            frozenset(constraints.requested_inputs.items()),
+            constraints.optimizeWidth,
+            constraints.optimizeDepth,
+            repr(sorted(constraints.requested_input_values.items())),
+        )
+
+    async def get_or_enrich(
+        self,
+        node: FrontendNode,
+        constraints: Constraints | None,
+        enrich: Callable[
+            [],
+            Coroutine[None, None, ImplementationNode | ParsedImplementationNode],
+        ],
+    ) -> ImplementationNode | ParsedImplementationNode:
+        """
+        Return the cached enrichment or compute it via `enrich`.
+
+        Parsed implementations are mutated during processing, so each caller receives a copy.
+        If the enriching caller is interrupted (e.g. cancelled), the entry is dropped
+        and the waiting callers start over, so one of them enriches the node instead.
+        """
+
+        key = self.key(node, constraints)
+        while True:
+            future = self._results.get(key)
+            if future is None:
+                future = asyncio.get_running_loop().create_future()
+                self._results[key] = future
+                try:
+                    future.set_result(await enrich())
+                except Exception as ex:
+                    future.set_exception(ex)
+                except BaseException:
+                    del self._results[key]
+                    future.cancel()
+                    raise
+
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not future.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                continue
+            break
+
+        if isinstance(result, ParsedImplementationNode):
+            return result.model_copy(
+                update={"implementation": clone(result.implementation)}
+            )
+        return result
+
+
 class Enricher:
     """
     Handles multiple :class:`~app.enricher.EnricherStrategy`.
+
+    :param strategies: Strategies to query for enrichments.
+    :param cache: Optional cache to share enrichments with other requests.
     """
 
     strategies: list[EnricherStrategy]
+    cache: EnrichmentCache | None
 
-    def __init__(self, *strategies: EnricherStrategy):
+    def __init__(
+        self, *strategies: EnricherStrategy, cache: EnrichmentCache | None = None
+    ):
         self.strategies = list(strategies)
+        self.cache = cache
+
+    def with_cache(self, cache: EnrichmentCache) -> "Enricher":
+        """
+        Create an enricher with the same strategies that shares enrichments via `cache`.
+        """
+
+        return Enricher(*self.strategies, cache=cache)
 
     async def try_enrich(
         self, node: FrontendNode, constraints: Constraints | None
@@ -198,6 +382,20 @@ class Enricher:
         if isinstance(node, ImplementationNode | ParsedImplementationNode):
             return node
 
+        if self.cache is not None:
+            return await self.cache.get_or_enrich(
+                node, constraints, lambda: self._enrich_uncached(node, constraints)
+            )
+
+        return await self._enrich_uncached(node, constraints)
+
+    async def _enrich_uncached(
+        self, node: FrontendNode, constraints: Constraints | None
+    ) -> ImplementationNode | ParsedImplementationNode:
+        """
+        Query all strategies and select the best enrichment.
+        """
+
         results: list[EnrichmentResult] = []
         exceptions: list[Exception] = []
 
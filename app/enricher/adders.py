@@ -0,0 +1,208 @@
+"""
+Generated adder circuits as OpenQASM statements.
+
+All adders act on little endian lists of qubits and add an ``n`` bit number ``a`` to
+an ``n`` bit number ``b``:
+
+* :func:`cuccaro_adder` adds in place with a single ancilla (Cuccaro et al., 2004).
+* :func:`draper_adder` adds in the Fourier basis without any carry (Draper, 2000).
+* :func:`carry_lookahead_adder` adds out of place in logarithmic depth
+  (Draper, Kutin, Rains and Svore, 2004).
+"""
+
+import math
+from collections.abc import Sequence
+
+from openqasm3.ast import (
+    Expression,
+    FloatLiteral,
+    Identifier,
+    IndexedIdentifier,
+    QuantumGate,
+    QuantumStatement,
+)
+
+Qubit = Identifier | IndexedIdentifier
+
+
+def _gate(
+    name: str, *qubits: Qubit, arguments: list[Expression] | None = None
+) -> QuantumGate:
+    return QuantumGate(
+        modifiers=[],
+        name=Identifier(name),
+        arguments=[] if arguments is None else arguments,
+        qubits=list(qubits),
+        duration=None,
+    )
+
+
+def cuccaro_adder(
+    a: Sequence[Qubit],
+    b: Sequence[Qubit],
+    ancilla: Qubit,
+    carry_out: Qubit | None = None,
+) -> list[QuantumStatement]:
+    """
+    Ripple-carry adder computing ``b = a + b mod 2^n`` in place.
+
+    A MAJ cascade stores the carries in `a`, the UMA cascade restores `a`
+    and writes the sum to `b` in ``O(n)`` depth.
+
+    :param a: Distinct qubits of the first summand, restored afterwards.
+    :param b: Distinct qubits of the second summand, replaced by the sum.
+    :param ancilla: Clean carry-in qubit, restored afterwards.
+    :param carry_out: Qubit the final carry is XORed onto, if any.
+    """
+
+    statements: list[QuantumStatement] = []
+    carries = [ancilla, *a[:-1]]
+    for carry, b_bit, a_bit in zip(carries, b, a, strict=True):
+        statements.append(_gate("cx", a_bit, b_bit))
+        statements.append(_gate("cx", a_bit, carry))
+        statements.append(_gate("ccx", carry, b_bit, a_bit))
+    if carry_out is not None:
+        statements.append(_gate("cx", a[-1], carry_out))
+    for carry, b_bit, a_bit in reversed(list(zip(carries, b, a, strict=True))):
+        statements.append(_gate("ccx", carry, b_bit, a_bit))
+        statements.append(_gate("cx", a_bit, carry))
+        statements.append(_gate("cx", carry, b_bit))
+    return statements
+
+
+def _phase(control: Qubit, target: Qubit, distance: int, sign: float) -> QuantumGate:
+    return _gate(
+        "cp", control, target, arguments=[FloatLiteral(sign * math.pi / 2**distance)]
+    )
+
+
+def draper_adder(
+    a: Sequence[Qubit | None], b: Sequence[Qubit], *, subtract: bool = False
+) -> list[QuantumStatement]:
+    """
+    Adder computing ``b = b ± a mod 2^n`` in the Fourier basis of `b`.
+
+    `b` is transformed by a QFT without swaps, so bit ``k`` holds the phase
+    ``2 pi b / 2^(k + 1)``. Each bit ``j <= k`` of `a` then adds ``pi / 2^(k - j)``
+    to that phase by a controlled phase rotation before the inverse QFT.
+    The rotations are ordered by ``k - j``, so all three steps take ``O(n)`` layers.
+    No carries are stored, but the circuit has ``O(n^2)`` rotations.
+
+    :param a: Qubits of the summand, which are only used as controls.
+        A qubit may occur several times (e.g. a sign bit), None denotes a zero bit.
+    :param b: Distinct qubits of the target register.
+    :param subtract: Whether to subtract `a` instead.
+    """
+
+    n = len(b)
+    sign = -1.0 if subtract else 1.0
+    statements: list[QuantumStatement] = []
+    for k in reversed(range(n)):
+        statements.append(_gate("h", b[k]))
+        statements.extend(_phase(b[j], b[k], k - j, 1.0) for j in reversed(range(k)))
+    for distance in range(n):
+        statements.extend(
+            _phase(control, b[k], distance, sign)
+            for k in range(distance, n)
+            if (control := a[k - distance]) is not None
+        )
+    for k in range(n):
+        statements.extend(_phase(b[j], b[k], k - j, -1.0) for j in range(k))
+        statements.append(_gate("h", b[k]))
+    return statements
+
+
+def lookahead_ancillas(n: int) -> int:
+    """
+    Number of ancillas :func:`carry_lookahead_adder` needs for `n` bit summands.
+    """
+
+    return n - n.bit_count() - (n.bit_length() - 1)
+
+
+def carry_lookahead_adder(
+    a: Sequence[Qubit | None],
+    b: Sequence[Qubit],
+    result: Sequence[Qubit],
+    ancillas: Sequence[Qubit],
+) -> list[QuantumStatement]:
+    """
+    Out of place adder computing ``result ^= a + b`` in depth ``O(log n)``.
+
+    The generate bits ``a_i b_i`` are written to ``result[i + 1]``
+    and the propagate bits ``a_i ^ b_i`` to `b`.
+    Propagate bits of blocks of ``2^t`` bits are combined on the ancillas,
+    which allows computing all carries in a binary tree and its inverse.
+    Afterwards the ancillas and `b` are restored.
+
+    :param a: Qubits of the first summand, which are only used as controls.
+        A qubit may occur several times (e.g. a sign bit), None denotes a zero bit.
+    :param b: Distinct qubits of the second summand.
+    :param result: ``n + 1`` clean qubits receiving the sum.
+    :param ancillas: :func:`lookahead_ancillas` clean qubits.
+    """
+
+    n = len(b)
+    levels = n.bit_length() - 1
+    remaining = iter(ancillas)
+    # propagate[t][m] of the block [2^t m, 2^t (m + 1)), block 0 isn't needed
+    propagate: list[dict[int, Qubit]] = [dict(enumerate(b))]
+    propagate.extend(
+        {m: next(remaining) for m in range(1, n >> t)} for t in range(1, levels)
+    )
+
+    def propagate_rounds() -> list[QuantumStatement]:
+        return [
+            _gate(
+                "ccx",
+                propagate[t - 1][2 * m],
+                propagate[t - 1][2 * m + 1],
+                propagate[t][m],
+            )
+            for t in range(1, levels)
+            for m in range(1, n >> t)
+        ]
+
+    statements: list[QuantumStatement] = [
+        _gate("ccx", a_bit, b_bit, result[i + 1])
+        for i, (a_bit, b_bit) in enumerate(zip(a, b, strict=True))
+        if a_bit is not None
+    ]
+    statements.extend(
+        _gate("cx", a_bit, b_bit)
+        for a_bit, b_bit in zip(a, b, strict=True)
+        if a_bit is not None
+    )
+    statements.extend(propagate_rounds())
+    for t in range(1, levels + 1):
+        statements.extend(
+            _gate(
+                "ccx",
+                result[(m << t) + (1 << (t - 1))],
+                propagate[t - 1][2 * m + 1],
+                result[(m << t) + (1 << t)],
+            )
+            for m in range(n >> t)
+        )
+    carry_levels = (2 * n // 3).bit_length() - 1
+    for t in reversed(range(1, carry_levels + 1)):
+        statements.extend(
+            _gate(
+                "ccx",
+                result[m << t],
+                propagate[t - 1][2 * m],
+                result[(m << t) + (1 << (t - 1))],
+            )
+            for m in range(1, (n - (1 << (t - 1))) // (1 << t) + 1)
+        )
+    statements.extend(reversed(propagate_rounds()))
+    statements.extend(
+        _gate("cx", b_bit, result_bit)
+        for b_bit, result_bit in zip(b, result, strict=False)
+    )
+    statements.extend(
+        _gate("cx", a_bit, b_bit)
+        for a_bit, b_bit in zip(a, b, strict=True)
+        if a_bit is not None
+    )
+    return statements
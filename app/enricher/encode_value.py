@@ -24,7 +24,6 @@ from app.enricher.exceptions import (
     EncodingNotSupported,
     EnricherException,
 )
-from app.enricher.schmidt_decomposition import analyze_schmidt_decomposition
 from app.enricher.utils import implementation, leqo_output
 from app.model import CompileRequest, data_types
 from app.model.exceptions import (
@@ -157,7 +156,7 @@ class EncodeValueEnricherStrategy(DataBaseEnricherStrategy):
         return new_node
 
     @override
-    async def _enrich_impl(
+    async def _enrich_impl(  # noqa: PLR0911
         self, node: CompileRequest.Node, constraints: Constraints | None
     ) -> list[EnrichmentResult]:
         handler_result = try_generate_encode_value_handler(
@@ -205,20 +204,13 @@ class EncodeValueEnricherStrategy(DataBaseEnricherStrategy):
             raw_state_vector = (
                 input_value.values if hasattr(input_value, "values") else input_value
             )
-            result = analyze_schmidt_decomposition(raw_state_vector, qargs=[0])
-
-            raise EnricherException(
-                (
-                    "Schmidt decomposition analysis is available, but circuit "
-                    "generation is not implemented yet. "
-                    f"rank={result.rank}, "
-                    f"coefficients={result.coefficients}, "
-                    f"entanglement_entropy={result.entanglement_entropy}, "
-                    f"is_separable={result.is_separable}"
-                ),
-                node,
+            # imported on first use, as it depends on qiskit
+            from app.enricher.encode_value_handlers.schmidt import (  # noqa: PLC0415
+                generate_schmidt_enrichment,
             )
 
+            return [generate_schmidt_enrichment(node, raw_state_vector)]
+
         if isinstance(node, CompileRequest.EncodeValueNode) and node.encoding in {
             "basis",
             "angle",
@@ -1,10 +1,9 @@
 from collections.abc import Callable
+from importlib import import_module
 
 from openqasm3 import ast
 
 from app.enricher import Constraints, EnrichmentResult
-from app.enricher.encode_value_handlers.amplitude import generate_amplitude_enrichment
-from app.enricher.encode_value_handlers.matrix import generate_matrix_enrichment
 from app.model import CompileRequest, data_types
 from app.model.exceptions import InputCountMismatch, InputTypeMismatch
 
@@ -16,12 +15,35 @@ CheckConstraints = Callable[
 
 Handler = Callable[
     [CompileRequest.EncodeValueNode, Constraints],
-    EnrichmentResult,
+    list[EnrichmentResult],
 ]
 
+
+def _lazy_handler(module: str, name: str) -> Handler:
+    """
+    Import the handler `name` from `module` on first call, as handlers depend on qiskit.
+    """
+
+    def handler(
+        node: CompileRequest.EncodeValueNode, constraints: Constraints
+    ) -> list[EnrichmentResult]:
+        generate: Callable[
+            [CompileRequest.EncodeValueNode, Constraints],
+            EnrichmentResult | list[EnrichmentResult],
+        ] = getattr(import_module(module), name)
+        result = generate(node, constraints)
+        return result if isinstance(result, list) else [result]
+
+    return handler
+
+
 ENCODE_VALUE_HANDLERS: dict[str, Handler] = {
-    "amplitude": generate_amplitude_enrichment,
-    "matrix": generate_matrix_enrichment,
+    "amplitude": _lazy_handler(
+        "app.enricher.encode_value_handlers.amplitude", "generate_amplitude_enrichments"
+    ),
+    "matrix": _lazy_handler(
+        "app.enricher.encode_value_handlers.matrix", "generate_matrix_enrichment"
+    ),
 }
 
 
@@ -59,4 +81,4 @@ def try_generate_encode_value_handler(
             expected="array",
         )
 
-    return [handler(node, constraints)]
+    return handler(node, constraints)
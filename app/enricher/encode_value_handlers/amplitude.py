@@ -11,12 +11,14 @@ from qiskit.circuit.library import StatePreparation
 
 from app.enricher import Constraints, EnrichmentResult, ImplementationMetaData
 from app.enricher.exceptions import EncodingNotSupported
-from app.enricher.utils import implementation, leqo_output
+from app.enricher.universal_oracles import gate, multi_controlled_x
+from app.enricher.utils import circuit_depth, implementation, leqo_output
 from app.model import CompileRequest, data_types
 from app.model.exceptions import InputSizeMismatch, InputTypeMismatch
 
 MIN_AMPLITUDE_VALUES = 2
 DECOMPOSITION_PASSES = 4
+REGISTER_NAME = "encoded"
 
 
 def _get_array_length(array_type: data_types.ArrayType | ast.ArrayType) -> int:
@@ -60,10 +62,13 @@ def _coerce_amplitude_array_value(raw_value: Any) -> list[float]:
     return [float(actual_raw.value if hasattr(actual_raw, "value") else actual_raw)]
 
 
-def generate_amplitude_enrichment(
+def _amplitude_vector(
     node: CompileRequest.EncodeValueNode,
     constraints: Constraints,
-) -> EnrichmentResult:
+) -> np.ndarray:
+    """
+    Normalized amplitudes of the constant input, padded to the next power of two.
+    """
     requested_input = constraints.requested_inputs[0]
 
     if not isinstance(requested_input, (data_types.ArrayType, ast.ArrayType)):
@@ -119,9 +124,22 @@ def generate_amplitude_enrichment(
             expected=1,
         )
 
-    qreg = QuantumRegister(n_qubits, "encoded")
+    return vector
+
+
+def _state_preparation_statements(
+    vector: np.ndarray, n_qubits: int
+) -> tuple[list[ast.Statement | ast.Pragma], int]:
+    """
+    Prepare `vector` on the first qubits of a register of `n_qubits` with qiskit.
+
+    :return: The statements declaring the register and preparing the state, and their depth.
+    """
+    qreg = QuantumRegister(n_qubits, REGISTER_NAME)
     circuit = QuantumCircuit(qreg, name="amplitude_encoding")
-    circuit.append(StatePreparation(vector.astype(complex)), qreg)
+    if vector.size > 1:
+        qubits = qreg[: int(log2(int(vector.size)))]
+        circuit.append(StatePreparation(vector.astype(complex)), qubits)
 
     for _ in range(DECOMPOSITION_PASSES):
         circuit = circuit.decompose()
@@ -133,12 +151,134 @@ def generate_amplitude_enrichment(
     if not any(isinstance(statement, ast.Include) for statement in statements):
         statements.insert(0, ast.Include("stdgates.inc"))
 
-    statements.append(leqo_output("out", 0, ast.Identifier("encoded")))
+    return statements, circuit.depth()
+
+
+def _transposition(
+    register: ast.Identifier, a: int, b: int, n_qubits: int
+) -> list[ast.QuantumStatement]:
+    """
+    Swap the basis states ``|a⟩`` and ``|b⟩``, leaving all other basis states unchanged.
+
+    CX gates controlled by a qubit ``p`` in which `a` and `b` differ reduce them to states
+    differing in ``p`` only, which are swapped by an X on ``p`` controlled by all other qubits.
+    """
+
+    def qubit(index: int) -> ast.IndexedIdentifier:
+        return ast.IndexedIdentifier(register, [[ast.IntegerLiteral(index)]])
+
+    difference = a ^ b
+    pivot = (difference & -difference).bit_length() - 1
+    others = difference & ~(1 << pivot)
+    fan_out = [
+        gate("cx", qubit(pivot), qubit(i)) for i in range(n_qubits) if others >> i & 1
+    ]
+    # value of the controls after the fan-out, which flips `others` if `a` has the pivot set
+    common = a ^ others if a >> pivot & 1 else a
+    negated = [
+        gate("x", qubit(i))
+        for i in range(n_qubits)
+        if i != pivot and not common >> i & 1
+    ]
+    controls = [qubit(i) for i in range(n_qubits) if i != pivot]
+    return [
+        *fan_out,
+        *negated,
+        multi_controlled_x(controls, qubit(pivot)),
+        *negated,
+        *reversed(fan_out),
+    ]
+
+
+def _is_sparse(vector: np.ndarray) -> bool:
+    """
+    Whether the sparse preparation (``O(k * n)`` gates) is cheaper than the dense one (``O(2^n)``).
+    """
+    n_qubits = int(log2(int(vector.size)))
+    return int(np.count_nonzero(vector)) * n_qubits < vector.size
+
+
+def _dense_enrichment(
+    node: CompileRequest.EncodeValueNode, vector: np.ndarray
+) -> EnrichmentResult:
+    n_qubits = int(log2(int(vector.size)))
+    statements, depth = _state_preparation_statements(vector, n_qubits)
+    statements.append(leqo_output("out", 0, ast.Identifier(REGISTER_NAME)))
+
+    return EnrichmentResult(
+        implementation(node, statements),
+        ImplementationMetaData(width=n_qubits, depth=depth),
+    )
+
+
+def _sparse_enrichment(
+    node: CompileRequest.EncodeValueNode, vector: np.ndarray
+) -> EnrichmentResult:
+    """
+    Prepare a vector with ``k`` nonzero amplitudes using ``O(k * n)`` gates.
+
+    The nonzero amplitudes are first prepared densely on the lowest ``ceil(log2(k))`` qubits,
+    keeping those whose index is below ``k`` in place.
+    Every other amplitude is then moved to its index by a transposition of basis states.
+    """
+    n_qubits = int(log2(int(vector.size)))
+    support = np.flatnonzero(vector)
+    k = int(support.size)
+
+    in_place = support < k
+    slots = support.copy()
+    slots[~in_place] = np.setdiff1d(np.arange(k), support[in_place])
+    compact = np.zeros(1 << (k - 1).bit_length())
+    compact[slots] = vector[support]
+
+    statements, depth = _state_preparation_statements(compact, n_qubits)
+    register = ast.Identifier(REGISTER_NAME)
+    if k == 1:
+        # a single basis state (up to global phase) only needs X on its set bits
+        target = int(support[0])
+        permutation: list[ast.QuantumStatement] = [
+            gate("x", ast.IndexedIdentifier(register, [[ast.IntegerLiteral(i)]]))
+            for i in range(n_qubits)
+            if target >> i & 1
+        ]
+    else:
+        permutation = [
+            statement
+            for slot, target in zip(
+                slots[~in_place].tolist(), support[~in_place].tolist(), strict=True
+            )
+            for statement in _transposition(register, slot, target, n_qubits)
+        ]
+    statements.extend(permutation)
+    statements.append(leqo_output("out", 0, register))
 
     return EnrichmentResult(
         implementation(node, statements),
         ImplementationMetaData(
-            width=n_qubits,
-            depth=circuit.depth(),
+            width=n_qubits, depth=depth + circuit_depth(permutation)
         ),
     )
+
+
+def generate_amplitude_enrichment(
+    node: CompileRequest.EncodeValueNode,
+    constraints: Constraints,
+) -> EnrichmentResult:
+    """
+    Prepare the constant input vector densely via qiskit's state preparation.
+    """
+    return _dense_enrichment(node, _amplitude_vector(node, constraints))
+
+
+def generate_amplitude_enrichments(
+    node: CompileRequest.EncodeValueNode,
+    constraints: Constraints,
+) -> list[EnrichmentResult]:
+    """
+    Prepare the constant input vector densely and, if few amplitudes are nonzero, sparsely.
+    """
+    vector = _amplitude_vector(node, constraints)
+    results = [_dense_enrichment(node, vector)]
+    if _is_sparse(vector):
+        results.append(_sparse_enrichment(node, vector))
+    return results
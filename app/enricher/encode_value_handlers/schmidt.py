@@ -0,0 +1,86 @@
+from typing import Any
+
+import numpy as np
+import openqasm3
+from openqasm3 import ast
+from qiskit import qasm3, transpile
+from qiskit.circuit import QuantumCircuit, QuantumRegister
+from qiskit.circuit.library import Isometry, StatePreparation
+
+from app.enricher import EnrichmentResult, ImplementationMetaData
+from app.enricher.schmidt_decomposition import (
+    DEFAULT_TOLERANCE,
+    coerce_state_vector,
+    schmidt_svd,
+)
+from app.enricher.utils import implementation, leqo_output
+from app.model import CompileRequest
+
+BASIS_GATES = ["u", "cx"]
+
+
+def _apply_isometry(
+    circuit: QuantumCircuit, isometry: np.ndarray, qubits: list[Any]
+) -> None:
+    if qubits:
+        circuit.append(Isometry(isometry, 0, 0), qubits)
+
+
+def generate_schmidt_enrichment(
+    node: CompileRequest.EncodeValueNode,
+    raw_state_vector: Any,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> EnrichmentResult:
+    """
+    Prepare a constant state vector via its Schmidt decomposition.
+
+    The qubits are split in a lower half B and an upper half A, giving
+    ``|psi> = sum_i s_i |u_i>_A |v_i>_B`` with Schmidt rank ``r`` after truncating
+    coefficients below `tolerance`.
+    The coefficients are prepared on the lowest ``ceil(log2(r))`` qubits of B,
+    copied to A by CX gates and then mapped to ``|u_i>`` and ``|v_i>`` by two isometries.
+    For weakly entangled states this is much shallower than a dense state preparation.
+
+    :param node: The encode value node to enrich.
+    :param raw_state_vector: Constant input, coerced by :func:`coerce_state_vector`.
+    :param tolerance: Schmidt coefficients up to this value are dropped.
+    """
+    vector = coerce_state_vector(raw_state_vector)
+    n_qubits = int(vector.size).bit_length() - 1
+    n_lower = n_qubits // 2
+
+    u_matrix, coefficients, vh_matrix = schmidt_svd(vector, list(range(n_lower)))
+    rank = int(np.count_nonzero(coefficients > tolerance))
+    rank_qubits = (rank - 1).bit_length()
+    truncated = np.zeros(1 << rank_qubits)
+    truncated[:rank] = coefficients[:rank] / np.linalg.norm(coefficients[:rank])
+
+    qreg = QuantumRegister(n_qubits, "encoded")
+    lower, upper = list(qreg[:n_lower]), list(qreg[n_lower:])
+    circuit = QuantumCircuit(qreg, name="schmidt_encoding")
+    if rank_qubits > 0:
+        circuit.append(StatePreparation(truncated.astype(complex)), lower[:rank_qubits])
+        for source, target in zip(lower[:rank_qubits], upper, strict=False):
+            circuit.cx(source, target)
+    _apply_isometry(circuit, vh_matrix[: 1 << rank_qubits].T, lower)
+    _apply_isometry(circuit, u_matrix[:, : 1 << rank_qubits], upper)
+
+    # isometries decompose into nested non-gate instructions, which can't be exported
+    circuit = transpile(circuit, basis_gates=BASIS_GATES, optimization_level=1)
+
+    qasm_text = qasm3.dumps(circuit)
+    program = openqasm3.parse(qasm_text)
+    statements = list(program.statements)
+
+    if not any(isinstance(statement, ast.Include) for statement in statements):
+        statements.insert(0, ast.Include("stdgates.inc"))
+
+    statements.append(leqo_output("out", 0, ast.Identifier("encoded")))
+
+    return EnrichmentResult(
+        implementation(node, statements),
+        ImplementationMetaData(
+            width=n_qubits,
+            depth=circuit.depth(),
+        ),
+    )
@@ -0,0 +1,125 @@
+"""
+Direct constructions of W and GHZ states as OpenQASM statements.
+
+The circuits are built from the gate structure of the states instead of an amplitude vector,
+so they need ``O(n)`` gates and no ``2^n`` sized intermediate data.
+"""
+
+import math
+
+from openqasm3.ast import (
+    Expression,
+    FloatLiteral,
+    Identifier,
+    IndexedIdentifier,
+    IntegerLiteral,
+    QuantumGate,
+    QuantumStatement,
+)
+
+
+def _gate(
+    name: str,
+    register: Identifier,
+    *indices: int,
+    arguments: list[Expression] | None = None,
+) -> QuantumGate:
+    return QuantumGate(
+        modifiers=[],
+        name=Identifier(name),
+        arguments=[] if arguments is None else arguments,
+        qubits=[IndexedIdentifier(register, [[IntegerLiteral(i)]]) for i in indices],
+        duration=None,
+    )
+
+
+def w_state(
+    register: Identifier, size: int, *, log_depth: bool = False
+) -> list[QuantumStatement]:
+    """
+    Prepare the W state ``(|10..0⟩ + |01..0⟩ + ... + |00..1⟩) / sqrt(size)``.
+
+    The excitation starts on the first qubit of the register.
+    A block of qubits carrying the excitation on its first qubit is split in two
+    by a controlled RY moving the excitation to the first qubit of the second part
+    with the probability of that part, followed by a CX clearing the first qubit again.
+    Both parts are then split independently.
+
+    * The linear cascade splits off one qubit at a time (depth ``2 * (size - 1) + 1``).
+    * The log-depth variant halves the blocks, splitting all blocks of a layer in parallel
+      (depth ``2 * ceil(log2(size)) + 1``).
+
+    Both variants use ``size - 1`` controlled RY and CX gates.
+
+    :param register: Register of at least `size` qubits in the zero state.
+    :param size: Number of qubits sharing the excitation.
+    :param log_depth: Whether to split the blocks in halves.
+    """
+
+    statements: list[QuantumStatement] = [_gate("x", register, 0)]
+    blocks = [(0, size)]
+    while blocks:
+        next_blocks = []
+        for start, length in blocks:
+            if length < 2:  # noqa: PLR2004 A single qubit holds the excitation
+                continue
+            head = (length + 1) // 2 if log_depth else 1
+            probability = (length - head) / length
+            theta = 2 * math.asin(math.sqrt(probability))
+            statements.append(
+                _gate(
+                    "cry",
+                    register,
+                    start,
+                    start + head,
+                    arguments=[FloatLiteral(theta)],
+                )
+            )
+            statements.append(_gate("cx", register, start + head, start))
+            next_blocks.extend([(start, head), (start + head, length - head)])
+        blocks = next_blocks
+    return statements
+
+
+def ghz_state(register: Identifier, size: int) -> list[QuantumStatement]:
+    """
+    Prepare the GHZ state ``(|0..0⟩ + |1..1⟩) / sqrt(2)``.
+
+    After a Hadamard on the first qubit, every qubit already entangled copies itself
+    to one further qubit per layer, doubling the entangled qubits with each layer
+    (depth ``ceil(log2(size)) + 1`` with ``size - 1`` CX gates).
+
+    :param register: Register of at least `size` qubits in the zero state.
+    :param size: Number of qubits to entangle.
+    """
+
+    statements: list[QuantumStatement] = [_gate("h", register, 0)]
+    entangled = 1
+    while entangled < size:
+        statements.extend(
+            _gate("cx", register, source, source + entangled)
+            for source in range(min(entangled, size - entangled))
+        )
+        entangled *= 2
+    return statements
+
+
+def entangled_state_variants(
+    register: Identifier, quantum_state: str, size: int
+) -> list[list[QuantumStatement]]:
+    """
+    All constructions of a W or GHZ state, to be offered as competing implementations.
+
+    W states are built by the linear cascade and, if it differs, the log-depth variant.
+    Both use the same gates, but their depth differs.
+
+    :param register: Register of at least `size` qubits in the zero state.
+    :param quantum_state: Either ``"w"`` or ``"ghz"``.
+    :param size: Number of qubits of the state.
+    """
+
+    if quantum_state == "ghz":
+        return [ghz_state(register, size)]
+    if size <= 2:  # noqa: PLR2004 Halving a block of two splits off a single qubit
+        return [w_state(register, size)]
+    return [w_state(register, size), w_state(register, size, log_depth=True)]
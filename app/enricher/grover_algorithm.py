@@ -2,15 +2,15 @@ import math
 from typing import override
 
 from openqasm3.ast import (
-    GateModifierName,
+    ForInLoop,
     Identifier,
     Include,
     IndexedIdentifier,
     IntegerLiteral,
-    QuantumGate,
-    QuantumGateModifier,
     QubitDeclaration,
+    RangeDefinition,
     Statement,
+    UintType,
 )
 
 from app.enricher import (
@@ -19,14 +19,34 @@ from app.enricher import (
     EnrichmentResult,
     ImplementationMetaData,
 )
-from app.enricher.utils import implementation, leqo_output
+from app.enricher.universal_oracles import (
+    declare_ancillas,
+    diffuser,
+    gate,
+    gate_definition,
+    oracle,
+    release_ancillas,
+    v_chain_ancillas,
+)
+from app.enricher.utils import circuit_depth, implementation, leqo_output
 from app.model.CompileRequest import GroverNode
 from app.model.CompileRequest import Node as FrontendNode
+from app.openqasm3.clone import clone
+
+MAX_UNROLLED_STATEMENTS = 64
+"""Larger Grover loops define the oracle and diffuser as gates and call them in a loop."""
 
-MAX_STANDARD_CONTROLS = 2
+ORACLE_GATE = "grover_oracle"
+DIFFUSER_GATE = "grover_diffuser"
 
 
 class GroverAlgorithmEnricherStrategy(EnricherStrategy):
+    """
+    Enrich :class:`~app.model.CompileRequest.GroverNode` with a complete Grover search,
+    additionally using V-chains on clean ancillas for the multi-controlled Z gates
+    of more than three qubits.
+    """
+
     @override
     def _enrich_impl(
         self, node: FrontendNode, constraints: Constraints | None
@@ -34,6 +54,14 @@ class GroverAlgorithmEnricherStrategy(EnricherStrategy):
         if not isinstance(node, GroverNode):
             return []
 
+        results = [self._enrich_with_ancillas(node, 0)]
+        if (num_ancillas := v_chain_ancillas(node.numQubits - 1)) > 0:
+            results.append(self._enrich_with_ancillas(node, num_ancillas))
+        return results
+
+    def _enrich_with_ancillas(
+        self, node: GroverNode, num_ancillas: int
+    ) -> EnrichmentResult:
         n = node.numQubits
         M = len(node.targetStates)
         N = 1 << n
@@ -51,184 +79,58 @@ class GroverAlgorithmEnricherStrategy(EnricherStrategy):
 
         q_reg = Identifier("query")
         statements.append(QubitDeclaration(q_reg, IntegerLiteral(n)))
+        ancillas = declare_ancillas(statements, num_ancillas)
 
         all_qubits = [IndexedIdentifier(q_reg, [[IntegerLiteral(i)]]) for i in range(n)]
-        target_idx = [all_qubits[-1]]
-        controls = all_qubits[:-1]
-
-        # mcx replacement
-        if len(controls) == 1:
-            gate_name = "cx"
-            gate_modifiers = []
-        elif len(controls) == MAX_STANDARD_CONTROLS:
-            gate_name = "ccx"
-            gate_modifiers = []
-        else:
-            gate_name = "x"
-            gate_modifiers = [
-                QuantumGateModifier(
-                    GateModifierName.ctrl, IntegerLiteral(len(controls))
-                )
-            ]
 
         # STEP 1: Initialization
-        statements.extend(
-            [
-                QuantumGate(
-                    modifiers=[],
-                    name=Identifier("h"),
-                    arguments=[],
-                    qubits=[q],
-                    duration=None,
-                )
-                for q in all_qubits
-            ]
-        )
+        initialization = [gate("h", q) for q in all_qubits]
+        statements.extend(initialization)
 
         # STEP 2: The Grover Loop (Oracle + Diffuser)
-        for _ in range(iterations):
-            # --- 2A. The Universal Oracle (Phase Mode) ---
-            for target_val in node.targetStates:
-                bin_str = format(target_val, f"0{n}b")[::-1]
-
-                # Apply X to '0' bits
-                statements.extend(
-                    [
-                        QuantumGate(
-                            modifiers=[],
-                            name=Identifier("x"),
-                            arguments=[],
-                            qubits=[all_qubits[q]],
-                            duration=None,
-                        )
-                        for q, val in enumerate(bin_str)
-                        if val == "0"
-                    ]
-                )
-
-                # Apply MCZ
-                statements.extend(
-                    [
-                        QuantumGate(
-                            modifiers=[],
-                            name=Identifier("h"),
-                            arguments=[],
-                            qubits=target_idx,
-                            duration=None,
-                        ),
-                        QuantumGate(
-                            modifiers=gate_modifiers,
-                            name=Identifier(gate_name),
-                            arguments=[],
-                            qubits=[*controls, *target_idx],
-                            duration=None,
-                        ),
-                        QuantumGate(
-                            modifiers=[],
-                            name=Identifier("h"),
-                            arguments=[],
-                            qubits=target_idx,
-                            duration=None,
-                        ),
-                    ]
-                )
-
-                # Undo X on '0' bits
-                statements.extend(
-                    [
-                        QuantumGate(
-                            modifiers=[],
-                            name=Identifier("x"),
-                            arguments=[],
-                            qubits=[all_qubits[q]],
-                            duration=None,
-                        )
-                        for q, val in enumerate(bin_str)
-                        if val == "0"
-                    ]
-                )
-
-            # --- 2B. The Grover Diffuser ---
-            statements.extend(
-                [
-                    QuantumGate(
-                        modifiers=[],
-                        name=Identifier("h"),
-                        arguments=[],
-                        qubits=[q],
-                        duration=None,
-                    )
-                    for q in all_qubits
-                ]
-            )
-            statements.extend(
-                [
-                    QuantumGate(
-                        modifiers=[],
-                        name=Identifier("x"),
-                        arguments=[],
-                        qubits=[q],
-                        duration=None,
-                    )
-                    for q in all_qubits
-                ]
-            )
-            statements.extend(
-                [
-                    QuantumGate(
-                        modifiers=[],
-                        name=Identifier("h"),
-                        arguments=[],
-                        qubits=target_idx,
-                        duration=None,
-                    ),
-                    QuantumGate(
-                        modifiers=gate_modifiers,
-                        name=Identifier(gate_name),
-                        arguments=[],
-                        qubits=[*controls, *target_idx],
-                        duration=None,
-                    ),
-                    QuantumGate(
-                        modifiers=[],
-                        name=Identifier("h"),
-                        arguments=[],
-                        qubits=target_idx,
-                        duration=None,
+        iteration = [
+            *oracle(all_qubits, node.targetStates, ancillas=ancillas),
+            *diffuser(all_qubits, ancillas),
+        ]
+        if iterations * len(iteration) <= MAX_UNROLLED_STATEMENTS:
+            for _ in range(iterations):
+                statements.extend(clone(iteration))
+        else:
+            statements[1:1] = [
+                gate_definition(
+                    ORACLE_GATE,
+                    n + num_ancillas,
+                    lambda qs: oracle(qs[:n], node.targetStates, ancillas=qs[n:]),
+                ),
+                gate_definition(
+                    DIFFUSER_GATE,
+                    n + num_ancillas,
+                    lambda qs: diffuser(qs[:n], qs[n:]),
+                ),
+            ]
+            statements.append(
+                ForInLoop(
+                    type=UintType(None),
+                    identifier=Identifier("iteration"),
+                    set_declaration=RangeDefinition(
+                        IntegerLiteral(0), IntegerLiteral(iterations - 1), None
                     ),
-                ]
-            )
-            statements.extend(
-                [
-                    QuantumGate(
-                        modifiers=[],
-                        name=Identifier("x"),
-                        arguments=[],
-                        qubits=[q],
-                        duration=None,
-                    )
-                    for q in all_qubits
-                ]
-            )
-            statements.extend(
-                [
-                    QuantumGate(
-                        modifiers=[],
-                        name=Identifier("h"),
-                        arguments=[],
-                        qubits=[q],
-                        duration=None,
-                    )
-                    for q in all_qubits
-                ]
+                    block=[
+                        gate(ORACLE_GATE, *all_qubits, *ancillas),
+                        gate(DIFFUSER_GATE, *all_qubits, *ancillas),
+                    ],
+                )
             )
 
         # STEP 3: Export the result
+        release_ancillas(statements, num_ancillas)
         statements.append(leqo_output("out", 0, q_reg))
 
-        return [
-            EnrichmentResult(
-                implementation(node, statements),
-                ImplementationMetaData(width=n, depth=None),
-            )
-        ]
+        return EnrichmentResult(
+            implementation(node, statements),
+            ImplementationMetaData(
+                width=n + num_ancillas,
+                depth=circuit_depth(initialization)
+                + iterations * circuit_depth(iteration),
+            ),
+        )
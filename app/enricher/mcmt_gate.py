@@ -20,12 +20,25 @@ from app.enricher import (
     EnrichmentResult,
     ImplementationMetaData,
 )
-from app.enricher.utils import implementation, leqo_output
+from app.enricher.universal_oracles import (
+    MAX_STANDARD_CONTROLS,
+    Qubit,
+    declare_ancillas,
+    gate,
+    release_ancillas,
+)
+from app.enricher.utils import circuit_depth, implementation, leqo_output
 from app.model.CompileRequest import MCMTGateNode
 from app.model.CompileRequest import Node as FrontendNode
+from app.openqasm3.clone import clone
 
 
 class MCMTGateEnricherStrategy(EnricherStrategy):
+    """
+    Enrich :class:`~app.model.CompileRequest.MCMTGateNode` with multi-controlled gates,
+    and additionally with a V-chain on clean ancillas for more than two controls.
+    """
+
     @override
     def _enrich_impl(
         self, node: FrontendNode, constraints: Constraints | None
@@ -74,42 +87,67 @@ class MCMTGateEnricherStrategy(EnricherStrategy):
                 else:
                     targets_flat.append(indexed_id)
 
-        # 2. Prepare the gate arguments and modifiers
+        # 2. Prepare the gate arguments
         gate_name_lower = node.baseGate.lower().split("(")[0]
         args = []
         if node.parameter is not None and node.baseGate in {"rx", "ry", "rz"}:
             args.append(FloatLiteral(node.parameter))
 
-        modifiers = [
-            QuantumGateModifier(
-                modifier=GateModifierName.ctrl,
-                argument=IntegerLiteral(len(controls_flat)),
+        def controlled_gate(controls: list[Qubit], target: Qubit) -> QuantumGate:
+            return QuantumGate(
+                modifiers=[
+                    QuantumGateModifier(
+                        modifier=GateModifierName.ctrl,
+                        argument=IntegerLiteral(len(controls)),
+                    )
+                ],
+                name=Identifier(gate_name_lower),
+                arguments=clone(args),
+                qubits=[*controls, target],
+                duration=None,
             )
-        ]
 
-        # 3. Apply the Multi-Controlled gate to EACH flattened target sequentially
-        statements.extend(
+        # 3a. Apply the Multi-Controlled gate to EACH flattened target sequentially
+        results = [
             [
-                QuantumGate(
-                    modifiers=modifiers,
-                    name=Identifier(gate_name_lower),
-                    arguments=args,
-                    qubits=[*controls_flat, target_qubit],
-                    duration=None,
-                )
-                for target_qubit in targets_flat
+                *statements,
+                *(controlled_gate(controls_flat, target) for target in targets_flat),
             ]
-        )
+        ]
+
+        # 3b. V-chain: compute the conjunction of the controls once into clean ancillas,
+        # control each target by it and uncompute, leaving the ancillas reusable
+        if len(controls_flat) > MAX_STANDARD_CONTROLS:
+            v_chain = list(statements)
+            ancillas = declare_ancillas(v_chain, len(controls_flat) - 1)
+            conjunction = [gate("ccx", *controls_flat[:2], ancillas[0])]
+            conjunction.extend(
+                gate("ccx", control, ancillas[i], ancillas[i + 1])
+                for i, control in enumerate(controls_flat[2:])
+            )
+            v_chain.extend(conjunction)
+            v_chain.extend(
+                controlled_gate([ancillas[-1]], target) for target in targets_flat
+            )
+            v_chain.extend(reversed(clone(conjunction)))
+            release_ancillas(v_chain, len(ancillas))
+            results.append(v_chain)
 
         # 4. Declare the outputs to pass the wires forward
+        outputs = []
         for i in range(total_qubits):
             is_ctrl = i < c
             reg_name = f"ctrl_{i}" if is_ctrl else f"target_{i - c}"
-            statements.append(leqo_output(f"out_{i}", i, Identifier(reg_name)))
+            outputs.append(leqo_output(f"out_{i}", i, Identifier(reg_name)))
 
+        num_qubits = len(controls_flat) + len(targets_flat)
         return [
             EnrichmentResult(
-                implementation(node, statements),
-                ImplementationMetaData(width=total_qubits, depth=len(targets_flat)),
+                implementation(node, [*result, *outputs]),
+                ImplementationMetaData(
+                    width=num_qubits + (len(controls_flat) - 1 if index else 0),
+                    depth=circuit_depth(result),
+                ),
             )
+            for index, result in enumerate(results)
         ]
@@ -4,10 +4,12 @@ Provides enricher strategy for enriching :class:`~app.model.CompileRequest.Opera
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import reduce
 from typing import cast, override
 
 from openqasm3.ast import (
     Annotation,
+    Concatenation,
     Identifier,
     Include,
     IndexedIdentifier,
@@ -21,11 +23,24 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import aliased, selectinload
 
 from app.enricher import Constraints, EnrichmentResult, ImplementationMetaData
+from app.enricher.adders import (
+    Qubit,
+    carry_lookahead_adder,
+    cuccaro_adder,
+    draper_adder,
+    lookahead_ancillas,
+)
 from app.enricher.db_enricher import DataBaseEnricherStrategy
 from app.enricher.exceptions import NoImplementationFound
 from app.enricher.models import BaseNode, Input, InputType, NodeType, OperatorType
 from app.enricher.models import OperatorNode as OperatorNodeTable
-from app.enricher.utils import implementation, leqo_input, leqo_output
+from app.enricher.utils import (
+    circuit_depth,
+    implementation,
+    leqo_input,
+    leqo_output,
+    leqo_reusable,
+)
 from app.model.CompileRequest import ImplementationNode, OperatorNode
 from app.model.CompileRequest import Node as FrontendNode
 from app.model.data_types import LeqoSupportedType, QubitType
@@ -34,6 +49,7 @@ from app.model.exceptions import (
     InputSizeMismatch,
     InputTypeMismatch,
 )
+from app.openqasm3.clone import clone
 
 _BINARY_OPERATOR_INPUT_COUNT = 2
 _BITWISE_AND_DEPTH = 1
@@ -54,6 +70,19 @@ class _AdditionOperand:
     signed: bool
 
 
+_AdderBuilder = Callable[
+    [list[Statement], _AdditionOperand, _AdditionOperand, int, bool],
+    tuple[list[Statement], list[Identifier], list[str]],
+]
+"""
+Generates the gates of an adder architecture adding `source` to `target`
+(or subtracting it) on ``size + 1`` bits.
+Declarations are appended to the given statements.
+Returns the gates, the registers forming the output and the registers
+returned to the zero state.
+"""
+
+
 class OperatorEnricherStrategy(DataBaseEnricherStrategy):
     """
     Strategy capable of enriching :class:`~app.model.CompileRequest.OperatorNode`.
@@ -191,7 +220,7 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
 
         if constraints is not None:
             try:
-                return [self._generate_addition_enrichment(node, constraints)]
+                return self._generate_addition_enrichments(node, constraints)
             except (InputCountMismatch, InputTypeMismatch):
                 raise
             except Exception as exc:  # pragma: no cover - defensive fallback
@@ -225,7 +254,7 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
                 expected=2,
             )
 
-        return [self._generate_addition_enrichment(node, constraints)]
+        return self._generate_addition_enrichments(node, constraints)
 
     async def _enrich_subtraction_operator(
         self,
@@ -236,7 +265,7 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
 
         if constraints is not None:
             try:
-                return [self._generate_subtraction_enrichment(node, constraints)]
+                return self._generate_subtraction_enrichments(node, constraints)
             except (InputCountMismatch, InputTypeMismatch):
                 raise
             except Exception as exc:  # pragma: no cover - defensive fallback
@@ -270,7 +299,7 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
                 expected=2,
             )
 
-        return [self._generate_subtraction_enrichment(node, constraints)]
+        return self._generate_subtraction_enrichments(node, constraints)
 
     async def _enrich_single_qubit_binary_operator(
         self,
@@ -310,35 +339,94 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
 
         return [generator(node, constraints)]
 
-    def _generate_addition_enrichment(
-        self, node: OperatorNode, constraints: Constraints
-    ) -> EnrichmentResult:
+    def _build_operands(
+        self,
+        node: OperatorNode,
+        constraints: Constraints,
+        names: tuple[str, str],
+    ) -> tuple[_AdditionOperand, _AdditionOperand]:
         requested_inputs = constraints.requested_inputs
         self._check_constraints(node, requested_inputs)
 
         lhs = cast(QubitType, requested_inputs[0])
         rhs = cast(QubitType, requested_inputs[1])
 
-        addend0 = _AdditionOperand(
-            name="addend0",
-            index=0,
-            declared_size=lhs.size,
-            effective_size=lhs.size or 1,
-            signed=lhs.signed,
+        return (
+            _AdditionOperand(
+                name=names[0],
+                index=0,
+                declared_size=lhs.size,
+                effective_size=lhs.size or 1,
+                signed=lhs.signed,
+            ),
+            _AdditionOperand(
+                name=names[1],
+                index=1,
+                declared_size=rhs.size,
+                effective_size=rhs.size or 1,
+                signed=rhs.signed,
+            ),
         )
-        addend1 = _AdditionOperand(
-            name="addend1",
-            index=1,
-            declared_size=rhs.size,
-            effective_size=rhs.size or 1,
-            signed=rhs.signed,
+
+    def _generate_addition_enrichments(
+        self, node: OperatorNode, constraints: Constraints
+    ) -> list[EnrichmentResult]:
+        """
+        Generate the ripple-carry adder along with the Cuccaro, Draper and
+        carry-lookahead adders, which trade width against depth differently.
+        """
+
+        addend0, addend1 = self._build_operands(
+            node, constraints, ("addend0", "addend1")
+        )
+        # the longer addend holds the sum if it is computed in place
+        if addend0.effective_size > addend1.effective_size:
+            target, source = addend0, addend1
+        else:
+            target, source = addend1, addend0
+
+        return [
+            self._generate_addition_enrichment(node, constraints),
+            *(
+                self._generate_adder_enrichment(
+                    node, build, target=target, source=source, subtract=False
+                )
+                for build in self._adder_builders()
+            ),
+        ]
+
+    def _generate_subtraction_enrichments(
+        self, node: OperatorNode, constraints: Constraints
+    ) -> list[EnrichmentResult]:
+        """
+        Generate the two's complement subtractor along with subtractors based on
+        the Cuccaro, Draper and carry-lookahead adders.
+        """
+
+        minuend, subtrahend = self._build_operands(
+            node, constraints, ("minuend", "subtrahend")
+        )
+        return [
+            self._generate_subtraction_enrichment(node, constraints),
+            *(
+                self._generate_adder_enrichment(
+                    node, build, target=minuend, source=subtrahend, subtract=True
+                )
+                for build in self._adder_builders()
+            ),
+        ]
+
+    def _generate_addition_enrichment(
+        self, node: OperatorNode, constraints: Constraints
+    ) -> EnrichmentResult:
+        addend0, addend1 = self._build_operands(
+            node, constraints, ("addend0", "addend1")
         )
 
         (
             statements,
             result_size,
             carry_count,
-            depth,
         ) = self._build_addition_statements(
             addend0=addend0,
             addend1=addend1,
@@ -350,31 +438,14 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
         )
         return EnrichmentResult(
             enriched_node,
-            ImplementationMetaData(width=width, depth=depth),
+            ImplementationMetaData(width=width, depth=circuit_depth(statements)),
         )
 
     def _generate_subtraction_enrichment(
         self, node: OperatorNode, constraints: Constraints
     ) -> EnrichmentResult:
-        requested_inputs = constraints.requested_inputs
-        self._check_constraints(node, requested_inputs)
-
-        lhs = cast(QubitType, requested_inputs[0])
-        rhs = cast(QubitType, requested_inputs[1])
-
-        minuend = _AdditionOperand(
-            name="minuend",
-            index=0,
-            declared_size=lhs.size,
-            effective_size=lhs.size or 1,
-            signed=lhs.signed,
-        )
-        subtrahend = _AdditionOperand(
-            name="subtrahend",
-            index=1,
-            declared_size=rhs.size,
-            effective_size=rhs.size or 1,
-            signed=rhs.signed,
+        minuend, subtrahend = self._build_operands(
+            node, constraints, ("minuend", "subtrahend")
         )
 
         (
@@ -382,7 +453,6 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
             result_size,
             complement_count,
             carry_count,
-            depth,
         ) = self._build_subtraction_statements(
             minuend=minuend,
             subtrahend=subtrahend,
@@ -399,7 +469,7 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
         )
         return EnrichmentResult(
             enriched_node,
-            ImplementationMetaData(width=width, depth=depth),
+            ImplementationMetaData(width=width, depth=circuit_depth(statements)),
         )
 
     def _generate_equality_enrichment(
@@ -879,7 +949,7 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
         *,
         addend0: _AdditionOperand,
         addend1: _AdditionOperand,
-    ) -> tuple[list[Statement], int, int, int]:
+    ) -> tuple[list[Statement], int, int]:
         signed_addition = addend0.signed or addend1.signed
         max_operand_bits = max(addend0.effective_size, addend1.effective_size)
         iteration_bits = max_operand_bits + (1 if signed_addition else 0)
@@ -937,7 +1007,6 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
         ]
 
         gate_statements: list[Statement] = []
-        depth = 0
 
         for index in range(iteration_bits):
             addend0_bit = self._select_operand_bit(addend0, addend0_bits, index)
@@ -951,15 +1020,15 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
                 index,
             )
 
-            round_statements, round_depth = self._build_addition_round(
-                addend0_bit=addend0_bit,
-                addend1_bit=addend1_bit,
-                result_bit=result_bit,
-                carry_in=carry_in,
-                carry_out=carry_out,
+            gate_statements.extend(
+                self._build_addition_round(
+                    addend0_bit=addend0_bit,
+                    addend1_bit=addend1_bit,
+                    result_bit=result_bit,
+                    carry_in=carry_in,
+                    carry_out=carry_out,
+                )
             )
-            gate_statements.extend(round_statements)
-            depth += round_depth
 
         statements.extend(gate_statements)
         output_alias = leqo_output("out", 0, Identifier("sum"))
@@ -967,14 +1036,14 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
             output_alias.annotations.append(Annotation("leqo.twos_complement", "true"))
         statements.append(output_alias)
 
-        return statements, result_size, carry_count, depth
+        return statements, result_size, carry_count
 
     def _build_subtraction_statements(
         self,
         *,
         minuend: _AdditionOperand,
         subtrahend: _AdditionOperand,
-    ) -> tuple[list[Statement], int, int, int, int]:
+    ) -> tuple[list[Statement], int, int, int]:
         max_operand_bits = max(minuend.effective_size, subtrahend.effective_size)
         iteration_bits = max_operand_bits + 1
         result_size = iteration_bits
@@ -1042,19 +1111,7 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
         ]
         one_bit = self._qubit_reference("one", 0)
 
-        gate_statements: list[Statement] = []
-        depth = 0
-
-        gate_statements.append(
-            QuantumGate(
-                modifiers=[],
-                name=Identifier("x"),
-                arguments=[],
-                qubits=[one_bit],
-                duration=None,
-            )
-        )
-        depth += 1
+        gate_statements: list[Statement] = [self._x_gate(one_bit)]
 
         for index in range(iteration_bits):
             complement_bit = complement_bits[index]
@@ -1064,20 +1121,10 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
                 index,
             )
 
-            gate_statements.append(
-                QuantumGate(
-                    modifiers=[],
-                    name=Identifier("x"),
-                    arguments=[],
-                    qubits=[complement_bit],
-                    duration=None,
-                )
-            )
-            depth += 1
+            gate_statements.append(self._x_gate(complement_bit))
 
             if subtrahend_bit is not None:
                 gate_statements.append(self._cx_gate(subtrahend_bit, complement_bit))
-                depth += 1
 
         for index in range(iteration_bits):
             minuend_bit = self._select_operand_bit(minuend, minuend_bits, index)
@@ -1086,22 +1133,301 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
             carry_in = one_bit if index == 0 else carry_bits[index - 1]
             carry_out = carry_bits[index] if index < carry_count else None
 
-            round_statements, round_depth = self._build_addition_round(
-                addend0_bit=minuend_bit,
-                addend1_bit=complement_bit,
-                result_bit=result_bit,
-                carry_in=carry_in,
-                carry_out=carry_out,
+            gate_statements.extend(
+                self._build_addition_round(
+                    addend0_bit=minuend_bit,
+                    addend1_bit=complement_bit,
+                    result_bit=result_bit,
+                    carry_in=carry_in,
+                    carry_out=carry_out,
+                )
             )
-            gate_statements.extend(round_statements)
-            depth += round_depth
 
         statements.extend(gate_statements)
         output_alias = leqo_output("out", 0, Identifier("difference"))
         output_alias.annotations.append(Annotation("leqo.twos_complement", "true"))
         statements.append(output_alias)
 
-        return statements, result_size, complement_count, carry_count, depth
+        return statements, result_size, complement_count, carry_count
+
+    def _adder_builders(self) -> tuple[_AdderBuilder, ...]:
+        return (
+            self._build_cuccaro_gates,
+            self._build_draper_gates,
+            self._build_lookahead_gates,
+        )
+
+    def _generate_adder_enrichment(
+        self,
+        node: OperatorNode,
+        build: _AdderBuilder,
+        *,
+        target: _AdditionOperand,
+        source: _AdditionOperand,
+        subtract: bool,
+    ) -> EnrichmentResult:
+        """
+        Generate ``target + source`` or ``target - source`` on ``max_size + 1`` bits.
+
+        Like the ripple-carry circuits, signed operands are sign extended
+        and the result is two's complement if any operand is signed.
+
+        :param build: Generates the gates of the adder architecture.
+        :param target: Operand the result is computed on if the adder works in place.
+        :param source: The other operand.
+        :param subtract: Whether to subtract `source` from `target`.
+        """
+
+        size = max(target.effective_size, source.effective_size)
+        statements: list[Statement] = [Include("stdgates.inc")]
+        statements.extend(
+            leqo_input(
+                operand.name,
+                operand.index,
+                operand.declared_size,
+                twos_complement=operand.signed,
+            )
+            for operand in sorted((target, source), key=lambda op: op.index)
+        )
+
+        gates, output, reusable = build(statements, target, source, size, subtract)
+
+        width = sum(
+            statement.size.value if isinstance(statement.size, IntegerLiteral) else 1
+            for statement in statements
+            if isinstance(statement, QubitDeclaration)
+        )
+        depth = circuit_depth(gates)
+
+        statements.extend(gates)
+        statements.extend(
+            leqo_reusable(f"{name}_reusable", Identifier(name)) for name in reusable
+        )
+        output_alias = leqo_output(
+            "out", 0, reduce(Concatenation, output[1:], output[0])
+        )
+        if subtract or target.signed or source.signed:
+            output_alias.annotations.append(Annotation("leqo.twos_complement", "true"))
+        statements.append(output_alias)
+
+        return EnrichmentResult(
+            implementation(node, statements),
+            ImplementationMetaData(width=width, depth=depth),
+        )
+
+    def _build_cuccaro_gates(
+        self,
+        statements: list[Statement],
+        target: _AdditionOperand,
+        source: _AdditionOperand,
+        size: int,
+        subtract: bool,
+    ) -> tuple[list[Statement], list[Identifier], list[str]]:
+        """
+        In-place Cuccaro adder, the target is extended by a carry qubit.
+
+        Subtraction uses ``a - b = ~(~a + b)``.
+        Needs a single ancilla besides the extension of the shorter operand.
+        """
+
+        target_bits, target_copies = self._extend_operand(statements, target, size)
+        source_bits, source_copies = self._extend_operand(statements, source, size)
+        carry = self._declare_qubit(statements, "carry")
+        ancilla = self._declare_qubit(statements, "ancilla")
+
+        gates: list[Statement] = [*target_copies, *source_copies]
+        if subtract:
+            gates.extend(self._x_gate(bit) for bit in target_bits)
+        gates.extend(
+            self._extension_bit_gates(target, source, carry, complement=subtract)
+        )
+        gates.extend(cuccaro_adder(source_bits, target_bits, ancilla, carry))
+        if subtract:
+            gates.extend(self._x_gate(bit) for bit in [*target_bits, carry])
+        gates.extend(clone(source_copies))
+
+        return (
+            gates,
+            [
+                *self._operand_registers(target, size),
+                Identifier("carry"),
+            ],
+            [
+                *(reg.name for reg in self._operand_registers(source, size)[1:]),
+                "ancilla",
+            ],
+        )
+
+    def _build_draper_gates(
+        self,
+        statements: list[Statement],
+        target: _AdditionOperand,
+        source: _AdditionOperand,
+        size: int,
+        subtract: bool,
+    ) -> tuple[list[Statement], list[Identifier], list[str]]:
+        """
+        Draper adder in the Fourier basis of the target, extended to the result size.
+
+        The source is only used as control, so it needs no extension and no ancillas.
+        """
+
+        target_bits, target_copies = self._extend_operand(statements, target, size + 1)
+        source_bits = self._build_qubit_references(
+            source.name, source.declared_size, source.effective_size
+        )
+
+        gates: list[Statement] = [*target_copies]
+        gates.extend(
+            draper_adder(
+                [
+                    self._select_operand_bit(source, source_bits, index)
+                    for index in range(size + 1)
+                ],
+                target_bits,
+                subtract=subtract,
+            )
+        )
+
+        return gates, self._operand_registers(target, size + 1), []
+
+    def _build_lookahead_gates(
+        self,
+        statements: list[Statement],
+        target: _AdditionOperand,
+        source: _AdditionOperand,
+        size: int,
+        subtract: bool,
+    ) -> tuple[list[Statement], list[Identifier], list[str]]:
+        """
+        Out-of-place carry-lookahead adder of logarithmic depth.
+
+        Subtraction uses ``a - b = ~(~a + b)``.
+        The extension of the target and the ancillas are restored afterwards.
+        """
+
+        result_name = "difference" if subtract else "sum"
+        target_bits, target_copies = self._extend_operand(statements, target, size)
+        source_bits = self._build_qubit_references(
+            source.name, source.declared_size, source.effective_size
+        )
+        statements.append(
+            QubitDeclaration(Identifier(result_name), IntegerLiteral(size + 1))
+        )
+        result_bits = self._build_qubit_references(result_name, size + 1, size + 1)
+        ancilla_count = lookahead_ancillas(size)
+        if ancilla_count > 0:
+            statements.append(
+                QubitDeclaration(Identifier("ancilla"), IntegerLiteral(ancilla_count))
+            )
+        ancillas = self._build_qubit_references("ancilla", ancilla_count, ancilla_count)
+
+        gates: list[Statement] = [*target_copies]
+        if subtract:
+            gates.extend(self._x_gate(bit) for bit in target_bits)
+        gates.extend(
+            self._extension_bit_gates(
+                target, source, result_bits[-1], complement=subtract
+            )
+        )
+        gates.extend(
+            carry_lookahead_adder(
+                [
+                    self._select_operand_bit(source, source_bits, index)
+                    for index in range(size)
+                ],
+                target_bits,
+                result_bits,
+                ancillas,
+            )
+        )
+        if subtract:
+            gates.extend(self._x_gate(bit) for bit in [*result_bits, *target_bits])
+        gates.extend(clone(target_copies))
+
+        reusable = [reg.name for reg in self._operand_registers(target, size)[1:]]
+        if ancilla_count > 0:
+            reusable.append("ancilla")
+        return gates, [Identifier(result_name)], reusable
+
+    def _extend_operand(
+        self,
+        statements: list[Statement],
+        operand: _AdditionOperand,
+        size: int,
+    ) -> tuple[list[Qubit], list[Statement]]:
+        """
+        Extend an operand to `size` distinct qubits.
+
+        The missing bits are declared as register ``<name>_extension``,
+        which holds copies of the sign bit for signed operands.
+
+        :return: The extended qubits and the gates copying the sign bit.
+            Applying the gates a second time resets the extension.
+        """
+
+        bits = self._build_qubit_references(
+            operand.name, operand.declared_size, operand.effective_size
+        )
+        extension_size = size - operand.effective_size
+        if extension_size <= 0:
+            return bits, []
+
+        name = f"{operand.name}_extension"
+        statements.append(
+            QubitDeclaration(Identifier(name), IntegerLiteral(extension_size))
+        )
+        extension = self._build_qubit_references(name, extension_size, extension_size)
+        copies: list[Statement] = (
+            [self._cx_gate(bits[-1], bit) for bit in extension]
+            if operand.signed
+            else []
+        )
+        return [*bits, *extension], copies
+
+    def _operand_registers(
+        self, operand: _AdditionOperand, size: int
+    ) -> list[Identifier]:
+        """
+        Registers of an operand extended by :meth:`_extend_operand`.
+        """
+
+        if size <= operand.effective_size:
+            return [Identifier(operand.name)]
+        return [Identifier(operand.name), Identifier(f"{operand.name}_extension")]
+
+    def _extension_bit_gates(
+        self,
+        target: _AdditionOperand,
+        source: _AdditionOperand,
+        result_bit: Qubit,
+        *,
+        complement: bool,
+    ) -> list[Statement]:
+        """
+        XOR the bits above the most significant bit of both operands onto `result_bit`.
+
+        Together with the final carry of an adder this gives the top bit of the sum of
+        the sign extended operands. Must be applied before the operands are modified,
+        but after the target is complemented if `complement` is set.
+        """
+
+        size = max(target.effective_size, source.effective_size)
+        gates: list[Statement] = []
+        for operand in (target, source):
+            bits = self._build_qubit_references(
+                operand.name, operand.declared_size, operand.effective_size
+            )
+            top_bit = self._select_operand_bit(operand, bits, size)
+            if top_bit is not None:
+                gates.append(self._cx_gate(top_bit, result_bit))
+            elif complement and operand is target:
+                gates.append(self._x_gate(result_bit))
+        return gates
+
+    def _declare_qubit(self, statements: list[Statement], name: str) -> Identifier:
+        statements.append(QubitDeclaration(Identifier(name), IntegerLiteral(1)))
+        return Identifier(name)
 
     def _determine_carry_out(
         self,
@@ -1124,9 +1450,8 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
         result_bit: Identifier | IndexedIdentifier,
         carry_in: Identifier | IndexedIdentifier | None,
         carry_out: Identifier | IndexedIdentifier | None,
-    ) -> tuple[list[Statement], int]:
+    ) -> list[Statement]:
         statements: list[Statement] = []
-        depth = 0
 
         if (
             carry_out is not None
@@ -1134,27 +1459,21 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
             and addend1_bit is not None
         ):
             statements.append(self._ccx_gate(addend0_bit, addend1_bit, carry_out))
-            depth += 1
 
         if carry_in is not None and carry_out is not None:
             if addend0_bit is not None:
                 statements.append(self._ccx_gate(carry_in, addend0_bit, carry_out))
-                depth += 1
             if addend1_bit is not None:
                 statements.append(self._ccx_gate(carry_in, addend1_bit, carry_out))
-                depth += 1
 
         if addend0_bit is not None:
             statements.append(self._cx_gate(addend0_bit, result_bit))
-            depth += 1
         if addend1_bit is not None:
             statements.append(self._cx_gate(addend1_bit, result_bit))
-            depth += 1
         if carry_in is not None:
             statements.append(self._cx_gate(carry_in, result_bit))
-            depth += 1
 
-        return statements, depth
+        return statements
 
     def _select_operand_bit(
         self,
@@ -1190,6 +1509,15 @@ class OperatorEnricherStrategy(DataBaseEnricherStrategy):
             [[IntegerLiteral(index)]],
         )
 
+    def _x_gate(self, target: Identifier | IndexedIdentifier) -> QuantumGate:
+        return QuantumGate(
+            modifiers=[],
+            name=Identifier("x"),
+            arguments=[],
+            qubits=[target],
+            duration=None,
+        )
+
     def _cx_gate(
         self,
         control: Identifier | IndexedIdentifier,
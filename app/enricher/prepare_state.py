@@ -2,30 +2,27 @@
 Provides enricher strategy for enriching :class:`~app.model.CompileRequest.PrepareStateNode` from a database.
 """
 
-import math
 from typing import cast, override
 
 from openqasm3.ast import (
-    FloatLiteral,
     Identifier,
     Include,
-    IndexedIdentifier,
     IntegerLiteral,
     QuantumGate,
     QubitDeclaration,
 )
 from sqlalchemy import Select, exists, select
-from sqlalchemy.ext.asyncio import AsyncEngine
 
 from app.enricher import Constraints, EnrichmentResult, ImplementationMetaData
 from app.enricher.db_enricher import DataBaseEnricherStrategy
+from app.enricher.entangled_states import entangled_state_variants
 from app.enricher.exceptions import (
     PrepareStateSizeOutOfRange,
     QuantumStateNotSupported,
 )
 from app.enricher.models import BaseNode, Input, NodeType, QuantumStateType
 from app.enricher.models import PrepareStateNode as PrepareStateTable
-from app.enricher.utils import implementation, leqo_output
+from app.enricher.utils import circuit_depth, implementation, leqo_output
 from app.model.CompileRequest import (
     Node as FrontendNode,
 )
@@ -41,9 +38,6 @@ class PrepareStateEnricherStrategy(DataBaseEnricherStrategy):
     Strategy capable of enriching :class:`~app.model.CompileRequest.PrepareStateNode` from a database.
     """
 
-    def __init__(self, engine: AsyncEngine):
-        super().__init__(engine)
-
     def _check_constraints(
         self, node: PrepareStateNode, requested_inputs: dict[int, LeqoSupportedType]
     ) -> None:
@@ -109,65 +103,27 @@ class PrepareStateEnricherStrategy(DataBaseEnricherStrategy):
                 )
             ]
 
-        if isinstance(node, PrepareStateNode) and (
-            str(node.quantumState).lower() in ("w", "quantumstatetype.w")
-            or node.quantumState == QuantumStateType.W
-        ):
+        if isinstance(node, PrepareStateNode) and node.quantumState in ("w", "ghz"):
             self._check_constraints(
                 node, {} if constraints is None else constraints.requested_inputs
             )
 
             size = node.size
             q_id = Identifier("q")
-            statements = [
-                Include("stdgates.inc"),
-                QubitDeclaration(q_id, IntegerLiteral(size)),
-            ]
-
-            statements.append(
-                QuantumGate(
-                    modifiers=[],
-                    name=Identifier("x"),
-                    arguments=[],
-                    qubits=[IndexedIdentifier(q_id, [IntegerLiteral(0)])],
-                    duration=None,
-                )
-            )
-
-            for i in range(size - 1):
-                prob = (size - i - 1) / (size - i)
-                theta = 2 * math.asin(math.sqrt(prob))
-
-                ctrl_qubit = IndexedIdentifier(q_id, [IntegerLiteral(i)])
-                target_qubit = IndexedIdentifier(q_id, [IntegerLiteral(i + 1)])
-
-                statements.append(
-                    QuantumGate(
-                        modifiers=[],
-                        name=Identifier("cry"),
-                        arguments=[FloatLiteral(theta)],
-                        qubits=[ctrl_qubit, target_qubit],
-                        duration=None,
-                    )
-                )
-
-                statements.append(
-                    QuantumGate(
-                        modifiers=[],
-                        name=Identifier("cx"),
-                        arguments=[],
-                        qubits=[target_qubit, ctrl_qubit],
-                        duration=None,
-                    )
-                )
-
-            statements.append(leqo_output("out", 0, q_id))
-
             return [
                 EnrichmentResult(
-                    implementation(node, statements),
-                    ImplementationMetaData(width=size, depth=size * 2),
+                    implementation(
+                        node,
+                        [
+                            Include("stdgates.inc"),
+                            QubitDeclaration(q_id, IntegerLiteral(size)),
+                            *gates,
+                            leqo_output("out", 0, q_id),
+                        ],
+                    ),
+                    ImplementationMetaData(width=size, depth=circuit_depth(gates)),
                 )
+                for gates in entangled_state_variants(q_id, node.quantumState, size)
             ]
 
         return await super()._enrich_impl(node, constraints)
@@ -184,7 +140,7 @@ class PrepareStateEnricherStrategy(DataBaseEnricherStrategy):
         if not isinstance(node, PrepareStateNode):
             return None
 
-        if node.quantumState in {"uniform", "w"}:
+        if node.quantumState in {"uniform", "w", "ghz"}:
             return None
 
         self._check_constraints(node, requested_inputs)
@@ -205,7 +161,7 @@ class PrepareStateEnricherStrategy(DataBaseEnricherStrategy):
         if not isinstance(node, PrepareStateNode):
             return None
 
-        if node.quantumState in {"uniform", "w"}:
+        if node.quantumState in {"uniform", "w", "ghz"}:
             return None
 
         self._check_constraints(
@@ -1,4 +1,5 @@
 import ast
+from collections import defaultdict
 from typing import override
 
 from openqasm3.ast import (
@@ -8,6 +9,7 @@ from openqasm3.ast import (
     IndexedIdentifier,
     IntegerLiteral,
     QuantumGate,
+    QuantumGateDefinition,
     QubitDeclaration,
     Statement,
 )
@@ -18,9 +20,12 @@ from app.enricher import (
     EnrichmentResult,
     ImplementationMetaData,
 )
-from app.enricher.utils import implementation, leqo_output
+from app.enricher.utils import circuit_depth, implementation, leqo_output
 from app.model.CompileRequest import Node as FrontendNode
 from app.model.CompileRequest import QAOANode
+from app.openqasm3.clone import clone
+
+RZZ_GATE = "rzz"
 
 
 def _get_q(q_reg: Identifier, idx: int) -> IndexedIdentifier:
@@ -53,118 +58,143 @@ def _parse_edges(edges_str: str, problem: str) -> tuple[list[list[int]], int, bo
     return edges, num_qubits, is_dimacs
 
 
-def _build_max2sat_gates(
-    q_reg: Identifier,
-    u: int,
-    v: int,
-    gamma_float: float,
-    is_dimacs: bool,
-) -> list[QuantumGate]:
-    """Generates cost gates for Max-2-SAT with optional literal polarity inversion."""
-    if is_dimacs:
-        sign_u = 1 if u > 0 else -1
-        sign_v = 1 if v > 0 else -1
-        idx_u = abs(u) - 1
-        idx_v = abs(v) - 1
-
-        val_u = FloatLiteral(sign_u * gamma_float)
-        val_v = FloatLiteral(sign_v * gamma_float)
-        val_uv = FloatLiteral(sign_u * sign_v * gamma_float)
-    else:
-        idx_u = u
-        idx_v = v
-        g_val = FloatLiteral(gamma_float)
-        val_u = g_val
-        val_v = g_val
-        val_uv = g_val
-
-    return [
-        QuantumGate(
-            modifiers=[],
-            name=Identifier("rz"),
-            arguments=[val_u],
-            qubits=[_get_q(q_reg, idx_u)],
-        ),
-        QuantumGate(
-            modifiers=[],
-            name=Identifier("rz"),
-            arguments=[val_v],
-            qubits=[_get_q(q_reg, idx_v)],
-        ),
-        QuantumGate(
-            modifiers=[],
-            name=Identifier("cx"),
-            arguments=[],
-            qubits=[_get_q(q_reg, idx_u), _get_q(q_reg, idx_v)],
-        ),
-        QuantumGate(
-            modifiers=[],
-            name=Identifier("rz"),
-            arguments=[val_uv],
-            qubits=[_get_q(q_reg, idx_v)],
-        ),
-        QuantumGate(
-            modifiers=[],
-            name=Identifier("cx"),
-            arguments=[],
-            qubits=[_get_q(q_reg, idx_u), _get_q(q_reg, idx_v)],
-        ),
-    ]
+ZZTerm = tuple[int, int, float]
+"""Interaction ``exp(-i angle/2 Z_u Z_v)`` between qubits u and v with its angle."""
 
 
-def _build_coloring_gates(
-    q_reg: Identifier, u_node: int, v_node: int, neg_g_val: FloatLiteral
-) -> list[QuantumGate]:
-    """Generates negative conflict penalty cost gates for Graph Coloring."""
-    return [
-        QuantumGate(
-            modifiers=[],
-            name=Identifier("cx"),
-            arguments=[],
-            qubits=[_get_q(q_reg, u_node), _get_q(q_reg, v_node)],
-        ),
-        QuantumGate(
-            modifiers=[],
-            name=Identifier("rz"),
-            arguments=[neg_g_val],
-            qubits=[_get_q(q_reg, v_node)],
-        ),
-        QuantumGate(
-            modifiers=[],
-            name=Identifier("cx"),
-            arguments=[],
-            qubits=[_get_q(q_reg, u_node), _get_q(q_reg, v_node)],
-        ),
-    ]
+def _max2sat_terms(
+    edges: list[list[int]], gamma: float, is_dimacs: bool
+) -> tuple[dict[int, float], list[ZZTerm]]:
+    """Generates bias and interaction terms for Max-2-SAT with optional literal polarity inversion."""
+    biases: dict[int, float] = defaultdict(float)
+    terms: list[ZZTerm] = []
+    for u, v in edges:
+        if is_dimacs:
+            sign_u = 1 if u > 0 else -1
+            sign_v = 1 if v > 0 else -1
+            idx_u = abs(u) - 1
+            idx_v = abs(v) - 1
+        else:
+            sign_u = sign_v = 1
+            idx_u = u
+            idx_v = v
+
+        biases[idx_u] += sign_u * gamma
+        biases[idx_v] += sign_v * gamma
+        terms.append((idx_u, idx_v, sign_u * sign_v * gamma))
+    return biases, terms
+
+
+def color_edges(terms: list[ZZTerm]) -> list[list[ZZTerm]]:
+    """
+    Partition interaction terms into layers of terms on disjoint qubits via greedy edge colouring.
+
+    Edges at high-degree vertices are coloured first, each edge gets the smallest colour
+    free at both ends, so at most ``2Δ - 1`` layers are used for maximum degree Δ
+    (Vizing: Δ or Δ + 1 are optimal).
+    Terms on a single qubit are constant and dropped.
+
+    :param terms: Interaction terms in input order.
+    :return: Layers of terms, in input order within each layer.
+    """
+
+    degree: dict[int, int] = defaultdict(int)
+    for u, v, _ in terms:
+        degree[u] += 1
+        degree[v] += 1
 
+    order = sorted(
+        (i for i, (u, v, _) in enumerate(terms) if u != v),
+        key=lambda i: -max(degree[terms[i][0]], degree[terms[i][1]]),
+    )
+    used: dict[int, set[int]] = defaultdict(set)
+    color_of: dict[int, int] = {}
+    for i in order:
+        u, v, _ = terms[i]
+        color = 0
+        while color in used[u] or color in used[v]:
+            color += 1
+        used[u].add(color)
+        used[v].add(color)
+        color_of[i] = color
 
-def _build_maxcut_gates(
-    q_reg: Identifier, u_node: int, v_node: int, g_val: FloatLiteral
+    layers: list[list[ZZTerm]] = [[] for _ in range(len(set(color_of.values())))]
+    for i, color in sorted(color_of.items()):
+        layers[color].append(terms[i])
+    return layers
+
+
+def _cost_layer(
+    q_reg: Identifier, layer: list[ZZTerm], native_rzz: bool
 ) -> list[QuantumGate]:
-    """Generates standard ZZ interaction cost gates for MaxCut."""
-    return [
+    """Generates the gates of one layer of interactions, which is of depth 3 (or 1 with rzz)."""
+    if native_rzz:
+        return [
+            QuantumGate(
+                modifiers=[],
+                name=Identifier(RZZ_GATE),
+                arguments=[FloatLiteral(angle)],
+                qubits=[_get_q(q_reg, u), _get_q(q_reg, v)],
+            )
+            for u, v, angle in layer
+        ]
+
+    cx = [
         QuantumGate(
             modifiers=[],
             name=Identifier("cx"),
             arguments=[],
-            qubits=[_get_q(q_reg, u_node), _get_q(q_reg, v_node)],
-        ),
+            qubits=[_get_q(q_reg, u), _get_q(q_reg, v)],
+        )
+        for u, v, _ in layer
+    ]
+    rz = [
         QuantumGate(
             modifiers=[],
             name=Identifier("rz"),
-            arguments=[g_val],
-            qubits=[_get_q(q_reg, v_node)],
-        ),
-        QuantumGate(
-            modifiers=[],
-            name=Identifier("cx"),
-            arguments=[],
-            qubits=[_get_q(q_reg, u_node), _get_q(q_reg, v_node)],
-        ),
+            arguments=[FloatLiteral(angle)],
+            qubits=[_get_q(q_reg, v)],
+        )
+        for _, v, angle in layer
     ]
+    return [*cx, *rz, *clone(cx)]
+
+
+def _rzz_definition() -> QuantumGateDefinition:
+    """Defines the ZZ rotation, as ``stdgates.inc`` does not provide it."""
+    theta = Identifier("theta")
+    a = Identifier("a")
+    b = Identifier("b")
+    return QuantumGateDefinition(
+        Identifier(RZZ_GATE),
+        [theta],
+        [a, b],
+        [
+            QuantumGate(
+                modifiers=[], name=Identifier("cx"), arguments=[], qubits=[a, b]
+            ),
+            QuantumGate(
+                modifiers=[], name=Identifier("rz"), arguments=[theta], qubits=[b]
+            ),
+            QuantumGate(
+                modifiers=[], name=Identifier("cx"), arguments=[], qubits=[a, b]
+            ),
+        ],
+    )
 
 
 class QAOAEnricherStrategy(EnricherStrategy):
+    """
+    QAOA ansatz with cost layers scheduled by edge colouring.
+
+    :param native_rzz: Emit interactions as ``rzz`` gates instead of ``cx``-``rz``-``cx``.
+    """
+
+    native_rzz: bool
+
+    def __init__(self, native_rzz: bool = False) -> None:
+        self.native_rzz = native_rzz
+
     @override
     def _enrich_impl(
         self, node: FrontendNode, constraints: Constraints | None
@@ -198,6 +228,9 @@ class QAOAEnricherStrategy(EnricherStrategy):
         statements: list[Statement] = [Include("stdgates.inc")]
         q_reg = Identifier(node.outputIdentifier)
 
+        if self.native_rzz:
+            statements.append(_rzz_definition())
+
         # 1. Declare the Quantum Register
         statements.append(QubitDeclaration(q_reg, IntegerLiteral(num_qubits)))
 
@@ -216,24 +249,28 @@ class QAOAEnricherStrategy(EnricherStrategy):
 
         # 3. Apply the QAOA Layers
         for i in range(node.p):
-            gamma_val = FloatLiteral(gammas[i])
             beta_val = FloatLiteral(betas[i])
 
             # Cost Hamiltonian
             if problem_type == "Max2SAT":
-                for u, v in edges:
-                    statements.extend(
-                        _build_max2sat_gates(q_reg, u, v, gammas[i], is_dimacs)
+                biases, terms = _max2sat_terms(edges, gammas[i], is_dimacs)
+                statements.extend(
+                    QuantumGate(
+                        modifiers=[],
+                        name=Identifier("rz"),
+                        arguments=[FloatLiteral(bias)],
+                        qubits=[_get_q(q_reg, q)],
                     )
+                    for q, bias in biases.items()
+                )
             elif problem_type == "GraphColoring":
-                neg_gamma_val = FloatLiteral(-gammas[i])
-                for u, v in edges:
-                    statements.extend(_build_coloring_gates(q_reg, u, v, neg_gamma_val))
+                terms = [(u, v, -gammas[i]) for u, v in edges]
             else:
                 # Default / MaxCut
                 beta_val = FloatLiteral(2.0 * betas[i])
-                for u, v in edges:
-                    statements.extend(_build_maxcut_gates(q_reg, u, v, gamma_val))
+                terms = [(u, v, gammas[i]) for u, v in edges]
+            for layer in color_edges(terms):
+                statements.extend(_cost_layer(q_reg, layer, self.native_rzz))
 
             # Mixer Hamiltonian
             statements.extend(
@@ -254,6 +291,8 @@ class QAOAEnricherStrategy(EnricherStrategy):
         return [
             EnrichmentResult(
                 implementation(node, statements),
-                ImplementationMetaData(width=num_qubits, depth=node.p * 3 + 1),
+                ImplementationMetaData(
+                    width=num_qubits, depth=circuit_depth(statements)
+                ),
             )
         ]
@@ -22,7 +22,12 @@ from app.enricher import (
     ImplementationMetaData,
 )
 from app.enricher.exceptions import EnricherException
-from app.enricher.utils import implementation, leqo_input, leqo_output
+from app.enricher.utils import (
+    circuit_depth,
+    implementation,
+    leqo_input,
+    leqo_output,
+)
 from app.model.CompileRequest import (
     Node as FrontendNode,
 )
@@ -86,6 +91,7 @@ def _build_qft_statements(
     size: int,
     inverse: bool = False,
     register_name: str = "q",
+    approximation_degree: int | None = None,
 ) -> list[Statement]:
     """
     Build the QFT or IQFT gate sequence for a register with the given name.
@@ -99,8 +105,15 @@ def _build_qft_statements(
     - Initial swaps
     - Reverse controlled phase rotations with negated angles
     - Hadamard in reverse order
+
+    With an approximation degree ``m`` only rotations by ``pi / 2^k`` with ``k <= m``
+    are kept (AQFT), giving ``O(n * m)`` instead of ``n * (n - 1) / 2`` rotations.
+    The dropped rotations sum up to an operator norm error of at most ``n * pi / 2^m``.
     """
 
+    if approximation_degree is None:
+        approximation_degree = size
+
     statements: list[Statement] = []
 
     if not inverse:
@@ -115,7 +128,9 @@ def _build_qft_statements(
                 )
             )
 
-            for control in range(target + 1, size):
+            for control in range(
+                target + 1, min(size, target + approximation_degree + 1)
+            ):
                 angle = pi / (2 ** (control - target))
                 statements.append(
                     QuantumGate(
@@ -162,7 +177,9 @@ def _build_qft_statements(
             )
 
         for target in reversed(range(size)):
-            for control in reversed(range(target + 1, size)):
+            for control in reversed(
+                range(target + 1, min(size, target + approximation_degree + 1))
+            ):
                 angle = -pi / (2 ** (control - target))
                 statements.append(
                     QuantumGate(
@@ -209,14 +226,19 @@ class QFTEnricherStrategy(EnricherStrategy):
         self, node: QFTNode, constraints: Constraints | None
     ) -> EnrichmentResult:
         size = _validate_qft_constraints(constraints, node)
+        gates = _build_qft_statements(
+            size,
+            inverse=node.inverse,
+            approximation_degree=node.approximationDegree,
+        )
         statements = [
             Include("stdgates.inc"),
             leqo_input("q", 0, size),
-            *_build_qft_statements(size, inverse=node.inverse),
+            *gates,
             leqo_output("q_out", 0, Identifier("q")),
         ]
 
         return EnrichmentResult(
             implementation(node, statements),
-            ImplementationMetaData(width=0, depth=None),
+            ImplementationMetaData(width=size, depth=circuit_depth(gates)),
         )
@@ -4,16 +4,23 @@ Qiskit-backed enrichment strategy for prepare-state nodes.
 This strategy generates OpenQASM implementations for prepare-state nodes
 by synthesizing circuits with Qiskit (v2+). The import is guarded so
 the backend still works without Qiskit installed.
+GHZ and W states are constructed directly by :mod:`app.enricher.entangled_states`,
+as synthesizing them from an amplitude vector scales exponentially with their size.
 """
 
 from __future__ import annotations
 
 from collections.abc import Iterable
-from math import sqrt
 from typing import override
 
 from openqasm3 import parse as parse_qasm
-from openqasm3.ast import Identifier, Program
+from openqasm3.ast import (
+    Identifier,
+    Include,
+    IntegerLiteral,
+    Program,
+    QubitDeclaration,
+)
 
 from app.enricher import (
     Constraints,
@@ -22,11 +29,12 @@ from app.enricher import (
     ImplementationMetaData,
     ParsedImplementationNode,
 )
+from app.enricher.entangled_states import entangled_state_variants
 from app.enricher.exceptions import (
     PrepareStateSizeOutOfRange,
     QuantumStateNotSupported,
 )
-from app.enricher.utils import leqo_output
+from app.enricher.utils import circuit_depth, implementation, leqo_output
 from app.model.CompileRequest import Node as FrontendNode
 from app.model.CompileRequest import PrepareStateNode
 from app.model.exceptions import InputCountMismatch
@@ -39,12 +47,10 @@ _BELL_STATE_SIZE = 2
 try:  # pragma: no cover - optional dependency
     import qiskit
     from qiskit.circuit import QuantumCircuit, QuantumRegister
-    from qiskit.circuit.library import StatePreparation
     from qiskit.qasm3 import dumps as qasm3_dumps
 except ModuleNotFoundError:  # pragma: no cover - exercised when qiskit is absent
     QuantumCircuit = None
     QuantumRegister = None
-    StatePreparation = None
     qasm3_dumps = None
     _QISKIT_VERSION = None
 else:  # pragma: no cover - exercised when qiskit is available
@@ -57,7 +63,6 @@ else:  # pragma: no cover - exercised when qiskit is available
     if _QISKIT_MAJOR < _MIN_QISKIT_MAJOR:
         QuantumCircuit = None
         QuantumRegister = None
-        StatePreparation = None
         qasm3_dumps = None
 
 HAS_QISKIT = (
@@ -98,6 +103,9 @@ class QiskitPrepareStateEnricherStrategy(EnricherStrategy):
             return []
 
         self._validate_constraints(node, constraints)
+        if node.quantumState in ("ghz", "w"):
+            return self._build_entangled_state(node)
+
         circuit = self._build_circuit(node)
         program = self._build_program(circuit)
 
@@ -135,18 +143,6 @@ class QiskitPrepareStateEnricherStrategy(EnricherStrategy):
             apply_x, apply_z = _BELL_STATE_SWITCHES[state]
             return self._build_bell_state(node, apply_x=apply_x, apply_z=apply_z)
 
-        if state == "ghz":
-            if node.size < _MIN_GHZ_SIZE:
-                raise QuantumStateNotSupported(node)
-
-            register = QuantumRegister(node.size, self._register_name)
-            circuit = QuantumCircuit(register, name="ghz_state")
-            circuit.h(register[0])
-            for target in range(1, node.size):
-                circuit.cx(register[0], register[target])
-
-            return circuit
-
         if state == "uniform":
             register = QuantumRegister(node.size, self._register_name)
             circuit = QuantumCircuit(register, name="uniform_state")
@@ -155,12 +151,6 @@ class QiskitPrepareStateEnricherStrategy(EnricherStrategy):
 
             return circuit
 
-        if state == "w":
-            if node.size < _MIN_W_SIZE:
-                raise QuantumStateNotSupported(node)
-
-            return self._build_w_state(node)
-
         if state == "custom":
             raise QuantumStateNotSupported(node)
 
@@ -192,6 +182,35 @@ class QiskitPrepareStateEnricherStrategy(EnricherStrategy):
 
         return circuit
 
+    def _build_entangled_state(self, node: PrepareStateNode) -> list[EnrichmentResult]:
+        """
+        Build GHZ and W states from their gate structure instead of an amplitude vector.
+
+        Each construction of the state is returned as a competing implementation.
+        """
+        minimum_size = _MIN_GHZ_SIZE if node.quantumState == "ghz" else _MIN_W_SIZE
+        if node.size < minimum_size:
+            raise QuantumStateNotSupported(node)
+
+        register = Identifier(self._register_name)
+        return [
+            EnrichmentResult(
+                implementation(
+                    node,
+                    [
+                        Include("stdgates.inc"),
+                        QubitDeclaration(register, IntegerLiteral(node.size)),
+                        *gates,
+                        leqo_output(f"{self._register_name}_out", 0, register),
+                    ],
+                ),
+                ImplementationMetaData(width=node.size, depth=circuit_depth(gates)),
+            )
+            for gates in entangled_state_variants(
+                register, node.quantumState, node.size
+            )
+        ]
+
     def _build_program(self, circuit: QuantumCircuit) -> Program:
         assert HAS_QISKIT
         assert qasm3_dumps is not None
@@ -207,31 +226,5 @@ class QiskitPrepareStateEnricherStrategy(EnricherStrategy):
         )
         return program
 
-    def _build_w_state(self, node: PrepareStateNode) -> QuantumCircuit:
-        assert HAS_QISKIT
-        assert QuantumCircuit is not None
-        assert QuantumRegister is not None
-
-        register = QuantumRegister(node.size, self._register_name)
-        circuit = QuantumCircuit(register, name="w_state")
-
-        amplitude_count = 1 << node.size
-        amplitudes = [0.0] * amplitude_count
-        norm = sqrt(node.size)
-        # Populate amplitudes so that exactly one qubit is excited per basis state, producing the equal-weight W superposition.
-        for index in range(node.size):
-            amplitudes[1 << index] = 1 / norm
-
-        if StatePreparation is not None:
-            circuit.compose(
-                StatePreparation(amplitudes),
-                qubits=register,
-                inplace=True,
-            )
-        else:  # pragma: no cover - fallback path for older Qiskit
-            circuit.initialize(amplitudes, register)
-
-        return circuit
-
 
 __all__ = ["HAS_QISKIT", "QiskitPrepareStateEnricherStrategy"]
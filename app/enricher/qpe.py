@@ -24,7 +24,12 @@ from app.enricher import (
 )
 from app.enricher.exceptions import EnricherException
 from app.enricher.qft import _build_qft_statements
-from app.enricher.utils import implementation, leqo_input, leqo_output
+from app.enricher.utils import (
+    circuit_depth,
+    implementation,
+    leqo_input,
+    leqo_output,
+)
 from app.model.CompileRequest import Node as FrontendNode
 from app.model.CompileRequest import QPENode
 from app.model.data_types import QubitType
@@ -99,7 +104,9 @@ def _controlled_phase_power_angle(
     return 2 * pi * phase * power
 
 
-def _build_qpe_statements(node: QPENode) -> list[Statement]:
+def _build_qpe_statements(
+    node: QPENode, approximation_degree: int | None = None
+) -> list[Statement]:
     estimation_size = node.estimationSize
 
     statements: list[Statement] = [
@@ -128,6 +135,7 @@ def _build_qpe_statements(node: QPENode) -> list[Statement]:
             estimation_size,
             inverse=True,
             register_name="estimation",
+            approximation_degree=approximation_degree,
         )
     )
 
@@ -160,5 +168,7 @@ class QPEEnricherStrategy(EnricherStrategy):
 
         return EnrichmentResult(
             implementation(node, statements),
-            ImplementationMetaData(width=node.estimationSize, depth=None),
+            ImplementationMetaData(
+                width=node.estimationSize, depth=circuit_depth(statements)
+            ),
         )
@@ -4,9 +4,9 @@ from math import log2
 from typing import Any
 
 import numpy as np
-from qiskit.quantum_info import Statevector, schmidt_decomposition
 
 DEFAULT_TOLERANCE = 1e-10
+COMPONENT_TOLERANCE = 1e-8
 MIN_STATE_VECTOR_LENGTH = 2
 SEPARABLE_RANK = 1
 
@@ -26,7 +26,8 @@ def coerce_state_vector(raw_value: Any) -> np.ndarray:
     if raw_value is None:
         raise RuntimeError("Schmidt decomposition needs a state vector input.")
 
-    if isinstance(raw_value, Statevector):
+    if isinstance(getattr(raw_value, "data", None), np.ndarray):
+        # e.g. a qiskit Statevector
         vector = np.asarray(raw_value.data, dtype=complex)
 
     elif isinstance(raw_value, str):
@@ -76,6 +77,34 @@ def validate_qargs(num_qubits: int, qargs: list[int]) -> None:
         raise RuntimeError("qargs must not contain all qubits.")
 
 
+def schmidt_svd(
+    vector: np.ndarray, qargs: list[int]
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Schmidt decomposition of a state into the qubits `qargs` (B) and the remaining qubits (A).
+
+    The state is reshaped to a ``2^|A| x 2^|B|`` matrix, whose SVD ``U diag(s) Vh``
+    gives ``|psi> = sum_i s_i |u_i>_A |v_i>_B`` with the columns ``u_i`` of ``U``
+    and the rows ``v_i`` of ``Vh``.
+    Both subsystems are indexed little-endian in ascending qubit order,
+    matching :func:`qiskit.quantum_info.schmidt_decomposition`.
+
+    :param vector: Normalized state vector of ``2^n`` amplitudes.
+    :param qargs: Qubits of subsystem B.
+    :return: ``U``, ``s`` (descending) and ``Vh``, with square ``U`` and ``Vh``.
+    """
+    num_qubits = int(vector.size).bit_length() - 1
+    qargs_b = sorted(set(qargs))
+    qargs_a = [qubit for qubit in range(num_qubits) if qubit not in qargs_b]
+
+    # axis k of the reshaped tensor is qubit n - 1 - k
+    tensor = vector.reshape([2] * num_qubits)
+    axes = [num_qubits - 1 - qubit for qubit in reversed(qargs_b + qargs_a)]
+    matrix = tensor.transpose(axes).reshape(1 << len(qargs_a), 1 << len(qargs_b))
+    u_matrix, singular_values, vh_matrix = np.linalg.svd(matrix)
+    return u_matrix, singular_values, vh_matrix
+
+
 def analyze_schmidt_decomposition(
     raw_state_vector: Any,
     qargs: list[int],
@@ -90,18 +119,12 @@ def analyze_schmidt_decomposition(
 
     validate_qargs(num_qubits, qargs)
 
-    state = Statevector(vector)
-    decomposition = schmidt_decomposition(state, qargs)
+    u_matrix, singular_values, vh_matrix = schmidt_svd(vector, qargs)
+    components = singular_values > COMPONENT_TOLERANCE
 
-    coefficients = [float(coefficient) for coefficient, _, _ in decomposition]
-    u_vectors = [
-        np.asarray(u_state.data, dtype=complex).tolist()
-        for _, u_state, _ in decomposition
-    ]
-    v_vectors = [
-        np.asarray(v_state.data, dtype=complex).tolist()
-        for _, _, v_state in decomposition
-    ]
+    coefficients = [float(coefficient) for coefficient in singular_values[components]]
+    u_vectors = u_matrix.T[components].tolist()
+    v_vectors = vh_matrix[components].tolist()
 
     probabilities = [
         coefficient**2 for coefficient in coefficients if coefficient > tolerance
@@ -1,3 +1,4 @@
+from collections.abc import Callable, Sequence
 from typing import override
 
 from openqasm3.ast import (
@@ -8,7 +9,9 @@ from openqasm3.ast import (
     IndexedIdentifier,
     IntegerLiteral,
     QuantumGate,
+    QuantumGateDefinition,
     QuantumGateModifier,
+    QuantumStatement,
     QubitDeclaration,
     Statement,
 )
@@ -19,12 +22,220 @@ from app.enricher import (
     EnrichmentResult,
     ImplementationMetaData,
 )
-from app.enricher.utils import implementation, leqo_output
+from app.enricher.utils import (
+    circuit_depth,
+    implementation,
+    leqo_output,
+    leqo_reusable,
+)
 from app.model.CompileRequest import GroverDiffuserNode, UniversalOracleNode
 from app.model.CompileRequest import Node as FrontendNode
+from app.openqasm3.clone import clone
+
+MAX_STANDARD_CONTROLS = 2
+
+Qubit = Identifier | IndexedIdentifier
+
+
+def gate(name: str, *qubits: Qubit) -> QuantumGate:
+    """
+    Apply a gate without arguments to `qubits`.
+    """
+
+    return QuantumGate(
+        modifiers=[],
+        name=Identifier(name),
+        arguments=[],
+        qubits=list(qubits),
+        duration=None,
+    )
+
+
+def multi_controlled_x(controls: Sequence[Qubit], target: Qubit) -> QuantumGate:
+    """
+    X on `target` controlled by all `controls`, using ``cx`` and ``ccx`` where possible.
+    """
+
+    if not controls:
+        return gate("x", target)
+    if len(controls) == 1:
+        return gate("cx", *controls, target)
+    if len(controls) == MAX_STANDARD_CONTROLS:
+        return gate("ccx", *controls, target)
+    result = gate("x", *controls, target)
+    result.modifiers = [
+        QuantumGateModifier(GateModifierName.ctrl, IntegerLiteral(len(controls)))
+    ]
+    return result
+
+
+def v_chain_ancillas(num_controls: int) -> int:
+    """
+    Number of clean ancillas :func:`controlled_x` needs to avoid gates with more than two controls.
+    """
+
+    return max(0, num_controls - MAX_STANDARD_CONTROLS)
+
+
+def controlled_x(
+    controls: Sequence[Qubit], target: Qubit, ancillas: Sequence[Qubit] = ()
+) -> list[QuantumGate]:
+    """
+    X on `target` controlled by all `controls`, as a V-chain of Toffoli gates if possible.
+
+    With at least :func:`v_chain_ancillas` clean `ancillas`, the conjunction of the controls
+    is computed into the ancillas by a chain of ``ccx`` (depth ``O(n)``),
+    applied to the target and uncomputed, leaving the ancillas clean.
+    Otherwise, a single :func:`multi_controlled_x` is returned.
+    """
+
+    needed = v_chain_ancillas(len(controls))
+    if needed == 0 or len(ancillas) < needed:
+        return [multi_controlled_x(controls, target)]
+
+    chain = [gate("ccx", controls[0], controls[1], ancillas[0])]
+    chain.extend(
+        gate("ccx", control, ancillas[i], ancillas[i + 1])
+        for i, control in enumerate(controls[2:-1])
+    )
+    return [
+        *chain,
+        gate("ccx", controls[-1], ancillas[needed - 1], target),
+        *reversed(clone(chain)),
+    ]
+
+
+def gray_code_rank(state: int) -> int:
+    """
+    Position of `state` in the binary reflected Gray code.
+    """
+
+    rank = state
+    while state:
+        state >>= 1
+        rank ^= state
+    return rank
+
+
+def oracle(
+    qubits: Sequence[Qubit],
+    target_states: Sequence[int],
+    boolean_target: Qubit | None = None,
+    ancillas: Sequence[Qubit] = (),
+) -> list[QuantumStatement]:
+    """
+    Mark the computational basis states `target_states` of `qubits`.
+
+    Each state is marked by a multi-controlled gate conjugated with X on its zero bits.
+    The states are visited in Gray code order, so consecutive states share most bits,
+    and only the X gates on differing bits are applied between two markings.
+
+    :param qubits: Query qubits, the first one is the least significant bit.
+    :param target_states: States to mark.
+    :param boolean_target: Flip this qubit for marked states (boolean oracle).
+        If None, flip the phase of marked states via the last query qubit (phase oracle).
+    :param ancillas: Clean ancillas for V-chain decompositions, see :func:`controlled_x`.
+    :return: The statements of the oracle.
+    """
+
+    def flip(mask: int) -> list[QuantumGate]:
+        return [gate("x", qubits[q]) for q in range(len(qubits)) if mask >> q & 1]
+
+    all_bits = (1 << len(qubits)) - 1
+    flipped = 0
+    statements: list[QuantumStatement] = []
+    for target_val in sorted(target_states, key=gray_code_rank):
+        zero_bits = ~target_val & all_bits
+        statements.extend(flip(flipped ^ zero_bits))
+        flipped = zero_bits
+        if boolean_target is None:
+            target = qubits[-1]
+            statements.extend(
+                [
+                    gate("h", target),
+                    *controlled_x(qubits[:-1], target, ancillas),
+                    gate("h", target),
+                ]
+            )
+        else:
+            statements.extend(controlled_x(qubits, boolean_target, ancillas))
+    statements.extend(flip(flipped))
+    return statements
+
+
+def diffuser(
+    qubits: Sequence[Qubit], ancillas: Sequence[Qubit] = ()
+) -> list[QuantumStatement]:
+    """
+    Grover diffuser (inversion about the mean) on `qubits`.
+
+    :param ancillas: Clean ancillas for V-chain decompositions, see :func:`controlled_x`.
+    """
+
+    target = qubits[-1]
+    return [
+        *(gate("h", q) for q in qubits),
+        *(gate("x", q) for q in qubits),
+        gate("h", target),
+        *controlled_x(qubits[:-1], target, ancillas),
+        gate("h", target),
+        *(gate("x", q) for q in qubits),
+        *(gate("h", q) for q in qubits),
+    ]
+
+
+def gate_definition(
+    name: str,
+    num_qubits: int,
+    body: Callable[[list[Identifier]], list[QuantumStatement]],
+) -> QuantumGateDefinition:
+    """
+    Define a gate on `num_qubits` qubits named ``q0``, ``q1``, ...
+
+    :param name: Name of the gate.
+    :param num_qubits: Number of qubit parameters.
+    :param body: Creates the body from the qubit parameters.
+    :return: The gate definition.
+    """
+
+    params = [Identifier(f"q{i}") for i in range(num_qubits)]
+    return QuantumGateDefinition(Identifier(name), [], params, body(params))
+
+
+def declare_ancillas(
+    statements: list[Statement], size: int, name: str = "ancilla"
+) -> list[IndexedIdentifier]:
+    """
+    Declare a register of `size` clean ancillas.
+
+    :param statements: Statements to append the declaration to.
+    :return: The ancilla qubits, empty if `size` is zero.
+    """
+
+    if size == 0:
+        return []
+    register = Identifier(name)
+    statements.append(QubitDeclaration(register, IntegerLiteral(size)))
+    return [IndexedIdentifier(register, [[IntegerLiteral(i)]]) for i in range(size)]
+
+
+def release_ancillas(
+    statements: list[Statement], size: int, name: str = "ancilla"
+) -> None:
+    """
+    Mark the ancillas declared by :func:`declare_ancillas` as reusable by later nodes.
+    """
+
+    if size > 0:
+        statements.append(leqo_reusable(f"{name}_reusable", Identifier(name)))
 
 
 class UniversalOracleEnricherStrategy(EnricherStrategy):
+    """
+    Enrich :class:`~app.model.CompileRequest.UniversalOracleNode` with multi-controlled gates,
+    and additionally with V-chains on clean ancillas if the oracle needs more than two controls.
+    """
+
     @override
     def _enrich_impl(
         self, node: FrontendNode, constraints: Constraints | None
@@ -32,6 +243,15 @@ class UniversalOracleEnricherStrategy(EnricherStrategy):
         if not isinstance(node, UniversalOracleNode):
             return []
 
+        num_controls = node.numQubits if node.mode == "boolean" else node.numQubits - 1
+        results = [self._enrich_with_ancillas(node, 0)]
+        if (num_ancillas := v_chain_ancillas(num_controls)) > 0:
+            results.append(self._enrich_with_ancillas(node, num_ancillas))
+        return results
+
+    def _enrich_with_ancillas(
+        self, node: UniversalOracleNode, num_ancillas: int
+    ) -> EnrichmentResult:
         n = node.numQubits
         statements: list[Statement] = [Include("stdgates.inc")]
 
@@ -40,110 +260,34 @@ class UniversalOracleEnricherStrategy(EnricherStrategy):
         q_decl.annotations = [Annotation("leqo.input", "0")]
         statements.append(q_decl)
 
-        target_idx = [IndexedIdentifier(q_reg, [[IntegerLiteral(n - 1)]])]
-
+        query = [IndexedIdentifier(q_reg, [[IntegerLiteral(q)]]) for q in range(n)]
+        boolean_target = None
         if node.mode == "boolean":
             t_reg = Identifier("target")
             statements.append(QubitDeclaration(t_reg, IntegerLiteral(1)))
-            target_idx = [IndexedIdentifier(t_reg, [[IntegerLiteral(0)]])]
-
-        for target_val in node.targetStates:
-            bin_str = format(target_val, f"0{n}b")[::-1]
-
-            statements.extend(
-                [
-                    QuantumGate(
-                        modifiers=[],
-                        name=Identifier("x"),
-                        arguments=[],
-                        qubits=[IndexedIdentifier(q_reg, [[IntegerLiteral(q)]])],
-                        duration=None,
-                    )
-                    for q, val in enumerate(bin_str)
-                    if val == "0"
-                ]
-            )
-
-            controls = [
-                IndexedIdentifier(q_reg, [[IntegerLiteral(q)]])
-                for q in range(n)
-                if node.mode == "boolean" or q != n - 1
-            ]
-
-            if node.mode == "phase":
-                statements.append(
-                    QuantumGate(
-                        modifiers=[],
-                        name=Identifier("h"),
-                        arguments=[],
-                        qubits=target_idx,
-                        duration=None,
-                    )
-                )
-
-            # mcx replacement
-            if len(controls) == 1:
-                gate_name = "cx"
-                gate_modifiers = []
-            elif len(controls) == 2:  # noqa: PLR2004
-                gate_name = "ccx"
-                gate_modifiers = []
-            else:
-                gate_name = "x"
-                gate_modifiers = [
-                    QuantumGateModifier(
-                        GateModifierName.ctrl, IntegerLiteral(len(controls))
-                    )
-                ]
-
-            statements.append(
-                QuantumGate(
-                    modifiers=gate_modifiers,
-                    name=Identifier(gate_name),
-                    arguments=[],
-                    qubits=[*controls, *target_idx],
-                    duration=None,
-                )
-            )
-
-            if node.mode == "phase":
-                statements.append(
-                    QuantumGate(
-                        modifiers=[],
-                        name=Identifier("h"),
-                        arguments=[],
-                        qubits=target_idx,
-                        duration=None,
-                    )
-                )
+            boolean_target = IndexedIdentifier(t_reg, [[IntegerLiteral(0)]])
+        ancillas = declare_ancillas(statements, num_ancillas)
 
-            statements.extend(
-                [
-                    QuantumGate(
-                        modifiers=[],
-                        name=Identifier("x"),
-                        arguments=[],
-                        qubits=[IndexedIdentifier(q_reg, [[IntegerLiteral(q)]])],
-                        duration=None,
-                    )
-                    for q, val in enumerate(bin_str)
-                    if val == "0"
-                ]
-            )
+        statements.extend(oracle(query, node.targetStates, boolean_target, ancillas))
 
+        release_ancillas(statements, num_ancillas)
         statements.append(leqo_output("out", 0, q_reg))
 
-        return [
-            EnrichmentResult(
-                implementation(node, statements),
-                ImplementationMetaData(
-                    width=n + (1 if node.mode == "boolean" else 0), depth=n * 3
-                ),
-            )
-        ]
+        return EnrichmentResult(
+            implementation(node, statements),
+            ImplementationMetaData(
+                width=n + (1 if node.mode == "boolean" else 0) + num_ancillas,
+                depth=circuit_depth(statements),
+            ),
+        )
 
 
 class GroverDiffuserEnricherStrategy(EnricherStrategy):
+    """
+    Enrich :class:`~app.model.CompileRequest.GroverDiffuserNode` with a multi-controlled Z,
+    and additionally with a V-chain on clean ancillas for more than three qubits.
+    """
+
     @override
     def _enrich_impl(
         self, node: FrontendNode, constraints: Constraints | None
@@ -151,6 +295,14 @@ class GroverDiffuserEnricherStrategy(EnricherStrategy):
         if not isinstance(node, GroverDiffuserNode):
             return []
 
+        results = [self._enrich_with_ancillas(node, 0)]
+        if (num_ancillas := v_chain_ancillas(node.numQubits - 1)) > 0:
+            results.append(self._enrich_with_ancillas(node, num_ancillas))
+        return results
+
+    def _enrich_with_ancillas(
+        self, node: GroverDiffuserNode, num_ancillas: int
+    ) -> EnrichmentResult:
         n = node.numQubits
         statements: list[Statement] = [Include("stdgates.inc")]
 
@@ -158,109 +310,17 @@ class GroverDiffuserEnricherStrategy(EnricherStrategy):
         q_decl = QubitDeclaration(q_reg, IntegerLiteral(n))
         q_decl.annotations = [Annotation("leqo.input", "0")]
         statements.append(q_decl)
+        ancillas = declare_ancillas(statements, num_ancillas)
 
         all_qubits = [IndexedIdentifier(q_reg, [[IntegerLiteral(i)]]) for i in range(n)]
-        target = [all_qubits[-1]]
-        controls = all_qubits[:-1]
-
-        # mcx replacement
-        if len(controls) == 1:
-            gate_name = "cx"
-            gate_modifiers = []
-        elif len(controls) == 2:  # noqa: PLR2004
-            gate_name = "ccx"
-            gate_modifiers = []
-        else:
-            gate_name = "x"
-            gate_modifiers = [
-                QuantumGateModifier(
-                    GateModifierName.ctrl, IntegerLiteral(len(controls))
-                )
-            ]
-
-        statements.extend(
-            [
-                QuantumGate(
-                    modifiers=[],
-                    name=Identifier("h"),
-                    arguments=[],
-                    qubits=[q],
-                    duration=None,
-                )
-                for q in all_qubits
-            ]
-        )
-
-        statements.extend(
-            [
-                QuantumGate(
-                    modifiers=[],
-                    name=Identifier("x"),
-                    arguments=[],
-                    qubits=[q],
-                    duration=None,
-                )
-                for q in all_qubits
-            ]
-        )
-
-        statements.extend(
-            [
-                QuantumGate(
-                    modifiers=[],
-                    name=Identifier("h"),
-                    arguments=[],
-                    qubits=target,
-                    duration=None,
-                ),
-                QuantumGate(
-                    modifiers=gate_modifiers,
-                    name=Identifier(gate_name),
-                    arguments=[],
-                    qubits=[*controls, *target],
-                    duration=None,
-                ),
-                QuantumGate(
-                    modifiers=[],
-                    name=Identifier("h"),
-                    arguments=[],
-                    qubits=target,
-                    duration=None,
-                ),
-            ]
-        )
-
-        statements.extend(
-            [
-                QuantumGate(
-                    modifiers=[],
-                    name=Identifier("x"),
-                    arguments=[],
-                    qubits=[q],
-                    duration=None,
-                )
-                for q in all_qubits
-            ]
-        )
-
-        statements.extend(
-            [
-                QuantumGate(
-                    modifiers=[],
-                    name=Identifier("h"),
-                    arguments=[],
-                    qubits=[q],
-                    duration=None,
-                )
-                for q in all_qubits
-            ]
-        )
+        statements.extend(diffuser(all_qubits, ancillas))
 
+        release_ancillas(statements, num_ancillas)
         statements.append(leqo_output("out", 0, q_reg))
 
-        return [
-            EnrichmentResult(
-                implementation(node, statements),
-                ImplementationMetaData(width=n, depth=5),
-            )
-        ]
+        return EnrichmentResult(
+            implementation(node, statements),
+            ImplementationMetaData(
+                width=n + num_ancillas, depth=circuit_depth(statements)
+            ),
+        )
@@ -2,18 +2,23 @@
 Utils for generating implementations for a :class:`~app.model.CompileRequest.Node` in an :class:`~app.enricher.EnricherStrategy`.
 """
 
-from collections.abc import Sequence
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
 from typing import cast
 
 from openqasm3.ast import (
     AliasStatement,
     Annotation,
     Concatenation,
+    GateModifierName,
     Identifier,
+    IndexedIdentifier,
     IndexExpression,
     IntegerLiteral,
     Pragma,
     Program,
+    QuantumGate,
+    QuantumStatement,
     QubitDeclaration,
     Statement,
 )
@@ -77,3 +82,100 @@ def leqo_output(name: str, index: int, value: AliasableExpression) -> AliasState
     result = AliasStatement(Identifier(name), alias_value)
     result.annotations = [Annotation("leqo.output", f"{index}")]
     return result
+
+
+def leqo_reusable(name: str, value: AliasableExpression) -> AliasStatement:
+    """
+    Marks ancilla qubits as returned to the zero state, so later nodes can reuse them.
+
+    :param name: Identifier of the alias
+    :param value: Openqasm3 construct referring to the reusable qubits
+    """
+
+    alias_value = cast(Concatenation | Identifier, value)
+    result = AliasStatement(Identifier(name), alias_value)
+    result.annotations = [Annotation("leqo.reusable", None)]
+    return result
+
+
+MAX_NATIVE_CONTROLS = 2
+"""Gates with more controls are not native Toffoli-like gates and are weighted by :func:`gate_depth`."""
+
+
+def gate_depth(gate: QuantumGate) -> int:
+    """
+    Estimated number of layers of a gate application.
+
+    A gate with ``k > 2`` controls counts as the ``4 * (k - 2)`` Toffoli gates of its
+    decomposition (Barenco et al., Lemma 7.2), any other gate as a single layer.
+    This keeps multi-controlled gates comparable to their decomposition with ancillas.
+    """
+
+    controls = 2 if gate.name.name == "ccx" else 0
+    for modifier in gate.modifiers:
+        if modifier.modifier in (GateModifierName.ctrl, GateModifierName.negctrl):
+            argument = modifier.argument
+            if argument is None:
+                controls += 1
+            elif isinstance(argument, IntegerLiteral):
+                controls += argument.value
+    if controls <= MAX_NATIVE_CONTROLS:
+        return 1
+    return 4 * (controls - MAX_NATIVE_CONTROLS)
+
+
+def circuit_depth(statements: Iterable[Statement | QuantumStatement]) -> int:
+    """
+    Depth of a straight-line circuit, counting each gate application as :func:`gate_depth` layers.
+
+    Qubits are identified by register name and literal index.
+    Gates on whole registers (or with computed indices) depend on all qubits of the register.
+    Statements other than :class:`openqasm3.ast.QuantumGate` are ignored.
+
+    :param statements: Statements of the circuit.
+    :return: Number of layers.
+    """
+
+    qubit_level: dict[tuple[str, int], int] = defaultdict(int)
+    # level of the last gate on the whole register
+    register_level: dict[str, int] = defaultdict(int)
+    # maximum level of all qubits of the register
+    register_max: dict[str, int] = defaultdict(int)
+
+    depth = 0
+    for statement in statements:
+        if not isinstance(statement, QuantumGate):
+            continue
+        operands: list[tuple[str, int | None]] = []
+        for qubit in statement.qubits:
+            if isinstance(qubit, Identifier):
+                operands.append((qubit.name, None))
+                continue
+            index: int | None = None
+            if (
+                isinstance(qubit, IndexedIdentifier)
+                and len(qubit.indices) == 1
+                and isinstance(qubit.indices[0], list)
+                and len(qubit.indices[0]) == 1
+                and isinstance(qubit.indices[0][0], IntegerLiteral)
+            ):
+                index = qubit.indices[0][0].value
+            operands.append((qubit.name.name, index))
+
+        level = gate_depth(statement) + max(
+            (
+                register_max[name]
+                if index is None
+                else max(qubit_level[name, index], register_level[name])
+                for name, index in operands
+            ),
+            default=0,
+        )
+        for name, index in operands:
+            if index is None:
+                register_level[name] = level
+            else:
+                qubit_level[name, index] = level
+            register_max[name] = max(register_max[name], level)
+        depth = max(depth, level)
+    return depth
@@ -0,0 +1,445 @@
+"""
+Durable queue of background jobs stored in PostgreSQL.
+
+API replicas only enqueue jobs, workers (see :mod:`app.worker`) run them.
+Jobs are claimed with ``FOR UPDATE SKIP LOCKED``, so any number of workers
+on any number of machines can share one queue without claiming a job twice.
+
+A claimed job is leased to its worker, which renews the lease with heartbeats while it runs.
+Once a lease expires (e.g. because the worker crashed), the job can be claimed again.
+Failed attempts are retried with exponential backoff until ``max_attempts`` is reached.
+Finished jobs are deleted, statuses and results are the durable record of a request.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import StrEnum
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row, and_, delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.compression import EncodedPayload
+from app.model.database_model import JobDb
+from app.transformation_manager.budget import CancellationToken
+
+DEFAULT_MAX_ATTEMPTS = 3
+"""Attempts before a job is given up."""
+
+RETRY_BASE_DELAY = 2.0
+"""Seconds to wait before the first retry, doubled for each further attempt."""
+
+RETRY_MAX_DELAY = 300.0
+"""Upper bound of the retry delay in seconds."""
+
+
+class JobKind(StrEnum):
+    """
+    What a job does, determines the format of its payload.
+    """
+
+    COMPILE = "compile"
+    ENRICH = "enrich"
+    COMPILE_BATCH = "compile_batch"
+
+
+class JobState(StrEnum):
+    """
+    Lifecycle of a job.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ClaimedJob:
+    """
+    A job leased to a worker.
+
+    :param id: ID of the job, the uuid of the request it processes.
+    :param kind: What the job does.
+    :param payload: The decoded payload.
+    :param attempts: Number of attempts including the current one.
+    :param max_attempts: Number of attempts before the job is given up.
+    :param created_at: Creation time of the request.
+    :param cancellation: Tripped when cancellation of the job is requested.
+    """
+
+    id: UUID
+    kind: JobKind
+    payload: str
+    attempts: int
+    max_attempts: int
+    created_at: datetime
+    cancellation: CancellationToken = field(
+        default_factory=CancellationToken, compare=False
+    )
+
+
+@dataclass(frozen=True)
+class QueueDepth:
+    """
+    Snapshot of the load of the queue.
+
+    :param queued: Number of requests waiting to be claimed, including backoffs.
+        Jobs count with their weight, e.g. a batch with each of its members.
+    :param running: Number of jobs currently leased to a worker.
+    :param oldest_wait: Seconds the longest waiting due job is waiting.
+    """
+
+    queued: int
+    running: int
+    oldest_wait: float
+
+
+@dataclass(frozen=True)
+class LeaseRenewal:
+    """
+    Outcome of a heartbeat.
+
+    :param held: Whether the worker still holds the lease.
+    :param cancel_requested: Whether cancellation of the job was requested.
+    """
+
+    held: bool
+    cancel_requested: bool = False
+
+
+_JOB_COLUMNS = (
+    JobDb.id,
+    JobDb.kind,
+    JobDb.payload,
+    JobDb.content_encoding,
+    JobDb.attempts,
+    JobDb.max_attempts,
+    JobDb.createdAt,
+    JobDb.cancel_requested,
+)
+"""Columns needed to create a :class:`ClaimedJob`."""
+
+
+def _to_claimed_job(row: Row[Any]) -> ClaimedJob:
+    job = ClaimedJob(
+        id=row.id,
+        kind=JobKind(row.kind),
+        payload=EncodedPayload.from_db(row.payload, row.content_encoding).decode(),
+        attempts=row.attempts,
+        max_attempts=row.max_attempts,
+        created_at=row.createdAt,
+    )
+    if row.cancel_requested:
+        # cancelled while running on a worker that lost its lease
+        job.cancellation.cancel()
+    return job
+
+
+_job_enqueued = asyncio.Event()
+
+
+async def wait_for_jobs(timeout: float) -> None:
+    """
+    Wait until a job is enqueued by this process or `timeout` seconds passed.
+
+    Jobs enqueued by other processes are only noticed after `timeout`.
+    """
+
+    try:
+        await asyncio.wait_for(_job_enqueued.wait(), timeout)
+    except TimeoutError:
+        return
+    _job_enqueued.clear()
+
+
+def retry_delay(attempts: int) -> float:
+    """
+    Backoff before the next attempt of a job.
+
+    :param attempts: Number of attempts made so far.
+    :return: Delay in seconds.
+    """
+
+    return min(RETRY_BASE_DELAY * 2.0 ** max(attempts - 1, 0), RETRY_MAX_DELAY)
+
+
+async def get_queue_depth(engine: AsyncEngine) -> QueueDepth:
+    """
+    Count the queued and running jobs in a single query.
+
+    Queued jobs are weighted by the number of requests they process.
+    """
+
+    statement = select(
+        func.coalesce(func.sum(JobDb.weight).filter(JobDb.state == JobState.QUEUED), 0),
+        func.count().filter(JobDb.state == JobState.RUNNING),
+        func.coalesce(
+            func.extract(
+                "epoch",
+                func.now()
+                - func.min(JobDb.run_after).filter(JobDb.state == JobState.QUEUED),
+            ),
+            0,
+        ),
+    ).where(JobDb.state != JobState.FAILED)
+
+    async with AsyncSession(engine) as session:
+        queued, running, oldest_wait = (await session.execute(statement)).one()
+
+    return QueueDepth(queued, running, max(float(oldest_wait), 0.0))
+
+
+async def enqueue_job(  # noqa: PLR0913 Too many arguments
+    engine: AsyncEngine,
+    job_id: UUID,
+    kind: JobKind,
+    payload: str,
+    created_at: datetime,
+    *,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    weight: int = 1,
+) -> None:
+    """
+    Add a job to the queue.
+
+    :param engine: Database engine to use.
+    :param job_id: ID of the job, the uuid of the request it processes.
+    :param kind: What the job does.
+    :param payload: Serialized input of the job.
+    :param created_at: Creation time of the request.
+    :param max_attempts: Number of attempts before the job is given up.
+    :param weight: Number of requests processed by the job, counted by admission control.
+    """
+
+    encoded = EncodedPayload.encode(payload)
+    async with AsyncSession(engine) as session:
+        session.add(
+            JobDb(
+                id=job_id,
+                kind=kind,
+                payload=encoded.content,
+                content_encoding=encoded.encoding,
+                state=JobState.QUEUED,
+                attempts=0,
+                max_attempts=max_attempts,
+                createdAt=created_at,
+                run_after=func.now(),
+                weight=weight,
+            )
+        )
+        await session.commit()
+
+    _job_enqueued.set()
+
+
+async def claim_job(
+    engine: AsyncEngine, owner: str, lease_seconds: float
+) -> ClaimedJob | None:
+    """
+    Lease the next due job to `owner`.
+
+    Due are queued jobs whose backoff has passed and running jobs whose lease expired.
+
+    :param engine: Database engine to use.
+    :param owner: Unique name of the claiming worker.
+    :param lease_seconds: Duration of the lease.
+    :return: The claimed job or `None` if no job is due.
+    """
+
+    candidate = (
+        select(JobDb.id)
+        .where(
+            or_(
+                and_(JobDb.state == JobState.QUEUED, JobDb.run_after <= func.now()),
+                and_(
+                    JobDb.state == JobState.RUNNING,
+                    JobDb.lease_expires_at < func.now(),
+                ),
+            )
+        )
+        .order_by(JobDb.run_after)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    statement = (
+        update(JobDb)
+        .where(JobDb.id == candidate)
+        .values(
+            state=JobState.RUNNING,
+            attempts=JobDb.attempts + 1,
+            lease_owner=owner,
+            lease_expires_at=func.now() + timedelta(seconds=lease_seconds),
+        )
+        .returning(*_JOB_COLUMNS)
+        .execution_options(synchronize_session=False)
+    )
+
+    async with AsyncSession(engine) as session:
+        row = (await session.execute(statement)).one_or_none()
+        await session.commit()
+
+    return _to_claimed_job(row) if row is not None else None
+
+
+async def _update_leased_job(
+    engine: AsyncEngine, job_id: UUID, owner: str, **values: object
+) -> bool:
+    """
+    Update a job only if `owner` still holds its lease.
+    """
+
+    async with AsyncSession(engine) as session:
+        result = await session.execute(
+            update(JobDb)
+            .where(
+                JobDb.id == job_id,
+                JobDb.lease_owner == owner,
+                JobDb.state == JobState.RUNNING,
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+    return bool(result.rowcount)
+
+
+async def renew_lease(
+    engine: AsyncEngine, job_id: UUID, owner: str, lease_seconds: float
+) -> LeaseRenewal:
+    """
+    Extend the lease of a running job and check for cancellation requests.
+    """
+
+    async with AsyncSession(engine) as session:
+        cancel_requested = (
+            await session.execute(
+                update(JobDb)
+                .where(
+                    JobDb.id == job_id,
+                    JobDb.lease_owner == owner,
+                    JobDb.state == JobState.RUNNING,
+                )
+                .values(lease_expires_at=func.now() + timedelta(seconds=lease_seconds))
+                .returning(JobDb.cancel_requested)
+                .execution_options(synchronize_session=False)
+            )
+        ).scalar_one_or_none()
+        await session.commit()
+
+    if cancel_requested is None:
+        return LeaseRenewal(held=False)
+    return LeaseRenewal(held=True, cancel_requested=cancel_requested)
+
+
+async def cancel_queued_job(engine: AsyncEngine, job_id: UUID) -> ClaimedJob | None:
+    """
+    Remove a job that was not claimed yet.
+
+    :return: The removed job or `None` if no such job is queued.
+    """
+
+    async with AsyncSession(engine) as session:
+        row = (
+            await session.execute(
+                delete(JobDb)
+                .where(JobDb.id == job_id, JobDb.state == JobState.QUEUED)
+                .returning(*_JOB_COLUMNS)
+                .execution_options(synchronize_session=False)
+            )
+        ).one_or_none()
+        await session.commit()
+
+    return _to_claimed_job(row) if row is not None else None
+
+
+async def request_cancellation(engine: AsyncEngine, job_id: UUID) -> JobKind | None:
+    """
+    Ask the worker running a job to cancel it.
+
+    The worker notices the request with its next heartbeat.
+
+    :return: Kind of the running job or `None` if no such job is running.
+    """
+
+    async with AsyncSession(engine) as session:
+        kind = (
+            await session.execute(
+                update(JobDb)
+                .where(JobDb.id == job_id, JobDb.state == JobState.RUNNING)
+                .values(cancel_requested=True)
+                .returning(JobDb.kind)
+                .execution_options(synchronize_session=False)
+            )
+        ).scalar_one_or_none()
+        await session.commit()
+
+    return JobKind(kind) if kind is not None else None
+
+
+async def complete_job(engine: AsyncEngine, job_id: UUID, owner: str) -> None:
+    """
+    Remove a successfully finished job from the queue.
+    """
+
+    async with AsyncSession(engine) as session:
+        await session.execute(
+            delete(JobDb)
+            .where(JobDb.id == job_id, JobDb.lease_owner == owner)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+
+async def retry_job(
+    engine: AsyncEngine, job_id: UUID, owner: str, error: str, delay: float
+) -> None:
+    """
+    Return a failed job to the queue to be retried after `delay` seconds.
+    """
+
+    await _update_leased_job(
+        engine,
+        job_id,
+        owner,
+        state=JobState.QUEUED,
+        run_after=func.now() + timedelta(seconds=delay),
+        lease_owner=None,
+        lease_expires_at=None,
+        last_error=error,
+    )
+
+
+async def release_job(engine: AsyncEngine, job_id: UUID, owner: str) -> None:
+    """
+    Return an interrupted job to the queue without counting the attempt.
+    """
+
+    await _update_leased_job(
+        engine,
+        job_id,
+        owner,
+        state=JobState.QUEUED,
+        attempts=JobDb.attempts - 1,
+        run_after=func.now(),
+        lease_owner=None,
+        lease_expires_at=None,
+    )
+
+
+async def fail_job(engine: AsyncEngine, job_id: UUID, owner: str, error: str) -> None:
+    """
+    Give up a job. It stays in the queue for inspection but is not claimed again.
+    """
+
+    await _update_leased_job(
+        engine,
+        job_id,
+        owner,
+        state=JobState.FAILED,
+        lease_owner=None,
+        lease_expires_at=None,
+        last_error=error,
+    )
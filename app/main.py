@@ -3,67 +3,125 @@ All fastapi endpoints available.
 """
 
 import asyncio
-import json
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
 from typing import Annotated, Literal, cast
 from uuid import UUID, uuid4
 
-from fastapi import BackgroundTasks, FastAPI, File, HTTPException, UploadFile
+from fastapi import FastAPI, File, HTTPException, Request, UploadFile
 from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.params import Depends
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.responses import (
     JSONResponse,
     PlainTextResponse,
     RedirectResponse,
     Response,
+    StreamingResponse,
 )
 
+from app.admission import admit_job, check_admission, format_metrics
+from app.caching import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    compute_digest,
+    etag_matches,
+    format_etag,
+)
+from app.compression import EncodedPayload, accepts_encoding
 from app.config import Settings
-from app.model.CompileRequest import ImplementationNode
+from app.enricher import EnrichmentCache
+from app.job_queue import (
+    ClaimedJob,
+    JobKind,
+    cancel_queued_job,
+    enqueue_job,
+    get_queue_depth,
+    request_cancellation,
+)
+from app.model.CompileRequest import (
+    BatchCompileRequest,
+    CompileRequest,
+    ImplementationNode,
+)
 from app.model.exceptions import LeqoProblemDetails
 from app.model.StatusResponse import (
+    CancelledStatus,
     CreatedStatus,
     FailedStatus,
     Progress,
     StatusResponse,
     StatusType,
     SuccessStatus,
+    TimeoutStatus,
 )
 from app.services import (
     get_db_engine,
+    get_enricher,
     get_qrms_url,
     get_request_url,
     get_result_url,
     get_service_deployment_models_url,
     get_settings,
+    get_status_broker,
     leqo_lifespan,
 )
+from app.status_events import (
+    KEEP_ALIVE_EVENT,
+    KEEP_ALIVE_INTERVAL,
+    StatusBroker,
+    format_event,
+    is_terminal,
+)
 from app.transformation_manager import (
     EnrichingProcessor,
     EnrichmentInserter,
     MergingProcessor,
     WorkflowProcessor,
+    find_quantum_groups,
+)
+from app.transformation_manager.budget import (
+    DeadlineExceeded,
+    ProcessingBudget,
+    ProcessingCancelled,
 )
+from app.transformation_manager.pre import ParseCache
 from app.utils import (
+    add_batch_to_db,
     add_result_to_db,
     add_status_response_to_db,
-    get_compile_request_payload,
+    delete_quantum_group_results,
+    BatchMemberRecord,
+    get_batch_statuses_from_db,
+    get_compile_request_payload_etag,
+    get_encoded_compile_request_payload,
+    get_encoded_results_from_db,
     get_qrms,
+    get_qrms_etag,
+    get_quantum_group_result,
+    get_stored_quantum_groups,
+    get_result_etag,
     list_qrm_ids,
     get_service_deployment_models,
+    get_service_deployment_models_etag,
     list_service_deployment_ids,
-    get_results_from_db,
+    not_none,
     get_results_overview_from_db,
     get_status_response_from_db,
+    StoredEtag,
     StoredFilePayload,
     store_compile_request_payload,
     store_qrms,
+    store_quantum_group_results,
     store_service_deployment_models,
     update_status_response_in_db,
+    update_status_responses_in_db,
 )
+from app.worker import cancel_local_job, embedded_workers
 
 """
 Ensure we use the old `WindowsSelectorEventLoopPolicy` on windows
@@ -72,7 +130,21 @@ as the postgresql driver cannot work with the modern `ProactorEventLoop`.
 if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-app = FastAPI(lifespan=leqo_lifespan)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Initialize the database and run the embedded job workers.
+    """
+
+    async with (
+        leqo_lifespan(app),
+        embedded_workers(get_db_engine(), get_settings(), run_job, fail_job_requests),
+    ):
+        yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -94,17 +166,19 @@ def _get_processor_target(processor: object) -> Literal["qasm", "workflow"]:
     return "qasm"
 
 
-@app.post("/compile")
+@app.post(
+    "/compile",
+    dependencies=[Depends(admit_job)],
+)
 async def post_compile(
     processor: Annotated[
         MergingProcessor, Depends(MergingProcessor.from_compile_request)
     ],
-    background_tasks: BackgroundTasks,
     settings: Annotated[Settings, Depends(get_settings)],
     engine: Annotated[AsyncEngine, Depends(get_db_engine)],
 ) -> RedirectResponse:
     """
-    Enqueue a :class:`~fastapi.background.BackgroundTasks` to process the :class:`~app.model.CompileRequest`.
+    Enqueue a job to process the :class:`~app.model.CompileRequest`.
     """
 
     uuid: UUID = uuid4()
@@ -115,11 +189,10 @@ async def post_compile(
     request_description = (
         getattr(metadata, "description", None) if metadata is not None else None
     )
-    original_request = getattr(processor, "original_request", None)
-    if original_request is not None:
-        await store_compile_request_payload(
-            engine, uuid, original_request.model_dump_json()
-        )
+    request_payload = not_none(
+        processor.original_request, "Processor without compile request"
+    ).model_dump_json()
+    await store_compile_request_payload(engine, uuid, request_payload)
     await add_status_response_to_db(
         engine,
         status_response,
@@ -127,14 +200,13 @@ async def post_compile(
         name=request_name,
         description=request_description,
     )
-
-    background_tasks.add_task(
-        process_compile_request,
+    await enqueue_job(
+        engine,
         uuid,
+        JobKind.COMPILE,
+        request_payload,
         status_response.createdAt,
-        processor,
-        settings,
-        engine,
+        max_attempts=settings.job_max_attempts,
     )
 
     return JSONResponse(
@@ -154,17 +226,187 @@ async def post_compile(
     )
 
 
-@app.post("/enrich")
+@app.post("/compile/batch")
+async def post_compile_batch(
+    request: BatchCompileRequest,
+    settings: Annotated[Settings, Depends(get_settings)],
+    engine: Annotated[AsyncEngine, Depends(get_db_engine)],
+) -> JSONResponse:
+    """
+    Enqueue a job to process all members of a :class:`~app.model.CompileRequest.BatchCompileRequest`.
+
+    Members share enrichments and parsed implementations.
+    Each member gets its own uuid, status and result like a request to ``/compile``.
+    """
+
+    await check_admission(engine, settings, weight=len(request.requests))
+
+    batch_id = uuid4()
+    createdAt = datetime.now(UTC)
+
+    members: list[tuple[UUID, CompileRequest]] = []
+    records: list[BatchMemberRecord] = []
+    for member_request in request.requests:
+        uuid = uuid4()
+        members.append((uuid, member_request))
+        records.append(
+            BatchMemberRecord(
+                status=CreatedStatus(
+                    uuid=uuid,
+                    createdAt=createdAt,
+                    progress=Progress(percentage=0, currentStep="init"),
+                ),
+                compilation_target=member_request.compilation_target,
+                payload=member_request.model_dump_json(),
+                name=member_request.metadata.name,
+                description=member_request.metadata.description,
+            )
+        )
+
+    await add_batch_to_db(engine, batch_id, records)
+    await enqueue_job(
+        engine,
+        batch_id,
+        JobKind.COMPILE_BATCH,
+        _BATCH_JOB_PAYLOAD.dump_json(members).decode(),
+        createdAt,
+        max_attempts=settings.job_max_attempts,
+        weight=len(members),
+    )
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "uuid": str(batch_id),
+            "links": {"status": f"{settings.api_base_url}compile/batch/{batch_id}"},
+            "members": [
+                {
+                    "uuid": str(uuid),
+                    "links": {
+                        "status": f"{settings.api_base_url}status/{uuid}",
+                        "result": get_result_url(uuid, settings),
+                        "request": get_request_url(uuid, settings),
+                    },
+                }
+                for uuid, _ in members
+            ],
+        },
+    )
+
+
+@app.get("/compile/batch/{uuid}")
+async def get_compile_batch_status(
+    uuid: UUID, engine: Annotated[AsyncEngine, Depends(get_db_engine)]
+) -> JSONResponse:
+    """
+    Fetch the aggregate status of a batch compile request.
+
+    The batch is in progress while any member is.
+    Otherwise it takes the status of its worst member,
+    from failed over timeout and cancelled to completed.
+
+    :raises HTTPException: (Status 404) If no batch with uuid is found
+    """
+
+    statuses = await get_batch_statuses_from_db(engine, uuid)
+    if not statuses:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No batch compile request with uuid '{uuid}' found.",
+        )
+
+    counts = {status: 0 for status in StatusType}
+    for status in statuses.values():
+        counts[status] += 1
+
+    if counts[StatusType.IN_PROGRESS] > 0:
+        aggregate = StatusType.IN_PROGRESS
+    elif counts[StatusType.FAILED] > 0:
+        aggregate = StatusType.FAILED
+    elif counts[StatusType.TIMEOUT] > 0:
+        aggregate = StatusType.TIMEOUT
+    elif counts[StatusType.CANCELLED] > 0:
+        aggregate = StatusType.CANCELLED
+    else:
+        aggregate = StatusType.COMPLETED
+
+    return JSONResponse(
+        status_code=200,
+        content={
+            "uuid": str(uuid),
+            "status": aggregate,
+            "counts": {status.value: count for status, count in counts.items()},
+            "members": {
+                str(member): status.value for member, status in statuses.items()
+            },
+        },
+    )
+
+
+@app.delete("/compile/{uuid}", status_code=202)
+async def cancel_compile(
+    uuid: UUID,
+    settings: Annotated[Settings, Depends(get_settings)],
+    engine: Annotated[AsyncEngine, Depends(get_db_engine)],
+) -> JSONResponse:
+    """
+    Cancel a compile, enrich or batch compile request.
+
+    Queued requests are cancelled immediately.
+    Running requests stop at the next checkpoint of their processing,
+    their status changes to ``cancelled`` once they stopped.
+
+    :raises HTTPException: (Status 404) If no request with uuid is found
+    :raises HTTPException: (Status 409) If the request already finished or is part of a batch
+    """
+
+    status_url = f"{settings.api_base_url}status/{uuid}"
+    queued_job = await cancel_queued_job(engine, uuid)
+    if queued_job is not None:
+        await update_status_responses_in_db(
+            engine,
+            [
+                _cancelled_status(request_id, queued_job.created_at)
+                for request_id in _job_request_ids(queued_job)
+            ],
+        )
+        kind = queued_job.kind
+    else:
+        kind = await request_cancellation(engine, uuid)
+        cancel_local_job(uuid)
+
+    if kind is not None:
+        if kind == JobKind.COMPILE_BATCH:
+            status_url = f"{settings.api_base_url}compile/batch/{uuid}"
+        return JSONResponse(
+            status_code=202,
+            content={"uuid": str(uuid), "links": {"status": status_url}},
+        )
+
+    state = await get_status_response_from_db(engine, uuid)
+    if state is None:
+        raise HTTPException(
+            status_code=404, detail=f"No compile request with uuid '{uuid}' found."
+        )
+    raise HTTPException(
+        status_code=409,
+        detail=f"Compile request with uuid '{uuid}' can not be cancelled in status '{state.status}'.",
+    )
+
+
+@app.post(
+    "/enrich",
+    dependencies=[Depends(admit_job)],
+)
 async def post_enrich(
     processor: Annotated[
         EnrichingProcessor, Depends(EnrichingProcessor.from_compile_request)
     ],
-    background_tasks: BackgroundTasks,
     settings: Annotated[Settings, Depends(get_settings)],
     engine: Annotated[AsyncEngine, Depends(get_db_engine)],
 ) -> RedirectResponse:
     """
-    Enqueue a :class:`~fastapi.background.BackgroundTasks` to enrich all nodes in the :class:`~app.model.CompileRequest`.
+    Enqueue a job to enrich all nodes in the :class:`~app.model.CompileRequest`.
     """
 
     uuid: UUID = uuid4()
@@ -175,11 +417,10 @@ async def post_enrich(
     request_description = (
         getattr(metadata, "description", None) if metadata is not None else None
     )
-    original_request = getattr(processor, "original_request", None)
-    if original_request is not None:
-        await store_compile_request_payload(
-            engine, uuid, original_request.model_dump_json()
-        )
+    request_payload = not_none(
+        processor.original_request, "Processor without compile request"
+    ).model_dump_json()
+    await store_compile_request_payload(engine, uuid, request_payload)
     await add_status_response_to_db(
         engine,
         status_response,
@@ -187,14 +428,13 @@ async def post_enrich(
         name=request_name,
         description=request_description,
     )
-
-    background_tasks.add_task(
-        process_enrich_request,
+    await enqueue_job(
+        engine,
         uuid,
+        JobKind.ENRICH,
+        request_payload,
         status_response.createdAt,
-        processor,
-        settings,
-        engine,
+        max_attempts=settings.job_max_attempts,
     )
 
     return RedirectResponse(
@@ -216,18 +456,36 @@ async def post_insert(
     inserter: Annotated[
         EnrichmentInserter, Depends(EnrichmentInserter.from_insert_request)
     ],
+    engine: Annotated[AsyncEngine, Depends(get_db_engine)],
 ) -> str | JSONResponse:
     """
     Insert enrichments via :class:`~app.model.InsertRequest`.
+
+    Stored quantum group programs are discarded, as they may use outdated enrichments.
     """
 
     try:
         await inserter.insert_all()
+        await delete_quantum_group_results(engine)
         return "success"
     except Exception as ex:
         return LeqoProblemDetails.from_exception(ex).to_response()
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(
+    engine: Annotated[AsyncEngine, Depends(get_db_engine)],
+) -> PlainTextResponse:
+    """
+    Expose the load of the job queue in the Prometheus text format, e.g. for autoscaling.
+    """
+
+    return PlainTextResponse(
+        format_metrics(await get_queue_depth(engine)),
+        media_type="text/plain; version=0.0.4",
+    )
+
+
 @app.get("/status/{uuid}")
 async def get_status(
     uuid: UUID, engine: Annotated[AsyncEngine, Depends(get_db_engine)]
@@ -248,18 +506,141 @@ async def get_status(
     return state
 
 
+@app.get(
+    "/status/{uuid}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def get_status_events(
+    uuid: UUID,
+    request: Request,
+    engine: Annotated[AsyncEngine, Depends(get_db_engine)],
+    broker: Annotated[StatusBroker, Depends(get_status_broker)],
+) -> StreamingResponse:
+    """
+    Stream the status of a compile request as Server-Sent Events.
+
+    Sends the current status first and then every update until the request completed or failed.
+    Use this instead of polling `/status/{uuid}`.
+
+    :raises HTTPException: (Status 404) If no compile request with uuid is found
+    """
+
+    if await get_status_response_from_db(engine, uuid) is None:
+        raise HTTPException(
+            status_code=404, detail=f"No compile request with uuid '{uuid}' found."
+        )
+
+    async def events() -> AsyncIterator[str]:
+        # Subscribe before reading the current state, so no update is missed in between.
+        async with broker.subscribe(uuid) as updates:
+            state = await get_status_response_from_db(engine, uuid)
+            while state is not None:
+                yield format_event(state)
+                if is_terminal(state):
+                    return
+
+                state = None
+                while state is None:
+                    try:
+                        state = await asyncio.wait_for(
+                            updates.get(), KEEP_ALIVE_INTERVAL
+                        )
+                    except TimeoutError:
+                        if await request.is_disconnected():
+                            return
+                        yield KEEP_ALIVE_EVENT
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _cache_headers(
+    etag: StoredEtag, accept_encoding: str | None, cache_control: str
+) -> dict[str, str]:
+    """
+    Build the caching headers for a stored payload.
+
+    The entity tag depends on the representation that will be sent,
+    which in turn depends on whether the client accepts the stored encoding.
+    """
+
+    headers = {"Cache-Control": cache_control}
+    if etag.encoding != "identity":
+        headers["Vary"] = "Accept-Encoding"
+    if etag.digest is not None:
+        encoding = (
+            etag.encoding
+            if accepts_encoding(accept_encoding, etag.encoding)
+            else "identity"
+        )
+        headers["ETag"] = format_etag(etag.digest, encoding)
+    return headers
+
+
+def _is_not_modified(request: Request, headers: dict[str, str]) -> bool:
+    """
+    Check whether the client already holds the representation described by `headers`.
+    """
+
+    etag = headers.get("ETag")
+    return etag is not None and etag_matches(request.headers.get("If-None-Match"), etag)
+
+
+def _encoded_response(
+    payload: EncodedPayload,
+    media_type: str,
+    accept_encoding: str | None,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    Build a response from a stored payload.
+
+    Compressed payloads are passed through as-is if the client accepts their encoding.
+    Otherwise, they are decompressed.
+    """
+
+    headers = dict(headers or {})
+    if payload.encoding != "identity" and accepts_encoding(
+        accept_encoding, payload.encoding
+    ):
+        headers["Content-Encoding"] = payload.encoding
+        return Response(
+            status_code=200,
+            content=payload.content,
+            media_type=media_type,
+            headers=headers,
+        )
+
+    return Response(
+        status_code=200,
+        content=payload.decode(),
+        media_type=media_type,
+        headers=headers,
+    )
+
+
 async def _resolve_result_response(
-    engine: AsyncEngine, uuid: UUID, settings: Settings | None = None
-) -> PlainTextResponse | JSONResponse:
+    engine: AsyncEngine,
+    uuid: UUID,
+    request: Request,
+    settings: Settings | None = None,
+) -> Response:
     """
     Fetch result of a compile request.
 
+    Results never change once written.
+    Conditional requests are answered from the stored entity tag without loading the result.
+
     :raises HTTPException: (Status 404) If no compile request with uuid is found
     """
 
-    result = await get_results_from_db(engine, uuid)
+    etag = await get_result_etag(engine, uuid)
 
-    if result is None:
+    if etag is None:
         raise HTTPException(
             status_code=404, detail=f"No compile request with uuid '{uuid}' found."
         )
@@ -267,6 +648,7 @@ async def _resolve_result_response(
     if settings is None:
         settings = get_settings()
 
+    accept_encoding = request.headers.get("Accept-Encoding")
     request_link = get_request_url(uuid, settings)
     result_link = get_result_url(uuid, settings)
     qrms_link = get_qrms_url(uuid, settings)
@@ -279,11 +661,24 @@ async def _resolve_result_response(
                 f'<{qrms_link}>; rel="qrms"',
                 f'<{service_models_link}>; rel="service-deployment-models"',
             )
-        )
+        ),
+        **_cache_headers(etag, accept_encoding, IMMUTABLE_CACHE_CONTROL),
     }
 
-    if isinstance(result, str):
-        return PlainTextResponse(status_code=200, content=result, headers=headers)
+    if _is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+
+    result = await get_encoded_results_from_db(engine, uuid)
+
+    if result is None:
+        raise HTTPException(
+            status_code=404, detail=f"No compile request with uuid '{uuid}' found."
+        )
+
+    if isinstance(result, EncodedPayload):
+        return _encoded_response(
+            result, PlainTextResponse.media_type, accept_encoding, headers
+        )
 
     return JSONResponse(
         status_code=200, content=jsonable_encoder(result), headers=headers
@@ -292,10 +687,11 @@ async def _resolve_result_response(
 
 @app.get("/results", response_model=None)
 async def get_result(
+    request: Request,
     engine: Annotated[AsyncEngine, Depends(get_db_engine)],
     uuid: UUID | None = None,
     status: StatusType | None = None,
-) -> PlainTextResponse | JSONResponse:
+) -> Response:
     """
     Fetch all results metadata or a specific result if a UUID is provided.
     """
@@ -327,35 +723,62 @@ async def get_result(
             status_code=200, content=jsonable_encoder(overview_with_links)
         )
 
-    return await _resolve_result_response(engine, uuid, settings)
+    return await _resolve_result_response(engine, uuid, request, settings)
 
 
 @app.get("/results/{uuid}", response_model=None)
 async def get_result_by_path(
-    uuid: UUID, engine: Annotated[AsyncEngine, Depends(get_db_engine)]
-) -> PlainTextResponse | JSONResponse:
+    uuid: UUID, request: Request, engine: Annotated[AsyncEngine, Depends(get_db_engine)]
+) -> Response:
     """
     Fetch result of a compile request by UUID path parameter.
     """
 
-    return await _resolve_result_response(engine, uuid)
+    return await _resolve_result_response(engine, uuid, request)
 
 
 @app.get("/request/{uuid}", response_model=None)
 async def get_request_payload(
-    uuid: UUID, engine: Annotated[AsyncEngine, Depends(get_db_engine)]
-) -> JSONResponse:
+    uuid: UUID, request: Request, engine: Annotated[AsyncEngine, Depends(get_db_engine)]
+) -> Response:
     """
     Fetch the original compile request payload associated with a UUID.
     """
 
-    payload = await get_compile_request_payload(engine, uuid)
+    etag = await get_compile_request_payload_etag(engine, uuid)
+    if etag is None:
+        raise HTTPException(
+            status_code=404, detail=f"No compile request with uuid '{uuid}' found."
+        )
+
+    accept_encoding = request.headers.get("Accept-Encoding")
+    headers = _cache_headers(etag, accept_encoding, IMMUTABLE_CACHE_CONTROL)
+    if _is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+
+    payload = await get_encoded_compile_request_payload(engine, uuid)
     if payload is None:
         raise HTTPException(
             status_code=404, detail=f"No compile request with uuid '{uuid}' found."
         )
 
-    return JSONResponse(status_code=200, content=json.loads(payload))
+    return _encoded_response(payload, JSONResponse.media_type, accept_encoding, headers)
+
+
+def _stored_file_response(stored_file: StoredFilePayload) -> Response:
+    """
+    Build a download response for a stored file.
+    """
+
+    headers = {"Cache-Control": REVALIDATE_CACHE_CONTROL}
+    if stored_file.etag:
+        headers["ETag"] = format_etag(stored_file.etag)
+    if stored_file.filename:
+        safe_filename = stored_file.filename.replace('"', "")
+        headers["Content-Disposition"] = f'attachment; filename="{safe_filename}"'
+
+    media_type = stored_file.content_type or "application/octet-stream"
+    return Response(content=stored_file.content, media_type=media_type, headers=headers)
 
 
 @app.get("/qrms", response_model=list[UUID])
@@ -371,25 +794,31 @@ async def list_qrms(
 
 @app.get("/qrms/{uuid}", response_model=None)
 async def get_qrms_payload(
-    uuid: UUID, engine: Annotated[AsyncEngine, Depends(get_db_engine)]
+    uuid: UUID, request: Request, engine: Annotated[AsyncEngine, Depends(get_db_engine)]
 ) -> Response:
     """
     Fetch the Quantum Resource Models file associated with a UUID.
+
+    QRMs can be replaced via `POST /qrms/{uuid}`, so clients have to revalidate them.
     """
 
+    etag = await get_qrms_etag(engine, uuid)
+    if etag is None:
+        raise HTTPException(
+            status_code=404, detail=f"No QRMs with uuid '{uuid}' found."
+        )
+
+    headers = _cache_headers(etag, None, REVALIDATE_CACHE_CONTROL)
+    if _is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+
     stored_file = await get_qrms(engine, uuid)
     if stored_file is None:
         raise HTTPException(
             status_code=404, detail=f"No QRMs with uuid '{uuid}' found."
         )
 
-    headers = {}
-    if stored_file.filename:
-        safe_filename = stored_file.filename.replace('"', "")
-        headers["Content-Disposition"] = f'attachment; filename="{safe_filename}"'
-
-    media_type = stored_file.content_type or "application/octet-stream"
-    return Response(content=stored_file.content, media_type=media_type, headers=headers)
+    return _stored_file_response(stored_file)
 
 
 @app.get("/service-deployment-models", response_model=list[UUID])
@@ -405,12 +834,26 @@ async def list_service_deployment_models(
 
 @app.get("/service-deployment-models/{uuid}", response_model=None)
 async def get_service_deployment_models_payload(
-    uuid: UUID, engine: Annotated[AsyncEngine, Depends(get_db_engine)]
+    uuid: UUID, request: Request, engine: Annotated[AsyncEngine, Depends(get_db_engine)]
 ) -> Response:
     """
     Fetch the Service Deployment Models file associated with a UUID.
+
+    The models can be replaced via `POST /service-deployment-models/{uuid}`,
+    so clients have to revalidate them.
     """
 
+    etag = await get_service_deployment_models_etag(engine, uuid)
+    if etag is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No service deployment models with uuid '{uuid}' found.",
+        )
+
+    headers = _cache_headers(etag, None, REVALIDATE_CACHE_CONTROL)
+    if _is_not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+
     stored_file = await get_service_deployment_models(engine, uuid)
     if stored_file is None:
         raise HTTPException(
@@ -418,13 +861,7 @@ async def get_service_deployment_models_payload(
             detail=f"No service deployment models with uuid '{uuid}' found.",
         )
 
-    headers = {}
-    if stored_file.filename:
-        safe_filename = stored_file.filename.replace('"', "")
-        headers["Content-Disposition"] = f'attachment; filename="{safe_filename}"'
-
-    media_type = stored_file.content_type or "application/octet-stream"
-    return Response(content=stored_file.content, media_type=media_type, headers=headers)
+    return _stored_file_response(stored_file)
 
 
 @app.post("/qrms/{uuid}", response_model=None, status_code=204)
@@ -475,6 +912,24 @@ async def put_service_deployment_models_payload(
     return Response(status_code=204)
 
 
+async def _report_processing(
+    engine: AsyncEngine, uuid: UUID, createdAt: datetime, target: str
+) -> None:
+    """
+    Mark a request as picked up by the background task.
+    """
+
+    await update_status_response_in_db(
+        engine,
+        CreatedStatus(
+            uuid=uuid,
+            createdAt=createdAt,
+            progress=Progress(percentage=10, currentStep="processing"),
+        ),
+        target,
+    )
+
+
 async def process_compile_request(
     uuid: UUID,
     createdAt: datetime,
@@ -492,84 +947,204 @@ async def process_compile_request(
     """
 
     target = _get_processor_target(processor)
-    status: SuccessStatus | FailedStatus
+    status: StatusResponse
     try:
-        result: str | list[ImplementationNode]
-        if target == "workflow":
-            original_request = getattr(processor, "original_request", None)
-            contains_plugin = False
-            if original_request is not None and hasattr(original_request, "nodes"):
-                contains_plugin = any(
-                    getattr(n, "type", None) == "plugin" for n in original_request.nodes
-                )
-            contains_placeholder = (
-                getattr(
-                    getattr(original_request, "metadata", None),
-                    "containsPlaceholder",
-                    False,
-                )
-                if original_request is not None
-                else False
+        await _report_processing(engine, uuid, createdAt, target)
+        async with asyncio.timeout(settings.processing_deadline_seconds):
+            result = await _compile(processor)
+        status = SuccessStatus(
+            uuid=uuid,
+            createdAt=createdAt,
+            completedAt=datetime.now(UTC),
+            progress=Progress(percentage=100, currentStep="done"),
+            result=get_result_url(uuid, settings),
+        )
+        await add_result_to_db(engine, uuid, result, target)
+        await update_status_response_in_db(engine, status, target)
+
+    except Exception as ex:
+        status = _aborted_status(uuid, createdAt, ex, settings) or FailedStatus(
+            uuid=uuid,
+            createdAt=createdAt,
+            progress=Progress(percentage=100, currentStep="done"),
+            result=LeqoProblemDetails.from_exception(
+                ex, is_debug=True, include_traceback=True
+            ),
+        )
+        await update_status_response_in_db(engine, status, target)
+
+
+def _aborted_status(
+    uuid: UUID, createdAt: datetime, ex: Exception, settings: Settings
+) -> CancelledStatus | TimeoutStatus | None:
+    """
+    Status of a request whose processing stopped due to cancellation or its deadline.
+
+    :param uuid: ID of the compile request
+    :param createdAt: Creation time of the compile request
+    :param ex: Exception that stopped the processing
+    :param settings: Settings from .env file
+    :return: The status or `None` if `ex` is an ordinary failure
+    """
+
+    if isinstance(ex, ProcessingCancelled):
+        return _cancelled_status(uuid, createdAt)
+    if isinstance(ex, TimeoutError):
+        # raised by asyncio.timeout if a single stage overran the deadline
+        ex = DeadlineExceeded(
+            not_none(settings.processing_deadline_seconds, "Timeout without deadline")
+        )
+    if isinstance(ex, DeadlineExceeded):
+        return TimeoutStatus(
+            uuid=uuid,
+            createdAt=createdAt,
+            progress=Progress(percentage=100, currentStep="done"),
+            result=LeqoProblemDetails(
+                status=504, title="Timeout", type=type(ex).__name__, detail=str(ex)
+            ),
+        )
+    return None
+
+
+def _cancelled_status(uuid: UUID, createdAt: datetime) -> CancelledStatus:
+    """
+    Status of a cancelled request.
+
+    :param uuid: ID of the compile request
+    :param createdAt: Creation time of the compile request
+    """
+
+    ex = ProcessingCancelled()
+    return CancelledStatus(
+        uuid=uuid,
+        createdAt=createdAt,
+        progress=Progress(percentage=100, currentStep="done"),
+        result=LeqoProblemDetails(
+            status=409, title="Cancelled", type=type(ex).__name__, detail=str(ex)
+        ),
+    )
+
+
+async def _compile(processor: MergingProcessor) -> str:
+    """
+    Compile the request of `processor` to its compilation target.
+
+    :param processor: Processor for the request
+    :return: The OpenQASM program or the BPMN workflow
+    """
+
+    target = _get_processor_target(processor)
+    if target == "workflow":
+        original_request = getattr(processor, "original_request", None)
+        contains_plugin = False
+        if original_request is not None and hasattr(original_request, "nodes"):
+            contains_plugin = any(
+                getattr(n, "type", None) == "plugin" for n in original_request.nodes
             )
-            print("Contains placeholder:", contains_placeholder)
-            print("Contains plugin:", contains_plugin)
-            if contains_plugin:
-                qasm = ""
-            else:
-                qasm = "" if contains_placeholder else await processor.process()
-            print("QASM")
-            print(qasm)
-            print("Requets")
-            print(processor.original_request)
-            workflow_processor = WorkflowProcessor(
-                processor.enricher,
-                processor.frontend_graph,
-                processor.optimize,
-                result=qasm,
-                original_request=processor.original_request,
+        contains_placeholder = (
+            getattr(
+                getattr(original_request, "metadata", None),
+                "containsPlaceholder",
+                False,
             )
-            workflow_processor.target = target
-            # result = await workflow_processor.process()
+            if original_request is not None
+            else False
+        )
+        print("Contains placeholder:", contains_placeholder)
+        print("Contains plugin:", contains_plugin)
+        if contains_plugin:
+            qasm = ""
+        else:
+            qasm = "" if contains_placeholder else await processor.process()
+        print("QASM")
+        print(qasm)
+        print("Requets")
+        print(processor.original_request)
+        workflow_processor = WorkflowProcessor(
+            processor.enricher,
+            processor.frontend_graph,
+            processor.optimize,
+            result=qasm,
+            original_request=processor.original_request,
+            parse_cache=processor.parse_cache,
+            budget=processor.budget,
+        )
+        workflow_processor.target = target
+        # result = await workflow_processor.process()
+
+        bpmn_xml = await workflow_processor.process()
+        print(f"[INFO] BPMN XML generated ({len(bpmn_xml)} chars)")
+        return bpmn_xml
+
+    print("ENRICHMENT vorher")
+    result = await processor.process()
+    print("ENRICHMENT fertig")
+    print(result)
+    return result
 
-            bpmn_xml = await workflow_processor.process()
-            print(f"[INFO] BPMN XML generated ({len(bpmn_xml)} chars)")
-            status = SuccessStatus(
+
+async def process_compile_batch(
+    createdAt: datetime,
+    members: list[tuple[UUID, MergingProcessor]],
+    settings: Settings,
+    engine: AsyncEngine,
+) -> None:
+    """
+    Process all members of a :class:`~app.model.CompileRequest.BatchCompileRequest`.
+
+    Members run one after another and share the caches of their processors.
+    Results and final statuses are persisted in bulk once all members are done.
+
+    :param createdAt: Creation time of the batch
+    :param members: ID and processor of each member
+    :param settings: Settings from .env file
+    :param engine: Database engine to use
+    """
+
+    await update_status_responses_in_db(
+        engine,
+        [
+            CreatedStatus(
                 uuid=uuid,
                 createdAt=createdAt,
-                completedAt=datetime.now(UTC),
-                progress=Progress(percentage=100, currentStep="done"),
-                result=get_result_url(uuid, settings),
+                progress=Progress(percentage=10, currentStep="processing"),
             )
+            for uuid, _ in members
+        ],
+    )
 
-            await add_result_to_db(engine, uuid, bpmn_xml, target)
-            await update_status_response_in_db(engine, status, target)
+    statuses: list[StatusResponse] = []
+    results: list[tuple[UUID, str, str]] = []
+    for uuid, processor in members:
+        try:
+            async with asyncio.timeout(settings.processing_deadline_seconds):
+                result = await _compile(processor)
+        except Exception as ex:
+            statuses.append(
+                _aborted_status(uuid, createdAt, ex, settings)
+                or FailedStatus(
+                    uuid=uuid,
+                    createdAt=createdAt,
+                    progress=Progress(percentage=100, currentStep="done"),
+                    result=LeqoProblemDetails.from_exception(
+                        ex, is_debug=True, include_traceback=True
+                    ),
+                )
+            )
+            continue
 
-        else:
-            print("ENRICHMENT vorher")
-            result = await processor.process()
-            print("ENRICHMENT fertig")
-            print(result)
-            status = SuccessStatus(
+        results.append((uuid, result, _get_processor_target(processor)))
+        statuses.append(
+            SuccessStatus(
                 uuid=uuid,
                 createdAt=createdAt,
                 completedAt=datetime.now(UTC),
                 progress=Progress(percentage=100, currentStep="done"),
                 result=get_result_url(uuid, settings),
             )
-            await add_result_to_db(engine, uuid, result, target)
-            await update_status_response_in_db(engine, status, target)
-
-    except Exception as ex:
-        status = FailedStatus(
-            uuid=uuid,
-            createdAt=createdAt,
-            progress=Progress(percentage=100, currentStep="done"),
-            result=LeqoProblemDetails.from_exception(
-                ex, is_debug=True, include_traceback=True
-            ),
         )
 
-    # await update_status_response_in_db(engine, status, target)
+    await update_status_responses_in_db(engine, statuses, results)
 
 
 async def process_enrich_request(
@@ -589,9 +1164,11 @@ async def process_enrich_request(
     """
 
     target = _get_processor_target(processor)
-    status: SuccessStatus | FailedStatus
+    status: StatusResponse
     try:
-        result = await processor.enrich_all()
+        await _report_processing(engine, uuid, createdAt, target)
+        async with asyncio.timeout(settings.processing_deadline_seconds):
+            result = await processor.enrich_all()
         await add_result_to_db(engine, uuid, result, target)
 
         status = SuccessStatus(
@@ -602,7 +1179,7 @@ async def process_enrich_request(
             result=get_result_url(uuid, settings),
         )
     except Exception as ex:
-        status = FailedStatus(
+        status = _aborted_status(uuid, createdAt, ex, settings) or FailedStatus(
             uuid=uuid,
             createdAt=createdAt,
             progress=Progress(percentage=100, currentStep="done"),
@@ -612,6 +1189,92 @@ async def process_enrich_request(
     await update_status_response_in_db(engine, status, target)
 
 
+_BATCH_JOB_PAYLOAD = TypeAdapter(list[tuple[UUID, CompileRequest]])
+"""Payload of :attr:`~app.job_queue.JobKind.COMPILE_BATCH` jobs: uuid and request of each member."""
+
+
+async def run_job(job: ClaimedJob, settings: Settings, engine: AsyncEngine) -> None:
+    """
+    Run a job claimed from the :mod:`app.job_queue`.
+
+    :param job: The job to run
+    :param settings: Settings from .env file
+    :param engine: Database engine to use
+    """
+
+    enricher = get_enricher(engine)
+    match job.kind:
+        case JobKind.COMPILE:
+            processor = MergingProcessor.from_compile_request(
+                CompileRequest.model_validate_json(job.payload), enricher, settings
+            )
+            processor.budget = ProcessingBudget.from_settings(
+                settings, job.cancellation
+            )
+            await process_compile_request(
+                job.id, job.created_at, processor, settings, engine
+            )
+        case JobKind.ENRICH:
+            enriching_processor = EnrichingProcessor.from_compile_request(
+                CompileRequest.model_validate_json(job.payload), enricher
+            )
+            enriching_processor.budget = ProcessingBudget.from_settings(
+                settings, job.cancellation
+            )
+            await process_enrich_request(
+                job.id, job.created_at, enriching_processor, settings, engine
+            )
+        case JobKind.COMPILE_BATCH:
+            shared_enricher = enricher.with_cache(EnrichmentCache())
+            parse_cache = ParseCache()
+            members: list[tuple[UUID, MergingProcessor]] = []
+            for uuid, request in _BATCH_JOB_PAYLOAD.validate_json(job.payload):
+                processor = MergingProcessor.from_compile_request(
+                    request, shared_enricher, settings
+                )
+                processor.parse_cache = parse_cache
+                processor.budget = ProcessingBudget.from_settings(
+                    settings, job.cancellation
+                )
+                members.append((uuid, processor))
+            await process_compile_batch(job.created_at, members, settings, engine)
+
+
+async def fail_job_requests(
+    job: ClaimedJob, error: Exception, engine: AsyncEngine
+) -> None:
+    """
+    Mark all requests of a job that is given up as failed.
+
+    :param job: The job that is given up
+    :param error: Cause of the last failed attempt
+    :param engine: Database engine to use
+    """
+
+    await update_status_responses_in_db(
+        engine,
+        [
+            FailedStatus(
+                uuid=uuid,
+                createdAt=job.created_at,
+                progress=Progress(percentage=100, currentStep="done"),
+                result=LeqoProblemDetails.from_exception(error),
+            )
+            for uuid in _job_request_ids(job)
+        ],
+    )
+
+
+def _job_request_ids(job: ClaimedJob) -> list[UUID]:
+    """
+    IDs of all requests processed by `job`.
+    """
+
+    if job.kind == JobKind.COMPILE_BATCH:
+        return [uuid for uuid, _ in _BATCH_JOB_PAYLOAD.validate_json(job.payload)]
+    return [job.id]
+
+
 @app.post(
     "/debug/compile",
     response_model=None,
@@ -778,31 +1441,57 @@ async def post_compileGroup(
     processor: Annotated[
         MergingProcessor, Depends(MergingProcessor.from_compile_request)
     ],
+    engine: Annotated[AsyncEngine, Depends(get_db_engine)],
     groupID: int = 0,  # default groupID is 0 #Annotated?
 ) -> str | JSONResponse:
     """
     Compiles the request to an openqasm3 program for the specified quantum group (groupID) in one request.
     No redirects and no polling of different endpoints needed.
 
+    The compiled groups are stored until enrichments are inserted,
+    so requesting another group of the same model is a lookup.
+    Groups that are not stored yet (e.g. because they failed before) are compiled on demand.
     """
 
     try:
-        target = _get_processor_target(processor)
-        # if target == "qasm": # needed?
-        # qasm = await processor.process()
-        workflow_processor = WorkflowProcessor(
-            processor.enricher,
-            processor.frontend_graph,
-            processor.optimize,
-            original_request=processor.original_request,
+        request_digest = compute_digest(
+            not_none(processor.original_request).model_dump_json().encode("utf-8")
         )
-        workflow_processor.target = target
-        quantum_groups = await workflow_processor.identify_quantum_groups()
-        # create subgraph of frontend graph for quantum group with groupID
-        group_nodes = quantum_groups[f"quantum_group_{groupID}"]
-        subgraph = processor.frontend_graph.create_subgraph(group_nodes)
-        processor.frontend_graph = subgraph
-        return await processor.process()
-    # TODO: IndexError abfangen & an Frontend zurück geben (groupID out of bounds)
+        program = await get_quantum_group_result(engine, request_digest, groupID)
+        if program is not None:
+            return program
+
+        quantum_groups = find_quantum_groups(processor.frontend_graph)
+        if not 0 <= groupID < len(quantum_groups):
+            return LeqoProblemDetails(
+                status=404,
+                title="Not Found",
+                detail=f"No quantum group with groupID '{groupID}' found, "
+                f"the model has {len(quantum_groups)} quantum groups.",
+            ).to_response()
+
+        indices = {group: index for index, group in enumerate(quantum_groups)}
+        stored = await get_stored_quantum_groups(engine, request_digest)
+        results = await processor.process_groups(
+            {
+                group: nodes
+                for group, nodes in quantum_groups.items()
+                if indices[group] not in stored
+            }
+        )
+        await store_quantum_group_results(
+            engine,
+            request_digest,
+            {
+                indices[group]: result
+                for group, result in results.items()
+                if isinstance(result, str)
+            },
+        )
+
+        result = results[f"quantum_group_{groupID}"]
+        if isinstance(result, Exception):
+            raise result
+        return result
     except Exception as ex:
         return LeqoProblemDetails.from_exception(ex, is_debug=True).to_response()
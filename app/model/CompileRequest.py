@@ -485,6 +485,9 @@ class QFTNode(BaseNode):
     inverse: bool = False
     """Whether to generate the inverse Quantum Fourier Transform."""
 
+    approximationDegree: int | None = Field(default=None, gt=0)
+    """Keep only rotations by pi/2^k with k up to this degree (exact QFT if not set)."""
+
     model_config = ConfigDict(use_attribute_docstrings=True)
 
 
@@ -1237,6 +1240,17 @@ class CompileRequest(BaseModel):
         return normalized
 
 
+class BatchCompileRequest(BaseModel):
+    """
+    Models a request to compile multiple :class:`CompileRequest` as one group.
+    """
+
+    requests: Annotated[list[CompileRequest], Field(min_length=1, max_length=1000)]
+    """Members of the batch. Each member gets its own status and result."""
+
+    model_config = ConfigDict(use_attribute_docstrings=True)
+
+
 EnrichableNode = (
     BoundaryNode
     | GateNode
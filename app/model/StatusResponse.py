@@ -27,6 +27,12 @@ class StatusType(StrEnum):
     COMPLETED = "completed"
     """The operation completed successfully"""
 
+    CANCELLED = "cancelled"
+    """The operation was cancelled on request"""
+
+    TIMEOUT = "timeout"
+    """The operation exceeded its deadline"""
+
 
 class Progress(BaseModel):
     """
@@ -115,4 +121,38 @@ class FailedStatus(StatusBase):
     model_config = ConfigDict(use_attribute_docstrings=True)
 
 
-StatusResponse = CreatedStatus | SuccessStatus | FailedStatus
+class CancelledStatus(StatusBase):
+    """
+    Models the status of a cancelled operation.
+    """
+
+    status: Literal[StatusType.CANCELLED] = StatusType.CANCELLED
+
+    completedAt: None = None
+    """The operation did not complete."""
+
+    result: LeqoProblemDetails
+    """Machine-readable information about the cancellation."""
+
+    model_config = ConfigDict(use_attribute_docstrings=True)
+
+
+class TimeoutStatus(StatusBase):
+    """
+    Models the status of an operation that exceeded its deadline.
+    """
+
+    status: Literal[StatusType.TIMEOUT] = StatusType.TIMEOUT
+
+    completedAt: None = None
+    """The operation did not complete."""
+
+    result: LeqoProblemDetails
+    """Machine-readable information about the exceeded deadline."""
+
+    model_config = ConfigDict(use_attribute_docstrings=True)
+
+
+StatusResponse = (
+    CreatedStatus | SuccessStatus | FailedStatus | CancelledStatus | TimeoutStatus
+)
@@ -5,7 +5,16 @@ Database schema for everything stored in the database.
 import uuid
 from datetime import datetime
 
-from sqlalchemy import UUID, ForeignKey, LargeBinary, String, Text
+from sqlalchemy import (
+    UUID,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from app.model.StatusResponse import StatusType
@@ -31,12 +40,18 @@ class StatusResponseDb(Base):
     completedAt: Mapped[datetime] = mapped_column(nullable=True)
     progressPercentage: Mapped[int] = mapped_column(nullable=False)
     progressCurrentStep: Mapped[str] = mapped_column(nullable=False)
-    result: Mapped[str] = mapped_column(Text, nullable=True)
+    result: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    content_encoding: Mapped[str] = mapped_column(
+        String, nullable=False, default="identity"
+    )
     name: Mapped[str | None] = mapped_column(String, nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     compilationTarget: Mapped[str] = mapped_column(
         String, nullable=False, default="qasm"
     )
+    batch_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), nullable=True, index=True
+    )
 
 
 class CompileResult(Base):
@@ -47,7 +62,11 @@ class CompileResult(Base):
     __tablename__ = "compile_results"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
-    implementation: Mapped[str] = mapped_column(nullable=False)
+    implementation: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    content_encoding: Mapped[str] = mapped_column(
+        String, nullable=False, default="identity"
+    )
+    etag: Mapped[str | None] = mapped_column(String, nullable=True)
     compilationTarget: Mapped[str] = mapped_column(
         String, nullable=False, default="qasm"
     )
@@ -61,7 +80,11 @@ class CompileRequestPayload(Base):
     __tablename__ = "compile_request_payloads"
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
-    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    content_encoding: Mapped[str] = mapped_column(
+        String, nullable=False, default="identity"
+    )
+    etag: Mapped[str | None] = mapped_column(String, nullable=True)
 
 
 class QuantumResourceModel(Base):
@@ -75,6 +98,7 @@ class QuantumResourceModel(Base):
     payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
     filename: Mapped[str | None] = mapped_column(String, nullable=True)
     content_type: Mapped[str | None] = mapped_column(String, nullable=True)
+    etag: Mapped[str | None] = mapped_column(String, nullable=True)
 
 
 class ServiceDeploymentModel(Base):
@@ -88,6 +112,25 @@ class ServiceDeploymentModel(Base):
     payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
     filename: Mapped[str | None] = mapped_column(String, nullable=True)
     content_type: Mapped[str | None] = mapped_column(String, nullable=True)
+    etag: Mapped[str | None] = mapped_column(String, nullable=True)
+
+
+class QuantumGroupResult(Base):
+    """
+    Store the compiled program of a quantum group of a compile request.
+
+    Requests are identified by the digest of their payload,
+    so any request with the same model finds the programs of all its groups.
+    """
+
+    __tablename__ = "quantum_group_results"
+
+    request_digest: Mapped[str] = mapped_column(String, primary_key=True)
+    group_index: Mapped[int] = mapped_column(Integer, primary_key=True)
+    implementation: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    content_encoding: Mapped[str] = mapped_column(
+        String, nullable=False, default="identity"
+    )
 
 
 class EnrichResult(Base):
@@ -101,6 +144,7 @@ class EnrichResult(Base):
     compilationTarget: Mapped[str] = mapped_column(
         String, nullable=False, default="qasm"
     )
+    etag: Mapped[str | None] = mapped_column(String, nullable=True)
     results: Mapped[list["SingleEnrichResult"]] = relationship(
         "SingleEnrichResult",
         back_populates="enrich_result",
@@ -128,3 +172,33 @@ class SingleEnrichResult(Base):
     enrich_result: Mapped["EnrichResult"] = relationship(
         "EnrichResult", back_populates="results"
     )
+
+
+class JobDb(Base):
+    """
+    Store a job of the durable job queue (see :mod:`app.job_queue`).
+
+    Times are taken from the database clock, so workers on different machines agree on leases.
+    """
+
+    __tablename__ = "jobs"
+    __table_args__ = (Index("ix_jobs_state_run_after", "state", "run_after"),)
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    kind: Mapped[str] = mapped_column(String, nullable=False)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    content_encoding: Mapped[str] = mapped_column(
+        String, nullable=False, default="identity"
+    )
+    state: Mapped[str] = mapped_column(String, nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    createdAt: Mapped[datetime] = mapped_column(nullable=False)
+    run_after: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    lease_owner: Mapped[str | None] = mapped_column(String, nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    cancel_requested: Mapped[bool] = mapped_column(nullable=False, default=False)
+    weight: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
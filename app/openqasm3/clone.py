@@ -0,0 +1,177 @@
+"""
+Fast structural cloning of OpenQASM ASTs and other dataclass trees.
+
+:func:`copy.deepcopy` records every copied object in a memo dictionary and dispatches
+via ``__reduce_ex__``, which is slow for the large trees of small dataclasses
+produced by the parser.
+:func:`clone` instead uses a copy function per class, generated once from the
+fields of the dataclass.
+
+* Immutable leaves (strings, numbers, enum members, frozen dataclasses of those) are shared.
+* Pydantic models, e.g. frontend nodes holding a parsed implementation, are supported as well.
+* Fields annotated with an immutable type are assigned without further dispatch.
+* No memo is kept, as ASTs are trees: an object referenced twice is copied twice.
+  Use :func:`copy.deepcopy` for graphs with shared mutable nodes or cycles.
+"""
+
+from collections.abc import Callable
+from copy import deepcopy
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import cache
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    Literal,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+from uuid import UUID
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+_IMMUTABLE_TYPES: frozenset[type] = frozenset(
+    {str, int, float, bool, complex, bytes, NoneType, UUID}
+)
+
+_cloners: dict[type, Callable[[Any], Any]] = {}
+
+
+def clone(value: T) -> T:
+    """
+    Copy a tree of dataclasses, lists, dicts and tuples.
+
+    :param value: Root of the tree, e.g. an :class:`openqasm3.ast.Program`.
+    :return: A copy sharing no mutable object with `value`.
+    """
+
+    cloner = _cloners.get(type(value))
+    if cloner is None:
+        cloner = _cloners[type(value)] = _create_cloner(type(value))
+    return cloner(value)  # type: ignore[no-any-return]
+
+
+def _share(value: T) -> T:
+    return value
+
+
+def _clone_list(value: list[Any]) -> list[Any]:
+    return [clone(item) for item in value]
+
+
+def _clone_tuple(value: tuple[Any, ...]) -> tuple[Any, ...]:
+    return tuple(clone(item) for item in value)
+
+
+def _clone_dict(value: dict[Any, Any]) -> dict[Any, Any]:
+    return {key: clone(item) for key, item in value.items()}
+
+
+@cache
+def _is_immutable(cls: type) -> bool:
+    """
+    Whether instances of `cls` can be shared between copies.
+
+    Frozen dataclasses are immutable if all their fields are annotated with immutable types.
+    """
+
+    if cls in _IMMUTABLE_TYPES or issubclass(cls, Enum):
+        return True
+    if not is_dataclass(cls) or not cls.__dataclass_params__.frozen:  # type: ignore[attr-defined]
+        return False
+    hints = _type_hints(cls)
+    return all(_is_immutable_hint(hints.get(f.name)) for f in fields(cls))
+
+
+def _is_immutable_hint(hint: Any) -> bool:
+    """
+    Whether all values of a field annotated with `hint` are immutable.
+    """
+
+    origin = get_origin(hint)
+    if origin is Literal:
+        return True
+    if origin in (Union, UnionType, tuple):
+        return all(arg is Ellipsis or _is_immutable_hint(arg) for arg in get_args(hint))
+    return isinstance(hint, type) and _is_immutable(hint)
+
+
+def _type_hints(cls: type) -> dict[str, Any]:
+    try:
+        return get_type_hints(cls)
+    except Exception:
+        return {}
+
+
+def _create_cloner(cls: type) -> Callable[[Any], Any]:  # noqa: PLR0911 Too many return statements
+    if _is_immutable(cls):
+        return _share
+    if cls is list:
+        return _clone_list
+    if cls is tuple:
+        return _clone_tuple
+    if cls is dict:
+        return _clone_dict
+    if is_dataclass(cls) and "__slots__" not in cls.__dict__:
+        return _create_dataclass_cloner(cls)
+    if issubclass(cls, BaseModel):
+        return _clone_model
+    return deepcopy
+
+
+def _create_dataclass_cloner(cls: type) -> Callable[[Any], Any]:
+    """
+    Generate a function copying the fields of a dataclass.
+
+    The instance is created without calling ``__init__``,
+    so fields excluded from it (e.g. ``span`` of AST nodes) are copied as well.
+    Instances with attributes besides their fields are copied attribute by attribute.
+    """
+
+    hints = _type_hints(cls)
+    names = [f.name for f in fields(cls)]
+    lines = [
+        f"{name!r}: d[{name!r}]"
+        if _is_immutable_hint(hints.get(name))
+        else f"{name!r}: clone(d[{name!r}])"
+        for name in names
+    ]
+    source = (
+        "def clone_dataclass(node):\n"
+        "    d = node.__dict__\n"
+        f"    if len(d) != {len(names)}:\n"
+        "        return clone_attributes(node)\n"
+        "    new = new_instance(cls)\n"
+        f"    new.__dict__ = {{{', '.join(lines)}}}\n"
+        "    return new\n"
+    )
+    namespace: dict[str, Any] = {
+        "cls": cls,
+        "clone": clone,
+        "clone_attributes": _clone_attributes,
+        "new_instance": object.__new__,
+    }
+    exec(source, namespace)
+    return namespace["clone_dataclass"]  # type: ignore[no-any-return]
+
+
+def _clone_attributes(node: T) -> T:
+    new = object.__new__(type(node))
+    new.__dict__ = _clone_dict(node.__dict__)
+    return new
+
+
+def _clone_model(model: BaseModel) -> BaseModel:
+    new = object.__new__(type(model))
+    object.__setattr__(new, "__dict__", _clone_dict(model.__dict__))
+    object.__setattr__(
+        new, "__pydantic_fields_set__", set(model.__pydantic_fields_set__)
+    )
+    object.__setattr__(new, "__pydantic_extra__", clone(model.__pydantic_extra__))
+    object.__setattr__(new, "__pydantic_private__", clone(model.__pydantic_private__))
+    return new
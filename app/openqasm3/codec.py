@@ -0,0 +1,413 @@
+"""
+Compact, versioned binary serialization of OpenQASM ASTs and other dataclass trees.
+
+Used as interchange format between processes and for persistent caches,
+where pickling large trees of small objects or printing and re-parsing is too slow.
+
+Layout of an encoded value:
+
+* Header: :data:`MAGIC`, :data:`VERSION` and the 32-bit fingerprint of the codec's types.
+* String table: Number of strings followed by each string as length-prefixed UTF-8.
+  Strings (identifiers, annotation keywords, ...) are stored once and referenced by index.
+* Root value: A tag byte followed by the payload of the tag.
+  Records (dataclasses) store their type id and their fields in declaration order,
+  integers are zigzag varints and lists of integers (e.g. qubit ids) are packed.
+
+The fingerprint covers the names and fields of all registered types,
+so data written by a different version of the AST is rejected instead of misread.
+"""
+
+import struct
+from collections.abc import Callable, Iterable
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from typing import Any, TypeVar, get_type_hints
+from uuid import UUID
+from zlib import crc32
+
+import openqasm3.ast
+
+from app.openqasm3.ast import CommentStatement
+
+T = TypeVar("T")
+
+MAGIC = b"LQ"
+VERSION = 1
+
+_NONE = 0
+_FALSE = 1
+_TRUE = 2
+_INT = 3
+_FLOAT = 4
+_STR = 5
+_LIST = 6
+_INT_LIST = 7
+_TUPLE = 8
+_DICT = 9
+_RECORD = 10
+_ENUM = 11
+_UUID = 12
+
+_FIELD_VALUE = 0
+_FIELD_INT = 1
+_FIELD_STR = 2
+_FIELD_BOOL = 3
+_FIELD_KINDS: dict[Any, int] = {int: _FIELD_INT, str: _FIELD_STR, bool: _FIELD_BOOL}
+"""Fields annotated with these types are stored without tag."""
+
+_RecordReader = tuple[type, tuple[tuple[str, Callable[[], Any]], ...]]
+"""Class of a record and the readers of its fields."""
+
+_DOUBLE = struct.Struct("<d")
+_HEADER = struct.Struct("<2sBI")
+
+
+class DecodeError(ValueError):
+    """
+    The data was not produced by a compatible :class:`Codec`.
+    """
+
+
+def _field_kinds(cls: type) -> tuple[tuple[str, int], ...]:
+    try:
+        hints = get_type_hints(cls)
+    except Exception:
+        hints = {}
+    return tuple(
+        (f.name, _FIELD_KINDS.get(hints.get(f.name), _FIELD_VALUE)) for f in fields(cls)
+    )
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:  # noqa: PLR2004 continuation bit
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class Codec:
+    """
+    Binary encoder and decoder for trees of registered dataclasses and enums.
+
+    Besides registered types, values may be ``None``, :class:`bool`, :class:`int`,
+    :class:`float`, :class:`str`, :class:`~uuid.UUID` and lists, tuples and dicts of values.
+    Shared objects are encoded once per reference, as ASTs are trees.
+
+    :param types: Dataclasses and enums to support. Their order defines the type ids.
+    """
+
+    types: tuple[type, ...]
+    fingerprint: int
+    _records: dict[type, tuple[int, tuple[tuple[str, int], ...]]]
+    _enums: dict[type, int]
+    _members: dict[Enum, int]
+    _decode_records: list[tuple[type, tuple[tuple[str, int], ...]] | None]
+    _decode_members: list[list[Enum] | None]
+
+    def __init__(self, types: Iterable[type]) -> None:
+        self.types = tuple(types)
+        self._records = {}
+        self._enums = {}
+        self._members = {}
+        member_lists: dict[type, list[Enum]] = {}
+        signature: list[str] = []
+        for type_id, cls in enumerate(self.types):
+            if issubclass(cls, Enum):
+                self._enums[cls] = type_id
+                members = member_lists[cls] = list(cls)
+                self._members.update((member, i) for i, member in enumerate(members))
+                names = tuple(member.name for member in members)
+            elif is_dataclass(cls):
+                record_fields = _field_kinds(cls)
+                self._records[cls] = (type_id, record_fields)
+                names = tuple(f"{name}:{kind}" for name, kind in record_fields)
+            else:
+                msg = f"{cls.__qualname__} is neither a dataclass nor an enum"
+                raise TypeError(msg)
+            signature.append(f"{cls.__module__}.{cls.__qualname__}:{','.join(names)}")
+        self.fingerprint = crc32("\n".join(signature).encode())
+        self._decode_records = [
+            (cls, self._records[cls][1]) if cls in self._records else None
+            for cls in self.types
+        ]
+        self._decode_members = [member_lists.get(cls) for cls in self.types]
+
+    def encode(self, value: object) -> bytes:
+        """
+        Encode a value.
+
+        :param value: Root of the tree to encode.
+        :return: The encoded value including header and string table.
+        :raises TypeError: If the tree contains an unsupported type.
+        """
+
+        strings: dict[str, int] = {}
+        body = bytearray()
+        self._encode_value(value, body, strings)
+
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, self.fingerprint))
+        _write_varint(out, len(strings))
+        for string in strings:
+            raw = string.encode()
+            _write_varint(out, len(raw))
+            out += raw
+        out += body
+        return bytes(out)
+
+    def _encode_value(  # noqa: PLR0912, PLR0915
+        self, value: object, out: bytearray, strings: dict[str, int]
+    ) -> None:
+        cls = type(value)
+        record = self._records.get(cls)
+        if record is not None:
+            type_id, record_fields = record
+            out.append(_RECORD)
+            _write_varint(out, type_id)
+            for name, kind in record_fields:
+                self._encode_field(getattr(value, name), kind, out, strings)
+        elif cls is str:
+            index = strings.get(value)  # type: ignore[call-overload]
+            if index is None:
+                index = strings[value] = len(strings)  # type: ignore[index]
+            out.append(_STR)
+            _write_varint(out, index)
+        elif value is None:
+            out.append(_NONE)
+        elif cls is bool:
+            out.append(_TRUE if value else _FALSE)
+        elif cls is int:
+            out.append(_INT)
+            _write_varint(out, _zigzag(value))  # type: ignore[arg-type]
+        elif cls is float:
+            out.append(_FLOAT)
+            out += _DOUBLE.pack(value)
+        elif cls is list:
+            items: list[Any] = value  # type: ignore[assignment]
+            if items and all(type(item) is int for item in items):
+                out.append(_INT_LIST)
+                _write_varint(out, len(items))
+                for item in items:
+                    _write_varint(out, _zigzag(item))
+            else:
+                out.append(_LIST)
+                _write_varint(out, len(items))
+                for item in items:
+                    self._encode_value(item, out, strings)
+        elif cls is tuple:
+            out.append(_TUPLE)
+            _write_varint(out, len(value))  # type: ignore[arg-type]
+            for item in value:  # type: ignore[attr-defined]
+                self._encode_value(item, out, strings)
+        elif cls is dict:
+            out.append(_DICT)
+            _write_varint(out, len(value))  # type: ignore[arg-type]
+            for key, item in value.items():  # type: ignore[attr-defined]
+                self._encode_value(key, out, strings)
+                self._encode_value(item, out, strings)
+        elif cls in self._enums:
+            out.append(_ENUM)
+            _write_varint(out, self._enums[cls])
+            _write_varint(out, self._members[value])  # type: ignore[index]
+        elif cls is UUID:
+            out.append(_UUID)
+            out += value.bytes  # type: ignore[attr-defined]
+        else:
+            msg = f"Can't encode value of type {cls.__qualname__}"
+            raise TypeError(msg)
+
+    def _encode_field(
+        self, value: object, kind: int, out: bytearray, strings: dict[str, int]
+    ) -> None:
+        if kind == _FIELD_VALUE:
+            self._encode_value(value, out, strings)
+        elif kind == _FIELD_INT and type(value) is int:
+            _write_varint(out, _zigzag(value))
+        elif kind == _FIELD_STR and type(value) is str:
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            _write_varint(out, index)
+        elif kind == _FIELD_BOOL and type(value) is bool:
+            out.append(value)
+        else:
+            msg = f"Can't encode {type(value).__qualname__} as field of kind {kind}"
+            raise TypeError(msg)
+
+    def decode(self, data: bytes, expected: type[T]) -> T:
+        """
+        Decode a value produced by :meth:`encode`.
+
+        :param data: The encoded value.
+        :param expected: Type of the root value.
+        :return: The decoded value.
+        :raises DecodeError: If the data is malformed, was encoded by an incompatible codec
+            or the root value is not an instance of `expected`.
+        """
+
+        if len(data) < _HEADER.size:
+            msg = "Data is too short"
+            raise DecodeError(msg)
+        magic, version, fingerprint = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            msg = f"Unsupported format {magic!r} version {version}"
+            raise DecodeError(msg)
+        if fingerprint != self.fingerprint:
+            msg = "Data was encoded with different types"
+            raise DecodeError(msg)
+
+        try:
+            value = self._decode(data, _HEADER.size)
+        except DecodeError:
+            raise
+        except (IndexError, KeyError, TypeError, ValueError, struct.error) as ex:
+            msg = "Data is malformed"
+            raise DecodeError(msg) from ex
+        if not isinstance(value, expected):
+            msg = f"Expected {expected.__qualname__}, got {type(value).__qualname__}"
+            raise DecodeError(msg)
+        return value
+
+    def _decode(self, data: bytes, pos: int) -> Any:  # noqa: PLR0915 Too many statements
+        """
+        Decode the string table and root value starting at `pos`.
+
+        The readers are closures over the position to avoid attribute lookups.
+        """
+
+        members = self._decode_members
+        unpack_double = _DOUBLE.unpack_from
+        new_instance: Callable[[type], Any] = object.__new__
+
+        def read_varint() -> int:
+            nonlocal pos
+            byte = data[pos]
+            pos += 1
+            if byte < 0x80:  # noqa: PLR2004 continuation bit
+                return byte
+            result = byte & 0x7F
+            shift = 7
+            while True:
+                byte = data[pos]
+                pos += 1
+                result |= (byte & 0x7F) << shift
+                if byte < 0x80:  # noqa: PLR2004 continuation bit
+                    return result
+                shift += 7
+
+        def read_int() -> int:
+            raw = read_varint()
+            return -((raw + 1) >> 1) if raw & 1 else raw >> 1
+
+        strings: list[str] = []
+        for _ in range(read_varint()):
+            length = read_varint()
+            strings.append(data[pos : pos + length].decode())
+            pos += length
+
+        def read_str() -> str:
+            return strings[read_varint()]
+
+        def read_bool() -> bool:
+            nonlocal pos
+            pos += 1
+            return data[pos - 1] == 1
+
+        def read_record() -> Any:
+            record = records[read_varint()]
+            if record is None:
+                raise KeyError(record)
+            cls, record_fields = record
+            instance = new_instance(cls)
+            instance.__dict__.update({name: read() for name, read in record_fields})
+            return instance
+
+        def read_float() -> float:
+            nonlocal pos
+            (value,) = unpack_double(data, pos)
+            pos += 8
+            return value  # type: ignore[no-any-return]
+
+        def read_int_list() -> list[int]:
+            return [read_int() for _ in range(read_varint())]
+
+        def read_enum() -> Enum:
+            enum_members = members[read_varint()]
+            if enum_members is None:
+                raise KeyError(enum_members)
+            return enum_members[read_varint()]
+
+        def read_uuid() -> UUID:
+            nonlocal pos
+            pos += 16
+            if pos > len(data):
+                raise IndexError(pos)
+            return UUID(bytes=bytes(data[pos - 16 : pos]))
+
+        readers: dict[int, Callable[[], Any]] = {
+            _NONE: lambda: None,
+            _FALSE: lambda: False,
+            _TRUE: lambda: True,
+            _INT: read_int,
+            _FLOAT: read_float,
+            _STR: read_str,
+            _LIST: lambda: [read_value() for _ in range(read_varint())],
+            _INT_LIST: read_int_list,
+            _TUPLE: lambda: tuple([read_value() for _ in range(read_varint())]),
+            _DICT: lambda: {read_value(): read_value() for _ in range(read_varint())},
+            _RECORD: read_record,
+            _ENUM: read_enum,
+            _UUID: read_uuid,
+        }
+
+        def read_value() -> Any:
+            nonlocal pos
+            tag = data[pos]
+            pos += 1
+            return readers[tag]()
+
+        field_readers: dict[int, Callable[[], Any]] = {
+            _FIELD_INT: read_int,
+            _FIELD_STR: read_str,
+            _FIELD_BOOL: read_bool,
+        }
+        records: list[_RecordReader | None] = [
+            None
+            if record is None
+            else (
+                record[0],
+                tuple(
+                    (name, field_readers.get(kind, read_value))
+                    for name, kind in record[1]
+                ),
+            )
+            for record in self._decode_records
+        ]
+
+        value = read_value()
+        if pos != len(data):
+            msg = "Trailing data after value"
+            raise DecodeError(msg)
+        return value
+
+
+AST_TYPES: tuple[type, ...] = (
+    *sorted(
+        (
+            cls
+            for cls in vars(openqasm3.ast).values()
+            if isinstance(cls, type)
+            and cls.__module__ == openqasm3.ast.__name__
+            and (is_dataclass(cls) or issubclass(cls, Enum))
+        ),
+        key=lambda cls: cls.__qualname__,
+    ),
+    CommentStatement,
+)
+"""All node and enum types of :mod:`openqasm3.ast` and :mod:`app.openqasm3.ast`."""
+
+AST_CODEC = Codec(AST_TYPES)
+"""Codec for OpenQASM ASTs, e.g. :class:`openqasm3.ast.Program`."""
@@ -2,10 +2,13 @@
 Contains services that are available via fastapi dependency injection.
 """
 
+import asyncio
+import logging
 import os
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from functools import lru_cache
+from importlib import import_module
 from typing import Annotated
 from uuid import UUID
 
@@ -20,11 +23,7 @@ from sqlalchemy.ext.asyncio import (
 
 from app.config import Settings
 from app.db_migrations import apply_migrations
-from app.enricher import Enricher
-from app.enricher.controlled_u import (
-    HAS_QISKIT_CONTROLLED_U,
-    ControlledUEnricherStrategy,
-)
+from app.enricher import Enricher, LazyEnricherStrategy
 from app.enricher.deutsch_jozsa import DeutschJozsaEnricherStrategy
 from app.enricher.encode_value import EncodeValueEnricherStrategy
 from app.enricher.gates import GateEnricherStrategy
@@ -38,15 +37,16 @@ from app.enricher.operator import OperatorEnricherStrategy
 from app.enricher.prepare_state import PrepareStateEnricherStrategy
 from app.enricher.qaoa import QAOAEnricherStrategy
 from app.enricher.qft import QFTEnricherStrategy
-from app.enricher.qiskit_prepare import HAS_QISKIT, QiskitPrepareStateEnricherStrategy
 from app.enricher.qpe import QPEEnricherStrategy
 from app.enricher.splitter import SplitterEnricherStrategy
 from app.enricher.universal_oracles import (
     GroverDiffuserEnricherStrategy,
     UniversalOracleEnricherStrategy,
 )
+from app.model.CompileRequest import ControlledUNode, PrepareStateNode
 from app.model.database_model import Base
-from app.utils import not_none
+from app.status_events import StatusBroker, listen_for_status_updates, status_broker
+from app.utils import get_status_response_from_db, not_none
 
 
 @asynccontextmanager
@@ -76,6 +76,15 @@ async def use_leqo_db() -> AsyncGenerator[AsyncEngine]:
         await engine.dispose()
 
 
+logger = logging.getLogger(__name__)
+
+LAZY_ENRICHER_MODULES = (
+    "app.enricher.encode_value_handlers.amplitude",
+    "app.enricher.encode_value_handlers.matrix",
+    "app.enricher.schmidt_decomposition",
+)
+"""Modules imported on first use by the encode value enricher."""
+
 engine_singleton: AsyncEngine | None = None
 
 
@@ -83,14 +92,27 @@ engine_singleton: AsyncEngine | None = None
 async def leqo_lifespan(_app: FastAPI | None = None) -> AsyncGenerator[None]:
     """
     Fastapi lifespan context manager.
-    Initializes the database.
+    Initializes the database, listens for status updates of other replicas
+    and warms up lazily loaded enrichers in the background.
     """
 
     global engine_singleton  # noqa PLW0603
 
     async with use_leqo_db() as engine:
         engine_singleton = engine
-        yield
+        warm_up = asyncio.create_task(asyncio.to_thread(warm_up_enrichers))
+        listener = asyncio.create_task(
+            listen_for_status_updates(
+                engine, status_broker, get_status_response_from_db
+            )
+        )
+        try:
+            yield
+        finally:
+            listener.cancel()
+            with suppress(asyncio.CancelledError):
+                await listener
+            warm_up.cancel()
 
 
 def get_db_engine() -> AsyncEngine:
@@ -102,6 +124,14 @@ def get_db_engine() -> AsyncEngine:
     return not_none(engine_singleton, "DataBase not initialized")
 
 
+def get_status_broker() -> StatusBroker:
+    """
+    Gets the broker delivering status updates in this process.
+    """
+
+    return status_broker
+
+
 def get_enricher(engine: Annotated[AsyncEngine, Depends(get_db_engine)]) -> Enricher:
     strategies = [
         LiteralEnricherStrategy(),
@@ -119,14 +149,9 @@ def get_enricher(engine: Annotated[AsyncEngine, Depends(get_db_engine)]) -> Enri
         GroverDiffuserEnricherStrategy(),
         GroverAlgorithmEnricherStrategy(),
     ]
-    if HAS_QISKIT:
-        strategies.append(QiskitPrepareStateEnricherStrategy())
-
-    if HAS_QISKIT_CONTROLLED_U:
-        strategies.append(ControlledUEnricherStrategy())
-
     strategies.extend(
         [
+            *_lazy_strategies(),
             OperatorEnricherStrategy(engine),
             GateEnricherStrategy(),
         ]
@@ -134,6 +159,43 @@ def get_enricher(engine: Annotated[AsyncEngine, Depends(get_db_engine)]) -> Enri
     return Enricher(*strategies)
 
 
+def _lazy_strategies() -> list[LazyEnricherStrategy]:
+    """
+    Strategies depending on qiskit, imported on first use to keep the startup fast.
+    """
+
+    return [
+        LazyEnricherStrategy(
+            "app.enricher.qiskit_prepare",
+            "QiskitPrepareStateEnricherStrategy",
+            (PrepareStateNode,),
+            available="HAS_QISKIT",
+        ),
+        LazyEnricherStrategy(
+            "app.enricher.controlled_u",
+            "ControlledUEnricherStrategy",
+            (ControlledUNode,),
+            available="HAS_QISKIT_CONTROLLED_U",
+        ),
+    ]
+
+
+def warm_up_enrichers() -> None:
+    """
+    Import the modules of lazily loaded strategies, so the first request using them is not delayed.
+
+    Failures are only logged, the affected strategies fail again on first use.
+    """
+
+    try:
+        for strategy in _lazy_strategies():
+            strategy.load()
+        for module in LAZY_ENRICHER_MODULES:
+            import_module(module)
+    except Exception:
+        logger.exception("Failed to warm up enrichers")
+
+
 @lru_cache
 def get_settings() -> Settings:
     """
@@ -0,0 +1,169 @@
+"""
+Push-based delivery of status updates.
+
+Status updates are fanned out to subscribers of the same process by the :class:`StatusBroker`.
+Other replicas are informed via PostgreSQL ``NOTIFY`` on :data:`STATUS_CHANNEL`,
+which is sent in the same transaction as the status update.
+Each replica ``LISTEN`` s on that channel (see :func:`listen_for_status_updates`)
+and forwards the updates to its own subscribers.
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, suppress
+from uuid import UUID, uuid4
+
+import psycopg
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.model.StatusResponse import StatusResponse, StatusType
+
+logger = logging.getLogger(__name__)
+
+STATUS_CHANNEL = "leqo_status"
+"""PostgreSQL notification channel for status updates."""
+
+INSTANCE_ID = uuid4().hex
+"""Identifies this process in notifications, so it can skip its own updates."""
+
+LISTEN_RETRY_DELAY = 5.0
+"""Seconds to wait before reconnecting a failed listener."""
+
+KEEP_ALIVE_INTERVAL = 15.0
+"""Seconds after which an idle event stream sends a comment to keep the connection open."""
+
+KEEP_ALIVE_EVENT = ": keep-alive\n\n"
+
+
+def is_terminal(status: StatusResponse) -> bool:
+    """
+    Whether no further status updates will follow.
+    """
+
+    return status.status != StatusType.IN_PROGRESS
+
+
+def notification_payload(uuid: UUID) -> str:
+    """
+    Payload of the ``NOTIFY`` sent when the status of `uuid` changes.
+    """
+
+    return json.dumps({"uuid": str(uuid), "origin": INSTANCE_ID})
+
+
+def format_event(status: StatusResponse) -> str:
+    """
+    Format a status update as Server-Sent Event.
+    """
+
+    return f"event: status\ndata: {status.model_dump_json()}\n\n"
+
+
+class StatusBroker:
+    """
+    In-process fan-out of status updates to subscribers.
+
+    Updates may be published from other threads (jobs run on their own event loop),
+    they are handed to each subscriber on the loop it subscribed from.
+    """
+
+    _subscribers: defaultdict[
+        UUID, dict[asyncio.Queue[StatusResponse], asyncio.AbstractEventLoop]
+    ]
+
+    def __init__(self) -> None:
+        self._subscribers = defaultdict(dict)
+
+    def has_subscribers(self, uuid: UUID) -> bool:
+        """
+        Whether someone in this process is waiting for updates on `uuid`.
+        """
+
+        return bool(self._subscribers.get(uuid))
+
+    def publish(self, status: StatusResponse) -> None:
+        """
+        Deliver a status update to all current subscribers of its uuid.
+        """
+
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+
+        for queue, loop in list(self._subscribers.get(status.uuid, {}).items()):
+            if loop is current:
+                queue.put_nowait(status)
+            else:
+                with suppress(RuntimeError):  # the subscriber's loop is closed
+                    loop.call_soon_threadsafe(queue.put_nowait, status)
+
+    @asynccontextmanager
+    async def subscribe(
+        self, uuid: UUID
+    ) -> AsyncIterator[asyncio.Queue[StatusResponse]]:
+        """
+        Receive all status updates for `uuid` published while the context is active.
+        """
+
+        queue: asyncio.Queue[StatusResponse] = asyncio.Queue()
+        self._subscribers[uuid][queue] = asyncio.get_running_loop()
+        try:
+            yield queue
+        finally:
+            subscribers = self._subscribers[uuid]
+            subscribers.pop(queue, None)
+            if not subscribers:
+                del self._subscribers[uuid]
+
+
+status_broker = StatusBroker()
+"""The broker of this process."""
+
+
+async def listen_for_status_updates(
+    engine: AsyncEngine,
+    broker: StatusBroker,
+    load_status: Callable[[AsyncEngine, UUID], Awaitable[StatusResponse | None]],
+) -> None:
+    """
+    Forward status updates of other replicas to `broker` until cancelled.
+
+    Uses a dedicated connection outside of the pool of `engine`.
+    Notifications only carry the uuid, so the status is loaded from the database,
+    but only if this process has a subscriber for it.
+
+    :param engine: Database to listen on.
+    :param broker: Broker to publish the updates to.
+    :param load_status: Loads the current status of a request.
+    """
+
+    conninfo = engine.url.set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(
+                conninfo, autocommit=True
+            ) as conn:
+                await conn.execute(f"LISTEN {STATUS_CHANNEL}")
+                async for notification in conn.notifies():
+                    payload = json.loads(notification.payload)
+                    if payload.get("origin") == INSTANCE_ID:
+                        continue
+
+                    uuid = UUID(payload["uuid"])
+                    if not broker.has_subscribers(uuid):
+                        continue
+
+                    status = await load_status(engine, uuid)
+                    if status is not None:
+                        broker.publish(status)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Status listener failed, reconnecting")
+            await asyncio.sleep(LISTEN_RETRY_DELAY)
@@ -4,8 +4,10 @@ Provides the ore logic of the backend.
 
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterator
+from itertools import chain
 import re
 from typing import Annotated, Any, Literal, cast
 
@@ -14,7 +16,12 @@ from networkx.algorithms.dag import topological_sort
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from app.config import Settings
-from app.enricher import Constraints, Enricher, ParsedImplementationNode
+from app.enricher import (
+    Constraints,
+    EnrichmentCache,
+    Enricher,
+    ParsedImplementationNode,
+)
 from app.model.CompileRequest import (
     ArrayLiteralNode,
     BitLiteralNode,
@@ -35,7 +42,13 @@ from app.model.CompileRequest import Node as FrontendNode
 from app.model.data_types import IntType, LeqoSupportedType
 from app.openqasm3.printer import leqo_dumps
 from app.services import get_db_engine, get_enricher, get_settings
+from app.transformation_manager.archives import (
+    ArchiveFile,
+    generate_qrms,
+    generate_service_zips,
+)
 from app.transformation_manager.bpmn_builder import BpmnBuilder
+from app.transformation_manager.budget import ProcessingBudget
 from app.transformation_manager.frontend_graph import FrontendGraph, TBaseNode
 from app.transformation_manager.graph import (
     ClassicalIOInstance,
@@ -50,21 +63,14 @@ from app.transformation_manager.nested.repeat import unroll_repeat
 from app.transformation_manager.nested.utils import generate_pass_node_implementation
 from app.transformation_manager.optimize import optimize
 from app.transformation_manager.post import postprocess
-from app.transformation_manager.pre import preprocess
+from app.transformation_manager.pre import ParseCache, preprocess
 from app.transformation_manager.pre.utils import PreprocessingException
 from app.utils import not_none
 import xml.etree.ElementTree as ET
 import xml.etree.ElementTree as ET
 from typing import Iterable, Dict, Tuple
-import uuid
 import random
 import string
-import io
-import zipfile
-from pathlib import Path
-import os
-import io
-import json
 import traceback
 
 traceback.print_exc()
@@ -96,6 +102,8 @@ class CommonProcessor:
     :param enricher: The enricher to use to get node implementations
     :frontend_graph: The graph to process
     :optimize_settings: Specify how to optimize the result
+    :parse_cache: Optional cache to share parsed implementations with other requests
+    :budget: Limits checked during processing, unlimited by default
     """
 
     frontend_graph: FrontendGraph
@@ -106,8 +114,10 @@ class CommonProcessor:
     target: Literal["qasm", "workflow"] = "qasm"
     original_request: CompileRequest | None = None
     result: str | None = None
-    qrms: Any | None = None
-    service_deployment_models: Any | None = None
+    qrms: ArchiveFile | None = None
+    service_deployment_models: ArchiveFile | None = None
+    parse_cache: ParseCache | None = None
+    budget: ProcessingBudget
 
     def __init__(
         self,
@@ -117,8 +127,12 @@ class CommonProcessor:
         qiskit_compat: bool = False,
         result: str | None = None,
         original_request: CompileRequest | None = None,
+        parse_cache: ParseCache | None = None,
+        budget: ProcessingBudget | None = None,
     ) -> None:
         self.enricher = enricher
+        self.parse_cache = parse_cache
+        self.budget = budget if budget is not None else ProcessingBudget()
         self.frontend_graph = frontend_graph
         self.optimize = optimize_settings
         self.graph = ProgramGraph()
@@ -247,6 +261,7 @@ class MergingProcessor(CommonProcessor):
             graph,
             request.metadata,
             qiskit_compat=settings.qiskit_compat_mode,
+            budget=ProcessingBudget.from_settings(settings),
         )
         processor.target = request.compilation_target
         processor.original_request = request
@@ -258,10 +273,13 @@ class MergingProcessor(CommonProcessor):
         """
         for node in topological_sort(self.frontend_graph):
             frontend_node = self.frontend_graph.node_data[node]
+            self.budget.checkpoint()
+            self.budget.add_node(frontend_node)
 
             missing_constant_inputs: set[int] = set()
 
             if isinstance(frontend_node, RepeatNode):
+                self.budget.check_unroll(frontend_node)
                 requested_inputs, _ = self._resolve_inputs(node)
                 entry_node_id, exit_node_id, enrolled_graph = unroll_repeat(
                     frontend_node,
@@ -305,6 +323,10 @@ class MergingProcessor(CommonProcessor):
                     ProgramNode(node),
                     enriched_node.implementation,
                     requested_inputs,
+                    self.parse_cache,
+                )
+                self.budget.add_statements(
+                    len(processed_node.implementation.statements), frontend_node
                 )
                 if isinstance(frontend_node, EncodeValueNode) and requested_values:
                     missing_constant_inputs = {
@@ -347,6 +369,8 @@ class MergingProcessor(CommonProcessor):
             frontend_graph,
             self.optimize,
             qiskit_compat=self.qiskit_compat,
+            parse_cache=self.parse_cache,
+            budget=self.budget,
         )
         await processor.process_nodes()
 
@@ -390,6 +414,7 @@ class MergingProcessor(CommonProcessor):
         await self.process_nodes()
         print("nodes")
 
+        self.budget.checkpoint()
         if self.optimize.optimizeWidth is not None:
             optimize(self.graph)
 
@@ -398,7 +423,10 @@ class MergingProcessor(CommonProcessor):
         # if self.qiskit_compat and self.target == "qasm":
         literal_nodes, used_literal_nodes = self._collect_literal_nodes()
 
+        self.budget.checkpoint()
         merged_program = merge_nodes(self.graph)
+        self.budget.check_qubit_width(merged_program)
+        self.budget.checkpoint()
         processed_program = postprocess(
             merged_program,
             qiskit_compat=self.qiskit_compat,
@@ -408,6 +436,47 @@ class MergingProcessor(CommonProcessor):
         print("final programm")
         return leqo_dumps(processed_program)
 
+    async def process_groups(
+        self, groups: dict[str, list[Any]]
+    ) -> dict[str, str | Exception]:
+        """
+        Compile each quantum group of the graph to its own program.
+
+        Groups are compiled concurrently and share enrichments and parsed implementations,
+        so nodes used by several groups (e.g. shared inputs) are enriched only once.
+        A failing group does not affect the others.
+
+        :param groups: Quantum groups as returned by :func:`find_quantum_groups`.
+        :return: The program or the error of each group.
+        """
+        enricher = self.enricher
+        if enricher.cache is None:
+            enricher = enricher.with_cache(EnrichmentCache())
+        parse_cache = self.parse_cache if self.parse_cache is not None else ParseCache()
+
+        async def process_group(nodes: list[Any]) -> str:
+            processor = MergingProcessor(
+                enricher,
+                self.frontend_graph.create_subgraph(nodes),
+                self.optimize,
+                qiskit_compat=self.qiskit_compat,
+                original_request=self.original_request,
+                parse_cache=parse_cache,
+                budget=self.budget,
+            )
+            return await processor.process()
+
+        results = await asyncio.gather(
+            *(process_group(nodes) for nodes in groups.values()),
+            return_exceptions=True,
+        )
+        programs: dict[str, str | Exception] = {}
+        for group_id, result in zip(groups, results, strict=True):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+            programs[group_id] = result
+        return programs
+
 
 class EnrichingProcessor(CommonProcessor):
     """
@@ -456,7 +525,9 @@ class EnrichingProcessor(CommonProcessor):
         for pred in list(frontend_graph.predecessors(node.id)):
             frontend_graph.remove_edge(pred, node.id)
 
-        processor = EnrichingProcessor(self.enricher, frontend_graph, self.optimize)
+        processor = EnrichingProcessor(
+            self.enricher, frontend_graph, self.optimize, budget=self.budget
+        )
         async for enriched_node in processor.enrich():
             if enriched_node.id != node.id:
                 yield enriched_node
@@ -469,6 +540,8 @@ class EnrichingProcessor(CommonProcessor):
         """
         for node in topological_sort(self.frontend_graph):
             frontend_node = self.frontend_graph.node_data[node]
+            self.budget.checkpoint()
+            self.budget.add_node(frontend_node)
             requested_inputs, requested_values = self._resolve_inputs(node)
 
             match frontend_node:
@@ -519,6 +592,56 @@ class EnrichingProcessor(CommonProcessor):
 CLASSICAL_TYPES = {"int", "float", "angle", "boolean", "bit", "file", "string"}
 
 
+def _is_quantum(node: TBaseNode) -> bool:
+    return getattr(node, "type", None) not in CLASSICAL_TYPES
+
+
+def find_quantum_groups(graph: FrontendGraph) -> dict[str, list[Any]]:
+    """
+    Group the quantum nodes of `graph` into weakly connected components.
+
+    Plugin nodes join the group of adjacent quantum nodes but do not start a group.
+    The traversal is iterative, so long chains do not hit the recursion limit.
+
+    :param graph: The graph to group.
+    :return: Nodes of each group keyed by ``quantum_group_<n>``, in traversal order.
+    """
+
+    groups: dict[str, list[Any]] = {}
+    visited: set[str] = set()
+
+    def neighbours(node_id: str) -> Iterator[str]:
+        for neighbour_id in chain(
+            graph.successors(node_id), graph.predecessors(node_id)
+        ):
+            if _is_quantum(graph.node_data[neighbour_id]):
+                yield neighbour_id
+
+    for root_id in graph.nodes:
+        root = graph.node_data.get(root_id)
+        if (
+            root is None
+            or root_id in visited
+            or not _is_quantum(root)
+            or getattr(root, "type", None) == "plugin"
+        ):
+            continue
+
+        group = groups[f"quantum_group_{len(groups)}"] = [root]
+        visited.add(root_id)
+        stack = [neighbours(root_id)]
+        while stack:
+            node_id = next(stack[-1], None)
+            if node_id is None:
+                stack.pop()
+            elif node_id not in visited:
+                visited.add(node_id)
+                group.append(graph.node_data[node_id])
+                stack.append(neighbours(node_id))
+
+    return groups
+
+
 class WorkflowProcessor(CommonProcessor):
     """Process a request to a workflow representation."""
 
@@ -538,6 +661,7 @@ class WorkflowProcessor(CommonProcessor):
     async def process(self) -> tuple[str, bytes]:
         """Run enrichment, classify nodes, group quantum nodes, and return BPMN XML."""
 
+        self.budget.checkpoint()
         # Identify quantum groups
         quantum_groups = await self.identify_quantum_groups()
 
@@ -609,7 +733,7 @@ class WorkflowProcessor(CommonProcessor):
 
         # Generate QRMs
         if quantum_groups:
-            qrms = await generate_qrms(quantum_groups)
+            self.qrms = await generate_qrms(quantum_groups)
         # return service_zip_bytes
         return bpmn_xml
 
@@ -617,241 +741,17 @@ class WorkflowProcessor(CommonProcessor):
         """
         Returns a dictionary of quantum groups keyed by group ID.
         """
-        # Collect quantum nodes
-        quantum_nodes = [
-            self.frontend_graph.node_data[node_id]
-            for node_id in self.frontend_graph.nodes
-            if (
-                node_id in self.frontend_graph.node_data
-                and getattr(self.frontend_graph.node_data[node_id], "type", None)
-                not in CLASSICAL_TYPES
-                and getattr(self.frontend_graph.node_data[node_id], "type", None)
-                != "plugin"
-            )
-        ]
-
-        # print(f"Quantum nodes: {[node.id for node in quantum_nodes]}")
-
-        # Group by connected components using DFS
-        groups: dict[str, list[Any]] = defaultdict(list)
-        visited = set()
-
-        def dfs(node: TBaseNode, group_id: str) -> None:
-            if node.id in visited:
-                return
-            visited.add(node.id)
-            groups[group_id].append(node)
-
-            # Traverse neighbors
-            for neighbor_id in self.frontend_graph.successors(node.id):
-                neighbor = self.frontend_graph.node_data[neighbor_id]
-                if getattr(neighbor, "type", None) not in CLASSICAL_TYPES:
-                    dfs(neighbor, group_id)
-            for neighbor_id in self.frontend_graph.predecessors(node.id):
-                neighbor = self.frontend_graph.node_data[neighbor_id]
-                if getattr(neighbor, "type", None) not in CLASSICAL_TYPES:
-                    dfs(neighbor, group_id)
-
-        group_counter = 0
-        for node in quantum_nodes:
-            if node.id not in visited:
-                dfs(node, f"quantum_group_{group_counter}")
-                group_counter += 1
-
-        return dict(groups)
+        return find_quantum_groups(self.frontend_graph)
 
     async def generate_service_zips(
         self, composite_nodes: list[str], node_metadata: dict[str, dict[str, Any]]
-    ) -> bytes:
+    ) -> ArchiveFile:
         """
         Generate one ZIP per node.
         Each ZIP contains a single service with logic ONLY for that node.
         """
-        output_dir = "/tmp/generated_services"
-        os.makedirs(output_dir, exist_ok=True)
-
-        master_zip_buffer = io.BytesIO()
-
-        with zipfile.ZipFile(
-            master_zip_buffer, mode="w", compression=zipfile.ZIP_DEFLATED
-        ) as master_zip:
-            for node_id in composite_nodes:
-                activity_name = "Activity_" + node_id.replace(" ", "_")
-
-                if "_human" in activity_name:
-                    continue
-
-                activity_zip_buffer = io.BytesIO()
-
-                with zipfile.ZipFile(
-                    activity_zip_buffer, mode="w", compression=zipfile.ZIP_DEFLATED
-                ) as activity_zip:
-                    # ---------- inner service.zip ----------
-                    inner_service_buffer = io.BytesIO()
-                    with zipfile.ZipFile(
-                        inner_service_buffer, mode="w", compression=zipfile.ZIP_DEFLATED
-                    ) as inner_service_zip:
-                        # ---------- serialize request ----------
-                        assert self.original_request is not None
-                        try:
-                            full_request_json = self.original_request.json()
-                        except Exception:
-                            full_request_json = json.loads(
-                                self.original_request.json(
-                                    exclude_none=True, exclude_unset=True
-                                )
-                            )
-
-                        safe_request_str = json.dumps(
-                            full_request_json, indent=4, ensure_ascii=False
-                        )
-
-                        # ---------- app.py ----------
-                        app_lines = [
-                            "import requests",
-                            "import time",
-                            "import json",
-                            "import os",
-                            "",
-                            "BACKEND_URL = os.environ.get('BACKEND_URL', 'http://localhost:8000')",
-                            "",
-                            "def main(**kwargs):",
-                        ]
-
-                        # ===== NODE-SPECIFIC LOGIC =====
-
-                        if node_id.endswith("_model"):
-                            app_lines += [
-                                f"    # Logic for {node_id}",
-                                f"    model_data = {safe_request_str}",
-                                f"    return model_data",
-                            ]
-
-                        elif node_id.endswith("_send_compile"):
-                            app_lines += [
-                                f"    # Logic for {node_id}",
-                                f"    model_data = {safe_request_str}",
-                                f"    model = json.loads(model_data)",
-                                f'    url = f"{{BACKEND_URL}}/compile"',
-                                f"    response = requests.post(url, json=model)",
-                                f"    response.raise_for_status()",
-                                f"    data = response.json()",
-                                f"    uuid = data.get('uuid')",
-                                f"    if not uuid:",
-                                f"        raise ValueError('Backend response does not contain uuid')",
-                                f"    return uuid",
-                            ]
-
-                        elif node_id.endswith("_poll_result"):
-                            app_lines += [
-                                f"    # Logic for {node_id}",
-                                f"    uuid = kwargs.get('uuid')",
-                                f"    if not uuid:",
-                                f"        raise ValueError('Missing uuid')",
-                                f'    status_url = f"{{BACKEND_URL}}/status/{{uuid}}"',
-                                f"    for attempt in range(20):",
-                                f"        resp = requests.get(status_url)",
-                                f"        if resp.ok:",
-                                f"            data = resp.json()",
-                                f"            if data.get('status') in ('completed','failed'):",
-                                f"                return data",
-                                f"        time.sleep(10)",
-                                f"    return {{'status': 'timeout'}}",
-                            ]
-
-                        elif node_id.endswith("_set_vars"):
-                            app_lines += [
-                                f"    # Logic for {node_id}",
-                                f"    status = kwargs.get('status')",
-                                f"    location = kwargs.get('location')",
-                                f"    result = {{'status': status, 'location': location}}",
-                                f"    with open('final_result.json', 'w') as f:",
-                                f"        json.dump(result, f)",
-                                f"    return result",
-                            ]
-
-                        else:
-                            app_lines += [
-                                f"    raise NotImplementedError('Unknown node type: {node_id}')"
-                            ]
-
-                        inner_service_zip.writestr("app.py", "\n".join(app_lines))
-
-                        # ---------- polling_agent.py ----------
-                        polling_agent_code = (
-                            "import threading\n"
-                            "import base64\n"
-                            "import os\n"
-                            "import requests\n"
-                            "import app\n\n"
-                            "def poll():\n"
-                            "    body = {\n"
-                            "        'workerId': 'WP67GZ6N9ZX5',\n"
-                            "        'maxTasks': 1,\n"
-                            "        'topics': [{'topicName': topic, 'lockDuration': 60000}]\n"
-                            "    }\n"
-                            "    try:\n"
-                            "        response = requests.post(pollingEndpoint + '/fetchAndLock', json=body)\n"
-                            "        if response.status_code == 200:\n"
-                            "            for task in response.json():\n"
-                            "                variables = task.get('variables', {})\n"
-                            "                result = app.main()\n"
-                            "                body = {'workerId': 'WP67GZ6N9ZX5', 'variables': {}}\n"
-                            "                body['variables']['result'] = {\n"
-                            "                    'value': base64.b64encode(str(result).encode()).decode(),\n"
-                            "                    'type': 'File',\n"
-                            "                    'valueInfo': {'filename': 'result.txt'}\n"
-                            "                }\n"
-                            "                requests.post(\n"
-                            "                    pollingEndpoint + '/' + task.get('id') + '/complete',\n"
-                            "                    json=body\n"
-                            "                )\n"
-                            "    except Exception as e:\n"
-                            "        print('Polling error:', e)\n"
-                            "    threading.Timer(8, poll).start()\n\n"
-                            "camundaEndpoint = os.environ['CAMUNDA_ENDPOINT']\n"
-                            "pollingEndpoint = camundaEndpoint + '/external-task'\n"
-                            "topic = os.environ['CAMUNDA_TOPIC']\n"
-                            "poll()\n"
-                        )
-
-                        inner_service_zip.writestr(
-                            "polling_agent.py", polling_agent_code
-                        )
-
-                        inner_service_zip.writestr("requirements.txt", "requests\n")
-
-                    # ---------- Docker layer ----------
-                    middle_service_buffer = io.BytesIO()
-                    with zipfile.ZipFile(
-                        middle_service_buffer,
-                        mode="w",
-                        compression=zipfile.ZIP_DEFLATED,
-                    ) as middle_zip:
-                        middle_zip.writestr(
-                            "service.zip", inner_service_buffer.getvalue()
-                        )
-
-                        middle_zip.writestr(
-                            "Dockerfile",
-                            """FROM python:3.8-slim
-    COPY service.zip /tmp/service.zip
-    RUN apt-get update && apt-get install -y unzip \
-        && unzip /tmp/service.zip -d /service \
-        && pip install -r /service/requirements.txt
-    CMD ["python", "/service/polling_agent.py"]
-    """,
-                        )
-
-                    activity_zip.writestr(
-                        "service.zip", middle_service_buffer.getvalue()
-                    )
-
-                master_zip.writestr(
-                    f"{activity_name}.zip", activity_zip_buffer.getvalue()
-                )
-
-        return master_zip_buffer.getvalue()
+        assert self.original_request is not None
+        return await generate_service_zips(composite_nodes, self.original_request)
 
 
 class EnrichmentInserter:
@@ -966,112 +866,3 @@ def _implementation_nodes_to_bpmn_xml(
     )
 
     return builder.build()
-
-
-async def generate_qrms(quantum_groups: dict[str, list[ImplementationNode]]) -> bytes:
-    """
-    Generate QRM BPMN files for each quantum node in the provided groups.
-
-    For each quantum node:
-    - Create a detector BPMN (quantumCircuitLoadingTask)
-    - Create a replacement BPMN (serviceTask with deploymentModelUrl)
-    - Package both into a ZIP file named after the node (e.g. node_id.zip)
-
-    Returns:
-        dict[str, bytes]: mapping of node_id -> zip file content (bytes)
-    """
-
-    output_dir = "/tmp/generated_qrms"
-    os.makedirs(output_dir, exist_ok=True)
-
-    combined_zip_buffer = io.BytesIO()
-
-    with zipfile.ZipFile(
-        combined_zip_buffer, mode="w", compression=zipfile.ZIP_DEFLATED
-    ) as combined_zip:
-        for group_id, nodes in quantum_groups.items():
-            for node in nodes:
-                node_id = getattr(node, "id", "unknown_node")
-                node_label = getattr(node, "label", node_id)
-
-                # Detector BPMN
-                detector_defs = ET.Element(
-                    "bpmn:definitions",
-                    {
-                        "xmlns:bpmn": "http://www.omg.org/spec/BPMN/20100524/MODEL",
-                        "xmlns:bpmndi": "http://www.omg.org/spec/BPMN/20100524/DI",
-                        "xmlns:dc": "http://www.omg.org/spec/DD/20100524/DC",
-                        "xmlns:quantme": "https://github.com/UST-QuAntiL/QuantME-Quantum4BPMN",
-                        "id": f"Definitions_{uuid.uuid4().hex[:BPMN_FLOW_ID_LENGTH]}",
-                        "targetNamespace": "http://bpmn.io/schema/bpmn",
-                        "exporter": "QuantME Modeler",
-                        "exporterVersion": "4.4.0",
-                    },
-                )
-
-                process_id = f"Process_{uuid.uuid4().hex[:BPMN_FLOW_ID_LENGTH]}"
-                process_el = ET.SubElement(
-                    detector_defs,
-                    "bpmn:process",
-                    {"id": process_id, "isExecutable": "true"},
-                )
-                detector_task_id = f"Task_{uuid.uuid4().hex[:BPMN_FLOW_ID_LENGTH]}"
-                ET.SubElement(
-                    process_el,
-                    "quantme:quantumCircuitLoadingTask",
-                    {"id": detector_task_id, "url": f"{node_label}/maxcut"},
-                )
-
-                detector_xml = ET.tostring(
-                    detector_defs, encoding="utf-8", xml_declaration=True
-                ).decode("utf-8")
-
-                # Replacement BPMN
-                executor_defs = ET.Element(
-                    "bpmn:definitions",
-                    {
-                        "xmlns:bpmn": "http://www.omg.org/spec/BPMN/20100524/MODEL",
-                        "xmlns:bpmndi": "http://www.omg.org/spec/BPMN/20100524/DI",
-                        "xmlns:dc": "http://www.omg.org/spec/DD/20100524/DC",
-                        "xmlns:quantme": "https://github.com/UST-QuAntiL/QuantME-Quantum4BPMN",
-                        "id": f"Definitions_{uuid.uuid4().hex[:BPMN_FLOW_ID_LENGTH]}",
-                        "targetNamespace": "http://bpmn.io/schema/bpmn",
-                        "exporter": "QuantME Modeler",
-                        "exporterVersion": "4.5.0-nightly.20211118",
-                    },
-                )
-
-                executor_process_id = (
-                    f"Process_{uuid.uuid4().hex[:BPMN_FLOW_ID_LENGTH]}"
-                )
-                executor_process = ET.SubElement(
-                    executor_defs,
-                    "bpmn:process",
-                    {"id": executor_process_id, "isExecutable": "true"},
-                )
-
-                executor_task_id = f"Task_{uuid.uuid4().hex[:BPMN_FLOW_ID_LENGTH]}"
-                ET.SubElement(
-                    executor_process,
-                    "bpmn:serviceTask",
-                    {
-                        "id": executor_task_id,
-                        "name": "Execute OpenQASM",
-                        "opentosca:deploymentModelUrl": f"{{{{ wineryEndpoint }}}}/servicetemplates/http%253A%252F%252Fquantil.org%252Fquantme%252Fpull/{node_id}/?csar",
-                    },
-                )
-
-                executor_xml = ET.tostring(
-                    executor_defs, encoding="utf-8", xml_declaration=True
-                ).decode("utf-8")
-
-                # Add both BPMN files to the combined ZIP
-                combined_zip.writestr(f"Activity_{node_id}/detector.bpmn", detector_xml)
-                combined_zip.writestr(
-                    f"Activity_{node_id}/replacement.bpmn", executor_xml
-                )
-
-                print(f"[INFO] Added QRM BPMNs for node {node_id} to master ZIP")
-
-    print("[INFO] Combined QRM ZIP generated successfully")
-    return combined_zip_buffer.getvalue()
@@ -0,0 +1,471 @@
+"""
+Generation of the ZIP archives accompanying generated workflows.
+
+Quantum Resource Models (QRMs) contain a detector and a replacement BPMN per quantum node,
+service deployment models a nested ``service.zip`` per activity.
+Members are rendered by a bounded thread pool and written to the archive in order
+as soon as they are done, so only a few members are held in memory at a time.
+The archive itself is spooled to a temporary file once it exceeds :data:`SPOOL_MAX_SIZE`.
+
+Artifacts shared by all members (polling agent, Dockerfile, the serialized request)
+are rendered once per archive.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+import xml.etree.ElementTree as ET
+import zipfile
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from io import BytesIO
+from tempfile import SpooledTemporaryFile
+from typing import Any, NamedTuple
+
+from app.model.CompileRequest import CompileRequest
+from app.model.StatusResponse import StatusType
+from app.transformation_manager.bpmn_builder import BPMN_FLOW_ID_LENGTH
+
+SPOOL_MAX_SIZE = 4 * 1024 * 1024
+"""Bytes of an archive kept in memory before it is spooled to a temporary file."""
+
+MEMBER_WORKERS = 4
+"""Threads rendering archive members."""
+
+CHUNK_SIZE = 64 * 1024
+"""Size of the chunks returned by :meth:`ArchiveFile.iter_chunks`."""
+
+POLLING_AGENT = """\
+import threading
+import base64
+import os
+import requests
+import app
+
+def poll():
+    body = {
+        'workerId': 'WP67GZ6N9ZX5',
+        'maxTasks': 1,
+        'topics': [{'topicName': topic, 'lockDuration': 60000}]
+    }
+    try:
+        response = requests.post(pollingEndpoint + '/fetchAndLock', json=body)
+        if response.status_code == 200:
+            for task in response.json():
+                variables = task.get('variables', {})
+                result = app.main()
+                body = {'workerId': 'WP67GZ6N9ZX5', 'variables': {}}
+                body['variables']['result'] = {
+                    'value': base64.b64encode(str(result).encode()).decode(),
+                    'type': 'File',
+                    'valueInfo': {'filename': 'result.txt'}
+                }
+                requests.post(
+                    pollingEndpoint + '/' + task.get('id') + '/complete',
+                    json=body
+                )
+    except Exception as e:
+        print('Polling error:', e)
+    threading.Timer(8, poll).start()
+
+camundaEndpoint = os.environ['CAMUNDA_ENDPOINT']
+pollingEndpoint = camundaEndpoint + '/external-task'
+topic = os.environ['CAMUNDA_TOPIC']
+poll()
+"""
+"""Polling agent running the ``app.py`` of a service for each fetched external task."""
+
+DOCKERFILE = """\
+FROM python:3.8-slim
+COPY service.zip /tmp/service.zip
+RUN apt-get update && apt-get install -y unzip \\
+    && unzip /tmp/service.zip -d /service \\
+    && pip install -r /service/requirements.txt
+CMD ["python", "/service/polling_agent.py"]
+"""
+"""Image running the polling agent of a service."""
+
+REQUIREMENTS = "requests\n"
+"""Python requirements of a service."""
+
+REQUEST_FILE = "request.json"
+"""Name of the serialized compile request inside ``service.zip``."""
+
+_TERMINAL_STATUSES = tuple(
+    status.value for status in StatusType if status != StatusType.IN_PROGRESS
+)
+
+_APP_HEADER = [
+    "import requests",
+    "import time",
+    "import json",
+    "import os",
+    "",
+    "BACKEND_URL = os.environ.get('BACKEND_URL', 'http://localhost:8000')",
+    "",
+    "def load_request():",
+    f"    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '{REQUEST_FILE}')",
+    "    with open(path, encoding='utf-8') as f:",
+    "        return json.load(f)",
+    "",
+    "def main(**kwargs):",
+]
+
+
+class ZipMember(NamedTuple):
+    """
+    A file inside an archive.
+
+    :param name: Path of the file inside the archive.
+    :param data: Content of the file.
+    :param compress_type: Compression of the file, archives are stored as they are.
+    """
+
+    name: str
+    data: bytes | str
+    compress_type: int = zipfile.ZIP_DEFLATED
+
+
+MemberTask = Callable[[], Iterable[ZipMember]]
+"""Renders the members of an archive belonging to one node."""
+
+
+class ArchiveFile:
+    """
+    A generated ZIP archive, kept in memory or spooled to a temporary file.
+    """
+
+    def __init__(self, file: SpooledTemporaryFile[bytes], size: int) -> None:
+        self._file = file
+        self.size = size
+
+    def iter_chunks(self, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Read the archive in chunks of at most `chunk_size` bytes.
+        """
+
+        self._file.seek(0)
+        while chunk := self._file.read(chunk_size):
+            yield chunk
+
+    def read(self) -> bytes:
+        """
+        Read the whole archive.
+        """
+
+        self._file.seek(0)
+        return self._file.read()
+
+    def close(self) -> None:
+        """
+        Release the memory or temporary file of the archive.
+        """
+
+        self._file.close()
+
+    def __enter__(self) -> ArchiveFile:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+def write_archive(
+    tasks: Iterable[MemberTask],
+    *,
+    workers: int = MEMBER_WORKERS,
+    spool_max_size: int = SPOOL_MAX_SIZE,
+) -> ArchiveFile:
+    """
+    Render the members of an archive in a thread pool and write them in order.
+
+    At most ``2 * workers`` tasks are in flight, which bounds the memory used for
+    members that are rendered but not written yet.
+
+    :param tasks: Tasks rendering the members, their order is kept in the archive.
+    :param workers: Number of threads rendering members.
+    :param spool_max_size: Bytes kept in memory before spooling to a temporary file.
+    :return: The archive.
+    """
+
+    file: SpooledTemporaryFile[bytes] = SpooledTemporaryFile(max_size=spool_max_size)
+    pending: deque[Future[Iterable[ZipMember]]] = deque()
+
+    with (
+        ThreadPoolExecutor(max_workers=workers) as executor,
+        zipfile.ZipFile(file, mode="w", compression=zipfile.ZIP_DEFLATED) as archive,
+    ):
+
+        def write_next() -> None:
+            for member in pending.popleft().result():
+                archive.writestr(
+                    member.name, member.data, compress_type=member.compress_type
+                )
+
+        for task in tasks:
+            if len(pending) >= 2 * workers:
+                write_next()
+            pending.append(executor.submit(lambda task=task: list(task())))
+        while pending:
+            write_next()
+
+    size = file.tell()
+    return ArchiveFile(file, size)
+
+
+def zip_bytes(members: Iterable[ZipMember]) -> bytes:
+    """
+    Create a small archive in memory, e.g. a member of another archive.
+    """
+
+    buffer = BytesIO()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for member in members:
+            archive.writestr(
+                member.name, member.data, compress_type=member.compress_type
+            )
+    return buffer.getvalue()
+
+
+def _new_id(prefix: str) -> str:
+    return f"{prefix}_{uuid.uuid4().hex[:BPMN_FLOW_ID_LENGTH]}"
+
+
+def _definitions(exporter_version: str) -> ET.Element:
+    return ET.Element(
+        "bpmn:definitions",
+        {
+            "xmlns:bpmn": "http://www.omg.org/spec/BPMN/20100524/MODEL",
+            "xmlns:bpmndi": "http://www.omg.org/spec/BPMN/20100524/DI",
+            "xmlns:dc": "http://www.omg.org/spec/DD/20100524/DC",
+            "xmlns:quantme": "https://github.com/UST-QuAntiL/QuantME-Quantum4BPMN",
+            "id": _new_id("Definitions"),
+            "targetNamespace": "http://bpmn.io/schema/bpmn",
+            "exporter": "QuantME Modeler",
+            "exporterVersion": exporter_version,
+        },
+    )
+
+
+def render_qrm(node_id: str, node_label: str) -> list[ZipMember]:
+    """
+    Render the detector and replacement BPMN of a quantum node.
+
+    The detector matches a ``quantumCircuitLoadingTask`` of the node,
+    the replacement executes the circuit with the node's deployment model.
+    """
+
+    detector = _definitions("4.4.0")
+    process = ET.SubElement(
+        detector,
+        "bpmn:process",
+        {"id": _new_id("Process"), "isExecutable": "true"},
+    )
+    ET.SubElement(
+        process,
+        "quantme:quantumCircuitLoadingTask",
+        {"id": _new_id("Task"), "url": f"{node_label}/maxcut"},
+    )
+
+    replacement = _definitions("4.5.0-nightly.20211118")
+    process = ET.SubElement(
+        replacement,
+        "bpmn:process",
+        {"id": _new_id("Process"), "isExecutable": "true"},
+    )
+    ET.SubElement(
+        process,
+        "bpmn:serviceTask",
+        {
+            "id": _new_id("Task"),
+            "name": "Execute OpenQASM",
+            "opentosca:deploymentModelUrl": f"{{{{ wineryEndpoint }}}}/servicetemplates/http%253A%252F%252Fquantil.org%252Fquantme%252Fpull/{node_id}/?csar",
+        },
+    )
+
+    return [
+        ZipMember(
+            f"Activity_{node_id}/detector.bpmn",
+            ET.tostring(detector, encoding="utf-8", xml_declaration=True),
+        ),
+        ZipMember(
+            f"Activity_{node_id}/replacement.bpmn",
+            ET.tostring(replacement, encoding="utf-8", xml_declaration=True),
+        ),
+    ]
+
+
+def write_qrms(
+    quantum_groups: dict[str, list[Any]], *, workers: int = MEMBER_WORKERS
+) -> ArchiveFile:
+    """
+    Write the QRMs of all quantum nodes into one archive.
+
+    :param quantum_groups: Quantum nodes grouped by quantum group.
+    :param workers: Number of threads rendering members.
+    :return: Archive with a ``detector.bpmn`` and ``replacement.bpmn`` per node.
+    """
+
+    tasks: list[MemberTask] = []
+    for nodes in quantum_groups.values():
+        for node in nodes:
+            node_id = getattr(node, "id", "unknown_node")
+            node_label = getattr(node, "label", node_id)
+            tasks.append(lambda i=node_id, label=node_label: render_qrm(i, label))
+    return write_archive(tasks, workers=workers)
+
+
+def render_service_app(node_id: str) -> tuple[str, bool]:
+    """
+    Render the ``app.py`` of the service implementing an activity.
+
+    :param node_id: ID of the activity.
+    :return: The source and whether it reads the serialized request.
+    """
+
+    if node_id.endswith("_model"):
+        body = [
+            f"    # Logic for {node_id}",
+            "    return load_request()",
+        ]
+        return "\n".join([*_APP_HEADER, *body]), True
+
+    if node_id.endswith("_send_compile"):
+        body = [
+            f"    # Logic for {node_id}",
+            "    model = load_request()",
+            '    url = f"{BACKEND_URL}/compile"',
+            "    response = requests.post(url, json=model)",
+            "    response.raise_for_status()",
+            "    data = response.json()",
+            "    uuid = data.get('uuid')",
+            "    if not uuid:",
+            "        raise ValueError('Backend response does not contain uuid')",
+            "    return uuid",
+        ]
+        return "\n".join([*_APP_HEADER, *body]), True
+
+    if node_id.endswith("_poll_result"):
+        body = [
+            f"    # Logic for {node_id}",
+            "    uuid = kwargs.get('uuid')",
+            "    if not uuid:",
+            "        raise ValueError('Missing uuid')",
+            '    events_url = f"{BACKEND_URL}/status/{uuid}/events"',
+            "    try:",
+            "        with requests.get(events_url, stream=True, timeout=(10, 300)) as resp:",
+            "            resp.raise_for_status()",
+            "            for line in resp.iter_lines(decode_unicode=True):",
+            "                if line and line.startswith('data:'):",
+            "                    data = json.loads(line[len('data:'):])",
+            f"                    if data.get('status') in {_TERMINAL_STATUSES!r}:",
+            "                        return data",
+            "    except requests.RequestException:",
+            "        pass",
+            '    status_url = f"{BACKEND_URL}/status/{uuid}"',
+            "    for attempt in range(20):",
+            "        resp = requests.get(status_url)",
+            "        if resp.ok:",
+            "            data = resp.json()",
+            f"            if data.get('status') in {_TERMINAL_STATUSES!r}:",
+            "                return data",
+            "        time.sleep(10)",
+            "    return {'status': 'timeout'}",
+        ]
+        return "\n".join([*_APP_HEADER, *body]), False
+
+    if node_id.endswith("_set_vars"):
+        body = [
+            f"    # Logic for {node_id}",
+            "    status = kwargs.get('status')",
+            "    location = kwargs.get('location')",
+            "    result = {'status': status, 'location': location}",
+            "    with open('final_result.json', 'w') as f:",
+            "        json.dump(result, f)",
+            "    return result",
+        ]
+        return "\n".join([*_APP_HEADER, *body]), False
+
+    body = [f"    raise NotImplementedError('Unknown node type: {node_id}')"]
+    return "\n".join([*_APP_HEADER, *body]), False
+
+
+def render_service(node_id: str, request_json: bytes) -> list[ZipMember]:
+    """
+    Render the deployment model of the service implementing an activity.
+
+    :param node_id: ID of the activity.
+    :param request_json: The serialized compile request, shared by all services.
+    :return: A single ``Activity_<node_id>.zip`` member.
+    """
+
+    app, reads_request = render_service_app(node_id)
+    service = [
+        ZipMember("app.py", app),
+        ZipMember("polling_agent.py", POLLING_AGENT),
+        ZipMember("requirements.txt", REQUIREMENTS),
+    ]
+    if reads_request:
+        service.append(ZipMember(REQUEST_FILE, request_json))
+
+    # already compressed archives are stored instead of deflated again
+    docker_layer = zip_bytes(
+        [
+            ZipMember("service.zip", zip_bytes(service), zipfile.ZIP_STORED),
+            ZipMember("Dockerfile", DOCKERFILE),
+        ]
+    )
+    activity = zip_bytes([ZipMember("service.zip", docker_layer, zipfile.ZIP_STORED)])
+    activity_name = "Activity_" + node_id.replace(" ", "_")
+    return [ZipMember(f"{activity_name}.zip", activity, zipfile.ZIP_STORED)]
+
+
+def write_service_zips(
+    activities: Iterable[str],
+    original_request: CompileRequest,
+    *,
+    workers: int = MEMBER_WORKERS,
+) -> ArchiveFile:
+    """
+    Write the service deployment models of all activities into one archive.
+
+    Human tasks are skipped, as they do not need a service.
+
+    :param activities: IDs of the activities.
+    :param original_request: The compile request, serialized once for all services.
+    :param workers: Number of threads rendering members.
+    :return: Archive with an ``Activity_<id>.zip`` per activity.
+    """
+
+    request_json = json.dumps(
+        original_request.model_dump(mode="json"), indent=4, ensure_ascii=False
+    ).encode("utf-8")
+    tasks: list[MemberTask] = [
+        lambda i=node_id: render_service(i, request_json)
+        for node_id in activities
+        if "_human" not in node_id
+    ]
+    return write_archive(tasks, workers=workers)
+
+
+async def generate_qrms(quantum_groups: dict[str, list[Any]]) -> ArchiveFile:
+    """
+    Generate the QRMs of all quantum nodes without blocking the event loop.
+    """
+
+    return await asyncio.to_thread(write_qrms, quantum_groups)
+
+
+async def generate_service_zips(
+    activities: Iterable[str], original_request: CompileRequest
+) -> ArchiveFile:
+    """
+    Generate the service deployment models without blocking the event loop.
+    """
+
+    return await asyncio.to_thread(
+        write_service_zips, list(activities), original_request
+    )
@@ -5,6 +5,7 @@ from collections import defaultdict, deque
 from typing import Any, Tuple, Optional
 from app.transformation_manager import bpmn_templates as GroovyScript
 from app.model.CompileRequest import CompileRequest
+from app.transformation_manager.bpmn_layout import Box, layered_layout
 import json
 
 # BPMN namespaces
@@ -24,7 +25,7 @@ BPMN_TASK_WIDTH = 120
 BPMN_TASK_HEIGHT = 80
 BPMN_GAP_X = 100
 BPMN_GAP_Y = 150
-BPMN_CHAIN_X_OFFSET = 170
+BPMN_ROW_GAP = 30
 BPMN_CHAIN_Y_BASE = 200
 BPMN_EVENT_WIDTH = 36
 BPMN_EVENT_HEIGHT = 36
@@ -74,12 +75,16 @@ class BpmnBuilder:
         self.chain_heads = []
         self.chain_ends = []
 
+        # id -> flow element of the process, maintained by _add_element
+        self.elements: dict[str, ET.Element] = {}
+        # id -> number of extensionElements, incoming and outgoing children
+        self._flow_ref_counts: dict[str, list[int]] = {}
+
         self._register_namespaces()
         self._init_xml()
 
         self.start_id = "StartEvent_1"
         self.end_id = "EndEvent_1"
-        self.task_positions = {}
         self.inserted_chains = {}
         self.human_tasks = {}
         self.fail_job_tasks = {}
@@ -88,7 +93,6 @@ class BpmnBuilder:
         self.alt_ends = defaultdict(list)
         self.alt_end_event_ids = set()
 
-        self.task_positions_per_node = {}
         self.flow_map_per_node = {}
         self.diagram_info_per_node = {}
 
@@ -137,6 +141,12 @@ class BpmnBuilder:
         """Returns the qualified name string {namespace}tag."""
         return f"{{{ns}}}{tag}"
 
+    def _add_element(self, tag: str, attrs: dict[str, str]) -> ET.Element:
+        """Creates a flow element in the process and indexes it by its id."""
+        element = ET.SubElement(self.process, self.qn(BPMN2_NS, tag), attrs)
+        self.elements.setdefault(attrs["id"], element)
+        return element
+
     def new_flow(self) -> str:
         """Generates a unique ID for a sequence flow."""
         return f"Flow_{uuid.uuid4().hex[:BPMN_FLOW_ID_LENGTH]}"
@@ -194,7 +204,7 @@ class BpmnBuilder:
                     all_activities.append(self.alt_ends[start_node][-1])
         all_activities = [x for x in all_activities if x is not None]
 
-        self.remove_invalid_incoming_outgoing(self.process)
+        self.remove_invalid_incoming_outgoing()
 
         self.indent(self.defs)
         return ET.tostring(self.defs, encoding="unicode"), all_activities
@@ -217,8 +227,9 @@ class BpmnBuilder:
             if level and (not elem.tail or not elem.tail.strip()):
                 elem.tail = i
 
-    def remove_invalid_incoming_outgoing(self, process):
-        for el in process.findall(".//*[@id]"):
+    def remove_invalid_incoming_outgoing(self):
+        """Removes incoming flows of start events and outgoing flows of end events."""
+        for el in self.elements.values():
             tag = el.tag
             # just extract the last part
             if tag.endswith("startEvent"):
@@ -230,17 +241,46 @@ class BpmnBuilder:
                     if c.tag.endswith("outgoing"):
                         el.remove(c)
 
-    def _fix_incoming_outgoing_order(self, element):
-        """Sort extension, then all incoming, then all outgoing, then the rest."""
-        # sort all children
-        ext = [c for c in list(element) if c.tag.endswith("extensionElements")]
-        incomings = [c for c in list(element) if c.tag.endswith("incoming")]
-        outgoings = [c for c in list(element) if c.tag.endswith("outgoing")]
-        rest = [c for c in list(element) if c not in ext + incomings + outgoings]
-        for c in list(element):
-            element.remove(c)
-        for c in ext + incomings + outgoings + rest:
-            element.append(c)
+    def _fix_incoming_outgoing_order(self, element) -> list[int]:
+        """
+        Sort extension, then all incoming, then all outgoing, then the rest.
+
+        Returns:
+            The number of extension, incoming and outgoing children.
+        """
+        groups = ([], [], [], [])
+        for c in element:
+            if c.tag.endswith("extensionElements"):
+                groups[0].append(c)
+            elif c.tag.endswith("incoming"):
+                groups[1].append(c)
+            elif c.tag.endswith("outgoing"):
+                groups[2].append(c)
+            else:
+                groups[3].append(c)
+        element[:] = [c for group in groups for c in group]
+        return [len(groups[0]), len(groups[1]), len(groups[2])]
+
+    def _add_flow_ref(self, element, kind: str, fid: str) -> None:
+        """
+        Adds an incoming or outgoing reference to a flow element, keeping the child order.
+
+        The children are sorted once, later references are inserted at their position.
+        """
+        element_id = element.attrib["id"]
+        counts = self._flow_ref_counts.get(element_id)
+        if counts is None:
+            counts = self._fix_incoming_outgoing_order(element)
+            self._flow_ref_counts[element_id] = counts
+
+        ref = ET.Element(self.qn(BPMN2_NS, kind))
+        ref.text = fid
+        if kind == "incoming":
+            element.insert(counts[0] + counts[1], ref)
+            counts[1] += 1
+        else:
+            element.insert(counts[0] + counts[1] + counts[2], ref)
+            counts[2] += 1
 
     def _create_plugin_flow(
         self,
@@ -251,10 +291,6 @@ class BpmnBuilder:
         # generate the plugin chain
         self._create_chain_clustering(start_node)
 
-        # Layout
-        positions = self._calculate_plugin_layout(start_node)
-        self.task_positions_per_node[start_node] = positions
-
         # Connect Flows
         flow_map = self._connect_plugin_flows(start_node)
         self.flow_map_per_node[start_node] = flow_map
@@ -276,10 +312,6 @@ class BpmnBuilder:
         # Generate the placeholder chain
         self._create_chain_placeholder(start_node)
 
-        # Layout
-        positions = self._calculate_placeholder_layout(start_node)
-        self.task_positions_per_node[start_node] = positions
-
         # Connect Flows
         flow_map = self._connect_placeholder_flows(start_node)
         self.flow_map_per_node[start_node] = flow_map
@@ -298,233 +330,12 @@ class BpmnBuilder:
         # Generate the nonPlaceholder chain
         self._create_chain_standard(start_node)
 
-        # Layout
-        positions = self._calculate_standard_layout(start_node)
-        self.task_positions_per_node[start_node] = positions
-
         # Connect Flows
         flow_map = self._connect_standard_flows(start_node)
         self.flow_map_per_node[start_node] = flow_map
 
         self.chain_level += 1
 
-    def _calculate_plugin_layout(
-        self,
-        start_node,
-    ):
-        """Calculates positions for all elements in the plugin flow."""
-        positions = {}
-        chain = self.inserted_chains[start_node]
-        human_id = self.human_tasks[start_node]
-        analyzefailedjob_id = self.fail_job_tasks[start_node]
-
-        (
-            call_plugin_id,
-            gateway3_id,
-            poll_job_id,
-            gateway4_id,
-            setvars2_id,
-        ) = chain
-
-        # Place first chain tasks at level 0; if multiple start nodes, they'll be stacked vertically
-        x = BPMN_START_X + BPMN_CHAIN_X_OFFSET
-        y = BPMN_CHAIN_Y_BASE + self.chain_level * (BPMN_TASK_HEIGHT + BPMN_GAP_Y)
-
-        # Place tasks
-        positions[call_plugin_id] = (x, y)
-        positions[poll_job_id] = (x + (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[setvars2_id] = (x + 2 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[human_id] = (x + 3 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[analyzefailedjob_id] = (
-            x + 2 * (BPMN_TASK_WIDTH + BPMN_GAP_X),
-            y + BPMN_TASK_HEIGHT + 30,
-        )
-
-        # Gateway 3
-        self._place_gateway_between(call_plugin_id, poll_job_id, gateway3_id, positions)
-
-        # Gateway 4
-        self._place_gateway_between(poll_job_id, setvars2_id, gateway4_id, positions)
-
-        if hasattr(self, "task_positions") and gateway3_id in self.task_positions:
-            positions[gateway3_id] = self.task_positions[gateway3_id]
-        if hasattr(self, "task_positions") and gateway4_id in self.task_positions:
-            positions[gateway4_id] = self.task_positions[gateway4_id]
-
-        # Alternative End-Events
-        afj_x, afj_y = positions[analyzefailedjob_id]
-        for altend_id in self.alt_ends.get(start_node, []):
-            if altend_id.endswith("_alt_end_2"):
-                positions[altend_id] = (
-                    afj_x + BPMN_TASK_WIDTH + BPMN_GAP_X // 2,
-                    afj_y + 22,
-                )
-            else:
-                positions[altend_id] = (
-                    x + 3 * (BPMN_TASK_WIDTH + BPMN_GAP_X) + 30,
-                    afj_y + 22,
-                )
-
-        print("plugin layout calculated")
-
-        return positions
-
-    def _calculate_placeholder_layout(self, start_node: str):
-        """Calculates positions for all elements in the placeholder flow."""
-        positions = {}
-        chain = self.inserted_chains[start_node]
-        human_id = self.human_tasks[start_node]
-        analyzefailedjob_id = self.fail_job_tasks[start_node]
-        analyzefailedtransf_id = self.fail_transf_tasks[start_node]
-        updatevars_id = self.update_tasks[start_node]
-
-        (
-            setvars1_id,
-            backendreq_id,
-            gateway1_id,
-            pollstat_id,
-            gateway2_id,
-            retrievecirc_id,
-            createdeploym_id,
-            exejob_id,
-            gateway3_id,
-            getjobres_id,
-            gateway4_id,
-            setvars2_id,
-        ) = chain
-
-        # Place first chain tasks at level 0; if multiple start nodes, they'll be stacked vertically
-        x = BPMN_START_X + BPMN_CHAIN_X_OFFSET
-        y = BPMN_CHAIN_Y_BASE + self.chain_level * (BPMN_TASK_HEIGHT + BPMN_GAP_Y)
-
-        # Place tasks
-        positions[setvars1_id] = (x, y)
-        positions[backendreq_id] = (x + (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[pollstat_id] = (x + 2 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[retrievecirc_id] = (x + 3 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[createdeploym_id] = (x + 4 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[exejob_id] = (x + 5 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[getjobres_id] = (x + 6 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[setvars2_id] = (x + 7 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[human_id] = (x + 8 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[updatevars_id] = (
-            x + 2 * (BPMN_TASK_WIDTH + BPMN_GAP_X),
-            y - BPMN_TASK_HEIGHT - 30,
-        )
-        positions[analyzefailedjob_id] = (
-            x + 7 * (BPMN_TASK_WIDTH + BPMN_GAP_X),
-            y + BPMN_TASK_HEIGHT + 30,
-        )
-
-        # Gateway 1
-        self._place_gateway_between(backendreq_id, pollstat_id, gateway1_id, positions)
-
-        # Gateway 2
-        self._place_gateway_between(
-            pollstat_id, retrievecirc_id, gateway2_id, positions
-        )
-
-        # Gateway 3
-        self._place_gateway_between(exejob_id, getjobres_id, gateway3_id, positions)
-
-        # Gateway 4
-        self._place_gateway_between(getjobres_id, setvars2_id, gateway4_id, positions)
-
-        gx2, _ = positions[retrievecirc_id]
-        positions[analyzefailedtransf_id] = (
-            gx2,
-            y + BPMN_TASK_HEIGHT + 30,
-        )
-
-        if hasattr(self, "task_positions") and gateway1_id in self.task_positions:
-            positions[gateway1_id] = self.task_positions[gateway1_id]
-        if hasattr(self, "task_positions") and gateway2_id in self.task_positions:
-            positions[gateway2_id] = self.task_positions[gateway2_id]
-        if hasattr(self, "task_positions") and gateway3_id in self.task_positions:
-            positions[gateway3_id] = self.task_positions[gateway3_id]
-        if hasattr(self, "task_positions") and gateway4_id in self.task_positions:
-            positions[gateway4_id] = self.task_positions[gateway4_id]
-
-        # Alternative End-Events
-        afj_x, afj_y = positions[analyzefailedjob_id]
-        for altend_id in self.alt_ends.get(start_node, []):
-            if altend_id.endswith("_alt_end_2"):
-                positions[altend_id] = (
-                    afj_x + BPMN_TASK_WIDTH + BPMN_GAP_X // 2,
-                    afj_y + 22,
-                )
-            else:
-                positions[altend_id] = (
-                    x + 4 * (BPMN_TASK_WIDTH + BPMN_GAP_X),
-                    afj_y + 22,
-                )
-
-        print("placeholder layout calculated")
-
-        return positions
-
-    def _calculate_standard_layout(self, start_node: str):
-        """Calculates positions for all elements in the standard flow."""
-        positions = {}
-        chain = self.inserted_chains[start_node]
-        human_id = self.human_tasks[start_node]
-        analyzefailedjob_id = self.fail_job_tasks[start_node]
-
-        (
-            setcirc_id,
-            createdeploym_id,
-            exejob_id,
-            gateway3_id,
-            getjobres_id,
-            gateway4_id,
-            setvars2_id,
-        ) = chain
-
-        # Place first chain tasks at level 0; if multiple start nodes, they'll be stacked vertically
-        x = BPMN_START_X + BPMN_CHAIN_X_OFFSET
-        y = BPMN_CHAIN_Y_BASE + self.chain_level * (BPMN_TASK_HEIGHT + BPMN_GAP_Y)
-
-        # Place tasks
-        positions[setcirc_id] = (x, y)
-        positions[createdeploym_id] = (x + (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[exejob_id] = (x + 2 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[getjobres_id] = (x + 3 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[setvars2_id] = (x + 4 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[human_id] = (x + 5 * (BPMN_TASK_WIDTH + BPMN_GAP_X), y)
-        positions[analyzefailedjob_id] = (
-            x + 4 * (BPMN_TASK_WIDTH + BPMN_GAP_X),
-            y + BPMN_TASK_HEIGHT + 30,
-        )
-
-        # Gateway 3
-        self._place_gateway_between(exejob_id, getjobres_id, gateway3_id, positions)
-
-        # Gateway 4
-        self._place_gateway_between(getjobres_id, setvars2_id, gateway4_id, positions)
-
-        if hasattr(self, "task_positions") and gateway3_id in self.task_positions:
-            positions[gateway3_id] = self.task_positions[gateway3_id]
-        if hasattr(self, "task_positions") and gateway4_id in self.task_positions:
-            positions[gateway4_id] = self.task_positions[gateway4_id]
-
-        # Alternative End-Events
-        afj_x, afj_y = positions[analyzefailedjob_id]
-        for altend_id in self.alt_ends.get(start_node, []):
-            if altend_id.endswith("_alt_end_2"):
-                positions[altend_id] = (
-                    afj_x + BPMN_TASK_WIDTH + BPMN_GAP_X // 2,
-                    afj_y + 22,
-                )
-            else:
-                positions[altend_id] = (
-                    x + 3 * (BPMN_TASK_WIDTH + BPMN_GAP_X) + 30,
-                    afj_y + 22,
-                )
-
-        print("standard layout calculated")
-
-        return positions
-
     def _connect_plugin_flows(self, start_node):
         """Creates a sequence flow for plugin chains. Connecting the chains will be separately."""
         chain = self.inserted_chains[start_node]
@@ -670,79 +481,99 @@ class BpmnBuilder:
 
         return flow_map
 
-    def _create_diagram(self):
-        """Generates the BPMNDI Diagram section with shapes and edges."""
+    def _element_size(self, eid: str) -> tuple[int, int]:
+        """Returns width and height of the shape of a BPMN element."""
+        if "_gateway_" in eid:
+            return BPMN_GW_WIDTH, BPMN_GW_HEIGHT
+        if eid in (self.start_id, self.end_id) or eid in self.alt_end_event_ids:
+            return BPMN_EVENT_WIDTH, BPMN_EVENT_HEIGHT
+        return BPMN_TASK_WIDTH, BPMN_TASK_HEIGHT
 
-        def add_shape(eid: str, x: int, y: int, w: int, h: int):
-            shape = ET.SubElement(
-                plane,
-                self.qn(BPMNDI_NS, "BPMNShape"),
-                {
-                    "id": f"{eid}_di",
-                    "bpmnElement": eid,
-                    "isMarkerVisible": "true",
-                },
-            )
-            ET.SubElement(
-                shape,
-                self.qn(DC_NS, "Bounds"),
-                x=str(x),
-                y=str(y),
-                width=str(w),
-                height=str(h),
+    def _calculate_layout(
+        self,
+    ) -> tuple[dict[str, Box], list[tuple[str, list[tuple[int, int]]]]]:
+        """
+        Lays out every chain with a layered layout and stacks the chains vertically.
+
+        The start event is part of the first chain, the end event part of the last one.
+        Flows between chains leave the end of a chain on the right and enter the head
+        of the next chain from above.
+
+        Returns:
+            The box of each element and the waypoints of each flow.
+        """
+        boxes: dict[str, Box] = {}
+        waypoints: list[tuple[str, list[tuple[int, int]]]] = []
+
+        chains = list(self.flow_map_per_node.values())
+        cross_chain_flows = getattr(self, "cross_chain_flows", [])
+        end_flows = [flow for flow in cross_chain_flows if flow[2] == self.end_id]
+
+        y = BPMN_CHAIN_Y_BASE
+        layouts = []
+        for index, flow_map in enumerate(chains):
+            flows = flow_map + end_flows if index == len(chains) - 1 else flow_map
+            sizes = {}
+            for _, src, tgt in flows:
+                for eid in (src, tgt):
+                    if eid not in sizes:
+                        sizes[eid] = self._element_size(eid)
+
+            # align the heads of all chains with the one following the start event
+            x = BPMN_START_X
+            if self.start_id not in sizes:
+                x += BPMN_EVENT_WIDTH + BPMN_GAP_X
+            layout = layered_layout(
+                sizes,
+                [(src, tgt) for _, src, tgt in flows],
+                origin=(x, y),
+                gap_x=BPMN_GAP_X,
+                gap_y=BPMN_ROW_GAP,
             )
+            for fid, src, tgt in flows:
+                waypoints.append((fid, layout.route(src, tgt)))
+            boxes.update(layout.boxes)
+            layouts.append(layout)
+            y = layout.bottom + BPMN_GAP_Y
+
+        # diagrams without any chain
+        boxes.setdefault(
+            self.start_id,
+            Box(BPMN_START_X, BPMN_START_Y, BPMN_EVENT_WIDTH, BPMN_EVENT_HEIGHT),
+        )
+        boxes.setdefault(
+            self.end_id,
+            Box(
+                boxes[self.start_id].right + BPMN_GAP_X,
+                BPMN_START_Y,
+                BPMN_EVENT_WIDTH,
+                BPMN_EVENT_HEIGHT,
+            ),
+        )
 
-        def add_waypoint(edge, x: int, y: int):
-            ET.SubElement(
-                edge, self.qn(DI_NS, "waypoint"), x=str(int(x)), y=str(int(y))
+        for index, (fid, src, tgt) in enumerate(cross_chain_flows):
+            if tgt == self.end_id and layouts:
+                continue
+            source, target = boxes[src], boxes[tgt]
+            right = layouts[index].right + BPMN_GAP_X // 2
+            between_y = (layouts[index].bottom + target.y) // 2
+            waypoints.append(
+                (
+                    fid,
+                    [
+                        (source.right, source.center_y),
+                        (right, source.center_y),
+                        (right, between_y),
+                        (target.center_x, between_y),
+                        (target.center_x, target.y),
+                    ],
+                )
             )
 
-        def add_orthogonal_waypoints(
-            edge,
-            sx: int,
-            sy: int,
-            tx: int,
-            ty: int,
-            route: str = "hv",
-            up_offset: int = 40,
-            pre_target_drop: int = 12,
-        ):
-            """
-            Adds orthogonal waypoints if needed for pretty edges
-            "hv": horizontal then vertical
-            "vh": vertical then horizontal
-            "up-left-down": start -> up -> left/right -> down -> target
-            """
-
-            # check first if up-left-down is required
-            if route == "up-left-down":
-                bend_y = min(sy, ty) - up_offset
-                pre_target_y = ty - pre_target_drop
-
-                add_waypoint(edge, sx, sy)
-                add_waypoint(edge, sx, bend_y)
-                add_waypoint(edge, tx, bend_y)
-                add_waypoint(edge, tx, pre_target_y)
-                add_waypoint(edge, tx, ty)
-                return
-
-            # already straight
-            if sx == tx or sy == ty:
-                add_waypoint(edge, sx, sy)
-                add_waypoint(edge, tx, ty)
-                return
-
-            if route == "vh":
-                add_waypoint(edge, sx, sy)
-                add_waypoint(edge, sx, ty)
-                add_waypoint(edge, tx, ty)
-                return
-
-            # default "hv"
-            add_waypoint(edge, sx, sy)
-            add_waypoint(edge, tx, sy)
-            add_waypoint(edge, tx, ty)
+        return boxes, waypoints
 
+    def _create_diagram(self):
+        """Generates the BPMNDI Diagram section with shapes and edges."""
         diagram = ET.SubElement(
             self.defs, self.qn(BPMNDI_NS, "BPMNDiagram"), {"id": "BPMNDiagram_1"}
         )
@@ -752,131 +583,38 @@ class BpmnBuilder:
             {"id": "BPMNPlane_1", "bpmnElement": f"Process_{self.process_id}"},
         )
 
-        # Put together all positions
-        merged_positions = {}
-        for positions in self.task_positions_per_node.values():
-            merged_positions.update(positions)
-
-        # Collect all real BPMN element ids (Tasks, Gateways, Events)
-        valid_bpmn_ids = {el.attrib["id"] for el in self.process.findall(".//*[@id]")}
-
-        # End Event X/Y - calculated based on last task
-        # Find max X task
-        last_x, last_y = BPMN_START_X, BPMN_START_Y
-        if merged_positions:
-            last_task_id = max(merged_positions.items(), key=lambda kv: kv[1][0])[0]
-            last_x, last_y = merged_positions[last_task_id]
-        end_x = last_x + BPMN_TASK_WIDTH + BPMN_GAP_X
-        end_y = last_y + (BPMN_TASK_HEIGHT // 2) - 18
-
-        # Start/End Shape
-        add_shape(
-            self.start_id,
-            BPMN_START_X,
-            BPMN_START_Y,
-            BPMN_EVENT_WIDTH,
-            BPMN_EVENT_HEIGHT,
-        )
-        add_shape(self.end_id, end_x, end_y, BPMN_EVENT_WIDTH, BPMN_EVENT_HEIGHT)
+        boxes, waypoints = self._calculate_layout()
 
-        # Shapes for all BPMN-elements
-        for eid, (x, y) in merged_positions.items():
-            if eid not in valid_bpmn_ids:
+        # Shapes for all BPMN-elements (Tasks, Gateways, Events)
+        for eid, box in boxes.items():
+            if eid not in self.elements:
                 continue
-            if "_gateway_" in eid:
-                add_shape(eid, x, y, BPMN_GW_WIDTH, BPMN_GW_HEIGHT)
-            elif eid in self.alt_end_event_ids:
-                add_shape(eid, x, y, BPMN_EVENT_WIDTH, BPMN_EVENT_HEIGHT)
-            else:
-                add_shape(eid, x, y, BPMN_TASK_WIDTH, BPMN_TASK_HEIGHT)
+            shape = ET.SubElement(
+                plane,
+                self.qn(BPMNDI_NS, "BPMNShape"),
+                {
+                    "id": f"{eid}_di",
+                    "bpmnElement": eid,
+                    "isMarkerVisible": "true",
+                },
+            )
+            ET.SubElement(
+                shape,
+                self.qn(DC_NS, "Bounds"),
+                x=str(box.x),
+                y=str(box.y),
+                width=str(box.width),
+                height=str(box.height),
+            )
 
-        # Gather all flows of the whole diagram
-        all_flows = []
-        for flow_map in self.flow_map_per_node.values():
-            all_flows.extend(flow_map)
-        # Cross-Chain-Flows too
-        cross_chain_flows = getattr(self, "cross_chain_flows", [])
-        all_flows.extend(cross_chain_flows)
-
-        if hasattr(self, "flow_map"):
-            all_flows.extend(self.flow_map)
-
-        def get_center(eid: str, mode: str) -> tuple[int, int]:
-            x, y = merged_positions.get(eid, (0, 0))
-            w, h = BPMN_TASK_WIDTH, BPMN_TASK_HEIGHT
-            if "_gateway_" in eid:
-                w, h = BPMN_GW_WIDTH, BPMN_GW_HEIGHT
-            if eid == self.start_id:
-                x, y, w, h = (
-                    BPMN_START_X,
-                    BPMN_START_Y,
-                    BPMN_EVENT_WIDTH,
-                    BPMN_EVENT_HEIGHT,
-                )
-            elif eid == self.end_id:
-                x, y, w, h = end_x, end_y, BPMN_EVENT_WIDTH, BPMN_EVENT_HEIGHT
-            elif eid in self.alt_end_event_ids:
-                w, h = BPMN_EVENT_WIDTH, BPMN_EVENT_HEIGHT
-
-            if mode == "bottom":
-                return x + w // 2, y + h
-            if mode == "top":
-                return x + w // 2, y
-            if mode == "left":
-                return x, y + h // 2
-            if mode == "right":
-                return x + w, y + h // 2
-            return x + w // 2, y + h // 2
-
-        for fid, src, tgt in all_flows:
+        for fid, points in waypoints:
             edge = ET.SubElement(
                 plane,
                 self.qn(BPMNDI_NS, "BPMNEdge"),
                 {"id": f"{fid}_di", "bpmnElement": fid},
             )
-
-            # Custom-Docking
-            if src.endswith("_human") and tgt.endswith("_set_circuit"):
-                mode_src = "bottom"
-                mode_tgt = "top"
-            elif src.endswith("_human") and tgt.endswith("_set_vars_1"):
-                mode_src = "bottom"
-                mode_tgt = "top"
-            elif src.endswith("_gateway_4") and tgt.endswith("_analyze_failed_job"):
-                mode_src = "bottom"
-                mode_tgt = "left"
-            elif "_gateway_" in src and "_gateway_" in tgt:
-                mode_src = "top"
-                mode_tgt = "top"
-            elif src.endswith("_gateway_2") and tgt.endswith("_update_vars"):
-                mode_src = "top"
-                mode_tgt = "right"
-            elif src.endswith("_update_vars") and tgt.endswith("_gateway_1"):
-                mode_src = "left"
-                mode_tgt = "top"
-            elif src.endswith("_gateway_2") and tgt.endswith("_analyze_failed_transf"):
-                mode_src = "bottom"
-                mode_tgt = "left"
-            else:
-                # Normal BPMN-order
-                mode_src = "right"
-                mode_tgt = "left"
-
-            sx, sy = get_center(src, mode_src)
-            tx, ty = get_center(tgt, mode_tgt)
-
-            route = "hv"
-            # Custom-Edges
-            if src.endswith("_gateway_4") and tgt.endswith("_gateway_3"):
-                route = "up-left-down"
-            elif src.endswith("_gateway_4") and tgt.endswith("_analyze_failed_job"):
-                route = "vh"
-            elif src.endswith("_gateway_2") and tgt.endswith("_update_vars"):
-                route = "vh"
-            elif src.endswith("_gateway_2") and tgt.endswith("_analyze_failed_transf"):
-                route = "vh"
-
-            add_orthogonal_waypoints(edge, sx, sy, tx, ty, route=route)
+            for x, y in points:
+                ET.SubElement(edge, self.qn(DI_NS, "waypoint"), x=str(x), y=str(y))
 
         print("global diagram created (all flows, incl. cross-chain)")
 
@@ -901,9 +639,7 @@ class BpmnBuilder:
 
     def _create_start_event(self) -> None:
         """Creates the Start Event and configures its form fields."""
-        start_event = ET.SubElement(
-            self.process, self.qn(BPMN2_NS, "startEvent"), {"id": self.start_id}
-        )
+        start_event = self._add_element("startEvent", {"id": self.start_id})
         ext = ET.SubElement(start_event, self.qn(BPMN2_NS, "extensionElements"))
         form = ET.SubElement(ext, self.qn(CAMUNDA_NS, "formData"))
         ET.SubElement(
@@ -962,7 +698,7 @@ class BpmnBuilder:
 
     def _create_end_event(self) -> None:
         """Creates the End Event."""
-        ET.SubElement(self.process, self.qn(BPMN2_NS, "endEvent"), {"id": self.end_id})
+        self._add_element("endEvent", {"id": self.end_id})
 
     def _analyze_graph(self) -> tuple[dict[str, list[str]], dict[str, list[str]]]:
         """Analyzes the graph to build adjacency maps."""
@@ -975,27 +711,7 @@ class BpmnBuilder:
     def _create_exclusive_gateway(self, gateway_id: str) -> None:
         """Creates an Exclusive Gateway element."""
         attrs = {"id": gateway_id}
-        ET.SubElement(self.process, self.qn(BPMN2_NS, "exclusiveGateway"), attrs)
-
-    def _place_gateway_between(
-        self,
-        left_id: str,
-        right_id: str,
-        gateway_id: str,
-        positions: dict[str, tuple[int, int]],
-    ):
-        lx, ly = positions[left_id]
-        rx, _ = positions[right_id]
-
-        gx = (
-            lx
-            + BPMN_TASK_WIDTH
-            + ((rx - (lx + BPMN_TASK_WIDTH)) // 2)
-            - BPMN_GW_WIDTH // 2
-        )
-        gy = ly + BPMN_TASK_HEIGHT // 2 - BPMN_GW_HEIGHT // 2
-
-        positions[gateway_id] = (gx, gy)
+        self._add_element("exclusiveGateway", attrs)
 
     def _create_service_task(
         self,
@@ -1015,7 +731,7 @@ class BpmnBuilder:
         attrs = {"id": task_id, "name": name}
         attrs[self.qn(CAMUNDA_NS, "asyncAfter")] = "true" if async_after else "false"
         attrs[self.qn(CAMUNDA_NS, "exclusive")] = "true" if exclusive else "false"
-        task = ET.SubElement(self.process, self.qn(BPMN2_NS, "serviceTask"), attrs)
+        task = self._add_element("serviceTask", attrs)
 
         ext = ET.SubElement(task, self.qn(BPMN2_NS, "extensionElements"))
         connector = ET.SubElement(ext, self.qn(CAMUNDA_NS, "connector"))
@@ -1112,7 +828,7 @@ class BpmnBuilder:
         if result_variable:
             attrs[self.qn(CAMUNDA_NS, "resultVariable")] = result_variable
 
-        task = ET.SubElement(self.process, self.qn(BPMN2_NS, "scriptTask"), attrs)
+        task = self._add_element("scriptTask", attrs)
 
         # connector/IO script
         if connector:
@@ -1260,9 +976,8 @@ class BpmnBuilder:
                 setvars2_id, "Set Variables", GroovyScript.SCRIPT_SET_VARS_CLUSTERING
             )
 
-        ET.SubElement(
-            self.process,
-            self.qn(BPMN2_NS, "userTask"),
+        self._add_element(
+            "userTask",
             {"id": human_task_id, "name": "Analyze Results"},
         )
         self._create_exclusive_gateway(
@@ -1272,14 +987,11 @@ class BpmnBuilder:
             gateway4_id
         )  # gateway_default_targets is always empty at this stage therefore there will be no default attribute
 
-        ET.SubElement(
-            self.process,
-            self.qn(BPMN2_NS, "userTask"),
+        self._add_element(
+            "userTask",
             {"id": analyzefailedjob_id, "name": "Analyze Failed Job"},
         )
-        ET.SubElement(
-            self.process, self.qn(BPMN2_NS, "endEvent"), {"id": altend2_id, "name": ""}
-        )
+        self._add_element("endEvent", {"id": altend2_id, "name": ""})
 
         return (
             createdeploym_id,
@@ -1431,15 +1143,12 @@ class BpmnBuilder:
             result_variable="matrix",
         )
 
-        ET.SubElement(
-            self.process,
-            self.qn(BPMN2_NS, "userTask"),
+        self._add_element(
+            "userTask",
             {"id": analyzefailedtransf_id, "name": "Analyze Failed Transformation"},
         )
 
-        ET.SubElement(
-            self.process, self.qn(BPMN2_NS, "endEvent"), {"id": altend1_id, "name": ""}
-        )
+        self._add_element("endEvent", {"id": altend1_id, "name": ""})
 
         self.inserted_chains[start_node] = (
             setvars1_id,
@@ -1657,21 +1366,18 @@ class BpmnBuilder:
         src_el_id = src
         tgt_el_id = tgt
 
-        src_el = self.process.find(f".//*[@id='{src_el_id}']")
-        tgt_el = self.process.find(f".//*[@id='{tgt_el_id}']")
+        src_el = self.elements.get(src_el_id)
+        tgt_el = self.elements.get(tgt_el_id)
 
         if tgt_el is not None:
             if tgt_el.tag != self.qn(BPMN2_NS, "startEvent"):
-                ET.SubElement(tgt_el, self.qn(BPMN2_NS, "incoming")).text = fid
-                self._fix_incoming_outgoing_order(tgt_el)
+                self._add_flow_ref(tgt_el, "incoming", fid)
         if src_el is not None:
             if src_el.tag != self.qn(BPMN2_NS, "endEvent"):
-                ET.SubElement(src_el, self.qn(BPMN2_NS, "outgoing")).text = fid
-                self._fix_incoming_outgoing_order(src_el)
+                self._add_flow_ref(src_el, "outgoing", fid)
 
-        sf = ET.SubElement(
-            self.process,
-            self.qn(BPMN2_NS, "sequenceFlow"),
+        sf = self._add_element(
+            "sequenceFlow",
             {"id": fid, "sourceRef": src_el_id, "targetRef": tgt_el_id},
         )
 
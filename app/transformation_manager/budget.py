@@ -0,0 +1,184 @@
+"""
+Resource budgets, deadlines and cooperative cancellation of processing.
+
+Processors call :meth:`ProcessingBudget.checkpoint` between nodes and stages.
+Work inside a single stage (e.g. one enrichment) is not interrupted,
+so checkpoints bound the time a cancelled or overdue request keeps running.
+"""
+
+from dataclasses import dataclass, field
+from time import monotonic
+
+from openqasm3.ast import IntegerLiteral, Program, QubitDeclaration
+
+from app.config import Settings
+from app.model.CompileRequest import Node as FrontendNode
+from app.model.CompileRequest import RepeatNode
+from app.transformation_manager.utils import ProcessingException
+
+
+class BudgetExceeded(ProcessingException):
+    """
+    The request needs more resources than allowed.
+    """
+
+
+class ProcessingCancelled(Exception):
+    """
+    Processing stopped because the request was cancelled.
+    """
+
+    def __init__(self) -> None:
+        super().__init__("The request was cancelled.")
+
+
+class DeadlineExceeded(Exception):
+    """
+    Processing stopped because it took longer than allowed.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        super().__init__(f"Processing exceeded the deadline of {seconds:g} seconds.")
+
+
+class CancellationToken:
+    """
+    Shared flag to request cancellation of processing.
+    """
+
+    cancelled: bool
+
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        """
+        Request cancellation. Processing stops at the next checkpoint.
+        """
+
+        self.cancelled = True
+
+
+@dataclass
+class ProcessingBudget:
+    """
+    Limits checked during processing of a single request.
+
+    `None` disables a limit.
+    The deadline starts with the first :meth:`checkpoint`.
+
+    :param max_nodes: Maximal number of processed nodes, including unrolled nodes.
+    :param max_qubit_width: Maximal number of qubits of the merged program.
+    :param max_statements: Maximal number of statements of all preprocessed nodes.
+    :param deadline_seconds: Maximal processing time in seconds.
+    :param cancellation: Token to cancel the processing.
+    """
+
+    max_nodes: int | None = None
+    max_qubit_width: int | None = None
+    max_statements: int | None = None
+    deadline_seconds: float | None = None
+    cancellation: CancellationToken = field(default_factory=CancellationToken)
+    nodes: int = 0
+    statements: int = 0
+    _deadline: float | None = field(default=None, init=False, repr=False)
+
+    @staticmethod
+    def from_settings(
+        settings: Settings, cancellation: CancellationToken | None = None
+    ) -> "ProcessingBudget":
+        """
+        Create a budget with the limits configured in `settings`.
+        """
+
+        return ProcessingBudget(
+            max_nodes=settings.max_processed_nodes,
+            max_qubit_width=settings.max_qubit_width,
+            max_statements=settings.max_statements,
+            deadline_seconds=settings.processing_deadline_seconds,
+            cancellation=cancellation or CancellationToken(),
+        )
+
+    def checkpoint(self) -> None:
+        """
+        Stop processing if it was cancelled or the deadline passed.
+
+        :raises ProcessingCancelled: If cancellation was requested.
+        :raises DeadlineExceeded: If the deadline passed.
+        """
+
+        if self.cancellation.cancelled:
+            raise ProcessingCancelled
+
+        if self.deadline_seconds is None:
+            return
+        if self._deadline is None:
+            self._deadline = monotonic() + self.deadline_seconds
+        elif monotonic() > self._deadline:
+            raise DeadlineExceeded(self.deadline_seconds)
+
+    def add_node(self, node: FrontendNode) -> None:
+        """
+        Count a processed node.
+
+        :raises BudgetExceeded: If too many nodes were processed.
+        """
+
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            msg = f"Request exceeds the limit of {self.max_nodes} processed nodes."
+            raise BudgetExceeded(msg, node)
+
+    def check_unroll(self, node: RepeatNode) -> None:
+        """
+        Reject a repeat node before unrolling it, if its unrolled nodes would exceed the budget.
+
+        :raises BudgetExceeded: If the unrolled nodes do not fit.
+        """
+
+        if self.max_nodes is None:
+            return
+        unrolled = node.iterations * len(node.block.nodes)
+        if self.nodes + unrolled > self.max_nodes:
+            msg = (
+                f"Unrolling {node.iterations} iterations of {len(node.block.nodes)} nodes "
+                f"exceeds the limit of {self.max_nodes} processed nodes."
+            )
+            raise BudgetExceeded(msg, node)
+
+    def add_statements(self, count: int, node: FrontendNode | None = None) -> None:
+        """
+        Count statements of a preprocessed node.
+
+        :raises BudgetExceeded: If the statements exceed the budget.
+        """
+
+        self.statements += count
+        if self.max_statements is not None and self.statements > self.max_statements:
+            msg = f"Request exceeds the limit of {self.max_statements} statements."
+            raise BudgetExceeded(msg, node)
+
+    def check_qubit_width(self, program: Program) -> None:
+        """
+        Check the number of qubits declared by a merged program.
+
+        :raises BudgetExceeded: If the program uses too many qubits.
+        """
+
+        if self.max_qubit_width is None:
+            return
+        width = 0
+        for statement in program.statements:
+            if not isinstance(statement, QubitDeclaration):
+                continue
+            if statement.size is None:
+                width += 1
+            elif isinstance(statement.size, IntegerLiteral):
+                width += statement.size.value
+
+        if width > self.max_qubit_width:
+            msg = (
+                f"Program uses {width} qubits, "
+                f"exceeding the limit of {self.max_qubit_width} qubits."
+            )
+            raise BudgetExceeded(msg)
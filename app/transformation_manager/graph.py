@@ -12,11 +12,17 @@ from networkx import DiGraph
 from openqasm3.ast import Program
 
 from app.model.data_types import (
+    ArrayType,
+    BitType,
+    BoolType,
+    FloatType,
+    IntType,
     LeqoSupportedClassicalType,
 )
 from app.model.data_types import (
     QubitType as LeqoQubitType,
 )
+from app.openqasm3.codec import AST_TYPES, Codec
 
 QubitID = int
 QubitIDs = list[int]
@@ -224,3 +230,28 @@ class ProcessedProgramNode:
     @property
     def id(self) -> UUID:
         return self.raw.id
+
+
+NODE_CODEC = Codec(
+    (
+        *AST_TYPES,
+        LeqoQubitType,
+        BitType,
+        BoolType,
+        IntType,
+        FloatType,
+        ArrayType,
+        ProgramNode,
+        ClassicalIOInstance,
+        QubitIOInstance,
+        IOInfo,
+        QubitInfo,
+        ProcessedProgramNode,
+    )
+)
+"""
+Binary codec for :class:`ProcessedProgramNode`, :class:`IOInfo`, :class:`QubitInfo` and ASTs.
+
+Use it to move preprocessed nodes between processes or to store them in persistent caches,
+see :mod:`app.openqasm3.codec`.
+"""
@@ -2,8 +2,6 @@
 Merge all nodes from :class:`~app.transformation_manager.graph.ProgramGraph` into a single QASM program.
 """
 
-from copy import deepcopy
-
 from networkx import topological_sort
 from openqasm3.ast import (
     AliasStatement,
@@ -21,6 +19,7 @@ from openqasm3.ast import (
 )
 
 from app.openqasm3.ast import CommentStatement
+from app.openqasm3.clone import clone
 from app.openqasm3.visitor import LeqoTransformer
 from app.transformation_manager.graph import (
     ClassicalIOInstance,
@@ -151,7 +150,7 @@ def merge_if_nodes(
                     msg = "Future Work: can't return classical output from if-then-else node"
                     raise NotImplementedError(msg)
 
-    endif_node_in_else = deepcopy(endif_node)
+    endif_node_in_else = clone(endif_node)
     else_graph.node_data[endif_node_raw] = endif_node_in_else
 
     reg_name = f"leqo_{if_node.id.hex}_{IF_REG_NAME}"
@@ -6,7 +6,6 @@ this module calls this function and handles the extensive pre- and postprocessin
 """
 
 from collections.abc import Callable, Coroutine
-from copy import deepcopy
 from typing import Any
 
 from openqasm3.ast import (
@@ -20,6 +19,7 @@ from app.model.CompileRequest import (
     IfThenElseNode,
 )
 from app.model.data_types import LeqoSupportedType
+from app.openqasm3.clone import clone
 from app.openqasm3.rename import simple_rename
 from app.transformation_manager.frontend_graph import FrontendGraph
 from app.transformation_manager.graph import ProgramGraph, ProgramNode
@@ -84,7 +84,7 @@ async def enrich_if_then_else(
     if_id = f"leqo_{parent_id.hex}_if"
     if_node = ProgramNode(if_id)
     if_front_node = ParsedImplementationNode(
-        id=if_id, implementation=deepcopy(pass_node_impl)
+        id=if_id, implementation=clone(pass_node_impl)
     )
     endif_id = f"leqo_{parent_id.hex}_endif"
     endif_node = ProgramNode(endif_id)
@@ -103,8 +103,8 @@ async def enrich_if_then_else(
         FrontendGraph.create(
             (
                 *node.thenBlock.nodes,
-                deepcopy(if_front_node),
-                deepcopy(endif_front_node),
+                clone(if_front_node),
+                clone(endif_front_node),
             ),
             node.thenBlock.edges,
         )
@@ -2,11 +2,10 @@
 Unroll the repeat node.
 """
 
-from copy import deepcopy
-
 from app.enricher import ParsedImplementationNode
 from app.model.CompileRequest import RepeatNode
 from app.model.data_types import LeqoSupportedType
+from app.openqasm3.clone import clone
 from app.transformation_manager.frontend_graph import FrontendGraph
 from app.transformation_manager.graph import ProgramNode
 from app.transformation_manager.nested.utils import generate_pass_node_implementation
@@ -40,7 +39,7 @@ def unroll_repeat(
         result = FrontendGraph()
         entry_node = ParsedImplementationNode(
             id=f"leqo_{parent_id.hex}_repeat_entry",
-            implementation=deepcopy(pass_node_impl),
+            implementation=clone(pass_node_impl),
         )
         result.append_node(entry_node)
         prev_id = entry_node.id
@@ -52,17 +51,17 @@ def unroll_repeat(
 
             exit_node = ParsedImplementationNode(
                 id=f"leqo_{parent_id.hex}_repeat_{i}_exit",
-                implementation=deepcopy(pass_node_impl),
+                implementation=clone(pass_node_impl),
             )
             result.append_node(exit_node)
             for n in node.block.nodes:
                 if n.id == node.id:
                     continue
-                iter_node = deepcopy(n)
+                iter_node = clone(n)
                 iter_node.id = new_id(iter_node.id)
                 result.append_node(iter_node)
             for e in node.block.edges:
-                iter_edge = deepcopy(e)
+                iter_edge = clone(e)
                 source_id = iter_edge.source[0]
                 target_id = iter_edge.target[0]
                 if source_id == node.id:
@@ -2,10 +2,11 @@
 Optimize the modeled graph by adding additional ancilla connections and decide whether to uncompute.
 """
 
-from copy import deepcopy
+from dataclasses import replace
 
 from openqasm3.ast import BranchingStatement, QASMNode, Statement
 
+from app.openqasm3.clone import clone
 from app.openqasm3.visitor import LeqoTransformer
 from app.transformation_manager.graph import ProgramGraph
 from app.transformation_manager.optimize.algos import NoPredCheckNeedDiffScore
@@ -37,13 +38,34 @@ class ApplyUncomputeTransformer(LeqoTransformer[None]):
         return node.if_block
 
 
+def copy_for_optimization(graph: ProgramGraph) -> ProgramGraph:
+    """
+    Copy the parts of the graph modified by the optimization algorithms.
+
+    The algorithms remove edges and consume qubit ids,
+    but never touch the implementations, which are shared with the original graph.
+
+    :param graph: Graph to copy.
+    :return: Copy with its own structure and qubit information.
+    """
+    result = ProgramGraph()
+    for raw_node in graph.nodes:
+        node = graph.get_data_node(raw_node)
+        result.append_node(replace(node, qubit=clone(node.qubit)))
+    result.add_edges_from(graph.edges)
+    result.edge_data = {key: list(edges) for key, edges in graph.edge_data.items()}
+    return result
+
+
 def optimize(graph: ProgramGraph) -> None:
     """
     Optimize the given graph in-place based on :class:`~app.transformation_manager.graph.IOInfo`.
 
     :param graph: Graph of all nodes representing the program
     """
-    ancilla_edges, uncomputes = NoPredCheckNeedDiffScore(deepcopy(graph)).compute()
+    ancilla_edges, uncomputes = NoPredCheckNeedDiffScore(
+        copy_for_optimization(graph)
+    ).compute()
     for edge in ancilla_edges:
         graph.append_edge(edge)
 
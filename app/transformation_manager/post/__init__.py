@@ -2,14 +2,18 @@
 Post-process merged QASM-Program.
 """
 
+import logging
 from collections.abc import Iterable
 
 from openqasm3.ast import Program
 
+from app.transformation_manager.post.peephole import optimize_gates
 from app.transformation_manager.post.qiskit_compat import apply_qiskit_compatibility
 from app.transformation_manager.post.sort_imports import SortImportsTransformer
 from app.transformation_manager.utils import cast_to_program
 
+logger = logging.getLogger(__name__)
+
 
 def postprocess(
     program: Program,
@@ -17,11 +21,24 @@ def postprocess(
     qiskit_compat: bool = False,
     literal_nodes: Iterable[str] | None = None,
     literal_nodes_with_consumers: Iterable[str] | None = None,
+    peephole: bool = True,
 ) -> Program:
     """
     Return post-processed program as AST.
+
+    :param peephole: Whether to cancel and fuse adjacent gates,
+        see :func:`~app.transformation_manager.post.peephole.optimize_gates`.
     """
     processed = program
+    if peephole:
+        processed, statistics = optimize_gates(processed)
+        logger.info(
+            "Peephole pass removed %d of %d gates (%d cancelled, %d fused)",
+            statistics.removed,
+            statistics.gates,
+            statistics.cancelled,
+            statistics.fused,
+        )
     if qiskit_compat:
         processed = apply_qiskit_compatibility(
             processed,
@@ -0,0 +1,459 @@
+"""
+Cancel and fuse adjacent gates in the merged program.
+
+Merging places the implementations of the nodes one after another,
+so gates at the node boundaries often undo each other,
+e.g. the ``x`` of a basis encoding and the ``x`` of the consumer.
+All qubit aliases are resolved to global qubits (the indices of ``leqo_reg``),
+which allows finding adjacent gates across nodes.
+"""
+
+import math
+from collections.abc import Iterable
+from copy import copy
+from dataclasses import dataclass
+
+from openqasm3.ast import (
+    AliasStatement,
+    BinaryExpression,
+    BranchingStatement,
+    ClassicalAssignment,
+    ClassicalDeclaration,
+    Concatenation,
+    ConstantDeclaration,
+    Expression,
+    FloatLiteral,
+    ForInLoop,
+    FunctionCall,
+    Identifier,
+    Include,
+    IndexedIdentifier,
+    IndexElement,
+    IndexExpression,
+    IntegerLiteral,
+    IODeclaration,
+    Pragma,
+    Program,
+    QASMNode,
+    QuantumBarrier,
+    QuantumGate,
+    QuantumGateDefinition,
+    QuantumMeasurement,
+    QuantumMeasurementStatement,
+    QuantumPhase,
+    QuantumReset,
+    QubitDeclaration,
+    Statement,
+    SubroutineDefinition,
+    UnaryExpression,
+    WhileLoop,
+)
+from openqasm3.visitor import QASMVisitor
+
+from app.openqasm3.ast import CommentStatement
+from app.transformation_manager.pre.utils import (
+    PreprocessingException,
+    parse_qasm_index,
+)
+
+SELF_INVERSE_GATES = frozenset(
+    {"x", "y", "z", "h", "cx", "CX", "cy", "cz", "ch", "swap", "ccx", "cswap"}
+)
+INVERSE_GATES = {"s": "sdg", "sdg": "s", "t": "tdg", "tdg": "t"}
+# a rotation by a multiple of the period is the identity up to a global phase
+ROTATION_PERIODS = {
+    "rx": 2 * math.pi,
+    "ry": 2 * math.pi,
+    "rz": 2 * math.pi,
+    "p": 2 * math.pi,
+    "phase": 2 * math.pi,
+    "u1": 2 * math.pi,
+    "cp": 2 * math.pi,
+    "cphase": 2 * math.pi,
+    "cu1": 2 * math.pi,
+    "crx": 4 * math.pi,
+    "cry": 4 * math.pi,
+    "crz": 4 * math.pi,
+}
+SYMMETRIC_GATES = frozenset({"cz", "swap", "cp", "cphase", "cu1"})
+CONSTANTS = {
+    "pi": math.pi,
+    "π": math.pi,
+    "tau": math.tau,
+    "τ": math.tau,
+    "euler": math.e,
+    "ℇ": math.e,
+}
+ANGLE_TOLERANCE = 1e-12
+
+# statements that neither act on qubits nor change the meaning of later gates
+NEUTRAL_STATEMENTS = (
+    CommentStatement,
+    ConstantDeclaration,
+    Include,
+    IODeclaration,
+    Pragma,
+    QuantumGateDefinition,
+    QubitDeclaration,
+    SubroutineDefinition,
+)
+
+
+@dataclass
+class PeepholeStatistics:
+    """
+    Counts of a :func:`optimize_gates` run.
+    """
+
+    gates: int = 0
+    """Number of gates in the input program."""
+
+    cancelled: int = 0
+    """Number of gates removed because they cancelled with their neighbour."""
+
+    fused: int = 0
+    """Number of rotations merged into the preceding rotation."""
+
+    @property
+    def removed(self) -> int:
+        """
+        Number of gates removed in total.
+        """
+        return self.cancelled + self.fused
+
+
+@dataclass
+class _Gate:
+    """
+    Gate in the output that later gates may cancel or fuse with.
+    """
+
+    position: int
+    name: str
+    qubits: tuple[int, ...]
+    angle: float | None
+
+
+class _FindCalls(QASMVisitor[None]):
+    found: bool
+
+    def __init__(self) -> None:
+        self.found = False
+
+    def visit_FunctionCall(self, node: FunctionCall) -> None:
+        self.found = True
+
+
+def _has_call(node: QASMNode | None) -> bool:
+    """
+    Whether the expression may call a subroutine, which might act on qubits.
+    """
+    if node is None:
+        return False
+    visitor = _FindCalls()
+    visitor.visit(node)
+    return visitor.found
+
+
+def _constant(expression: Expression) -> float | None:  # noqa: PLR0911
+    """
+    Evaluate a constant angle, None if it depends on variables or isn't supported.
+    """
+    match expression:
+        case IntegerLiteral() | FloatLiteral():
+            return float(expression.value)
+        case Identifier():
+            return CONSTANTS.get(expression.name)
+        case UnaryExpression() if expression.op.name == "-":
+            value = _constant(expression.expression)
+            return None if value is None else -value
+        case BinaryExpression():
+            lhs, rhs = _constant(expression.lhs), _constant(expression.rhs)
+            if lhs is None or rhs is None:
+                return None
+            match expression.op.name:
+                case "+":
+                    return lhs + rhs
+                case "-":
+                    return lhs - rhs
+                case "*":
+                    return lhs * rhs
+                case "/" if rhs != 0:
+                    return lhs / rhs
+    return None
+
+
+class _Optimizer:
+    """
+    Single pass over a block, keeping the gates on each qubit as a stack.
+
+    Every gate is compared with the last gate on its qubits only,
+    which makes the pass linear in the number of statements.
+    A cancelled gate is popped, so the gate before it becomes adjacent
+    to the next gate again (e.g. ``h x x h`` vanishes completely).
+    """
+
+    registers: dict[str, list[int]]
+    size: int
+    statistics: PeepholeStatistics
+    overridden: frozenset[str]
+    output: list[Statement | None]
+    timelines: dict[int, list[_Gate | None]]
+
+    def __init__(
+        self,
+        registers: dict[str, list[int]],
+        size: int,
+        statistics: PeepholeStatistics,
+        overridden: frozenset[str],
+    ) -> None:
+        self.registers = registers
+        self.size = size
+        self.statistics = statistics
+        self.overridden = overridden
+        self.output = []
+        self.timelines = {}
+
+    def optimize(self, statements: Iterable[Statement]) -> list[Statement]:
+        for statement in statements:
+            self.visit(statement)
+        return [statement for statement in self.output if statement is not None]
+
+    def nested(self, statements: list[Statement]) -> list[Statement]:
+        """
+        Optimize a scoped block, which starts and ends with a full fence.
+        """
+        optimizer = _Optimizer(
+            dict(self.registers), self.size, self.statistics, self.overridden
+        )
+        result = optimizer.optimize(statements)
+        self.size = optimizer.size
+        return result
+
+    def resolve(self, expression: QASMNode) -> list[int] | None:
+        """
+        Resolve a qubit expression to global qubits, None if that isn't possible.
+        """
+        match expression:
+            case Identifier():
+                if (
+                    expression.name.startswith("$")
+                    and expression.name not in self.registers
+                ):
+                    self.registers[expression.name] = [self.declare(1)]
+                return self.registers.get(expression.name)
+            case IndexedIdentifier():
+                qubits = self.registers.get(expression.name.name)
+                return self.select(qubits, expression.indices)
+            case IndexExpression():
+                qubits = self.resolve(expression.collection)
+                return self.select(qubits, [expression.index])
+            case Concatenation():
+                lhs, rhs = self.resolve(expression.lhs), self.resolve(expression.rhs)
+                return None if lhs is None or rhs is None else lhs + rhs
+        return None
+
+    @staticmethod
+    def select(
+        qubits: list[int] | None, indices: list[IndexElement]
+    ) -> list[int] | None:
+        if qubits is None:
+            return None
+        try:
+            selected = parse_qasm_index(indices, len(qubits))
+        except (PreprocessingException, IndexError):
+            return None
+        if isinstance(selected, int):
+            return [qubits[selected]]
+        return [qubits[index] for index in selected]
+
+    def declare(self, size: int) -> int:
+        start = self.size
+        self.size += size
+        return start
+
+    def fence(self, qubits: Iterable[int] | None) -> None:
+        """
+        Stop gates from cancelling across this point, None for all qubits.
+        """
+        if qubits is None:
+            self.timelines.clear()
+            return
+        for qubit in qubits:
+            self.timelines.setdefault(qubit, []).append(None)
+
+    def fence_operands(self, operands: Iterable[QASMNode]) -> None:
+        qubits: list[int] = []
+        for operand in operands:
+            resolved = self.resolve(operand)
+            if resolved is None:
+                self.fence(None)
+                return
+            qubits.extend(resolved)
+        self.fence(qubits)
+
+    def visit(self, statement: Statement) -> None:  # noqa: PLR0912
+        match statement:
+            case QuantumGate():
+                self.visit_gate(statement)
+                return
+            case QubitDeclaration():
+                size = 1 if statement.size is None else _constant(statement.size)
+                if size is None:
+                    self.registers.pop(statement.qubit.name, None)
+                else:
+                    start = self.declare(int(size))
+                    self.registers[statement.qubit.name] = list(
+                        range(start, start + int(size))
+                    )
+            case AliasStatement():
+                qubits = self.resolve(statement.value)
+                if qubits is None:
+                    self.registers.pop(statement.target.name, None)
+                else:
+                    self.registers[statement.target.name] = qubits
+            case QuantumMeasurementStatement():
+                self.fence_operands([statement.measure.qubit])
+            case ClassicalDeclaration(init_expression=QuantumMeasurement() as measure):
+                self.fence_operands([measure.qubit])
+            case ClassicalAssignment(rvalue=QuantumMeasurement() as measure):
+                self.fence_operands([measure.qubit])
+            case ClassicalDeclaration() if not _has_call(statement.init_expression):
+                pass
+            case ClassicalAssignment() if not _has_call(statement.rvalue):
+                pass
+            case QuantumReset():
+                self.fence_operands([statement.qubits])
+            case QuantumBarrier() | QuantumPhase() if statement.qubits:
+                self.fence_operands(statement.qubits)
+            case QuantumPhase():
+                pass
+            case BranchingStatement():
+                statement = copy(statement)
+                statement.if_block = self.nested(statement.if_block)
+                statement.else_block = self.nested(statement.else_block)
+                self.fence(None)
+            case ForInLoop() | WhileLoop():
+                statement = copy(statement)
+                statement.block = self.nested(statement.block)
+                self.fence(None)
+            case _ if isinstance(statement, NEUTRAL_STATEMENTS):
+                pass
+            case _:
+                self.fence(None)
+        self.output.append(statement)
+
+    def visit_gate(self, gate: QuantumGate) -> None:
+        self.statistics.gates += 1
+        name = gate.name.name
+        qubits: list[int] = []
+        for operand in gate.qubits:
+            resolved = self.resolve(operand)
+            if resolved is None or len(resolved) != 1:
+                # broadcasts and unknown qubits are kept as they are
+                self.fence_operands(gate.qubits)
+                self.output.append(gate)
+                return
+            qubits.extend(resolved)
+
+        angle = None
+        optimizable = (
+            not gate.modifiers
+            and gate.duration is None
+            and name not in self.overridden
+            and len(set(qubits)) == len(qubits)
+        )
+        if name in ROTATION_PERIODS:
+            angle = _constant(gate.arguments[0]) if len(gate.arguments) == 1 else None
+            optimizable = optimizable and angle is not None
+        else:
+            optimizable = (
+                optimizable
+                and not gate.arguments
+                and (name in SELF_INVERSE_GATES or name in INVERSE_GATES)
+            )
+        if not optimizable:
+            self.fence(qubits)
+            self.output.append(gate)
+            return
+
+        current = _Gate(len(self.output), name, tuple(qubits), angle)
+        previous = self.previous(current)
+        if previous is None:
+            self.push(current)
+            self.output.append(gate)
+        elif angle is None:
+            self.pop(previous)
+            self.statistics.cancelled += 2
+        else:
+            assert previous.angle is not None
+            previous.angle += angle
+            if abs(math.remainder(previous.angle, ROTATION_PERIODS[name])) < (
+                ANGLE_TOLERANCE
+            ):
+                self.pop(previous)
+                self.statistics.cancelled += 2
+            else:
+                self.statistics.fused += 1
+                fused = copy(self.output[previous.position])
+                assert isinstance(fused, QuantumGate)
+                fused.arguments = [FloatLiteral(previous.angle)]
+                self.output[previous.position] = fused
+
+    def previous(self, gate: _Gate) -> _Gate | None:
+        """
+        The last gate on the qubits if it cancels or fuses with the given gate.
+        """
+        previous = self.last(gate.qubits[0])
+        if previous is None or previous.name != INVERSE_GATES.get(gate.name, gate.name):
+            return None
+        if any(self.last(qubit) is not previous for qubit in gate.qubits[1:]):
+            return None
+        if previous.qubits == gate.qubits or (
+            gate.name in SYMMETRIC_GATES and set(previous.qubits) == set(gate.qubits)
+        ):
+            return previous
+        return None
+
+    def last(self, qubit: int) -> _Gate | None:
+        timeline = self.timelines.get(qubit)
+        return timeline[-1] if timeline else None
+
+    def push(self, gate: _Gate) -> None:
+        for qubit in gate.qubits:
+            self.timelines.setdefault(qubit, []).append(gate)
+
+    def pop(self, gate: _Gate) -> None:
+        for qubit in gate.qubits:
+            self.timelines[qubit].pop()
+        self.output[gate.position] = None
+
+
+def optimize_gates(program: Program) -> tuple[Program, PeepholeStatistics]:
+    """
+    Cancel and fuse adjacent gates acting on the same qubits.
+
+    - Self-inverse gates (e.g. ``x x``, ``h h``, ``cx cx``) and inverse pairs
+      (``s sdg``, ``t tdg``) cancel.
+    - Consecutive rotations around the same axis (e.g. ``rz``, ``rx``, ``ry``, ``cp``)
+      with constant angles are fused into one, which is dropped if the angle vanishes.
+
+    Measurements, resets, barriers, gates on unknown qubits and calls
+    separate the gates on the affected qubits.
+    Blocks of branching statements and loops are optimized on their own.
+    Gates with modifiers and gates whose standard name is overridden by a definition
+    are left untouched.
+
+    :param program: The merged program, which isn't modified.
+    :return: The optimized program and the statistics of the pass.
+    """
+    statistics = PeepholeStatistics()
+    overridden = frozenset(
+        statement.name.name
+        for statement in program.statements
+        if isinstance(statement, QuantumGateDefinition)
+    )
+    optimizer = _Optimizer({}, 0, statistics, overridden)
+    result = copy(program)
+    result.statements = optimizer.optimize(program.statements)  # type: ignore[assignment]
+    return result, statistics
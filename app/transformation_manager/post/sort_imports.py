@@ -2,7 +2,7 @@
 Ensure unique imports at the front of the program.
 """
 
-from openqasm3.ast import Include, Program
+from openqasm3.ast import Include, Program, QuantumGateDefinition
 from openqasm3.visitor import QASMTransformer
 
 from app.transformation_manager.utils import cast_to_program
@@ -16,12 +16,17 @@ class SortImportsTransformer(QASMTransformer[None]):
 
     - remove duplicate imports
     - move imports at the top
+    - move gate definitions nested in blocks (e.g. if-then-else) to the global scope
     """
 
     seen: dict[str, Include]
+    hoisted: list[QuantumGateDefinition]
+    global_gates: set[int]
 
     def __init__(self) -> None:
         self.seen = {}
+        self.hoisted = []
+        self.global_gates = set()
 
     def visit_Include(self, node: Include) -> None:
         """
@@ -32,10 +37,33 @@ class SortImportsTransformer(QASMTransformer[None]):
         """
         self.seen[node.filename] = node
 
+    def visit_QuantumGateDefinition(
+        self, node: QuantumGateDefinition
+    ) -> QuantumGateDefinition | None:
+        """
+        Store and remove gate definitions that are not in the global scope.
+
+        OpenQASM only allows gate definitions in the global scope.
+
+        :param node: The statement to process
+        :return: None removes the node
+        """
+        if id(node) in self.global_gates:
+            return node
+        self.hoisted.append(node)
+        return None
+
     def visit_Program(self, node: Program) -> Program:
         """
-        Execute a normal (generic) visit, then add removed imports back.
+        Execute a normal (generic) visit, then add removed imports and gates back.
         """
+        self.global_gates = {
+            id(statement)
+            for statement in node.statements
+            if isinstance(statement, QuantumGateDefinition)
+        }
         program = cast_to_program(self.generic_visit(node))
-        program.statements = list(self.seen.values()) + program.statements
+        program.statements = (
+            list(self.seen.values()) + self.hoisted + program.statements
+        )
         return program
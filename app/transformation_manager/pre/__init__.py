@@ -16,6 +16,7 @@ from copy import copy
 from openqasm3.ast import AliasStatement, Concatenation, Identifier, Statement, Program
 
 from app.model.data_types import LeqoSupportedType
+from app.openqasm3.clone import clone
 from app.transformation_manager.graph import (
     IOInfo,
     ProcessedProgramNode,
@@ -84,10 +85,37 @@ def expand_unary_concat_broadcast(program: Program) -> Program:
     return p2
 
 
+class ParseCache:
+    """
+    Share parsed implementations between nodes and requests.
+
+    The pipeline mutates the parsed program, so each lookup returns a copy.
+    """
+
+    _programs: dict[str, Program]
+
+    def __init__(self) -> None:
+        self._programs = {}
+
+    def parse(self, implementation: str) -> Program:
+        """
+        Parse an OpenQASM 2/3 implementation, reusing earlier results.
+
+        :param implementation: The implementation to parse.
+        :return: A fresh copy of the parsed program.
+        """
+        program = self._programs.get(implementation)
+        if program is None:
+            program = parse_to_openqasm3(implementation)
+            self._programs[implementation] = program
+        return clone(program)
+
+
 def preprocess(
     node: ProgramNode,
     implementation: str | Program,
     requested_inputs: dict[int, LeqoSupportedType] | None = None,
+    parse_cache: ParseCache | None = None,
 ) -> ProcessedProgramNode:
     """
     Run an openqasm3 snippet through the preprocessing pipeline.
@@ -95,11 +123,14 @@ def preprocess(
     :param node: The node to preprocess.
     :param implementation: A valid OpenQASM 2/3 implementation for that node.
     :param requested_inputs: Optional inputs specification for size_casting
+    :param parse_cache: Optional cache to reuse parsed implementations
     :return: The preprocessed program.
     """
     try:
         if isinstance(implementation, Program):
             ast = implementation
+        elif parse_cache is not None:
+            ast = parse_cache.parse(implementation)
         else:
             ast = parse_to_openqasm3(implementation)
 
@@ -30,14 +30,18 @@ Key Features
 - **Automated OpenQASM Conversion**: Seamlessly converts OpenQASM 2.x code into valid OpenQASM 3.1 format.
 - **Unsupported Gate Management**: Detects and provides definitions for gates specified in "qelib1.inc".
 - **Library Integration**: Incorporates additional OpenQASM gate definitions from provided strings.
+- **Gate Library Registry**: Gate libraries are parsed once per process and shared by all converters,
+  see :func:`get_gate_library`.
 """
 
 import re
+from functools import cache
 from pathlib import Path
 
 from openqasm3.ast import Include, Program, QASMNode, QuantumGate, QuantumGateDefinition
 from openqasm3.parser import parse
 
+from app.openqasm3.clone import clone
 from app.openqasm3.visitor import LeqoTransformer
 from app.transformation_manager.pre.utils import PreprocessingException
 from app.transformation_manager.utils import cast_to_program
@@ -58,6 +62,9 @@ ANNOTATION_PATTERN = re.compile(r"^\s*//\s*(@.+)$", re.MULTILINE)
 LIB_REPLACEMENTS = {"qelib1.inc": "stdgates.inc"}
 # NOTE: if this version is updated, the docs need to be updated also
 TARGET_QASM_VERSION = "3.1"
+QELIB1_PATH = (
+    Path(__file__).absolute().parent / "qasm_lib_for_converter" / "qasm3_qelib1.qasm"
+)
 
 
 class CustomOpenqasmLib:
@@ -65,7 +72,10 @@ class CustomOpenqasmLib:
     Encapsulates an OpenQASM 3.x-compatible gate library for custom gate resolution.
 
     Used to provide gate definitions (e.g., from qelib1.inc) that can be injected into
-    converted OpenQASM 2.x code. Only gate definitions (`QuantumGateDefinition`) are retained."""
+    converted OpenQASM 2.x code. Only gate definitions (`QuantumGateDefinition`) are retained.
+
+    Libraries may be shared between converters (see :func:`get_gate_library`),
+    so their gate definitions must not be modified."""
 
     name: str
     content: str
@@ -86,6 +96,30 @@ class CustomOpenqasmLib:
                 self.gates.append(statement)
 
 
+@cache
+def get_gate_library(name: str, content: str) -> CustomOpenqasmLib:
+    """
+    Get the parsed gate library for `name` and `content`.
+
+    Each library is parsed only once per process and shared afterwards.
+
+    :param name: The name of the module.
+    :param content: The custom gate definitions in OpenQASM 3.x as string.
+    :return: The shared, parsed library.
+    """
+    return CustomOpenqasmLib(name, content)
+
+
+@cache
+def get_qelib1() -> CustomOpenqasmLib:
+    """
+    Get the builtin OpenQASM 3.x port of "qelib1.inc".
+
+    :return: The shared, parsed library.
+    """
+    return get_gate_library("qelib1.inc", QELIB1_PATH.read_text())
+
+
 class QASMConversionError(PreprocessingException):
     """
     Custom exception raised for errors occurring during QASM conversion.
@@ -167,7 +201,8 @@ class ApplyCustomGates(LeqoTransformer[None]):
         self.generic_visit(node)
         node.statements = (
             sorted(self.includes.values(), key=lambda imp: imp.filename)
-            + [self.gates[gd] for gd in sorted(self.require_gates)]
+            # copy the shared definitions, as later passes modify the program
+            + [clone(self.gates[gd]) for gd in sorted(self.require_gates)]
             + node.statements
         )
         return node
@@ -202,12 +237,7 @@ class QASMConverter:
         if custom_libs is not None:
             for lib in custom_libs:
                 self.add_custom_gate_lib(lib)
-        with (
-            Path(__file__).absolute().parent
-            / "qasm_lib_for_converter"
-            / "qasm3_qelib1.qasm"
-        ).open() as f:
-            self.add_custom_gate_lib(CustomOpenqasmLib("qelib1.inc", f.read()))
+        self.add_custom_gate_lib(get_qelib1())
 
     def parse_to_qasm3(self, qasm2_code: str) -> Program:
         """
@@ -4,7 +4,6 @@ Parse input/output info for single code snippet over leqo-annotations.
 
 from __future__ import annotations
 
-from copy import deepcopy
 from itertools import chain
 
 from openqasm3.ast import (
@@ -47,6 +46,7 @@ from app.model.data_types import (
 from app.model.data_types import (
     IntType as LeqoIntType,
 )
+from app.openqasm3.clone import clone
 from app.openqasm3.visitor import LeqoTransformer
 from app.transformation_manager.graph import (
     ClassicalIOInstance,
@@ -236,7 +236,7 @@ class ParseAnnotationsVisitor(LeqoTransformer[None]):
                         msg = f"Unsupported: Can't handle indexed {source.type}"
                         raise PreprocessingException(msg)
             case Identifier():
-                info = deepcopy(self.__name_to_info.get(value.name))
+                info = clone(self.__name_to_info.get(value.name))
                 if info is not None:
                     info.name = name
                 return info
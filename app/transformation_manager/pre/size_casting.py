@@ -4,8 +4,6 @@ Allow for smaller inputs by reducing the size of the type in the AST and parsed
 
 from __future__ import annotations
 
-from copy import deepcopy
-
 from openqasm3.ast import (
     AliasStatement,
     Annotation,
@@ -38,6 +36,7 @@ from app.model.data_types import (
 from app.model.data_types import (
     LeqoSupportedClassicalType,
 )
+from app.openqasm3.clone import clone
 from app.openqasm3.visitor import LeqoTransformer
 from app.transformation_manager.graph import (
     ClassicalIOInstance,
@@ -188,8 +187,8 @@ class SizeCastTransformer(LeqoTransformer[None]):
         assert isinstance(node.type, (IntType, FloatType))
 
         new_input_node = ClassicalDeclaration(
-            type=deepcopy(node.type),
-            identifier=deepcopy(node.identifier),
+            type=clone(node.type),
+            identifier=clone(node.identifier),
             init_expression=Identifier(new_input_name),
         )
 
@@ -2,22 +2,27 @@
 Utils used throughout the whole application.
 """
 
-from collections.abc import Callable
+import json
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import TypeVar
 from uuid import UUID
 
 from openqasm3.ast import Program
 from openqasm3.printer import dumps
-from sqlalchemy import select
+from sqlalchemy import String, cast, delete, func, select, text, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.caching import compute_digest
+from app.compression import ContentEncoding, EncodedPayload, parse_content_encoding
 from app.model.CompileRequest import ImplementationNode
 from app.model.database_model import (
     CompileRequestPayload,
     CompileResult,
     EnrichResult,
+    QuantumGroupResult,
     QuantumResourceModel,
     ServiceDeploymentModel,
     SingleEnrichResult,
@@ -25,13 +30,16 @@ from app.model.database_model import (
 )
 from app.model.exceptions import LeqoProblemDetails
 from app.model.StatusResponse import (
+    CancelledStatus,
     CreatedStatus,
     FailedStatus,
     Progress,
     StatusResponse,
     StatusType,
     SuccessStatus,
+    TimeoutStatus,
 )
+from app.status_events import STATUS_CHANNEL, notification_payload, status_broker
 
 TParam = TypeVar("TParam")
 TReturn = TypeVar("TReturn")
@@ -106,6 +114,39 @@ class StoredFilePayload:
     content: bytes
     filename: str | None = None
     content_type: str | None = None
+    etag: str | None = None
+
+
+@dataclass(frozen=True)
+class BatchMemberRecord:
+    """
+    Initial state of a member of a batch compile request.
+
+    :param status: Initial status of the member.
+    :param compilation_target: Compilation target of the member.
+    :param payload: The serialized compile request.
+    :param name: Optional name originating from the request metadata.
+    :param description: Optional description originating from the request metadata.
+    """
+
+    status: StatusResponse
+    compilation_target: str
+    payload: str
+    name: str | None = None
+    description: str | None = None
+
+
+@dataclass(frozen=True)
+class StoredEtag:
+    """
+    Entity tag of a stored payload, loaded without loading the payload itself.
+
+    :param digest: Content hash computed when the payload was written (`None` for legacy rows).
+    :param encoding: Content encoding of the stored payload.
+    """
+
+    digest: str | None
+    encoding: ContentEncoding = "identity"
 
 
 def safe_generate_implementation_node(
@@ -126,6 +167,17 @@ def safe_generate_implementation_node(
     return ImplementationNode(id=node_id, implementation=impl)
 
 
+def _encode_status_result(status: StatusResponse) -> EncodedPayload | None:
+    """
+    Serialize the result of a :class:`~app.model.StatusResponse.StatusResponse` for storage.
+    """
+    if status.result is None:
+        return None
+    if isinstance(status.result, LeqoProblemDetails):
+        return EncodedPayload.encode(status.result.model_dump_json())
+    return EncodedPayload.encode(status.result)
+
+
 async def add_status_response_to_db(
     engine: AsyncEngine,
     status: StatusResponse,
@@ -143,11 +195,7 @@ async def add_status_response_to_db(
     :param name: Optional name originating from the request metadata
     :param description: Optional description originating from the request metadata
     """
-    result_value = (
-        status.result.model_dump_json()
-        if isinstance(status.result, LeqoProblemDetails)
-        else status.result
-    )
+    result_value = _encode_status_result(status)
     process_state = StatusResponseDb(
         id=status.uuid,
         status=status.status,
@@ -155,7 +203,10 @@ async def add_status_response_to_db(
         completedAt=status.completedAt,
         progressPercentage=status.progress.percentage if status.progress else None,
         progressCurrentStep=status.progress.currentStep if status.progress else None,
-        result=result_value,
+        result=result_value.content if result_value is not None else None,
+        content_encoding=result_value.encoding
+        if result_value is not None
+        else "identity",
         name=name,
         description=description,
         compilationTarget=compilation_target,
@@ -177,6 +228,9 @@ async def update_status_response_in_db(
     """
     Update the :class:`~app.model.StatusResponse.StatusResponse` in the database by replacing the row.
 
+    Subscribers in this process receive the new state directly.
+    Other replicas are notified via ``NOTIFY`` (see :mod:`app.status_events`).
+
     :param engine: Database engine to use.
     :param new_state: New status information to persist.
     :param compilation_target: Compilation target associated with this request.
@@ -194,6 +248,7 @@ async def update_status_response_in_db(
             else getattr(existing_state, "description", None)
         )
 
+        result_value = _encode_status_result(new_state)
         new_process_state = StatusResponseDb(
             id=new_state.uuid,
             status=new_state.status,
@@ -201,17 +256,152 @@ async def update_status_response_in_db(
             completedAt=new_state.completedAt,
             progressPercentage=new_state.progress.percentage,
             progressCurrentStep=new_state.progress.currentStep,
-            result=new_state.result.model_dump_json()
-            if isinstance(new_state.result, LeqoProblemDetails)
-            else new_state.result,
+            result=result_value.content if result_value is not None else None,
+            content_encoding=result_value.encoding
+            if result_value is not None
+            else "identity",
             name=stored_name,
             description=stored_description,
             compilationTarget=compilation_target,
         )
 
         await session.merge(new_process_state)
+        await session.execute(
+            select(func.pg_notify(STATUS_CHANNEL, notification_payload(new_state.uuid)))
+        )
+        await session.commit()
+
+    status_broker.publish(new_state)
+
+
+async def add_batch_to_db(
+    engine: AsyncEngine, batch_id: UUID, members: Sequence[BatchMemberRecord]
+) -> None:
+    """
+    Insert the statuses and request payloads of all members of a batch in one transaction.
+
+    :param engine: Database engine to use.
+    :param batch_id: ID shared by all members of the batch.
+    :param members: The members to insert.
+    """
+    rows: list[StatusResponseDb | CompileRequestPayload] = []
+    for member in members:
+        status = member.status
+        result_value = _encode_status_result(status)
+        payload = EncodedPayload.encode(member.payload)
+        rows.append(
+            StatusResponseDb(
+                id=status.uuid,
+                status=status.status,
+                createdAt=status.createdAt,
+                completedAt=status.completedAt,
+                progressPercentage=status.progress.percentage,
+                progressCurrentStep=status.progress.currentStep,
+                result=result_value.content if result_value is not None else None,
+                content_encoding=result_value.encoding
+                if result_value is not None
+                else "identity",
+                name=member.name,
+                description=member.description,
+                compilationTarget=member.compilation_target,
+                batch_id=batch_id,
+            )
+        )
+        rows.append(
+            CompileRequestPayload(
+                id=status.uuid,
+                payload=payload.content,
+                content_encoding=payload.encoding,
+                etag=compute_digest(member.payload.encode("utf-8")),
+            )
+        )
+
+    async with AsyncSession(engine) as session:
+        session.add_all(rows)
+        await session.commit()
+
+
+async def update_status_responses_in_db(
+    engine: AsyncEngine,
+    new_states: Sequence[StatusResponse],
+    results: Sequence[tuple[UUID, str, str]] = (),
+) -> None:
+    """
+    Update many :class:`~app.model.StatusResponse.StatusResponse` with a single bulk ``UPDATE``.
+
+    Name, description and compilation target of the rows are kept.
+    Subscribers are notified like in :func:`update_status_response_in_db`.
+
+    :param engine: Database engine to use.
+    :param new_states: New status information to persist.
+    :param results: Compile results as ``(uuid, result, compilation target)``
+        to insert in the same transaction.
+    """
+    if not new_states and not results:
+        return
+
+    values: list[dict[str, object]] = []
+    for state in new_states:
+        result_value = _encode_status_result(state)
+        values.append(
+            {
+                "id": state.uuid,
+                "status": state.status,
+                "createdAt": state.createdAt,
+                "completedAt": state.completedAt,
+                "progressPercentage": state.progress.percentage,
+                "progressCurrentStep": state.progress.currentStep,
+                "result": result_value.content if result_value is not None else None,
+                "content_encoding": result_value.encoding
+                if result_value is not None
+                else "identity",
+            }
+        )
+
+    async with AsyncSession(engine) as session:
+        await _upsert_compile_results(
+            session,
+            [
+                _compile_result_values(uuid, result, compilation_target)
+                for uuid, result, compilation_target in results
+            ],
+        )
+        if values:
+            await session.execute(update(StatusResponseDb), values)
+            await session.execute(
+                select(func.pg_notify(STATUS_CHANNEL, text("payload"))).select_from(
+                    func.unnest(
+                        cast(
+                            [notification_payload(state.uuid) for state in new_states],
+                            ARRAY(String),
+                        )
+                    ).alias("payload")
+                )
+            )
         await session.commit()
 
+    for state in new_states:
+        status_broker.publish(state)
+
+
+async def get_batch_statuses_from_db(
+    engine: AsyncEngine, batch_id: UUID
+) -> dict[UUID, StatusType]:
+    """
+    Get the status of all members of a batch.
+
+    :param engine: Database engine to use.
+    :param batch_id: ID of the batch.
+    :return: Status by member uuid, empty if the batch does not exist.
+    """
+    async with AsyncSession(engine) as session:
+        rows = await session.execute(
+            select(StatusResponseDb.id, StatusResponseDb.status).where(
+                StatusResponseDb.batch_id == batch_id
+            )
+        )
+        return {row.id: row.status for row in rows.all()}
+
 
 async def get_status_response_from_db(
     engine: AsyncEngine, uuid: UUID
@@ -232,6 +422,13 @@ async def get_status_response_from_db(
             percentage=process_state_db.progressPercentage,
             currentStep=process_state_db.progressCurrentStep,
         )
+        result = (
+            EncodedPayload.from_db(
+                process_state_db.result, process_state_db.content_encoding
+            ).decode()
+            if process_state_db.result is not None
+            else None
+        )
 
         match process_state_db.status:
             case StatusType.IN_PROGRESS:
@@ -244,7 +441,7 @@ async def get_status_response_from_db(
                     createdAt=process_state_db.createdAt,
                     completedAt=process_state_db.completedAt,
                     progress=progress,
-                    result=process_state_db.result,
+                    result=not_none(result, "Completed status without result"),
                 )
             case StatusType.FAILED:
                 return FailedStatus(
@@ -252,9 +449,64 @@ async def get_status_response_from_db(
                     createdAt=process_state_db.createdAt,
                     progress=progress,
                     result=LeqoProblemDetails.model_validate_json(
-                        process_state_db.result
+                        not_none(result, "Failed status without result")
+                    ),
+                )
+            case StatusType.CANCELLED:
+                return CancelledStatus(
+                    uuid=uuid,
+                    createdAt=process_state_db.createdAt,
+                    progress=progress,
+                    result=LeqoProblemDetails.model_validate_json(
+                        not_none(result, "Cancelled status without result")
                     ),
                 )
+            case StatusType.TIMEOUT:
+                return TimeoutStatus(
+                    uuid=uuid,
+                    createdAt=process_state_db.createdAt,
+                    progress=progress,
+                    result=LeqoProblemDetails.model_validate_json(
+                        not_none(result, "Timeout status without result")
+                    ),
+                )
+
+
+def _compile_result_values(
+    uuid: UUID, result: str, compilation_target: str
+) -> dict[str, object]:
+    encoded = EncodedPayload.encode(result)
+    return {
+        "id": uuid,
+        "implementation": encoded.content,
+        "content_encoding": encoded.encoding,
+        "etag": compute_digest(result.encode("utf-8")),
+        "compilationTarget": compilation_target,
+    }
+
+
+async def _upsert_compile_results(
+    session: AsyncSession, values: list[dict[str, object]]
+) -> None:
+    """
+    Insert compile results, replacing existing results with the same id.
+
+    A job whose lease expired may run a second time, so results can be written twice.
+    """
+
+    if not values:
+        return
+    statement = insert(CompileResult).values(values)
+    await session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[CompileResult.id],
+            set_={
+                column: statement.excluded[column]
+                for column in values[0]
+                if column != "id"
+            },
+        )
+    )
 
 
 async def add_result_to_db(
@@ -264,46 +516,81 @@ async def add_result_to_db(
     compilation_target: str,
 ) -> None:
     """
-    Add a result to the database for the given uuid
+    Add a result to the database for the given uuid, replacing an existing result.
 
     :param engine: Database engine to add the result to
     :param uuid: UUID of the process state this result belongs
     :param result: List of :class:`~app.model.CompileRequest.ImplementationNode` to add as results
     :param compilation_target: Compilation target associated with this result
     """
-    processed_result: CompileResult | EnrichResult
-    if isinstance(results, str):
-        processed_result = CompileResult(
-            id=uuid, implementation=results, compilationTarget=compilation_target
-        )
-    else:
-        processed_result = EnrichResult(id=uuid, compilationTarget=compilation_target)
-        enrichment_results = [
-            SingleEnrichResult(
-                impl_id=result.id,
-                impl_label=result.label,
-                implementation=result.implementation,
-                enrich_result=processed_result,
-            )
-            for result in results
-        ]
-        processed_result.results = enrichment_results
-
     async with AsyncSession(engine) as session:
-        session.add(processed_result)
+        if isinstance(results, str):
+            await _upsert_compile_results(
+                session, [_compile_result_values(uuid, results, compilation_target)]
+            )
+        else:
+            etag = compute_digest(
+                json.dumps(
+                    [
+                        [result.id, result.label, result.implementation]
+                        for result in results
+                    ]
+                ).encode("utf-8")
+            )
+            statement = insert(EnrichResult).values(
+                id=uuid, compilationTarget=compilation_target, etag=etag
+            )
+            await session.execute(
+                statement.on_conflict_do_update(
+                    index_elements=[EnrichResult.id],
+                    set_={"compilationTarget": compilation_target, "etag": etag},
+                )
+            )
+            await session.execute(
+                delete(SingleEnrichResult).where(
+                    SingleEnrichResult.enrich_result_id == uuid
+                )
+            )
+            session.add_all(
+                SingleEnrichResult(
+                    impl_id=result.id,
+                    impl_label=result.label,
+                    implementation=result.implementation,
+                    enrich_result_id=uuid,
+                )
+                for result in results
+            )
         await session.commit()
 
 
 async def get_results_from_db(
     engine: AsyncEngine, uuid: UUID
 ) -> str | list[ImplementationNode] | None:
+    """
+    Retrieve the (decompressed) result for the given uuid.
+    """
+    result = await get_encoded_results_from_db(engine, uuid)
+    if isinstance(result, EncodedPayload):
+        return result.decode()
+    return result
+
+
+async def get_encoded_results_from_db(
+    engine: AsyncEngine, uuid: UUID
+) -> EncodedPayload | list[ImplementationNode] | None:
+    """
+    Retrieve the result for the given uuid.
+    Compile results are returned as stored, without decompressing them.
+    """
     async with AsyncSession(engine) as session:
         db_result = await session.execute(
             select(CompileResult).where(CompileResult.id == uuid)
         )
         processed_result = db_result.scalar_one_or_none()
         if processed_result:
-            return processed_result.implementation
+            return EncodedPayload.from_db(
+                processed_result.implementation, processed_result.content_encoding
+            )
 
         enrichment_db_result = await session.execute(
             select(EnrichResult)
@@ -324,6 +611,34 @@ async def get_results_from_db(
         return None
 
 
+async def get_result_etag(engine: AsyncEngine, uuid: UUID) -> StoredEtag | None:
+    """
+    Retrieve the entity tag of the result for the given uuid without loading the result.
+    """
+    async with AsyncSession(engine) as session:
+        compile_row = (
+            await session.execute(
+                select(CompileResult.etag, CompileResult.content_encoding).where(
+                    CompileResult.id == uuid
+                )
+            )
+        ).one_or_none()
+        if compile_row is not None:
+            return StoredEtag(
+                compile_row.etag, parse_content_encoding(compile_row.content_encoding)
+            )
+
+        enrich_row = (
+            await session.execute(
+                select(EnrichResult.etag).where(EnrichResult.id == uuid)
+            )
+        ).one_or_none()
+        if enrich_row is not None:
+            return StoredEtag(enrich_row.etag)
+
+        return None
+
+
 async def get_results_overview_from_db(
     engine: AsyncEngine,
     status: StatusType | None = None,
@@ -365,8 +680,16 @@ async def store_compile_request_payload(
     """
     Persist the original compile request payload.
     """
+    encoded = EncodedPayload.encode(payload)
     async with AsyncSession(engine) as session:
-        await session.merge(CompileRequestPayload(id=uuid, payload=payload))
+        await session.merge(
+            CompileRequestPayload(
+                id=uuid,
+                payload=encoded.content,
+                content_encoding=encoded.encoding,
+                etag=compute_digest(payload.encode("utf-8")),
+            )
+        )
         await session.commit()
 
 
@@ -374,9 +697,40 @@ async def get_compile_request_payload(engine: AsyncEngine, uuid: UUID) -> str |
     """
     Retrieve the original compile request payload if available.
     """
+    encoded = await get_encoded_compile_request_payload(engine, uuid)
+    return encoded.decode() if encoded is not None else None
+
+
+async def get_encoded_compile_request_payload(
+    engine: AsyncEngine, uuid: UUID
+) -> EncodedPayload | None:
+    """
+    Retrieve the original compile request payload as stored, without decompressing it.
+    """
     async with AsyncSession(engine) as session:
         entity = await session.get(CompileRequestPayload, uuid)
-        return entity.payload if entity is not None else None
+        if entity is None:
+            return None
+        return EncodedPayload.from_db(entity.payload, entity.content_encoding)
+
+
+async def get_compile_request_payload_etag(
+    engine: AsyncEngine, uuid: UUID
+) -> StoredEtag | None:
+    """
+    Retrieve the entity tag of the original compile request payload without loading the payload.
+    """
+    async with AsyncSession(engine) as session:
+        row = (
+            await session.execute(
+                select(
+                    CompileRequestPayload.etag, CompileRequestPayload.content_encoding
+                ).where(CompileRequestPayload.id == uuid)
+            )
+        ).one_or_none()
+        if row is None:
+            return None
+        return StoredEtag(row.etag, parse_content_encoding(row.content_encoding))
 
 
 async def store_qrms(
@@ -396,6 +750,7 @@ async def store_qrms(
                 payload=qrms.content,
                 filename=qrms.filename,
                 content_type=qrms.content_type,
+                etag=compute_digest(qrms.content),
             )
         )
         await session.commit()
@@ -414,6 +769,7 @@ async def get_qrms(engine: AsyncEngine, uuid: UUID) -> StoredFilePayload | None:
             content=entity.payload,
             filename=entity.filename,
             content_type=entity.content_type,
+            etag=entity.etag,
         )
 
 
@@ -434,8 +790,93 @@ async def store_service_deployment_models(
                 payload=service_models.content,
                 filename=service_models.filename,
                 content_type=service_models.content_type,
+                etag=compute_digest(service_models.content),
+            )
+        )
+        await session.commit()
+
+
+async def get_qrms_etag(engine: AsyncEngine, uuid: UUID) -> StoredEtag | None:
+    """
+    Retrieve the entity tag of the stored Quantum Resource Models without loading them.
+    """
+
+    async with AsyncSession(engine) as session:
+        row = (
+            await session.execute(
+                select(QuantumResourceModel.etag).where(QuantumResourceModel.id == uuid)
+            )
+        ).one_or_none()
+        return StoredEtag(row.etag) if row is not None else None
+
+
+async def store_quantum_group_results(
+    engine: AsyncEngine, request_digest: str, programs: dict[int, str]
+) -> None:
+    """
+    Persist the compiled programs of the quantum groups of a compile request.
+
+    :param engine: Database engine to use
+    :param request_digest: Digest of the compile request payload
+    :param programs: Program of each group keyed by group index
+    """
+
+    async with AsyncSession(engine) as session:
+        for group_index, program in programs.items():
+            encoded = EncodedPayload.encode(program)
+            await session.merge(
+                QuantumGroupResult(
+                    request_digest=request_digest,
+                    group_index=group_index,
+                    implementation=encoded.content,
+                    content_encoding=encoded.encoding,
+                )
+            )
+        await session.commit()
+
+
+async def get_quantum_group_result(
+    engine: AsyncEngine, request_digest: str, group_index: int
+) -> str | None:
+    """
+    Retrieve the compiled program of a quantum group of a compile request.
+    """
+
+    async with AsyncSession(engine) as session:
+        entity = await session.get(QuantumGroupResult, (request_digest, group_index))
+        if entity is None:
+            return None
+        return EncodedPayload.from_db(
+            entity.implementation, entity.content_encoding
+        ).decode()
+
+
+async def get_stored_quantum_groups(
+    engine: AsyncEngine, request_digest: str
+) -> set[int]:
+    """
+    Retrieve the indices of the quantum groups of a compile request that are stored.
+    """
+
+    async with AsyncSession(engine) as session:
+        rows = await session.execute(
+            select(QuantumGroupResult.group_index).where(
+                QuantumGroupResult.request_digest == request_digest
             )
         )
+        return set(rows.scalars())
+
+
+async def delete_quantum_group_results(engine: AsyncEngine) -> None:
+    """
+    Delete all stored quantum group programs.
+
+    Stored programs depend on the enrichments in the database,
+    so they have to be discarded whenever enrichments are inserted.
+    """
+
+    async with AsyncSession(engine) as session:
+        await session.execute(delete(QuantumGroupResult))
         await session.commit()
 
 
@@ -454,9 +895,28 @@ async def get_service_deployment_models(
             content=entity.payload,
             filename=entity.filename,
             content_type=entity.content_type,
+            etag=entity.etag,
         )
 
 
+async def get_service_deployment_models_etag(
+    engine: AsyncEngine, uuid: UUID
+) -> StoredEtag | None:
+    """
+    Retrieve the entity tag of the stored Service Deployment Models without loading them.
+    """
+
+    async with AsyncSession(engine) as session:
+        row = (
+            await session.execute(
+                select(ServiceDeploymentModel.etag).where(
+                    ServiceDeploymentModel.id == uuid
+                )
+            )
+        ).one_or_none()
+        return StoredEtag(row.etag) if row is not None else None
+
+
 async def list_service_deployment_ids(engine: AsyncEngine) -> list[UUID]:
     """
     Return all UUIDs that have an associated service deployment payload.
@@ -0,0 +1,329 @@
+"""
+Workers running the jobs of the :mod:`app.job_queue`.
+
+Workers run embedded in the API process (see :attr:`~app.config.Settings.embedded_workers`)
+or standalone via ``python -m app.worker``.
+Standalone workers only need access to the database, so compile capacity can be scaled
+independently of the API replicas.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, suppress
+from time import monotonic
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.admission import job_durations
+from app.config import Settings
+from app.job_queue import (
+    ClaimedJob,
+    claim_job,
+    complete_job,
+    fail_job,
+    release_job,
+    renew_lease,
+    retry_delay,
+    retry_job,
+    wait_for_jobs,
+)
+from app.services import get_settings, use_leqo_db
+from app.status_events import INSTANCE_ID
+
+logger = logging.getLogger(__name__)
+
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{INSTANCE_ID[:8]}"
+"""Identifies the workers of this process as lease owners."""
+
+JobRunner = Callable[[ClaimedJob, Settings, AsyncEngine], Awaitable[None]]
+"""Runs a claimed job, raises if the attempt failed."""
+
+JobFailureHandler = Callable[[ClaimedJob, Exception, AsyncEngine], Awaitable[None]]
+"""Reports the failure of a job that is given up."""
+
+
+_running_jobs: dict[UUID, ClaimedJob] = {}
+"""Jobs currently running in this process."""
+
+
+def cancel_local_job(job_id: UUID) -> bool:
+    """
+    Cancel a job if it runs in this process, without waiting for the next heartbeat.
+
+    :return: Whether the job runs in this process.
+    """
+
+    job = _running_jobs.get(job_id)
+    if job is None:
+        return False
+    job.cancellation.cancel()
+    return True
+
+
+async def _heartbeat(
+    engine: AsyncEngine, job: ClaimedJob, owner: str, settings: Settings
+) -> None:
+    """
+    Renew the lease of `job` and forward cancellation requests until cancelled.
+    """
+
+    while True:
+        await asyncio.sleep(settings.job_heartbeat_interval)
+        try:
+            renewal = await renew_lease(
+                engine, job.id, owner, settings.job_lease_seconds
+            )
+        except Exception:
+            logger.exception("Failed to renew lease of job %s", job.id)
+            continue
+
+        if not renewal.held:
+            logger.warning("Lost lease of job %s", job.id)
+            return
+        if renewal.cancel_requested:
+            job.cancellation.cancel()
+
+
+class _JobThread:
+    """
+    Runs a job on its own event loop and database engine in a separate thread.
+    """
+
+    def __init__(
+        self,
+        run_job: JobRunner,
+        job: ClaimedJob,
+        settings: Settings,
+        engine: AsyncEngine,
+    ) -> None:
+        self._run_job = run_job
+        self._job = job
+        self._settings = settings
+        self._engine = engine
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._cancelled = False
+
+    async def _main(self) -> None:
+        with self._lock:
+            if self._cancelled:
+                raise asyncio.CancelledError
+            self._loop = asyncio.get_running_loop()
+            self._task = asyncio.current_task()
+
+        # connections of a pool can't be shared between event loops
+        engine = create_async_engine(self._engine.url, poolclass=NullPool)
+        try:
+            await self._run_job(self._job, self._settings, engine)
+        finally:
+            await engine.dispose()
+
+    def _cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            if self._loop is not None and self._task is not None:
+                with suppress(RuntimeError):  # the loop already finished
+                    self._loop.call_soon_threadsafe(self._task.cancel)
+
+    async def run(self) -> None:
+        thread = asyncio.ensure_future(asyncio.to_thread(asyncio.run, self._main()))
+        try:
+            await asyncio.shield(thread)
+        except asyncio.CancelledError:
+            self._cancel()
+            await asyncio.wait([thread])
+            raise
+
+
+async def run_job_in_thread(
+    run_job: JobRunner, job: ClaimedJob, settings: Settings, engine: AsyncEngine
+) -> None:
+    """
+    Run a job in a separate thread with its own event loop and database engine.
+
+    Compiling is mostly CPU bound. On the event loop of the worker it would starve
+    the heartbeat, so the lease could expire and another worker run the job a second time.
+    Cancelling the calling task cancels the job and waits until it stopped.
+
+    :param run_job: Runs the job.
+    :param job: The job to run.
+    :param settings: Settings from .env file.
+    :param engine: Engine whose database the job uses.
+    """
+
+    await _JobThread(run_job, job, settings, engine).run()
+
+
+async def run_claimed_job(  # noqa: PLR0913 Too many arguments
+    engine: AsyncEngine,
+    settings: Settings,
+    owner: str,
+    job: ClaimedJob,
+    run_job: JobRunner,
+    on_give_up: JobFailureHandler,
+) -> None:
+    """
+    Run a claimed job and record the outcome in the queue.
+
+    :param engine: Database engine to use.
+    :param settings: Settings from .env file.
+    :param owner: Name of the worker holding the lease.
+    :param job: The job to run.
+    :param run_job: Runs the job.
+    :param on_give_up: Reports the failure of a job that is given up.
+    """
+
+    if job.attempts > job.max_attempts:
+        # previous workers lost the lease too often, most likely by crashing
+        error = RuntimeError(f"Job gave up after {job.max_attempts} attempts")
+        await on_give_up(job, error, engine)
+        await fail_job(engine, job.id, owner, str(error))
+        return
+
+    _running_jobs[job.id] = job
+    heartbeat = asyncio.create_task(_heartbeat(engine, job, owner, settings))
+    started = monotonic()
+    try:
+        await run_job_in_thread(run_job, job, settings, engine)
+    except asyncio.CancelledError:
+        await asyncio.shield(release_job(engine, job.id, owner))
+        raise
+    except Exception as ex:
+        logger.exception("Attempt %d of job %s failed", job.attempts, job.id)
+        if job.attempts >= job.max_attempts:
+            await on_give_up(job, ex, engine)
+            await fail_job(engine, job.id, owner, repr(ex))
+        else:
+            await retry_job(engine, job.id, owner, repr(ex), retry_delay(job.attempts))
+    else:
+        job_durations.record(monotonic() - started)
+        await complete_job(engine, job.id, owner)
+    finally:
+        del _running_jobs[job.id]
+        heartbeat.cancel()
+        with suppress(asyncio.CancelledError):
+            await heartbeat
+
+
+async def work(  # noqa: PLR0913 Too many arguments
+    engine: AsyncEngine,
+    settings: Settings,
+    owner: str,
+    stop: asyncio.Event,
+    run_job: JobRunner,
+    on_give_up: JobFailureHandler,
+) -> None:
+    """
+    Claim and run jobs one after another until `stop` is set.
+
+    :param engine: Database engine to use.
+    :param settings: Settings from .env file.
+    :param owner: Unique name of this worker.
+    :param stop: Stops the worker after the current job.
+    :param run_job: Runs a job.
+    :param on_give_up: Reports the failure of a job that is given up.
+    """
+
+    while not stop.is_set():
+        try:
+            job = await claim_job(engine, owner, settings.job_lease_seconds)
+        except Exception:
+            logger.exception("Failed to claim job")
+            job = None
+
+        if job is None:
+            await wait_for_jobs(settings.job_poll_interval)
+            continue
+
+        try:
+            await run_claimed_job(engine, settings, owner, job, run_job, on_give_up)
+        except Exception:
+            logger.exception("Failed to record outcome of job %s", job.id)
+
+
+@asynccontextmanager
+async def embedded_workers(
+    engine: AsyncEngine,
+    settings: Settings,
+    run_job: JobRunner,
+    on_give_up: JobFailureHandler,
+) -> AsyncIterator[None]:
+    """
+    Run :attr:`~app.config.Settings.embedded_workers` workers while the context is active.
+
+    Jobs still running on exit are returned to the queue.
+    """
+
+    stop = asyncio.Event()
+    tasks = [
+        asyncio.create_task(
+            work(engine, settings, f"{WORKER_ID}:{index}", stop, run_job, on_give_up)
+        )
+        for index in range(settings.embedded_workers)
+    ]
+    try:
+        yield
+    finally:
+        stop.set()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+
+
+async def run_workers(settings: Settings) -> None:
+    """
+    Run :attr:`~app.config.Settings.worker_concurrency` workers until SIGINT or SIGTERM.
+
+    Running jobs are finished before the workers stop.
+    """
+
+    # The job handlers live next to the endpoints enqueuing the jobs.
+    # Importing them here avoids an import cycle, as app.main embeds workers itself.
+    from app.main import fail_job_requests, run_job  # noqa: PLC0415
+
+    stop = asyncio.Event()
+    if sys.platform != "win32":
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+
+    async with use_leqo_db() as engine:
+        await asyncio.gather(
+            *(
+                work(
+                    engine,
+                    settings,
+                    f"{WORKER_ID}:{index}",
+                    stop,
+                    run_job,
+                    fail_job_requests,
+                )
+                for index in range(settings.worker_concurrency)
+            )
+        )
+
+
+def main() -> None:
+    """
+    Entry point of a standalone worker.
+    """
+
+    logging.basicConfig(level=logging.INFO)
+    if sys.platform == "win32":
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    asyncio.run(run_workers(get_settings()))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from json import JSONDecodeError, dumps
 from pathlib import Path
 from time import sleep
 from typing import Any, TypeVar
+from uuid import uuid4
 
 import pytest
 import yaml
@@ -17,8 +18,12 @@ from app.main import app
 TModel = TypeVar("TModel", bound=BaseModel)
 
 SUCCESS_CODE = 200
+ACCEPTED_CODE = 202
+NOT_MODIFIED_CODE = 304
+NOT_FOUND_CODE = 404
+CONFLICT_CODE = 409
 POLL_INTERVAL = 0.1
-MAX_ATTEMPTS = 5
+MAX_ATTEMPTS = 50
 TEST_DIR = Path(__file__).parent
 
 
@@ -361,3 +366,213 @@ def test_result_endpoint_overview(client: TestClient) -> None:
     stored_payload = stored_request.json()
     expected_payload = json.loads(compile_request)
     _assert_request_matches(stored_payload, expected_payload)
+
+
+def test_result_endpoint_conditional_get(client: TestClient) -> None:
+    compile_request = """{
+        "metadata": {
+            "version": "1.0.0",
+            "name": "Cached Model",
+            "description": "",
+            "author": ""
+        },
+        "nodes": [
+            { "id": "newNode0", "type": "qubit" },
+            {
+                "id": "newNode1",
+                "type": "implementation",
+                "implementation": "OPENQASM 3.1;\\n@leqo.input 0\\nqubit[1] q;"
+            }
+        ],
+        "edges": [
+            { "source": ["newNode0", 0], "target": ["newNode1", 0] }
+        ]
+    }"""
+
+    response = handle_endpoints(client, compile_request, "/compile")
+    assert response.status_code == SUCCESS_CODE
+    uuid = response.url.path.rsplit("/", 1)[-1]
+
+    for path in (f"/results/{uuid}", f"/request/{uuid}"):
+        response = client.get(path)
+        assert response.status_code == SUCCESS_CODE
+        etag = response.headers["ETag"]
+        assert "immutable" in response.headers["Cache-Control"]
+
+        not_modified = client.get(path, headers={"If-None-Match": etag})
+        assert not_modified.status_code == NOT_MODIFIED_CODE
+        assert not_modified.headers["ETag"] == etag
+        assert not_modified.content == b""
+
+        modified = client.get(path, headers={"If-None-Match": '"other"'})
+        assert modified.status_code == SUCCESS_CODE
+        assert modified.content == response.content
+
+
+def test_status_events(client: TestClient) -> None:
+    compile_request = """{
+        "metadata": {
+            "version": "1.0.0",
+            "name": "Streamed Model",
+            "description": "",
+            "author": ""
+        },
+        "nodes": [
+            { "id": "newNode0", "type": "qubit" }
+        ],
+        "edges": []
+    }"""
+
+    response = client.post(
+        "/compile",
+        headers={"Content-Type": "application/json"},
+        content=compile_request,
+    )
+    uuid = response.json()["uuid"]
+
+    statuses = []
+    with client.stream("GET", f"/status/{uuid}/events") as events:
+        assert events.status_code == SUCCESS_CODE
+        assert events.headers["Content-Type"].startswith("text/event-stream")
+        statuses = [
+            json.loads(line.removeprefix("data: "))
+            for line in events.iter_lines()
+            if line.startswith("data: ")
+        ]
+
+    assert statuses
+    assert statuses[-1]["uuid"] == uuid
+    assert statuses[-1]["status"] == "completed"
+
+    missing = client.get(f"/status/{uuid4()}/events")
+    assert missing.status_code == NOT_FOUND_CODE
+
+
+def test_compile_batch(client: TestClient) -> None:
+    member_requests = [
+        {
+            "metadata": {
+                "version": "1.0.0",
+                "name": f"Batch Member {index}",
+                "description": "",
+                "author": "",
+            },
+            "nodes": [
+                {"id": "newNode0", "type": "int", "value": value},
+                {"id": "newNode1", "type": "qubit"},
+            ],
+            "edges": [],
+        }
+        for index, value in enumerate((3, 3, 5))
+    ]
+
+    response = client.post("/compile/batch", json={"requests": member_requests})
+    assert response.status_code == SUCCESS_CODE
+    batch = response.json()
+    members = batch["members"]
+    assert len(members) == len(member_requests)
+
+    for _ in range(MAX_ATTEMPTS):
+        aggregate = client.get(f"/compile/batch/{batch['uuid']}").json()
+        if aggregate["status"] != "in_progress":
+            break
+        sleep(POLL_INTERVAL)
+
+    for member, member_request in zip(members, member_requests, strict=True):
+        status = client.get(f"/status/{member['uuid']}").json()
+        assert status["status"] == "completed"
+
+        stored = client.get(f"/request/{member['uuid']}")
+        assert stored.status_code == SUCCESS_CODE
+        _assert_request_matches(stored.json(), member_request)
+
+    first = client.get(f"/results/{members[0]['uuid']}").text
+    second = client.get(f"/results/{members[1]['uuid']}").text
+    assert first == second
+
+    assert aggregate["status"] == "completed"
+    assert aggregate["counts"]["completed"] == len(member_requests)
+    assert set(aggregate["members"]) == {member["uuid"] for member in members}
+
+    missing = client.get(f"/compile/batch/{uuid4()}")
+    assert missing.status_code == NOT_FOUND_CODE
+
+
+def test_cancel_compile(client: TestClient) -> None:
+    compile_request = """{
+        "metadata": {
+            "version": "1.0.0",
+            "name": "Cancelled Model",
+            "description": "",
+            "author": ""
+        },
+        "nodes": [
+            { "id": "newNode0", "type": "qubit" }
+        ],
+        "edges": []
+    }"""
+
+    response = client.post(
+        "/compile",
+        headers={"Content-Type": "application/json"},
+        content=compile_request,
+    )
+    uuid = response.json()["uuid"]
+
+    cancelled = client.delete(f"/compile/{uuid}")
+    for _ in range(MAX_ATTEMPTS):
+        status = client.get(f"/status/{uuid}").json()
+        if status["status"] != "in_progress":
+            break
+        sleep(POLL_INTERVAL)
+
+    if cancelled.status_code == ACCEPTED_CODE:
+        assert status["status"] in {"cancelled", "completed"}
+    else:
+        # the request finished before it could be cancelled
+        assert cancelled.status_code == CONFLICT_CODE
+        assert status["status"] == "completed"
+
+    finished = client.delete(f"/compile/{uuid}")
+    assert finished.status_code == CONFLICT_CODE
+
+    missing = client.delete(f"/compile/{uuid4()}")
+    assert missing.status_code == NOT_FOUND_CODE
+
+
+def test_metrics(client: TestClient) -> None:
+    response = client.get("/metrics")
+    assert response.status_code == SUCCESS_CODE
+    assert response.headers["Content-Type"].startswith("text/plain")
+    assert "leqo_jobs_queued " in response.text
+    assert "leqo_admission_rejections_total" in response.text
+
+
+def test_compile_group(client: TestClient) -> None:
+    compile_request = {
+        "metadata": {
+            "version": "1.0.0",
+            "name": "Grouped Model",
+            "description": "",
+            "author": "",
+        },
+        "nodes": [
+            {"id": "newNode0", "type": "qubit"},
+            {"id": "newNode1", "type": "int", "value": 3},
+            {"id": "newNode2", "type": "qubit", "size": 2},
+        ],
+        "edges": [],
+    }
+
+    first = client.post("/compileGroup", params={"groupID": 0}, json=compile_request)
+    second = client.post("/compileGroup", params={"groupID": 1}, json=compile_request)
+    again = client.post("/compileGroup", params={"groupID": 0}, json=compile_request)
+
+    assert first.status_code == SUCCESS_CODE
+    assert second.status_code == SUCCESS_CODE
+    assert first.text != second.text
+    assert again.text == first.text
+
+    missing = client.post("/compileGroup", params={"groupID": 2}, json=compile_request)
+    assert missing.status_code == NOT_FOUND_CODE
+    assert missing.headers["Content-Type"] == "application/problem+json"
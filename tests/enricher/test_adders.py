@@ -0,0 +1,174 @@
+import itertools
+
+import pytest
+from openqasm3.ast import (
+    Identifier,
+    IndexedIdentifier,
+    IntegerLiteral,
+    Program,
+    QuantumGate,
+    QuantumStatement,
+    QubitDeclaration,
+)
+
+from app.enricher.adders import (
+    carry_lookahead_adder,
+    cuccaro_adder,
+    draper_adder,
+    lookahead_ancillas,
+)
+from app.enricher.utils import circuit_depth
+from tests.enricher.utils import evaluate_registers, to_circuit
+
+
+def _register(name: str, size: int) -> list[IndexedIdentifier]:
+    return [
+        IndexedIdentifier(Identifier(name), [[IntegerLiteral(i)]]) for i in range(size)
+    ]
+
+
+def _program(registers: dict[str, int], statements: list[QuantumStatement]) -> Program:
+    return Program(
+        [
+            *(
+                QubitDeclaration(Identifier(name), IntegerLiteral(size))
+                for name, size in registers.items()
+                if size > 0
+            ),
+            *statements,
+        ],
+        version="3.1",
+    )
+
+
+def _summands(size: int) -> list[tuple[int, int]]:
+    pairs = list(itertools.product(range(2**size), repeat=2))
+    # keep the larger cases fast, the carries still reach all positions
+    return pairs if size <= 4 else pairs[:: 2**size - 1]  # noqa: PLR2004
+
+
+def _run_reversible(
+    statements: list[QuantumStatement], values: dict[str, int]
+) -> dict[str, int]:
+    """
+    Apply a circuit of x, cx and ccx gates on indexed qubits to register values.
+    """
+    registers = dict(values)
+    for statement in statements:
+        assert isinstance(statement, QuantumGate)
+        *controls, target = [
+            (qubit.name.name, qubit.indices[0][0].value)  # type: ignore[union-attr, index]
+            for qubit in statement.qubits
+        ]
+        assert statement.name.name == "c" * len(controls) + "x"
+        if all(registers[name] >> index & 1 for name, index in controls):
+            registers[target[0]] ^= 1 << target[1]
+    return registers
+
+
+@pytest.mark.parametrize("size", range(1, 9))
+def test_cuccaro_adder(size: int) -> None:
+    """
+    The sum replaces b, a and the ancilla are restored, the carry is written out.
+    """
+    statements = cuccaro_adder(
+        _register("a", size),
+        _register("b", size),
+        _register("ancilla", 1)[0],
+        _register("carry", 1)[0],
+    )
+
+    for a, b in _summands(size):
+        values = {"a": a, "b": b, "ancilla": 0, "carry": 0}
+        assert _run_reversible(statements, values) == {
+            "a": a,
+            "b": (a + b) % 2**size,
+            "ancilla": 0,
+            "carry": (a + b) >> size,
+        }
+
+
+@pytest.mark.parametrize("subtract", [False, True])
+@pytest.mark.parametrize("size", range(1, 5))
+def test_draper_adder(size: int, subtract: bool) -> None:
+    """
+    The Fourier basis adder adds to or subtracts from b without any ancillas.
+    """
+    statements = draper_adder(
+        _register("a", size), _register("b", size), subtract=subtract
+    )
+    circuit = to_circuit(_program({"a": size, "b": size}, statements))
+
+    for a, b in _summands(size):
+        expected = b - a if subtract else b + a
+        assert evaluate_registers(circuit, {"a": a, "b": b}) == {
+            "a": a,
+            "b": expected % 2**size,
+        }
+
+
+def test_draper_adder_with_repeated_and_zero_bits() -> None:
+    """
+    Controls may repeat a sign bit or be missing for zero bits.
+    """
+    sign = _register("a", 1)[0]
+    statements = draper_adder([None, sign, sign], _register("b", 3))
+    circuit = to_circuit(_program({"a": 1, "b": 3}, statements))
+
+    for a, b in itertools.product(range(2), range(8)):
+        result = evaluate_registers(circuit, {"a": a, "b": b})
+        assert result["b"] == (b + 6 * a) % 8
+
+
+def test_draper_adder_has_linear_depth() -> None:
+    def depth(size: int) -> int:
+        return circuit_depth(draper_adder(_register("a", size), _register("b", size)))
+
+    assert depth(32) - depth(16) == 2 * (depth(16) - depth(8))
+
+
+@pytest.mark.parametrize(
+    ("size", "ancillas"), [(1, 0), (3, 0), (4, 1), (6, 2), (8, 4), (16, 11)]
+)
+def test_lookahead_ancillas(size: int, ancillas: int) -> None:
+    assert lookahead_ancillas(size) == ancillas
+
+
+@pytest.mark.parametrize("size", range(1, 11))
+def test_carry_lookahead_adder(size: int) -> None:
+    """
+    The sum is written to the result, the summands and ancillas are restored.
+    """
+    statements = carry_lookahead_adder(
+        _register("a", size),
+        _register("b", size),
+        _register("sum", size + 1),
+        _register("ancilla", lookahead_ancillas(size)),
+    )
+
+    for a, b in _summands(size):
+        values = {"a": a, "b": b, "sum": 0, "ancilla": 0}
+        assert _run_reversible(statements, values) == {
+            "a": a,
+            "b": b,
+            "sum": a + b,
+            "ancilla": 0,
+        }
+
+
+def test_carry_lookahead_adder_has_logarithmic_depth() -> None:
+    """
+    Doubling the size adds a constant number of layers.
+    """
+
+    def depth(size: int) -> int:
+        return circuit_depth(
+            carry_lookahead_adder(
+                _register("a", size),
+                _register("b", size),
+                _register("sum", size + 1),
+                _register("ancilla", lookahead_ancillas(size)),
+            )
+        )
+
+    assert depth(64) - depth(32) == depth(32) - depth(16)
@@ -1,11 +1,17 @@
 from types import SimpleNamespace
 
+import numpy as np
 import pytest
+from qiskit.quantum_info import Statevector
 
 from app.enricher import Constraints
-from app.enricher.encode_value_handlers.amplitude import generate_amplitude_enrichment
+from app.enricher.encode_value_handlers.amplitude import (
+    generate_amplitude_enrichment,
+    generate_amplitude_enrichments,
+)
 from app.model import CompileRequest, data_types
 from app.model.exceptions import InputSizeMismatch, InputTypeMismatch
+from tests.enricher.utils import to_circuit
 
 
 def _amplitude_node(bounds: int = 0) -> CompileRequest.EncodeValueNode:
@@ -98,3 +104,52 @@ def test_amplitude_encoding_generates_state_preparation_result() -> None:
     assert result.meta_data.width == 1
     assert result.meta_data.depth is not None
     assert result.enriched_node is not None
+
+
+@pytest.mark.parametrize(
+    ("n_qubits", "support"),
+    [(2, [3]), (4, [9]), (4, [1, 6, 15]), (5, [0, 2, 17]), (6, [4, 7, 20, 33, 63])],
+)
+def test_amplitude_encoding_offers_sparse_preparation(
+    n_qubits: int, support: list[int]
+) -> None:
+    """
+    Vectors with few nonzero amplitudes are also prepared by permuting a small dense state.
+    """
+    values = np.zeros(1 << n_qubits)
+    values[support] = np.random.default_rng(n_qubits).normal(size=len(support))
+    constraints = _constraints(
+        data_types.ArrayType(
+            element_type=data_types.FloatType(size=32),
+            length=values.size,
+        ),
+        values.tolist(),
+    )
+
+    results = generate_amplitude_enrichments(_amplitude_node(), constraints)
+
+    assert len(results) == 2  # noqa: PLR2004
+    dense, sparse = results
+    assert sparse.meta_data.width == n_qubits
+    assert sparse.meta_data.depth is not None
+    assert dense.meta_data.depth is not None
+    assert sparse.meta_data.depth < dense.meta_data.depth
+    expected = values / np.linalg.norm(values)
+    for result in results:
+        program = result.enriched_node.implementation
+        assert not isinstance(program, str)
+        state = Statevector.from_instruction(to_circuit(program))
+        # qiskit drops the global phase of the dense preparation
+        assert np.isclose(abs(np.vdot(state.data, expected)), 1)
+
+
+def test_amplitude_encoding_dense_only_for_dense_vectors() -> None:
+    constraints = _constraints(
+        data_types.ArrayType(
+            element_type=data_types.FloatType(size=32),
+            length=4,
+        ),
+        [1.0, 0.0, 2.0, 0.0],
+    )
+
+    assert len(generate_amplitude_enrichments(_amplitude_node(), constraints)) == 1
@@ -0,0 +1,83 @@
+import math
+
+import numpy as np
+import pytest
+from openqasm3.ast import (
+    Identifier,
+    IntegerLiteral,
+    Program,
+    QuantumStatement,
+    QubitDeclaration,
+)
+from qiskit.quantum_info import Statevector
+
+from app.enricher.entangled_states import (
+    entangled_state_variants,
+    ghz_state,
+    w_state,
+)
+from app.enricher.utils import circuit_depth
+from tests.enricher.utils import to_circuit
+
+REGISTER = Identifier("q")
+
+
+def _statevector(size: int, statements: list[QuantumStatement]) -> np.ndarray:
+    program = Program(
+        [QubitDeclaration(REGISTER, IntegerLiteral(size)), *statements], version="3.1"
+    )
+    return np.asarray(Statevector.from_instruction(to_circuit(program)).data)
+
+
+@pytest.mark.parametrize("log_depth", [False, True])
+@pytest.mark.parametrize("size", range(1, 8))
+def test_w_state(size: int, log_depth: bool) -> None:
+    """
+    Both variants prepare an equal superposition of the single excitations.
+    """
+    statements = w_state(REGISTER, size, log_depth=log_depth)
+
+    expected = np.zeros(2**size)
+    expected[[1 << i for i in range(size)]] = 1 / math.sqrt(size)
+    assert np.allclose(_statevector(size, statements), expected)
+    assert len(statements) == 2 * size - 1
+
+
+@pytest.mark.parametrize("size", range(1, 8))
+def test_ghz_state(size: int) -> None:
+    """
+    The fan-out tree entangles all qubits with ``size - 1`` CX gates.
+    """
+    statements = ghz_state(REGISTER, size)
+
+    expected = np.zeros(2**size)
+    expected[[0, -1]] = 1 / math.sqrt(2)
+    assert np.allclose(_statevector(size, statements), expected)
+    assert len(statements) == size
+
+
+def test_depth() -> None:
+    """
+    The log-depth variants grow logarithmically and build large states without amplitude vectors.
+    """
+    size = 1000
+    layers = math.ceil(math.log2(size))
+
+    assert circuit_depth(w_state(REGISTER, size)) == 2 * (size - 1) + 1
+    assert circuit_depth(w_state(REGISTER, size, log_depth=True)) == 2 * layers + 1
+    assert circuit_depth(ghz_state(REGISTER, size)) == layers + 1
+
+
+@pytest.mark.parametrize(
+    ("quantum_state", "size", "depths"),
+    [("ghz", 8, [4]), ("w", 2, [3]), ("w", 8, [15, 7])],
+)
+def test_entangled_state_variants(
+    quantum_state: str, size: int, depths: list[int]
+) -> None:
+    """
+    W states offer the log-depth variant unless it equals the linear cascade.
+    """
+    variants = entangled_state_variants(REGISTER, quantum_state, size)
+
+    assert [circuit_depth(variant) for variant in variants] == depths
@@ -1,10 +1,13 @@
 import pytest
+from openqasm3.ast import QuantumGateDefinition
+from openqasm3.parser import parse
 from pydantic import ValidationError
 
 from app.enricher import Constraints
 from app.enricher.grover_algorithm import GroverAlgorithmEnricherStrategy
 from app.model.CompileRequest import GroverNode
 from app.openqasm3.printer import leqo_dumps
+from tests.enricher.utils import assert_equivalent_with_clean_ancillas
 
 
 @pytest.mark.asyncio
@@ -80,3 +83,51 @@ def test_grover_validation_error():
         GroverNode(
             id="g-err", type="grover", numQubits=2, targetStates=[5], numIterations=1
         )
+
+
+def test_grover_large_loop_uses_gate_definitions():
+    # 8 qubits, 2 targets and 12 iterations would unroll to over 1000 gates
+    node = GroverNode(
+        id="grover-large",
+        type="grover",
+        numQubits=8,
+        targetStates=[3, 200],
+        numIterations=12,
+    )
+    strategy = GroverAlgorithmEnricherStrategy()
+    results = strategy._enrich_impl(node, Constraints(requested_inputs={}))
+
+    program = results[0].enriched_node.implementation
+    qasm = leqo_dumps(program)
+    parse(qasm)
+
+    definitions = [
+        s for s in program.statements if isinstance(s, QuantumGateDefinition)
+    ]
+    assert [d.name.name for d in definitions] == ["grover_oracle", "grover_diffuser"]
+    assert "for uint iteration in [0:11] {" in qasm
+    assert qasm.count("grover_oracle query[0], query[1]") == 1
+    assert qasm.count("ctrl(7) @ x q0, q1, q2, q3, q4, q5, q6, q7;") == 3  # noqa: PLR2004
+    assert len(program.statements) < 20  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("iterations", [1, 3])
+def test_grover_v_chain(iterations: int):
+    # unrolled for a single iteration, gate definitions with ancilla parameters for three
+    node = GroverNode(
+        id="grover-v",
+        type="grover",
+        numQubits=5,
+        targetStates=[3, 17],
+        numIterations=iterations,
+    )
+    plain, v_chain = GroverAlgorithmEnricherStrategy()._enrich_impl(node, None)
+
+    program = v_chain.enriched_node.implementation
+    qasm = leqo_dumps(program)
+    assert "qubit[2] ancilla;" in qasm
+    assert "ctrl(" not in qasm
+    assert ("grover_oracle query[0]" in qasm) == (iterations > 1)
+    assert v_chain.meta_data.width == 5 + 2
+    assert v_chain.meta_data.depth < plain.meta_data.depth
+    assert_equivalent_with_clean_ancillas(program, plain.enriched_node.implementation)
@@ -4,6 +4,7 @@ from app.enricher import Constraints
 from app.enricher.universal_oracles import GroverDiffuserEnricherStrategy
 from app.model.CompileRequest import GroverDiffuserNode
 from app.openqasm3.printer import leqo_dumps
+from tests.enricher.utils import assert_equivalent_with_clean_ancillas
 
 
 @pytest.mark.asyncio
@@ -32,3 +33,21 @@ async def test_grover_diffuser():
         "let out = query;"
     )
     assert expected_qasm in qasm
+
+
+@pytest.mark.asyncio
+async def test_grover_diffuser_v_chain():
+    node = GroverDiffuserNode(id="gd-2", type="grover-diffuser", numQubits=5)
+    plain, v_chain = GroverDiffuserEnricherStrategy()._enrich_impl(
+        node, Constraints(requested_inputs={})
+    )
+
+    qasm = leqo_dumps(v_chain.enriched_node.implementation)
+    assert "qubit[2] ancilla;" in qasm
+    assert "ccx query[0], query[1], ancilla[0];" in qasm
+    assert "ccx query[3], ancilla[1], query[4];" in qasm
+    assert "@leqo.reusable\nlet ancilla_reusable = ancilla;" in qasm
+    assert v_chain.meta_data.depth < plain.meta_data.depth
+    assert_equivalent_with_clean_ancillas(
+        v_chain.enriched_node.implementation, plain.enriched_node.implementation
+    )
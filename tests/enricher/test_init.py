@@ -8,8 +8,10 @@ from app.enricher import (
     Constraints,
     Enricher,
     EnricherStrategy,
+    EnrichmentCache,
     EnrichmentResult,
     ImplementationMetaData,
+    LazyEnricherStrategy,
 )
 from app.enricher.exceptions import EnrichmentFailed
 from app.model.CompileRequest import (
@@ -197,3 +199,120 @@ async def test_enrich_unknown_node_empty_list() -> None:
         await enricher.enrich(
             BoolLiteralNode(id="nodeId", value=False), constraints=None
         )
+
+
+class CountingEnricherStrategy(EnricherStrategy):
+    calls: int
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @override
+    async def _enrich_impl(
+        self, node: FrontendNode, constraints: Constraints | None
+    ) -> EnrichmentResult:
+        self.calls += 1
+        if not isinstance(node, IntLiteralNode):
+            raise NodeUnsupportedException(node)
+
+        await asyncio.sleep(0)
+        return EnrichmentResult(
+            ImplementationNode(id=node.id, implementation=f"int {node.value}"),
+            ImplementationMetaData(width=None, depth=None),
+        )
+
+
+@pytest.mark.asyncio
+async def test_enrichment_cache_shares_results() -> None:
+    strategy = CountingEnricherStrategy()
+    cache = EnrichmentCache()
+    first = Enricher(strategy).with_cache(cache)
+    second = Enricher(strategy).with_cache(cache)
+
+    results = await asyncio.gather(
+        first.enrich(IntLiteralNode(id="nodeId", value=42), constraints=None),
+        first.enrich(IntLiteralNode(id="nodeId", value=42), constraints=None),
+        second.enrich(IntLiteralNode(id="nodeId", value=42), constraints=None),
+    )
+
+    assert strategy.calls == 1
+    assert {result.implementation for result in results} == {"int 42"}
+
+    await second.enrich(IntLiteralNode(id="nodeId", value=7), constraints=None)
+    assert strategy.calls == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_enrichment_cache_shares_failures() -> None:
+    strategy = CountingEnricherStrategy()
+    enricher = Enricher(strategy).with_cache(EnrichmentCache())
+
+    for _ in range(2):
+        with pytest.raises(EnrichmentFailed):
+            await enricher.enrich(
+                FloatLiteralNode(id="nodeId", value=4.2), constraints=None
+            )
+
+    assert strategy.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_enrichment_cache_survives_cancelled_caller() -> None:
+    cache = EnrichmentCache()
+    node = IntLiteralNode(id="nodeId", value=42)
+    started = asyncio.Event()
+    calls = 0
+
+    async def enrich() -> ImplementationNode:
+        nonlocal calls
+        calls += 1
+        started.set()
+        await asyncio.sleep(0 if calls > 1 else 10)
+        return ImplementationNode(id="nodeId", implementation="int 42")
+
+    first = asyncio.create_task(cache.get_or_enrich(node, None, enrich))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_enrich(node, None, enrich))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    result = await asyncio.wait_for(waiter, timeout=1)
+
+    assert first.cancelled()
+    assert result.implementation == "int 42"
+    assert calls == 2  # noqa: PLR2004
+    assert await cache.get_or_enrich(node, None, enrich) == result
+    assert calls == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_lazy_strategy_skips_other_nodes() -> None:
+    strategy = LazyEnricherStrategy(
+        "app.enricher.not_existing", "Strategy", (FloatLiteralNode,)
+    )
+    result = await strategy.enrich(IntLiteralNode(id="nodeId", value=42), None)
+    assert list(result) == []
+
+
+@pytest.mark.asyncio
+async def test_lazy_strategy_delegates() -> None:
+    strategy = LazyEnricherStrategy(
+        __name__, "IntToAEnricherStrategy", (IntLiteralNode,)
+    )
+    result = list(await strategy.enrich(IntLiteralNode(id="nodeId", value=42), None))
+    assert result[0].enriched_node == ImplementationNode(
+        id="nodeId", implementation="A"
+    )
+
+
+@pytest.mark.asyncio
+async def test_lazy_strategy_unavailable() -> None:
+    strategy = LazyEnricherStrategy(
+        __name__, "IntToAEnricherStrategy", (IntLiteralNode,), available="UNAVAILABLE"
+    )
+    result = await strategy.enrich(IntLiteralNode(id="nodeId", value=42), None)
+    assert list(result) == []
+    assert strategy.load() is None
+
+
+UNAVAILABLE = False
@@ -4,6 +4,7 @@ from app.enricher import Constraints
 from app.enricher.mcmt_gate import MCMTGateEnricherStrategy
 from app.model.CompileRequest import MCMTGateNode
 from app.openqasm3.printer import leqo_dumps
+from tests.enricher.utils import assert_equivalent_with_clean_ancillas
 
 
 @pytest.mark.asyncio
@@ -202,3 +203,34 @@ async def test_mcmt_gate_output_routing_integrity():
     assert "@leqo.output 1\nlet out_1 = ctrl_1;" in qasm
     assert "@leqo.output 2\nlet out_2 = target_0;" in qasm
     assert "@leqo.output 3\nlet out_3 = target_1;" in qasm
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("base_gate", "parameter"), [("x", None), ("ry", 0.7)])
+async def test_mcmt_gate_v_chain(base_gate: str, parameter: float | None):
+    """
+    More than two controls also yield a V-chain computing the conjunction of the
+    controls once into clean ancillas, which are reusable afterwards.
+    """
+    node = MCMTGateNode(
+        id="mcmt-v",
+        type="mcmt-gate",
+        baseGate=base_gate,
+        numControls=4,
+        numTargets=2,
+        parameter=parameter,
+    )
+    plain, v_chain = MCMTGateEnricherStrategy()._enrich_impl(
+        node, Constraints(requested_inputs={})
+    )
+
+    qasm = leqo_dumps(v_chain.enriched_node.implementation)
+    assert "qubit[3] ancilla;" in qasm
+    assert qasm.count("ccx") == 6  # noqa: PLR2004
+    assert f"ctrl(1) @ {base_gate}" in qasm
+    assert "@leqo.reusable\nlet ancilla_reusable = ancilla;" in qasm
+    assert v_chain.meta_data.width == 6 + 3
+    assert v_chain.meta_data.depth < plain.meta_data.depth
+    assert_equivalent_with_clean_ancillas(
+        v_chain.enriched_node.implementation, plain.enriched_node.implementation
+    )
@@ -1,7 +1,11 @@
+import itertools
+
 import pytest
 import pytest_asyncio
 from openqasm3.ast import (
     AliasStatement,
+    Concatenation,
+    Expression,
     Identifier,
     IndexedIdentifier,
     IntegerLiteral,
@@ -26,7 +30,10 @@ from app.model.CompileRequest import PrepareStateNode as FrontendPrepareStateNod
 from app.model.CompileRequest import SingleInsertMetaData
 from app.model.data_types import FloatType, QubitType
 from app.model.exceptions import InputCountMismatch, InputTypeMismatch
-from tests.enricher.utils import assert_enrichments
+from tests.enricher.utils import assert_enrichments, evaluate_registers, to_circuit
+
+# ripple-carry, Cuccaro, Draper and carry-lookahead
+ADDER_ARCHITECTURES = 4
 
 
 @pytest_asyncio.fixture(autouse=True)
@@ -134,7 +141,7 @@ async def test_enrich_plus_operator(engine: AsyncEngine) -> None:
         node, constraints
     )
     enrichment_results = list(enrichment_results)
-    assert len(enrichment_results) == 1
+    assert len(enrichment_results) == ADDER_ARCHITECTURES
 
     result = enrichment_results[0]
     lhs_size = constraints.requested_inputs[0].size or 1
@@ -180,7 +187,7 @@ async def test_enrich_plus_operator_with_signed_extension(
     )
     enrichment_results = list(enrichment_results)
 
-    assert len(enrichment_results) == 1
+    assert len(enrichment_results) == ADDER_ARCHITECTURES
     enriched_node = enrichment_results[0].enriched_node
     assert isinstance(enriched_node.implementation, Program)
     program = enriched_node.implementation
@@ -379,7 +386,7 @@ async def test_enrich_minus_operator(engine: AsyncEngine) -> None:
     )
     enrichment_results = list(enrichment_results)
 
-    assert len(enrichment_results) == 1
+    assert len(enrichment_results) == ADDER_ARCHITECTURES
 
     result = enrichment_results[0]
     lhs_size = constraints.requested_inputs[0].size or 1
@@ -470,3 +477,101 @@ async def test_subtraction_uses_twos_complement_construction(
 
     assert len(x_gates) >= min_twos_complement_x_gate_count
     assert len(cx_gates) > 0
+
+
+def _output_value(program: Program, registers: dict[str, int]) -> int:
+    alias = program.statements[-1]
+    assert isinstance(alias, AliasStatement)
+    sizes = {
+        stmt.qubit.name: stmt.size.value if isinstance(stmt.size, IntegerLiteral) else 1
+        for stmt in program.statements
+        if isinstance(stmt, QubitDeclaration)
+    }
+
+    def names(expression: Expression) -> list[str]:
+        if isinstance(expression, Concatenation):
+            return names(expression.lhs) + names(expression.rhs)
+        assert isinstance(expression, Identifier)
+        return [expression.name]
+
+    value = 0
+    for name in reversed(names(alias.value)):
+        value = (value << sizes[name]) | registers[name]
+    return value
+
+
+def _signed(value: int, size: int, signed: bool) -> int:
+    return value - 2**size if signed and value >> (size - 1) else value
+
+
+@pytest.mark.parametrize("operator", ["+", "-"])
+@pytest.mark.parametrize(
+    ("lhs", "rhs"),
+    [
+        (QubitType(size=2), QubitType(size=2)),
+        (QubitType(size=3), QubitType(size=1)),
+        (QubitType(size=1, signed=True), QubitType(size=3, signed=True)),
+        (QubitType(size=3, signed=True), QubitType(size=2)),
+        (QubitType(size=None), QubitType(size=2, signed=True)),
+    ],
+)
+def test_generated_adders_compute_result(
+    engine: AsyncEngine, operator: str, lhs: QubitType, rhs: QubitType
+) -> None:
+    """
+    All adder architectures compute the sign extended result on ``max_size + 1`` bits,
+    declare the reported width and return their ancillas clean.
+    """
+    node = FrontendOperatorNode(id="1", label=None, type="operator", operator=operator)
+    constraints = Constraints(requested_inputs={0: lhs, 1: rhs})
+    strategy = OperatorEnricherStrategy(engine)
+    if operator == "+":
+        names = ("addend0", "addend1")
+        results = strategy._generate_addition_enrichments(node, constraints)
+    else:
+        names = ("minuend", "subtrahend")
+        results = strategy._generate_subtraction_enrichments(node, constraints)
+
+    lhs_size, rhs_size = lhs.size or 1, rhs.size or 1
+    result_size = max(lhs_size, rhs_size) + 1
+    assert len(results) == ADDER_ARCHITECTURES
+    for result in results:
+        program = result.enriched_node.implementation
+        assert isinstance(program, Program)
+        circuit = to_circuit(program)
+        assert circuit.num_qubits == result.meta_data.width
+        reusable = [
+            stmt.value.name
+            for stmt in program.statements
+            if isinstance(stmt, AliasStatement)
+            and isinstance(stmt.value, Identifier)
+            and any(a.keyword == "leqo.reusable" for a in stmt.annotations)
+        ]
+
+        for x, y in itertools.product(range(2**lhs_size), range(2**rhs_size)):
+            registers = evaluate_registers(circuit, {names[0]: x, names[1]: y})
+            a = _signed(x, lhs_size, lhs.signed)
+            b = _signed(y, rhs_size, rhs.signed)
+            expected = (a + b if operator == "+" else a - b) % 2**result_size
+            assert _output_value(program, registers) == expected
+            assert all(registers[name] == 0 for name in reusable)
+
+
+def test_generated_adders_trade_width_for_depth(engine: AsyncEngine) -> None:
+    """
+    The optimization goals select different adders for larger registers.
+    """
+    node = FrontendOperatorNode(id="1", label=None, type="operator", operator="+")
+    constraints = Constraints(
+        requested_inputs={0: QubitType(size=16), 1: QubitType(size=16)}
+    )
+
+    ripple, cuccaro, draper, lookahead = OperatorEnricherStrategy(
+        engine
+    )._generate_addition_enrichments(node, constraints)
+
+    widths = [r.meta_data.width for r in (ripple, cuccaro, draper, lookahead)]
+    depths = [r.meta_data.depth for r in (ripple, cuccaro, draper, lookahead)]
+    assert min(widths) == draper.meta_data.width == 33  # noqa: PLR2004
+    assert cuccaro.meta_data.width == 34  # noqa: PLR2004
+    assert min(d for d in depths if d is not None) == lookahead.meta_data.depth
@@ -41,17 +41,8 @@ async def setup_database_data(session: AsyncSession) -> None:
         quantum_state=QuantumStateType.PSI_PLUS,
         size=3,
     )
-    node3 = PrepareStateNode(
-        type=NodeType.PREPARE,
-        depth=3,
-        width=3,
-        implementation="gzh_impl",
-        inputs=[],
-        quantum_state=QuantumStateType.GHZ,
-        size=6,
-    )
 
-    session.add_all([node1, node2, node3])
+    session.add_all([node1, node2])
     await session.commit()
 
 
@@ -115,7 +106,10 @@ async def test_enrich_psi_plus_prepare_state(engine: AsyncEngine) -> None:
 
 
 @pytest.mark.asyncio
-async def test_enrich_gzh_prepare_state(engine: AsyncEngine) -> None:
+async def test_enrich_ghz_prepare_state(engine: AsyncEngine) -> None:
+    """
+    GHZ states are generated as a fan-out tree without a database lookup.
+    """
     node = FrontendPrepareStateNode(
         id="3", label=None, type="prepare", quantumState="ghz", size=6
     )
@@ -125,8 +119,22 @@ async def test_enrich_gzh_prepare_state(engine: AsyncEngine) -> None:
         optimizeWidth=True,
     )
 
-    result = await PrepareStateEnricherStrategy(engine).enrich(node, constraints)
-    assert_enrichments(result, "gzh_impl", 3, 3)
+    results = list(await PrepareStateEnricherStrategy(engine).enrich(node, constraints))
+    assert len(results) == 1
+
+    implementation = leqo_dumps(results[0].enriched_node.implementation)
+    assert "qubit[6] q;" in implementation
+    assert (
+        "h q[0];\n"
+        "cx q[0], q[1];\n"
+        "cx q[0], q[2];\n"
+        "cx q[1], q[3];\n"
+        "cx q[0], q[4];\n"
+        "cx q[1], q[5];\n"
+    ) in implementation
+    assert "let out = q;" in implementation
+    assert results[0].meta_data.width == 6  # noqa: PLR2004
+    assert results[0].meta_data.depth == 4  # noqa: PLR2004
 
 
 @pytest.mark.asyncio
@@ -159,7 +167,8 @@ async def test_enrich_superposition_prepare_state(engine: AsyncEngine) -> None:
 async def test_enrich_w_prepare_state(engine: AsyncEngine) -> None:
     """
     Tests that a W-State node generates the correct sequential
-    controlled-RY and CNOT ladder for amplitude distribution.
+    controlled-RY and CNOT ladder for amplitude distribution,
+    next to the log-depth construction.
     """
     node = FrontendPrepareStateNode(
         id="w-state-node-1",
@@ -176,7 +185,7 @@ async def test_enrich_w_prepare_state(engine: AsyncEngine) -> None:
     )
 
     results = list(await PrepareStateEnricherStrategy(engine).enrich(node, constraints))
-    assert len(results) == 1
+    assert len(results) == 2  # noqa: PLR2004
 
     result = results[0]
     implementation = result.enriched_node.implementation
@@ -189,6 +198,7 @@ async def test_enrich_w_prepare_state(engine: AsyncEngine) -> None:
 
     assert "qubit[3] q;" in implementation_str
     assert "x q[0];" in implementation_str
+    assert implementation_str != leqo_dumps(results[1].enriched_node.implementation)
 
     theta_0 = 2 * math.asin(math.sqrt(2 / 3))
     theta_1 = 2 * math.asin(math.sqrt(1 / 2))
@@ -202,7 +212,7 @@ async def test_enrich_w_prepare_state(engine: AsyncEngine) -> None:
     assert "let out = q;" in implementation_str
 
     expected_width = 3
-    expected_depth = 6
+    expected_depth = 5
     assert result.meta_data.width == expected_width
     assert result.meta_data.depth == expected_depth
 
@@ -271,3 +281,21 @@ async def test_enrich_prepare_state_node_not_in_db(engine: AsyncEngine) -> None:
     )
 
     assert (await PrepareStateEnricherStrategy(engine).enrich(node, constraints)) == []
+
+
+@pytest.mark.asyncio
+async def test_enrich_w_prepare_state_variants(engine: AsyncEngine) -> None:
+    """
+    Large W states offer the linear and the log-depth construction, so ranking can pick one.
+    """
+    node = FrontendPrepareStateNode(
+        id="w-state-node-2", label=None, type="prepare", quantumState="w", size=16
+    )
+    constraints = Constraints(
+        requested_inputs={}, optimizeDepth=True, optimizeWidth=False
+    )
+
+    results = await PrepareStateEnricherStrategy(engine).enrich(node, constraints)
+
+    assert [result.meta_data.depth for result in results] == [31, 9]
+    assert all(result.meta_data.width == 16 for result in results)  # noqa: PLR2004
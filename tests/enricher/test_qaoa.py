@@ -1,7 +1,8 @@
 import pytest
+from openqasm3.parser import parse
 
 from app.enricher import Constraints
-from app.enricher.qaoa import QAOAEnricherStrategy
+from app.enricher.qaoa import QAOAEnricherStrategy, color_edges
 from app.model.CompileRequest import QAOANode
 from app.openqasm3.printer import leqo_dumps
 
@@ -163,3 +164,52 @@ async def test_qaoa_max2sat_with_polarity_cnf():
 
     # sign_u * sign_v (1 * -1 = -1)
     assert "rz(-0.4) q_polar[1];" in qasm
+
+
+def test_color_edges_layers_are_matchings():
+    """
+    Each layer of the edge colouring acts on disjoint qubits and
+    the number of layers respects the greedy bound ``2Δ - 1``.
+    """
+    # complete graph on 6 vertices, Δ = 5
+    terms = [(u, v, 0.5) for u in range(6) for v in range(u + 1, 6)]
+    layers = color_edges(terms)
+
+    assert sorted(t for layer in layers for t in layer) == sorted(terms)
+    for layer in layers:
+        qubits = [q for u, v, _ in layer for q in (u, v)]
+        assert len(qubits) == len(set(qubits))
+    assert len(layers) <= 2 * 5 - 1
+
+
+@pytest.mark.asyncio
+async def test_qaoa_depth_follows_degree():
+    """
+    The cost layer depth depends on the maximum degree, not on the number of edges.
+    """
+    # ring of 12 vertices: 12 edges but degree 2
+    edges = [[i, (i + 1) % 12] for i in range(12)]
+    node = QAOANode(
+        id="qaoa-ring",
+        type="qaoa",
+        p=1,
+        problem="MaxCut",
+        optimizer="COBYLA",
+        edges=str(edges),
+        outputIdentifier="q_ring",
+    )
+    results = QAOAEnricherStrategy()._enrich_impl(
+        node, Constraints(requested_inputs={})
+    )
+
+    # h + at most 3 colours of cx-rz-cx + rx
+    assert results[0].meta_data.depth <= 1 + 3 * 3 + 1
+
+    rzz_results = QAOAEnricherStrategy(native_rzz=True)._enrich_impl(
+        node, Constraints(requested_inputs={})
+    )
+    qasm = leqo_dumps(rzz_results[0].enriched_node.implementation)
+    parse(qasm)
+    assert "gate rzz(theta) a, b {" in qasm
+    assert qasm.count("rzz(0.5) q_ring[") == len(edges)
+    assert rzz_results[0].meta_data.depth <= 1 + 3 + 1
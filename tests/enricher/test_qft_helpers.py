@@ -1,11 +1,23 @@
 import math
 
+import numpy as np
 import pytest
-from openqasm3.ast import FloatLiteral, QuantumGate
+from openqasm3.ast import (
+    FloatLiteral,
+    Identifier,
+    IntegerLiteral,
+    Program,
+    QuantumGate,
+    QubitDeclaration,
+)
 
 from app.enricher import Constraints
 from app.enricher.exceptions import EnricherException
-from app.enricher.qft import _build_qft_statements, _validate_qft_constraints
+from app.enricher.qft import (
+    QFTEnricherStrategy,
+    _build_qft_statements,
+    _validate_qft_constraints,
+)
 from app.model.CompileRequest import QFTNode
 from app.model.data_types import IntType, QubitType
 from app.model.exceptions import (
@@ -13,6 +25,8 @@ from app.model.exceptions import (
     InputSizeMismatch,
     InputTypeMismatch,
 )
+from app.openqasm3.printer import leqo_dumps
+from tests.enricher.utils import unitary
 
 
 def _only_gates(statements):
@@ -242,3 +256,101 @@ def test_qft_constraints_reject_missing_input_index_zero() -> None:
         match=r"^Could not determine input type for QFT input 0$",
     ):
         _validate_qft_constraints(constraints, node)
+
+
+def _qft_unitary(size: int, approximation_degree: int | None = None) -> np.ndarray:
+    return unitary(
+        Program(
+            [
+                QubitDeclaration(Identifier("q"), IntegerLiteral(size)),
+                *_build_qft_statements(size, approximation_degree=approximation_degree),
+            ]
+        )
+    )
+
+
+def _dft(size: int) -> np.ndarray:
+    # q[0] is the most significant qubit, while the unitary is indexed little endian
+    reversed_bits = [int(f"{i:0{size}b}"[::-1], 2) for i in range(2**size)]
+    exponents = np.outer(reversed_bits, reversed_bits)
+    return np.exp(2j * math.pi * exponents / 2**size) / math.sqrt(2**size)
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 4, 5])
+def test_exact_qft_matches_dft(size: int) -> None:
+    assert np.allclose(_qft_unitary(size), _dft(size))
+
+
+@pytest.mark.parametrize(("size", "degree"), [(3, 1), (4, 1), (4, 2), (5, 2), (5, 3)])
+def test_approximate_qft_is_within_error_bound(size: int, degree: int) -> None:
+    cp_count = sum(
+        1
+        for stmt in _only_gates(
+            _build_qft_statements(size, approximation_degree=degree)
+        )
+        if _gate_name(stmt) == "cp"
+    )
+    error = np.linalg.norm(_qft_unitary(size, degree) - _qft_unitary(size), ord=2)
+
+    assert cp_count == sum(min(degree, size - 1 - target) for target in range(size))
+    assert 0 < error <= size * math.pi / 2**degree
+
+
+def test_approximate_inverse_qft_inverts_approximate_qft() -> None:
+    size, degree = 5, 2
+    program = Program(
+        [
+            QubitDeclaration(Identifier("q"), IntegerLiteral(size)),
+            *_build_qft_statements(size, approximation_degree=degree),
+            *_build_qft_statements(size, inverse=True, approximation_degree=degree),
+        ]
+    )
+
+    assert np.allclose(unitary(program), np.eye(2**size))
+
+
+@pytest.mark.asyncio
+async def test_optimize_depth_keeps_exact_qft() -> None:
+    size = 8
+    constraints = Constraints(
+        requested_inputs={0: QubitType(size)},
+        optimizeWidth=False,
+        optimizeDepth=True,
+    )
+
+    result = next(
+        iter(await QFTEnricherStrategy().enrich(QFTNode(id="qft"), constraints))
+    )
+
+    assert leqo_dumps(result.enriched_node.implementation).count("cp(") == (
+        size * (size - 1) // 2
+    )
+
+
+@pytest.mark.asyncio
+async def test_enrich_approximate_qft_reports_metadata() -> None:
+    size = 16
+    constraints = Constraints(
+        requested_inputs={0: QubitType(size)},
+        optimizeWidth=False,
+        optimizeDepth=False,
+    )
+
+    exact = next(
+        iter(await QFTEnricherStrategy().enrich(QFTNode(id="qft"), constraints))
+    )
+    approximate = next(
+        iter(
+            await QFTEnricherStrategy().enrich(
+                QFTNode(id="qft", approximationDegree=3), constraints
+            )
+        )
+    )
+
+    assert exact.meta_data.width == approximate.meta_data.width == size
+    assert exact.meta_data.depth is not None
+    assert approximate.meta_data.depth is not None
+    assert approximate.meta_data.depth <= exact.meta_data.depth
+    assert leqo_dumps(approximate.enriched_node.implementation).count(
+        "cp("
+    ) < leqo_dumps(exact.enriched_node.implementation).count("cp(")
@@ -50,6 +50,8 @@ async def test_qiskit_strategy_skips_when_library_missing(
         ("ψ-", 2),
         ("ghz", 3),
         ("w", 3),
+        ("ghz", 25),
+        ("w", 25),
     ],
 )
 async def test_qiskit_strategy_generates_program_for_supported_states(
@@ -73,22 +75,22 @@ async def test_qiskit_strategy_generates_program_for_supported_states(
     enrichment_results = await strategy.enrich(node, constraints)
 
     results = list(enrichment_results)
-    assert len(results) == 1
+    assert len(results) == (2 if quantum_state == "w" else 1)
 
-    result = results[0]
-    assert result.meta_data.width == size
-    assert result.meta_data.depth is None or result.meta_data.depth > 0
+    for result in results:
+        assert result.meta_data.width == size
+        assert result.meta_data.depth is None or result.meta_data.depth > 0
 
-    program = result.enriched_node.implementation
-    assert isinstance(program, Program)
+        program = result.enriched_node.implementation
+        assert isinstance(program, Program)
 
-    alias_statement = program.statements[-1]
-    assert isinstance(alias_statement, AliasStatement)
+        alias_statement = program.statements[-1]
+        assert isinstance(alias_statement, AliasStatement)
 
-    annotation_keywords = [
-        annotation.keyword for annotation in alias_statement.annotations
-    ]
-    assert "leqo.output" in annotation_keywords
+        annotation_keywords = [
+            annotation.keyword for annotation in alias_statement.annotations
+        ]
+        assert "leqo.output" in annotation_keywords
 
 
 @pytest.mark.asyncio
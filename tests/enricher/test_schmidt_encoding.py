@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from qiskit.quantum_info import Statevector
+
+from app.enricher import Constraints
+from app.enricher.encode_value_handlers.amplitude import generate_amplitude_enrichment
+from app.enricher.encode_value_handlers.schmidt import generate_schmidt_enrichment
+from app.model.CompileRequest import EncodeValueNode
+from app.model.data_types import ArrayType, FloatType
+from tests.enricher.utils import to_circuit
+
+
+def _node() -> EncodeValueNode:
+    return EncodeValueNode(
+        id="schmidt-node",
+        label=None,
+        type="encode",
+        encoding="schmidt",
+        bounds=0,
+    )
+
+
+def _random_state(rng: np.random.Generator, n_qubits: int) -> np.ndarray:
+    vector = rng.normal(size=1 << n_qubits) + 1j * rng.normal(size=1 << n_qubits)
+    return vector / np.linalg.norm(vector)
+
+
+def _prepared_state(vector: np.ndarray) -> np.ndarray:
+    result = generate_schmidt_enrichment(_node(), vector.tolist())
+    program = result.enriched_node.implementation
+    assert not isinstance(program, str)
+    assert result.meta_data.width == int(vector.size).bit_length() - 1
+    return np.asarray(Statevector.from_instruction(to_circuit(program)).data)
+
+
+@pytest.mark.parametrize("n_qubits", range(1, 6))
+def test_schmidt_encoding_prepares_state(n_qubits: int) -> None:
+    vector = _random_state(np.random.default_rng(n_qubits), n_qubits)
+
+    # the global phase is not exported
+    assert np.isclose(abs(np.vdot(_prepared_state(vector), vector)), 1)
+
+
+def test_schmidt_encoding_truncates_to_rank() -> None:
+    rng = np.random.default_rng(0)
+    vector = np.kron(_random_state(rng, 3), _random_state(rng, 3)) + 1e-12
+
+    assert np.isclose(abs(np.vdot(_prepared_state(vector), vector)), 1)
+
+
+def test_schmidt_encoding_is_shallower_for_product_states() -> None:
+    rng = np.random.default_rng(1)
+    vector = np.kron(rng.normal(size=16), rng.normal(size=16))
+    amplitude = generate_amplitude_enrichment(
+        _node(),
+        Constraints(
+            requested_inputs={
+                0: ArrayType(element_type=FloatType(size=32), length=256)
+            },
+            requested_input_values={0: SimpleNamespace(values=vector.tolist())},
+        ),
+    )
+
+    schmidt = generate_schmidt_enrichment(_node(), vector.tolist())
+
+    assert schmidt.meta_data.depth is not None
+    assert amplitude.meta_data.depth is not None
+    assert schmidt.meta_data.depth * 4 < amplitude.meta_data.depth
@@ -1,3 +1,7 @@
+import random
+import re
+
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
@@ -5,6 +9,7 @@ from app.enricher import Constraints
 from app.enricher.universal_oracles import UniversalOracleEnricherStrategy
 from app.model.CompileRequest import UniversalOracleNode
 from app.openqasm3.printer import leqo_dumps
+from tests.enricher.utils import assert_equivalent_with_clean_ancillas, unitary
 
 
 @pytest.mark.asyncio
@@ -92,3 +97,67 @@ def test_universal_oracle_validation_error():
             targetStates=[5],
             mode="phase",
         )
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 4])
+def test_universal_oracle_equivalence(n: int):
+    # Random target sets, including duplicates that unmark a state again
+    rng = random.Random(n)
+    for _ in range(5):
+        targets = [rng.randrange(1 << n) for _ in range(rng.randint(1, 1 << n))]
+        marked = [targets.count(state) % 2 == 1 for state in range(1 << n)]
+        strategy = UniversalOracleEnricherStrategy()
+
+        node = UniversalOracleNode(
+            id="uo-eq", numQubits=n, targetStates=targets, mode="phase"
+        )
+        program = strategy._enrich_impl(node, None)[0].enriched_node.implementation
+        expected = np.diag([-1 if m else 1 for m in marked])
+        assert np.allclose(unitary(program), expected)
+
+        node = UniversalOracleNode(
+            id="uo-eq", numQubits=n, targetStates=targets, mode="boolean"
+        )
+        program = strategy._enrich_impl(node, None)[0].enriched_node.implementation
+        # the target qubit is the most significant one
+        expected = np.zeros((2 << n, 2 << n))
+        for state in range(1 << n):
+            flip = 1 << n if marked[state] else 0
+            expected[state ^ flip, state] = 1
+            expected[state ^ (1 << n) ^ flip, state ^ (1 << n)] = 1
+        assert np.allclose(unitary(program), expected)
+
+
+def test_universal_oracle_gray_code_cancels_x_gates():
+    # Marking all 16 states: Gray code order flips a single bit between states
+    node = UniversalOracleNode(
+        id="uo-all", numQubits=4, targetStates=list(range(16)), mode="boolean"
+    )
+    program = UniversalOracleEnricherStrategy()._enrich_impl(node, None)[0]
+    qasm = leqo_dumps(program.enriched_node.implementation)
+
+    # 4 initial flips, one per transition and 3 final flips (the last state is 1000)
+    # instead of 2 flips per zero bit of each state (64)
+    assert len(re.findall(r"^x ", qasm, re.MULTILINE)) == 4 + 15 + 3
+
+
+@pytest.mark.parametrize(
+    ("n", "mode"), [(3, "boolean"), (4, "phase"), (4, "boolean"), (5, "phase")]
+)
+def test_universal_oracle_v_chain(n: int, mode: str):
+    # More than two controls: a second result uses Toffoli V-chains on clean ancillas
+    node = UniversalOracleNode(
+        id="uo-v", numQubits=n, targetStates=[1, 6, (1 << n) - 1], mode=mode
+    )
+    plain, v_chain = UniversalOracleEnricherStrategy()._enrich_impl(node, None)
+
+    num_ancillas = n - 2 if mode == "boolean" else n - 3
+    qasm = leqo_dumps(v_chain.enriched_node.implementation)
+    assert f"qubit[{num_ancillas}] ancilla;" in qasm
+    assert "@leqo.reusable\nlet ancilla_reusable = ancilla;" in qasm
+    assert "ctrl(" not in qasm
+    assert v_chain.meta_data.width == plain.meta_data.width + num_ancillas
+    assert_equivalent_with_clean_ancillas(
+        v_chain.enriched_node.implementation,
+        plain.enriched_node.implementation,
+    )
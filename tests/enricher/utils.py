@@ -1,9 +1,35 @@
+import math
 from collections.abc import Iterable
 from textwrap import dedent
 
+import numpy as np
+import pytest
+from openqasm3.ast import (
+    BinaryExpression,
+    Expression,
+    FloatLiteral,
+    ForInLoop,
+    GateModifierName,
+    Identifier,
+    IntegerLiteral,
+    Program,
+    QuantumGate,
+    QuantumGateDefinition,
+    QuantumStatement,
+    QubitDeclaration,
+    RangeDefinition,
+    Statement,
+    UnaryExpression,
+)
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.circuit import Qubit
+from qiskit.circuit.library import get_standard_gate_name_mapping
+from qiskit.quantum_info import Operator, Statevector
+
 from app.enricher import EnrichmentResult, ParsedImplementationNode
 from app.model.CompileRequest import ImplementationNode
 from app.openqasm3.printer import leqo_dumps
+from app.utils import not_none
 
 
 def assert_enrichment(
@@ -29,3 +55,165 @@ def assert_enrichments(
         assert impl_str == expected_implementation
         assert result.meta_data.width == expected_width
         assert result.meta_data.depth == expected_depth
+
+
+def _evaluate(expression: Expression, scope: dict[str, float]) -> float:  # noqa: PLR0911
+    match expression:
+        case IntegerLiteral() | FloatLiteral():
+            return expression.value
+        case Identifier(name="pi" | "π"):
+            return math.pi
+        case Identifier():
+            return scope[expression.name]
+        case UnaryExpression() if expression.op.name == "-":
+            return -_evaluate(expression.expression, scope)
+        case BinaryExpression():
+            lhs = _evaluate(expression.lhs, scope)
+            rhs = _evaluate(expression.rhs, scope)
+            match expression.op.name:
+                case "+":
+                    return lhs + rhs
+                case "-":
+                    return lhs - rhs
+                case "*":
+                    return lhs * rhs
+                case "/":
+                    return lhs / rhs
+    msg = f"Unsupported expression {expression}"
+    raise NotImplementedError(msg)
+
+
+def _apply(
+    circuit: QuantumCircuit,
+    statements: Iterable[Statement | QuantumStatement],
+    qubits: dict[str, list[Qubit]],
+    gates: dict[str, QuantumGateDefinition],
+    scope: dict[str, float],
+) -> None:
+    for statement in statements:
+        match statement:
+            case QubitDeclaration():
+                size = (
+                    1
+                    if statement.size is None
+                    else int(_evaluate(statement.size, scope))
+                )
+                register = QuantumRegister(size, statement.qubit.name)
+                circuit.add_register(register)
+                qubits[statement.qubit.name] = list(register)
+            case QuantumGateDefinition():
+                gates[statement.name.name] = statement
+            case ForInLoop(set_declaration=RangeDefinition() as loop_range):
+                start = int(_evaluate(not_none(loop_range.start, "open range"), scope))
+                end = int(_evaluate(not_none(loop_range.end, "open range"), scope))
+                for _ in range(start, end + 1):
+                    _apply(circuit, statement.block, qubits, gates, scope)
+            case QuantumGate():
+                _apply_gate(circuit, statement, qubits, gates, scope)
+
+
+def _apply_gate(
+    circuit: QuantumCircuit,
+    gate: QuantumGate,
+    qubits: dict[str, list[Qubit]],
+    gates: dict[str, QuantumGateDefinition],
+    scope: dict[str, float],
+) -> None:
+    targets: list[Qubit] = []
+    for qubit in gate.qubits:
+        if isinstance(qubit, Identifier):
+            targets.extend(qubits[qubit.name])
+        else:
+            register = qubits[qubit.name.name]
+            for index in qubit.indices[0]:  # type: ignore[union-attr]
+                value = int(_evaluate(index, scope))
+                targets.append(register[value])
+    arguments = [_evaluate(argument, scope) for argument in gate.arguments]
+
+    definition = gates.get(gate.name.name)
+    if definition is not None:
+        sub_circuit = QuantumCircuit(len(definition.qubits))
+        _apply(
+            sub_circuit,
+            definition.body,
+            {q.name: [sub_circuit.qubits[i]] for i, q in enumerate(definition.qubits)},
+            gates,
+            {a.name: v for a, v in zip(definition.arguments, arguments, strict=True)},
+        )
+        instruction = sub_circuit.to_gate(label=gate.name.name)
+    else:
+        instruction = get_standard_gate_name_mapping()[gate.name.name.lower()]
+        if arguments:
+            instruction = type(instruction)(*arguments)
+
+    for modifier in reversed(gate.modifiers):
+        count = (
+            1 if modifier.argument is None else int(_evaluate(modifier.argument, scope))
+        )
+        match modifier.modifier:
+            case GateModifierName.ctrl:
+                instruction = instruction.control(count)
+            case GateModifierName.negctrl:
+                instruction = instruction.control(count, ctrl_state=0)
+            case GateModifierName.inv:
+                instruction = instruction.inverse()
+            case GateModifierName.pow:
+                instruction = instruction.power(count)
+    circuit.append(instruction, targets)
+
+
+def to_circuit(program: Program) -> QuantumCircuit:
+    """
+    Build a qiskit circuit from the gates of a program.
+
+    Supports qubit declarations, gate definitions, standard gates (and ``U``) with modifiers
+    and ``for`` loops over literal ranges; other statements are ignored.
+    The qubits are ordered by declaration.
+    """
+    circuit = QuantumCircuit()
+    _apply(circuit, program.statements, {}, {}, {})
+    return circuit
+
+
+def unitary(program: Program) -> np.ndarray:
+    """
+    Unitary of the gates of a program in qiskit's (little-endian) qubit order.
+    """
+    return Operator(to_circuit(program)).data
+
+
+def assert_equivalent_with_clean_ancillas(program: Program, reference: Program) -> None:
+    """
+    Assert `program` acts like `reference` if its additional qubits start clean.
+
+    The additional (ancilla) qubits must be declared last.
+    As the columns of a unitary are normalized, matching the block of clean inputs and
+    outputs also means that the ancillas are returned clean.
+    """
+    expected = unitary(reference)
+    size = expected.shape[0]
+    assert np.allclose(unitary(program)[:size, :size], expected)
+
+
+def evaluate_registers(
+    circuit: QuantumCircuit, values: dict[str, int]
+) -> dict[str, int]:
+    """
+    Run a circuit mapping basis states to basis states on the given register values.
+
+    :param circuit: Circuit built by :func:`to_circuit`.
+    :param values: Initial values of registers, other registers start in zero.
+    :return: The final value of each register.
+    """
+    initial = 0
+    for register in reversed(circuit.qregs):
+        initial = (initial << register.size) | values.get(register.name, 0)
+    state = Statevector.from_int(initial, 2**circuit.num_qubits).evolve(circuit)
+    final = int(np.argmax(np.abs(state.data)))
+    assert abs(state.data[final]) == pytest.approx(1)
+
+    result = {}
+    for register in circuit.qregs:
+        result[register.name] = final & ((1 << register.size) - 1)
+        final >>= register.size
+    return result
@@ -0,0 +1,100 @@
+from openqasm3.ast import (
+    BinaryExpression,
+    BinaryOperator,
+    ClassicalDeclaration,
+    Identifier,
+    Program,
+    QuantumGate,
+)
+from openqasm3.parser import parse
+
+from app.enricher import ParsedImplementationNode
+from app.openqasm3.clone import clone
+from app.transformation_manager.graph import (
+    IOConnection,
+    IOInfo,
+    ProcessedProgramNode,
+    ProgramNode,
+    QubitIOInstance,
+)
+
+SOURCE = """
+OPENQASM 3.1;
+include "stdgates.inc";
+@leqo.input 0
+qubit[2] q;
+float x = 1.5 * 2;
+h q[0];
+cx q[0], q[1];
+"""
+
+
+def test_clone_equals_original() -> None:
+    """
+    The clone is equal to the original, including the spans excluded from ``__init__``.
+    """
+    program = parse(SOURCE)
+    copy = clone(program)
+
+    assert copy == program
+    assert copy is not program
+    for original, cloned in zip(program.statements, copy.statements, strict=True):
+        assert cloned is not original
+        assert cloned.span == original.span
+        assert cloned.annotations == original.annotations
+
+
+def test_clone_is_independent() -> None:
+    """
+    Mutating the clone leaves the original untouched.
+    """
+    program = parse(SOURCE)
+    copy = clone(program)
+
+    declaration = copy.statements[2]
+    assert isinstance(declaration, ClassicalDeclaration)
+    declaration.identifier.name = "y"
+    gate = copy.statements[3]
+    assert isinstance(gate, QuantumGate)
+    gate.qubits.clear()
+    copy.statements.pop()
+
+    assert program == parse(SOURCE)
+
+
+def test_clone_shares_immutable_leaves() -> None:
+    """
+    Strings, enum members and frozen dataclasses are not copied.
+    """
+    expression = BinaryExpression(BinaryOperator["*"], Identifier("x"), Identifier("y"))
+    copy = clone(expression)
+    assert copy.op is expression.op
+    assert isinstance(copy.lhs, Identifier)
+    assert copy.lhs is not expression.lhs
+    assert copy.lhs.name is expression.lhs.name  # type: ignore[attr-defined]
+
+    raw = ProgramNode("a")
+    connection = IOConnection((raw, 0), (ProgramNode("b"), 0))
+    assert clone(connection) is connection
+
+    node = ProcessedProgramNode(
+        raw, Program([]), IOInfo(inputs={0: QubitIOInstance("q", [0, 1])})
+    )
+    node_copy = clone(node)
+    assert node_copy == node
+    assert node_copy.raw is raw
+    assert node_copy.io.inputs[0] is not node.io.inputs[0]
+
+
+def test_clone_pydantic_model() -> None:
+    """
+    Pydantic models are cloned including their fields set.
+    """
+    node = ParsedImplementationNode(id="a", implementation=parse(SOURCE))
+    copy = clone(node)
+
+    assert copy == node
+    assert copy.implementation is not node.implementation
+    assert copy.model_fields_set == node.model_fields_set
+    copy.id = "b"
+    assert node.id == "a"
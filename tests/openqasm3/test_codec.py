@@ -0,0 +1,128 @@
+from contextlib import suppress
+
+import pytest
+from openqasm3.ast import Program
+from openqasm3.parser import parse
+
+from app.model.data_types import ArrayType, IntType
+from app.openqasm3.ast import CommentStatement
+from app.openqasm3.codec import AST_CODEC, Codec, DecodeError
+from app.transformation_manager.graph import (
+    NODE_CODEC,
+    ClassicalIOInstance,
+    IOInfo,
+    ProcessedProgramNode,
+    ProgramNode,
+    QubitInfo,
+    QubitIOInstance,
+)
+
+SOURCE = """
+OPENQASM 3.1;
+include "stdgates.inc";
+@leqo.input 0
+qubit[3] q;
+@leqo.input 1
+int[32] i;
+float x = -1.5 * 2 + i;
+bit[3] b = "101";
+ctrl @ rx(pi / 2) q[0], q[1];
+if (b[0] == 1) {
+    x q[-1];
+}
+"""
+
+
+def test_program_round_trip() -> None:
+    """
+    Decoding an encoded program restores it including spans and enum values.
+    """
+    program = parse(SOURCE)
+    program.statements.append(CommentStatement("done"))
+
+    decoded = AST_CODEC.decode(AST_CODEC.encode(program), Program)
+
+    assert decoded == program
+    for original, restored in zip(program.statements, decoded.statements, strict=True):
+        assert restored.span == original.span
+
+
+def test_strings_are_interned() -> None:
+    """
+    Repeated identifiers are stored once in the string table.
+    """
+    short = AST_CODEC.encode(parse("qubit q;\nh q;"))
+    long = AST_CODEC.encode(parse("qubit q;\nh q;\nh q;\nh q;"))
+
+    assert long.count(b"q") == short.count(b"q") == 1
+
+
+def test_node_round_trip() -> None:
+    """
+    Processed nodes round trip with their io and qubit info.
+    """
+    node = ProcessedProgramNode(
+        ProgramNode("a", label="A"),
+        parse(SOURCE),
+        IOInfo(
+            inputs={
+                0: QubitIOInstance("q", [0, 1, 2]),
+                1: ClassicalIOInstance("i", IntType(32)),
+            },
+            outputs={0: ClassicalIOInstance("c", ArrayType(IntType(8), 300))},
+        ),
+        QubitInfo({"q": [0, 1, 2], "anc": [3]}, clean_ids=[3], dirty_ids=[-1]),
+    )
+
+    decoded = NODE_CODEC.decode(NODE_CODEC.encode(node), ProcessedProgramNode)
+
+    assert decoded == node
+    assert decoded.raw == node.raw
+    assert decoded.id == node.id
+    assert NODE_CODEC.decode(NODE_CODEC.encode(node.qubit), QubitInfo) == node.qubit
+
+
+def test_reject_incompatible_data() -> None:
+    """
+    Data of other codecs, truncated data and unexpected root types are rejected.
+    """
+    data = AST_CODEC.encode(parse(SOURCE))
+
+    with pytest.raises(DecodeError, match="different types"):
+        Codec([ProgramNode]).decode(data, Program)
+    with pytest.raises(DecodeError, match="malformed"):
+        AST_CODEC.decode(data[:-3], Program)
+    with pytest.raises(DecodeError, match="Unsupported format"):
+        AST_CODEC.decode(b"XX" + data[2:], Program)
+    with pytest.raises(DecodeError, match="Expected QubitInfo"):
+        AST_CODEC.decode(data, QubitInfo)
+
+
+def test_reject_tampered_data() -> None:
+    """
+    Tampering with any byte either yields a value or raises :class:`DecodeError`.
+    """
+    codec = Codec([])
+    data = codec.encode({0: "a"})
+    unhashable_key = data.replace(bytes([3, 0]), bytes([6, 0]), 1)
+
+    with pytest.raises(DecodeError, match="malformed"):
+        codec.decode(unhashable_key, dict)
+
+    data = AST_CODEC.encode(parse(SOURCE))
+    for pos in range(len(data)):
+        for tampered in (data[pos] ^ 0xFF, data[pos] ^ 0x01):
+            with suppress(DecodeError):
+                AST_CODEC.decode(
+                    data[:pos] + bytes([tampered]) + data[pos + 1 :], Program
+                )
+
+
+def test_reject_unsupported_values() -> None:
+    """
+    Unregistered types and values violating a field's annotation can't be encoded.
+    """
+    with pytest.raises(TypeError, match="ProgramNode"):
+        AST_CODEC.encode(ProgramNode("a"))
+    with pytest.raises(TypeError, match="NoneType"):
+        NODE_CODEC.encode(IntType(None))  # type: ignore[arg-type]
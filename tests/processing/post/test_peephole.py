@@ -0,0 +1,300 @@
+import random
+
+import pytest
+from openqasm3.ast import (
+    FloatLiteral,
+    Identifier,
+    IndexedIdentifier,
+    IntegerLiteral,
+    Program,
+    QuantumGate,
+    QubitDeclaration,
+    Statement,
+)
+from openqasm3.parser import parse
+from openqasm3.printer import dumps
+from qiskit.quantum_info import Operator
+
+from app.transformation_manager.post import postprocess
+from app.transformation_manager.post.peephole import (
+    PeepholeStatistics,
+    optimize_gates,
+)
+from app.transformation_manager.utils import normalize_qasm_string
+from tests.enricher.utils import to_circuit
+
+
+def _optimize(code: str) -> tuple[str, PeepholeStatistics]:
+    program, statistics = optimize_gates(parse(normalize_qasm_string(code)))
+    return normalize_qasm_string(dumps(program)), statistics
+
+
+def _assert_optimized(code: str, expected: str) -> PeepholeStatistics:
+    actual, statistics = _optimize(code)
+    assert actual == normalize_qasm_string(expected)
+    return statistics
+
+
+def test_cancel_across_aliases() -> None:
+    statistics = _assert_optimized(
+        """
+        OPENQASM 3.1;
+        qubit[3] leqo_reg;
+        let leqo_a_q = leqo_reg[{2, 0}];
+        x leqo_a_q[0];
+        cx leqo_a_q[1], leqo_a_q[0];
+        let leqo_b_q = leqo_reg[{0}];
+        let leqo_b_r = leqo_reg[1:2];
+        cx leqo_b_q[0], leqo_b_r[1];
+        x leqo_b_r[1];
+        h leqo_b_r[0];
+        """,
+        """
+        OPENQASM 3.1;
+        qubit[3] leqo_reg;
+        let leqo_a_q = leqo_reg[{2, 0}];
+        let leqo_b_q = leqo_reg[{0}];
+        let leqo_b_r = leqo_reg[1:2];
+        h leqo_b_r[0];
+        """,
+    )
+    assert statistics == PeepholeStatistics(gates=5, cancelled=4, fused=0)
+
+
+def test_cancel_nested_pairs() -> None:
+    _assert_optimized(
+        """
+        OPENQASM 3.1;
+        qubit[2] q;
+        h q[0];
+        s q[0];
+        cz q[0], q[1];
+        cz q[1], q[0];
+        sdg q[0];
+        h q[0];
+        """,
+        """
+        OPENQASM 3.1;
+        qubit[2] q;
+        """,
+    )
+
+
+def test_keep_non_adjacent_and_non_inverse_gates() -> None:
+    code = """
+    OPENQASM 3.1;
+    qubit[2] q;
+    s q[0];
+    s q[0];
+    cx q[0], q[1];
+    cx q[1], q[0];
+    x q[1];
+    y q[0];
+    x q[1];
+    """
+    statistics = _assert_optimized(
+        code,
+        """
+        OPENQASM 3.1;
+        qubit[2] q;
+        s q[0];
+        s q[0];
+        cx q[0], q[1];
+        cx q[1], q[0];
+        y q[0];
+        """,
+    )
+    assert statistics.removed == 2  # noqa: PLR2004
+
+
+def test_fuse_rotations() -> None:
+    statistics = _assert_optimized(
+        """
+        OPENQASM 3.1;
+        qubit[2] q;
+        rz(0.25) q[0];
+        rx(1) q[1];
+        rz(0.5) q[0];
+        rz(pi / 4) q[0];
+        ry(0.5) q[1];
+        cp(1.0) q[0], q[1];
+        cp(-1.0) q[1], q[0];
+        """,
+        """
+        OPENQASM 3.1;
+        qubit[2] q;
+        rz(1.5353981633974483) q[0];
+        rx(1) q[1];
+        ry(0.5) q[1];
+        """,
+    )
+    assert statistics == PeepholeStatistics(gates=7, cancelled=2, fused=2)
+
+
+def test_drop_full_rotations() -> None:
+    statistics = _assert_optimized(
+        """
+        OPENQASM 3.1;
+        qubit q;
+        rx(pi) q;
+        rx(0.5) q;
+        rx(pi - 0.5) q;
+        """,
+        """
+        OPENQASM 3.1;
+        qubit q;
+        """,
+    )
+    assert statistics == PeepholeStatistics(gates=3, cancelled=2, fused=1)
+
+
+def test_keep_variable_rotations() -> None:
+    code = """
+    OPENQASM 3.1;
+    qubit q;
+    input float theta;
+    rz(theta) q;
+    rz(-theta) q;
+    """
+    assert _optimize(code) == (normalize_qasm_string(code), PeepholeStatistics(2))
+
+
+@pytest.mark.parametrize(
+    "separator",
+    [
+        "barrier q[0];",
+        "barrier;",
+        "bit c = measure q[0];",
+        "reset q[0];",
+        "x q;",
+        "foo(q[0]);",
+        "ctrl @ x q[1], q[0];",
+        "if (c) { x q[1]; }",
+    ],
+)
+def test_respect_separators(separator: str) -> None:
+    code = f"""
+    OPENQASM 3.1;
+    qubit[2] q;
+    bit c;
+    h q[0];
+    {separator}
+    h q[0];
+    """
+    actual, statistics = _optimize(code)
+    assert actual == normalize_qasm_string(dumps(parse(normalize_qasm_string(code))))
+    assert statistics.removed == 0
+
+
+def test_unrelated_statements_do_not_separate() -> None:
+    _assert_optimized(
+        """
+        OPENQASM 3.1;
+        qubit[2] q;
+        h q[0];
+        barrier q[1];
+        bit c = measure q[1];
+        h q[0];
+        """,
+        """
+        OPENQASM 3.1;
+        qubit[2] q;
+        barrier q[1];
+        bit c = measure q[1];
+        """,
+    )
+
+
+def test_optimize_branches_separately() -> None:
+    _assert_optimized(
+        """
+        OPENQASM 3.1;
+        qubit[2] leqo_reg;
+        bit c;
+        x leqo_reg[0];
+        if (c) {
+            let leqo_a_q = leqo_reg[1];
+            x leqo_reg[0];
+            h leqo_a_q;
+            h leqo_reg[1];
+        } else {
+            x leqo_reg[0];
+        }
+        x leqo_reg[0];
+        """,
+        """
+        OPENQASM 3.1;
+        qubit[2] leqo_reg;
+        bit c;
+        x leqo_reg[0];
+        if (c) {
+          let leqo_a_q = leqo_reg[1];
+          x leqo_reg[0];
+        } else {
+          x leqo_reg[0];
+        }
+        x leqo_reg[0];
+        """,
+    )
+
+
+def test_keep_overridden_gates() -> None:
+    code = """
+    OPENQASM 3.1;
+    gate h a {
+      s a;
+    }
+    qubit q;
+    h q;
+    h q;
+    """
+    assert _optimize(code)[0] == normalize_qasm_string(dumps(parse(code)))
+
+
+def test_input_is_not_modified() -> None:
+    program = parse("OPENQASM 3.1;\nqubit q;\nrz(1) q;\nrz(1) q;\n")
+    expected = dumps(program)
+
+    optimize_gates(program)
+
+    assert dumps(program) == expected
+
+
+def test_postprocess_optimizes_by_default() -> None:
+    program = parse("OPENQASM 3.1;\nqubit q;\nx q;\nx q;\n")
+
+    assert len(postprocess(program).statements) == 1
+    assert len(postprocess(program, peephole=False).statements) == 3  # noqa: PLR2004
+
+
+def _random_program(seed: int) -> Program:
+    generator = random.Random(seed)
+    gates = ["x", "h", "s", "sdg", "t", "tdg", "cx", "cz", "rz", "rx", "ry", "cp"]
+    statements: list[Statement] = [QubitDeclaration(Identifier("q"), IntegerLiteral(3))]
+    for _ in range(60):
+        name = generator.choice(gates)
+        arity = 2 if name.startswith("c") else 1
+        qubits = generator.sample(range(3), arity)
+        angle = generator.choice([0.5, -0.5, 1.0, 3.14159])
+        statements.append(
+            QuantumGate(
+                [],
+                Identifier(name),
+                [FloatLiteral(angle)] if name.startswith(("r", "cp")) else [],
+                [
+                    IndexedIdentifier(Identifier("q"), [[IntegerLiteral(i)]])
+                    for i in qubits
+                ],
+            )
+        )
+    return Program(statements, version="3.1")
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_optimized_program_is_equivalent(seed: int) -> None:
+    program = _random_program(seed)
+
+    optimized, statistics = optimize_gates(program)
+
+    assert len(optimized.statements) - 1 == statistics.gates - statistics.removed
+    assert Operator(to_circuit(optimized)).equiv(Operator(to_circuit(program)))
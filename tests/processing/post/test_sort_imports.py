@@ -1,3 +1,4 @@
+from openqasm3.ast import BranchingStatement
 from openqasm3.parser import parse
 from openqasm3.printer import dumps
 
@@ -58,3 +59,41 @@ def test_all() -> None:
     """)
     actual = normalize_qasm_string(dumps(SortImportsTransformer().visit(parse(code))))
     assert expected == actual
+
+
+def test_hoist_nested_gate_definitions() -> None:
+    program = parse(
+        normalize_qasm_string("""
+    include "stdgates.inc";
+    gate a q { x q; }
+    bit c;
+    qubit q0;
+    if (c) {
+        b q0;
+    }
+    a q0;
+    """)
+    )
+    # the parser rejects nested definitions, but merging if-then-else nodes creates them
+    branch = program.statements[4]
+    assert isinstance(branch, BranchingStatement)
+    branch.if_block[0:0] = parse(
+        'include "stdgates.inc";\ngate b q { h q; }'
+    ).statements
+    expected = normalize_qasm_string(
+        dumps(
+            parse("""
+    include "stdgates.inc";
+    gate b q { h q; }
+    gate a q { x q; }
+    bit c;
+    qubit q0;
+    if (c) {
+        b q0;
+    }
+    a q0;
+    """)
+        )
+    )
+    actual = normalize_qasm_string(dumps(SortImportsTransformer().visit(program)))
+    assert expected == actual
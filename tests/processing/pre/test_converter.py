@@ -1,8 +1,14 @@
 import pytest
-from openqasm3.ast import Program
+from openqasm3.ast import Program, QuantumGateDefinition
 from openqasm3.printer import dumps
 
-from app.transformation_manager.pre.converter import QASMConversionError, QASMConverter
+from app.transformation_manager.pre import ParseCache
+from app.transformation_manager.pre.converter import (
+    QASMConversionError,
+    QASMConverter,
+    get_gate_library,
+    get_qelib1,
+)
 from app.transformation_manager.utils import normalize_qasm_string
 
 
@@ -318,3 +324,43 @@ def test_unsupported_gate_conversion() -> None:
     """
     converter = QASMConverter()
     check_out(converter.parse_to_qasm3(input_qasm2), expected)
+
+
+def test_parse_cache_returns_copies() -> None:
+    cache = ParseCache()
+    implementation = """OPENQASM 2.0;
+    qreg q[1];
+    """
+
+    first = cache.parse(implementation)
+    first.statements.clear()
+    second = cache.parse(implementation)
+
+    assert second is not first
+    check_out(second, "OPENQASM 3.1;\nqubit[1] q;")
+
+
+def test_gate_library_is_parsed_once() -> None:
+    content = "OPENQASM 3.1;\ngate id2 q { }"
+    assert get_gate_library("custom.inc", content) is get_gate_library(
+        "custom.inc", content
+    )
+    assert QASMConverter().custom_libs["qelib1.inc"] is get_qelib1()
+
+
+def test_shared_gate_definitions_are_copied() -> None:
+    input_qasm2 = """OPENQASM 2.0;
+    include "qelib1.inc";
+    qreg q[2];
+    cu1(0.5) q[0], q[1];
+    """
+    qelib1_before = dumps(Program(statements=list(get_qelib1().gates)))
+
+    first = QASMConverter().parse_to_qasm3(input_qasm2)
+    for statement in first.statements:
+        if isinstance(statement, QuantumGateDefinition):
+            statement.body.clear()
+
+    assert dumps(Program(statements=list(get_qelib1().gates))) == qelib1_before
+    second = QASMConverter().parse_to_qasm3(input_qasm2)
+    assert dumps(second) != dumps(first)
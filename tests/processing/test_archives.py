@@ -0,0 +1,119 @@
+import json
+import zipfile
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+
+from app.model.CompileRequest import CompileRequest
+from app.transformation_manager.archives import (
+    REQUEST_FILE,
+    ZipMember,
+    generate_qrms,
+    render_service_app,
+    write_archive,
+    write_service_zips,
+)
+
+
+def _open(data: bytes) -> zipfile.ZipFile:
+    return zipfile.ZipFile(BytesIO(data))
+
+
+def test_members_keep_order() -> None:
+    tasks = [lambda i=i: [ZipMember(f"{i}.txt", str(i) * (100 - i))] for i in range(50)]
+
+    with write_archive(tasks, workers=3, spool_max_size=256) as archive:
+        assert archive.size > 256  # noqa: PLR2004
+        data = b"".join(archive.iter_chunks(100))
+        assert data == archive.read()
+
+    members = _open(data)
+    assert members.namelist() == [f"{i}.txt" for i in range(50)]
+    assert members.read("7.txt") == b"7" * 93
+
+
+@pytest.mark.asyncio
+async def test_generate_qrms() -> None:
+    groups = {
+        "quantum_group_0": [SimpleNamespace(id="a"), SimpleNamespace(id="b")],
+        "quantum_group_1": [SimpleNamespace(id="c", label="C")],
+    }
+
+    with await generate_qrms(groups) as archive:
+        members = _open(archive.read())
+
+    assert members.namelist() == [
+        f"Activity_{node}/{kind}.bpmn"
+        for node in "abc"
+        for kind in ("detector", "replacement")
+    ]
+    assert b'url="C/maxcut"' in members.read("Activity_c/detector.bpmn")
+    assert b"pull/c/?csar" in members.read("Activity_c/replacement.bpmn")
+
+
+def test_service_zips() -> None:
+    request = CompileRequest.model_validate(
+        {
+            "metadata": {
+                "version": "1.0.0",
+                "name": "Workflow",
+                "description": "",
+                "author": "",
+            },
+            "nodes": [{"id": "q", "type": "qubit"}],
+            "edges": [],
+        }
+    )
+    activities = ["a_model", "a_human", "a_poll_result"]
+
+    with write_service_zips(activities, request) as archive:
+        members = _open(archive.read())
+
+    assert members.namelist() == ["Activity_a_model.zip", "Activity_a_poll_result.zip"]
+    docker_layer = _open(
+        _open(members.read("Activity_a_model.zip")).read("service.zip")
+    )
+    assert "Dockerfile" in docker_layer.namelist()
+    service = _open(docker_layer.read("service.zip"))
+    assert json.loads(service.read(REQUEST_FILE))["nodes"][0]["id"] == "q"
+    compile(service.read("app.py"), "app.py", "exec")
+
+    poll = _open(_open(members.read("Activity_a_poll_result.zip")).read("service.zip"))
+    assert REQUEST_FILE not in _open(poll.read("service.zip")).namelist()
+
+
+class _EventStream:
+    def __init__(self, status: str) -> None:
+        self.lines = [": keep-alive", f'data: {{"status": "{status}"}}']
+
+    def __enter__(self) -> "_EventStream":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_lines(self, decode_unicode: bool) -> list[str]:
+        assert decode_unicode
+        return self.lines
+
+
+@pytest.mark.parametrize("status", ["completed", "failed", "cancelled", "timeout"])
+def test_poll_result_stops_at_terminal_status(status: str) -> None:
+    source, _ = render_service_app("a_poll_result")
+    namespace: dict[str, object] = {}
+    exec(compile(source, "app.py", "exec"), namespace)
+    streams: list[str] = []
+
+    def get(url: str, **kwargs: object) -> _EventStream:
+        assert kwargs["stream"]
+        streams.append(url)
+        return _EventStream(status)
+
+    namespace["requests"] = SimpleNamespace(get=get, RequestException=Exception)
+
+    assert namespace["main"](uuid="abc") == {"status": status}  # type: ignore[operator]
+    assert streams == ["http://localhost:8000/status/abc/events"]
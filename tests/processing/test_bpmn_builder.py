@@ -0,0 +1,87 @@
+import xml.etree.ElementTree as ET
+from types import SimpleNamespace
+
+from app.model.CompileRequest import CompileRequest
+from app.transformation_manager.bpmn_builder import BPMN2_NS, BPMNDI_NS, BpmnBuilder
+
+CHILD_ORDER = ("extensionElements", "incoming", "outgoing")
+
+
+def _build(group_count: int) -> ET.Element:
+    request = CompileRequest.model_validate(
+        {
+            "metadata": {
+                "version": "1.0.0",
+                "name": "Workflow",
+                "description": "",
+                "author": "",
+            },
+            "nodes": [{"id": "newNode0", "type": "int", "value": "size"}],
+            "edges": [],
+        }
+    )
+    groups = {
+        f"quantum_group_{index}": SimpleNamespace(type="implementation")
+        for index in range(group_count)
+    }
+    xml, _ = BpmnBuilder("test", groups, [], original_request=request).build()
+    return ET.fromstring(xml)
+
+
+def test_flows_are_referenced_by_their_elements() -> None:
+    definitions = _build(3)
+    process = definitions.find(f"{{{BPMN2_NS}}}process")
+    assert process is not None
+    elements = {element.attrib["id"]: element for element in process}
+
+    for flow in process.iter(f"{{{BPMN2_NS}}}sequenceFlow"):
+        source = elements[flow.attrib["sourceRef"]]
+        target = elements[flow.attrib["targetRef"]]
+        if not source.tag.endswith("endEvent"):
+            outgoing = [c.text for c in source if c.tag.endswith("outgoing")]
+            assert flow.attrib["id"] in outgoing
+        if not target.tag.endswith("startEvent"):
+            incoming = [c.text for c in target if c.tag.endswith("incoming")]
+            assert flow.attrib["id"] in incoming
+
+
+def test_incoming_before_outgoing() -> None:
+    process = _build(3).find(f"{{{BPMN2_NS}}}process")
+    assert process is not None
+
+    for element in process:
+        order = [
+            CHILD_ORDER.index(kind)
+            for child in element
+            for kind in CHILD_ORDER
+            if child.tag.endswith(kind)
+        ]
+        assert order == sorted(order)
+
+
+def test_diagram_covers_all_elements_without_overlap() -> None:
+    definitions = _build(3)
+    process = definitions.find(f"{{{BPMN2_NS}}}process")
+    assert process is not None
+
+    shapes = {
+        shape.attrib["bpmnElement"]: shape[0].attrib
+        for shape in definitions.iter(f"{{{BPMNDI_NS}}}BPMNShape")
+    }
+    edges = {
+        edge.attrib["bpmnElement"]
+        for edge in definitions.iter(f"{{{BPMNDI_NS}}}BPMNEdge")
+    }
+    flows = {flow.attrib["id"] for flow in process.iter(f"{{{BPMN2_NS}}}sequenceFlow")}
+    assert edges == flows
+    assert set(shapes) == {
+        element.attrib["id"] for element in process if element.attrib["id"] not in flows
+    }
+
+    boxes = [
+        tuple(int(bounds[key]) for key in ("x", "y", "width", "height"))
+        for bounds in shapes.values()
+    ]
+    for i, (x, y, w, h) in enumerate(boxes):
+        for ox, oy, ow, oh in boxes[i + 1 :]:
+            assert x + w <= ox or ox + ow <= x or y + h <= oy or oy + oh <= y
@@ -0,0 +1,67 @@
+from itertools import pairwise
+
+from app.transformation_manager.bpmn_layout import Box, Layout, layered_layout
+
+TASK = (120, 80)
+GATEWAY = (50, 50)
+
+
+def test_chain_is_straight() -> None:
+    sizes = {"a": TASK, "gw": GATEWAY, "b": TASK}
+    layout = layered_layout(sizes, [("a", "gw"), ("gw", "b")], origin=(10, 20))
+
+    a, gw, b = layout.boxes["a"], layout.boxes["gw"], layout.boxes["b"]
+    assert (a.x, a.y) == (10, 20)
+    assert a.center_y == gw.center_y == b.center_y
+    assert a.right < gw.x < gw.right < b.x
+    assert not layout.back_edges
+    assert layout.route("a", "gw") == [(a.right, a.center_y), (gw.x, gw.center_y)]
+
+
+def test_cycle_is_routed_above() -> None:
+    sizes = {"a": TASK, "gw1": GATEWAY, "b": TASK, "gw2": GATEWAY, "c": TASK}
+    edges = [("a", "gw1"), ("gw1", "b"), ("b", "gw2"), ("gw2", "gw1"), ("gw2", "c")]
+    layout = layered_layout(sizes, edges)
+
+    assert layout.back_edges == {("gw2", "gw1")}
+    assert [layout.boxes[node].x for node in sizes] == sorted(
+        layout.boxes[node].x for node in sizes
+    )
+
+    gw1, gw2 = layout.boxes["gw1"], layout.boxes["gw2"]
+    route = layout.route("gw2", "gw1")
+    assert route[0] == (gw2.center_x, gw2.y)
+    assert route[-1] == (gw1.center_x, gw1.y)
+    assert route[1][1] == route[2][1] < min(gw1.y, gw2.y)
+
+
+def test_branches_get_own_rows() -> None:
+    sizes = {"gw": GATEWAY, "main": TASK, "fail": TASK, "end": (36, 36), "next": TASK}
+    edges = [("gw", "main"), ("gw", "fail"), ("fail", "end"), ("main", "next")]
+    layout = layered_layout(sizes, edges)
+
+    gw, main, fail = layout.boxes["gw"], layout.boxes["main"], layout.boxes["fail"]
+    assert main.x == fail.x
+    assert main.center_y == gw.center_y
+    assert fail.y >= main.bottom
+    assert layout.boxes["end"].center_y == fail.center_y
+
+    route = layout.route("gw", "fail")
+    assert route[0] == (gw.right, gw.center_y)
+    assert route[-1] == (fail.x, fail.center_y)
+    assert all(a[0] == b[0] or a[1] == b[1] for a, b in pairwise(route))
+
+
+def test_crossings_are_reduced() -> None:
+    sizes = dict.fromkeys(["a", "b", "x", "y"], TASK)
+    layout = layered_layout(sizes, [("a", "y"), ("b", "x")])
+
+    boxes = layout.boxes
+    assert (boxes["a"].y < boxes["b"].y) == (boxes["y"].y < boxes["x"].y)
+
+
+def test_same_column_route() -> None:
+    layout = Layout(boxes={"a": Box(0, 0, 10, 10), "b": Box(0, 20, 10, 10)})
+
+    assert layout.route("a", "b") == [(5, 10), (5, 20)]
+    assert layout.route("b", "a") == [(5, 20), (5, 10)]
@@ -0,0 +1,96 @@
+import pytest
+
+from app.enricher import Enricher
+from app.model.CompileRequest import (
+    Edge,
+    ImplementationNode,
+    IntLiteralNode,
+    OptimizeSettings,
+    PluginNode,
+)
+from app.transformation_manager import MergingProcessor, find_quantum_groups
+from app.transformation_manager.frontend_graph import FrontendGraph
+
+H_IMPL = """
+OPENQASM 3.1;
+@leqo.input 0
+qubit[1] q;
+h q;
+@leqo.output 0
+let _out = q;
+"""
+INIT_IMPL = """
+OPENQASM 3.1;
+qubit[1] q;
+@leqo.output 0
+let _out = q;
+"""
+
+
+class DummyOptimizeSettings(OptimizeSettings):
+    optimizeWidth = None
+    optimizeDepth = None
+
+
+def _edge(source: str, target: str) -> Edge:
+    return Edge(source=(source, 0), target=(target, 0))
+
+
+def _ids(groups: dict[str, list[ImplementationNode]]) -> dict[str, list[str]]:
+    return {group_id: [node.id for node in nodes] for group_id, nodes in groups.items()}
+
+
+def test_groups_are_split_by_classical_nodes() -> None:
+    nodes = [
+        ImplementationNode(id="a", implementation=INIT_IMPL),
+        ImplementationNode(id="b", implementation=H_IMPL),
+        IntLiteralNode(id="i", value=1),
+        ImplementationNode(id="c", implementation=H_IMPL),
+        PluginNode(id="p", pluginName="plugin", inputs=[], outputs=[]),
+        PluginNode(id="lonely", pluginName="plugin", inputs=[], outputs=[]),
+    ]
+    edges = [_edge("a", "b"), _edge("b", "i"), _edge("i", "c"), _edge("c", "p")]
+    graph = FrontendGraph.create(nodes, edges)
+
+    assert _ids(find_quantum_groups(graph)) == {
+        "quantum_group_0": ["a", "b"],
+        "quantum_group_1": ["c", "p"],
+    }
+
+
+def test_long_chain_does_not_recurse() -> None:
+    length = 5000
+    nodes = [
+        ImplementationNode(id=f"n{i}", implementation=H_IMPL) for i in range(length)
+    ]
+    edges = [_edge(f"n{i}", f"n{i + 1}") for i in range(length - 1)]
+    graph = FrontendGraph.create(reversed(nodes), edges)
+
+    groups = find_quantum_groups(graph)
+
+    assert list(groups) == ["quantum_group_0"]
+    assert [node.id for node in groups["quantum_group_0"]] == [
+        f"n{i}" for i in reversed(range(length))
+    ]
+
+
+@pytest.mark.asyncio
+async def test_process_groups() -> None:
+    nodes = [
+        ImplementationNode(id="a", implementation=INIT_IMPL),
+        ImplementationNode(id="b", implementation=H_IMPL),
+        ImplementationNode(id="c", implementation=INIT_IMPL),
+        ImplementationNode(id="broken", implementation="OPENQASM 3.1; qubit q"),
+    ]
+    graph = FrontendGraph.create(nodes, [_edge("a", "b")])
+    processor = MergingProcessor(Enricher(), graph, DummyOptimizeSettings())
+
+    groups = find_quantum_groups(graph)
+    results = await processor.process_groups(groups)
+
+    assert list(results) == list(groups)
+    assert isinstance(results["quantum_group_0"], str)
+    assert "h " in results["quantum_group_0"]
+    assert isinstance(results["quantum_group_1"], str)
+    assert "h " not in results["quantum_group_1"]
+    assert isinstance(results["quantum_group_2"], Exception)
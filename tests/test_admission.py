@@ -0,0 +1,82 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app import admission
+from app.admission import (
+    DEFAULT_JOB_DURATION,
+    DURATION_SMOOTHING,
+    MAX_RETRY_AFTER,
+    JobDurations,
+    check_admission,
+    format_metrics,
+    retry_after,
+)
+from app.config import Settings
+from app.job_queue import QueueDepth
+
+
+def test_job_durations_moving_average() -> None:
+    durations = JobDurations()
+    assert durations.mean == DEFAULT_JOB_DURATION
+
+    durations.record(10.0)
+    assert durations.mean == 10.0  # noqa: PLR2004
+
+    durations.record(20.0)
+    assert durations.mean == 10.0 + DURATION_SMOOTHING * 10.0
+
+
+def test_retry_after_scales_with_workers() -> None:
+    one_worker = QueueDepth(queued=10, running=1, oldest_wait=0.0)
+    four_workers = QueueDepth(queued=10, running=4, oldest_wait=0.0)
+
+    assert retry_after(10, one_worker, 2.0) == 20  # noqa: PLR2004
+    assert retry_after(10, four_workers, 2.0) == 5  # noqa: PLR2004
+
+
+def test_retry_after_bounds() -> None:
+    idle = QueueDepth(queued=0, running=0, oldest_wait=0.0)
+
+    assert retry_after(0, idle, 2.0) == 1
+    assert retry_after(1_000_000, idle, 2.0) == MAX_RETRY_AFTER
+
+
+def test_format_metrics() -> None:
+    metrics = format_metrics(QueueDepth(queued=3, running=2, oldest_wait=1.5))
+
+    assert "leqo_jobs_queued 3\n" in metrics
+    assert "leqo_jobs_running 2\n" in metrics
+    assert "leqo_job_queue_oldest_wait_seconds 1.5\n" in metrics
+    assert 'leqo_admission_rejections_total{code="429"}' in metrics
+
+
+@pytest.mark.parametrize(
+    ("queued", "weight", "admitted"),
+    [
+        (0, 1, True),
+        (9, 1, True),
+        (10, 1, False),
+        (5, 5, True),
+        (5, 6, False),
+        (0, 50, True),
+        (1, 50, False),
+    ],
+)
+@pytest.mark.asyncio
+async def test_check_admission_weights_batches(
+    monkeypatch: pytest.MonkeyPatch, queued: int, weight: int, admitted: bool
+) -> None:
+    async def get_queue_depth(_engine: AsyncEngine) -> QueueDepth:
+        return QueueDepth(queued=queued, running=1, oldest_wait=0.0)
+
+    monkeypatch.setattr(admission, "get_queue_depth", get_queue_depth)
+    settings = Settings(max_queued_jobs=10)
+    engine: AsyncEngine = None  # type: ignore[assignment]
+
+    if admitted:
+        await check_admission(engine, settings, weight)
+    else:
+        with pytest.raises(HTTPException) as info:
+            await check_admission(engine, settings, weight)
+        assert info.value.status_code == 429  # noqa: PLR2004
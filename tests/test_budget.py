@@ -0,0 +1,93 @@
+from time import sleep
+
+import pytest
+from openqasm3.ast import (
+    Identifier,
+    IntegerLiteral,
+    Program,
+    QubitDeclaration,
+)
+
+from app.model.CompileRequest import (
+    ImplementationNode,
+    NestedBlock,
+    QubitNode,
+    RepeatNode,
+)
+from app.transformation_manager.budget import (
+    BudgetExceeded,
+    CancellationToken,
+    DeadlineExceeded,
+    ProcessingBudget,
+    ProcessingCancelled,
+)
+
+
+def test_unlimited_budget() -> None:
+    budget = ProcessingBudget()
+    for _ in range(100):
+        budget.checkpoint()
+        budget.add_node(QubitNode(id="q"))
+    budget.add_statements(1_000_000)
+
+
+def test_checkpoint_cancelled() -> None:
+    cancellation = CancellationToken()
+    budget = ProcessingBudget(cancellation=cancellation)
+    budget.checkpoint()
+
+    cancellation.cancel()
+    with pytest.raises(ProcessingCancelled):
+        budget.checkpoint()
+
+
+def test_checkpoint_deadline() -> None:
+    budget = ProcessingBudget(deadline_seconds=0.01)
+    budget.checkpoint()
+    sleep(0.02)
+    with pytest.raises(DeadlineExceeded):
+        budget.checkpoint()
+
+
+def test_add_node_limit() -> None:
+    budget = ProcessingBudget(max_nodes=2)
+    budget.add_node(QubitNode(id="q0"))
+    budget.add_node(QubitNode(id="q1"))
+    with pytest.raises(BudgetExceeded):
+        budget.add_node(QubitNode(id="q2"))
+
+
+def test_check_unroll() -> None:
+    node = RepeatNode(
+        id="repeat",
+        iterations=10,
+        block=NestedBlock(
+            nodes=[
+                ImplementationNode(id="a", implementation=""),
+                ImplementationNode(id="b", implementation=""),
+            ],
+            edges=[],
+        ),
+    )
+    ProcessingBudget(max_nodes=21).check_unroll(node)
+    with pytest.raises(BudgetExceeded):
+        ProcessingBudget(max_nodes=19).check_unroll(node)
+
+
+def test_add_statements_limit() -> None:
+    budget = ProcessingBudget(max_statements=10)
+    budget.add_statements(10)
+    with pytest.raises(BudgetExceeded):
+        budget.add_statements(1)
+
+
+def test_check_qubit_width() -> None:
+    program = Program(
+        statements=[
+            QubitDeclaration(Identifier("a"), IntegerLiteral(3)),
+            QubitDeclaration(Identifier("b"), None),
+        ]
+    )
+    ProcessingBudget(max_qubit_width=4).check_qubit_width(program)
+    with pytest.raises(BudgetExceeded):
+        ProcessingBudget(max_qubit_width=3).check_qubit_width(program)
@@ -0,0 +1,25 @@
+from app.caching import compute_digest, etag_matches, format_etag
+
+
+def test_compute_digest() -> None:
+    assert compute_digest(b"abc") == compute_digest(b"abc")
+    assert compute_digest(b"abc") != compute_digest(b"abd")
+    assert len(compute_digest(b"")) == 64  # noqa: PLR2004
+
+
+def test_format_etag() -> None:
+    assert format_etag("abc") == '"abc"'
+    assert format_etag("abc", "identity") == '"abc"'
+    assert format_etag("abc", "gzip") == '"abc-gzip"'
+
+
+def test_etag_matches() -> None:
+    etag = format_etag("abc")
+    assert not etag_matches(None, etag)
+    assert not etag_matches("", etag)
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('W/"abc"', etag)
+    assert etag_matches('"xyz", "abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"abc-gzip"', etag)
+    assert not etag_matches('"xyz"', etag)
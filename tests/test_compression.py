@@ -0,0 +1,54 @@
+import gzip
+
+import pytest
+
+from app.compression import EncodedPayload, accepts_encoding
+
+
+def test_small_payload_is_not_compressed() -> None:
+    payload = EncodedPayload.encode("OPENQASM 3.1;")
+    assert payload.encoding == "identity"
+    assert payload.content == b"OPENQASM 3.1;"
+    assert payload.decode() == "OPENQASM 3.1;"
+
+
+def test_large_payload_is_compressed() -> None:
+    text = "OPENQASM 3.1;\n" + "h q[0];\n" * 1000
+    payload = EncodedPayload.encode(text)
+    assert payload.encoding == "gzip"
+    assert len(payload.content) < len(text)
+    assert gzip.decompress(payload.content).decode() == text
+    assert payload.decode() == text
+
+
+def test_encoding_is_deterministic() -> None:
+    text = "x" * 4096
+    assert EncodedPayload.encode(text) == EncodedPayload.encode(text)
+
+
+def test_from_db() -> None:
+    assert EncodedPayload.from_db(b"abc", None).decode() == "abc"
+    assert EncodedPayload.from_db(b"abc", "identity").decode() == "abc"
+    assert EncodedPayload.from_db(gzip.compress(b"abc"), "gzip").decode() == "abc"
+    with pytest.raises(ValueError, match="Unsupported content encoding 'br'"):
+        EncodedPayload.from_db(b"abc", "br")
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ("", False),
+        ("gzip", True),
+        ("deflate, gzip", True),
+        ("GZIP;q=0.5", True),
+        ("gzip;q=0", False),
+        ("br", False),
+        ("*", True),
+        ("*;q=0", False),
+        ("gzip;q=0, *", False),
+    ],
+)
+def test_accepts_encoding(header: str | None, expected: bool) -> None:
+    assert accepts_encoding(header, "gzip") == expected
+    assert accepts_encoding(header, "identity")
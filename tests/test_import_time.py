@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+IMPORT_TIME_BUDGET = 5.0
+"""Seconds importing :mod:`app.main` may take, including all its dependencies."""
+
+LAZY_MODULES = ("qiskit", "numpy", "scipy")
+"""Heavy modules only imported on first use."""
+
+
+def _import_app() -> tuple[float, set[str]]:
+    """
+    Import :mod:`app.main` in a fresh interpreter.
+
+    :return: Cumulative import time in seconds and the loaded lazy modules.
+    """
+
+    script = (
+        "import sys, app.main; "
+        f"print(*(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    microseconds = next(
+        int(line.split("|")[1])
+        for line in process.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2].strip() == "app.main"
+    )
+    return microseconds / 1_000_000, set(process.stdout.split())
+
+
+def test_import_time_budget() -> None:
+    seconds, lazy_modules = _import_app()
+
+    assert lazy_modules == set(), "heavy modules are imported on startup"
+    assert seconds < IMPORT_TIME_BUDGET
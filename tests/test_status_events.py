@@ -0,0 +1,80 @@
+import asyncio
+import json
+import threading
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from app.model.StatusResponse import CreatedStatus, Progress, SuccessStatus
+from app.status_events import (
+    INSTANCE_ID,
+    StatusBroker,
+    format_event,
+    is_terminal,
+    notification_payload,
+)
+
+
+@pytest.mark.asyncio
+async def test_broker_fans_out_to_subscribers() -> None:
+    broker = StatusBroker()
+    uuid = uuid4()
+    status = CreatedStatus.init_status(uuid)
+
+    async with broker.subscribe(uuid) as first, broker.subscribe(uuid) as second:
+        assert broker.has_subscribers(uuid)
+        broker.publish(status)
+        broker.publish(CreatedStatus.init_status(uuid4()))
+        assert first.get_nowait() == status
+        assert second.get_nowait() == status
+        assert first.empty()
+        assert second.empty()
+
+    assert not broker.has_subscribers(uuid)
+    broker.publish(status)
+
+
+@pytest.mark.asyncio
+async def test_broker_accepts_updates_from_other_threads() -> None:
+    broker = StatusBroker()
+    uuid = uuid4()
+    status = CreatedStatus.init_status(uuid)
+
+    async with broker.subscribe(uuid) as queue:
+        thread = threading.Thread(target=broker.publish, args=(status,))
+        thread.start()
+        thread.join()
+        assert await asyncio.wait_for(queue.get(), 1) == status
+
+
+def test_is_terminal() -> None:
+    uuid = uuid4()
+    assert not is_terminal(CreatedStatus.init_status(uuid))
+    assert is_terminal(
+        SuccessStatus(
+            uuid=uuid,
+            createdAt=datetime.now(UTC),
+            completedAt=datetime.now(UTC),
+            progress=Progress(percentage=100, currentStep="done"),
+            result="http://localhost:8000/results/x",
+        )
+    )
+
+
+def test_format_event() -> None:
+    status = CreatedStatus.init_status(uuid4())
+    event = format_event(status)
+    assert event.startswith("event: status\ndata: ")
+    assert event.endswith("\n\n")
+    data = json.loads(event.removeprefix("event: status\ndata: "))
+    assert data["uuid"] == str(status.uuid)
+    assert data["status"] == "in_progress"
+
+
+def test_notification_payload() -> None:
+    uuid = uuid4()
+    assert json.loads(notification_payload(uuid)) == {
+        "uuid": str(uuid),
+        "origin": INSTANCE_ID,
+    }